@@ -0,0 +1,4 @@
+"""Benchmarks for the ae-cli client stack.
+
+Run ``python -m benchmarks --help`` from the repository root.
+"""
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import argparse
+import json
+from pathlib import Path
+import sys
+
+from ae_cli.cli_parser import DEFAULT_BRIDGE_URL
+from ae_cli.client import AEClient
+
+from .baseline import (
+    DEFAULT_METRIC,
+    DEFAULT_THRESHOLD,
+    build_report,
+    compare_reports,
+    format_comparison,
+    load_report,
+    save_report,
+)
+from .scene_generator import LAYER_TYPES, SceneSpec, generate_scene
+from .scene_scale import DEFAULT_BEND_FACTOR, DEFAULT_SIZES, run_scale
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Benchmark ae-cli client overhead against a local stand-in bridge.",
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Run the client benchmark suite")
+    run_parser.add_argument("--output", help="Write the results as a JSON baseline to this path")
+    run_parser.add_argument("--filter", help="Only run cases whose name contains this text")
+    run_parser.add_argument(
+        "--scale",
+        type=int,
+        default=1,
+        help="Multiply iteration counts (default: 1)",
+    )
+
+    compare_parser = subparsers.add_parser("compare", help="Compare two benchmark JSON files")
+    compare_parser.add_argument("baseline", help="Baseline JSON written by 'run --output'")
+    compare_parser.add_argument("current", help="Current JSON written by 'run --output'")
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"Allowed relative slowdown before flagging a regression (default: {DEFAULT_THRESHOLD})",
+    )
+    compare_parser.add_argument(
+        "--metric",
+        default=DEFAULT_METRIC,
+        help=f"Result field to compare (default: {DEFAULT_METRIC})",
+    )
+    def add_scene_spec_arguments(sub: argparse.ArgumentParser) -> None:
+        sub.add_argument("--keyframes", type=int, default=0, help="Keyframes per animated property")
+        sub.add_argument(
+            "--animated-properties",
+            type=int,
+            default=1,
+            help="Animated transform properties per layer (1-4, default: 1)",
+        )
+        sub.add_argument("--effects", type=int, default=0, help="Slider effects per layer")
+        sub.add_argument("--expressions", type=int, default=0, help="Expressions per layer")
+        sub.add_argument("--repeaters", type=int, default=0, help="Repeaters per shape layer")
+        sub.add_argument(
+            "--parent-depth",
+            type=int,
+            default=0,
+            help="Parent chain depth (0 disables parenting)",
+        )
+        sub.add_argument(
+            "--layer-type",
+            dest="layer_types",
+            action="append",
+            choices=list(LAYER_TYPES),
+            help="Layer types to cycle through (repeatable, default: all)",
+        )
+        sub.add_argument("--seed", type=int, default=0)
+
+    generate_parser = subparsers.add_parser("generate", help="Write a synthetic scene JSON file")
+    generate_parser.add_argument("--layers", type=int, required=True)
+    generate_parser.add_argument("--output", required=True, help="Path for the scene JSON")
+    add_scene_spec_arguments(generate_parser)
+
+    scale_parser = subparsers.add_parser("scale", help="Apply generated scenes of growing size to a bridge")
+    scale_parser.add_argument(
+        "--base-url",
+        default=DEFAULT_BRIDGE_URL,
+        help=f"Bridge URL to measure (default: {DEFAULT_BRIDGE_URL})",
+    )
+    scale_parser.add_argument("--timeout", type=float, default=600.0, help="HTTP timeout per apply (default: 600)")
+    scale_parser.add_argument(
+        "--sizes",
+        default=",".join(str(size) for size in DEFAULT_SIZES),
+        help="Comma-separated layer counts (default: 10,100,1000,5000)",
+    )
+    scale_parser.add_argument(
+        "--mode",
+        choices=["merge", "replace-managed", "clear-all"],
+        default="clear-all",
+        help="apply-scene mode; clear-all empties the bench comp before each size (default)",
+    )
+    scale_parser.add_argument("--validate-only", action="store_true", help="Plan only, do not mutate the project")
+    scale_parser.add_argument(
+        "--bend-factor",
+        type=float,
+        default=DEFAULT_BEND_FACTOR,
+        help=f"Marginal cost growth that counts as a bend (default: {DEFAULT_BEND_FACTOR})",
+    )
+    scale_parser.add_argument("--output", help="Write the measurements as JSON to this path")
+    add_scene_spec_arguments(scale_parser)
+
+    return parser
+
+
+def _scene_spec(args: argparse.Namespace, layers: int) -> SceneSpec:
+    spec = SceneSpec(
+        layers=layers,
+        keyframes=args.keyframes,
+        animated_properties=args.animated_properties,
+        effects=args.effects,
+        expressions=args.expressions,
+        repeaters=args.repeaters,
+        parent_depth=args.parent_depth,
+        seed=args.seed,
+    )
+    if args.layer_types:
+        spec.layer_types = tuple(args.layer_types)
+    spec.validate()
+    return spec
+
+
+def _generate(args: argparse.Namespace) -> int:
+    scene = generate_scene(_scene_spec(args, args.layers))
+    Path(args.output).write_text(json.dumps(scene, indent=2) + "\n", encoding="utf-8")
+    print(f"Wrote {len(scene['layers'])} layers to {args.output}", file=sys.stderr)
+    return 0
+
+
+def _scale(args: argparse.Namespace) -> int:
+    try:
+        sizes = [int(part) for part in args.sizes.split(",") if part.strip()]
+    except ValueError:
+        print("benchmarks error: --sizes must be comma-separated integers.", file=sys.stderr)
+        return 2
+    if not sizes or min(sizes) < 1:
+        print("benchmarks error: --sizes must contain positive layer counts.", file=sys.stderr)
+        return 2
+
+    def progress(point: dict) -> None:
+        print(
+            f"layers={point['layers']:<6} wall={point['wallMs']:.1f}ms "
+            f"perLayer={point['msPerLayer']:.3f}ms ops={point['operationsPlanned']} "
+            f"payload={point['payloadBytes']}B",
+            file=sys.stderr,
+        )
+
+    client = AEClient(base_url=args.base_url, timeout=args.timeout, trace=True)
+    report = run_scale(
+        client,
+        _scene_spec(args, sizes[0]),
+        sizes=sizes,
+        validate_only=args.validate_only,
+        mode=args.mode,
+        bend_factor=args.bend_factor,
+        progress=progress,
+    )
+    bend = report["bend"]
+    if bend is None:
+        print("No bend detected in the measured range.", file=sys.stderr)
+    else:
+        print(
+            f"Bend at {bend['layers']} layers: {bend['marginalMsPerLayer']:.3f}ms per extra layer "
+            f"(was {bend['previousMarginalMsPerLayer']:.3f}ms)",
+            file=sys.stderr,
+        )
+    if args.output:
+        Path(args.output).write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+    return 0
+
+
+def _run(args: argparse.Namespace) -> int:
+    from .suite import run_suite
+
+    if args.scale < 1:
+        print("benchmarks error: --scale must be at least 1.", file=sys.stderr)
+        return 2
+
+    def progress(name: str, stats: dict) -> None:
+        print(
+            f"{name:<36} p50={stats['p50Ms']:.3f}ms p95={stats['p95Ms']:.3f}ms {stats['opsPerSec']:.0f} ops/s",
+            file=sys.stderr,
+        )
+
+    results = run_suite(scale=args.scale, name_filter=args.filter, progress=progress)
+    if args.output:
+        save_report(build_report(results, args.scale), args.output)
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    comparison = compare_reports(
+        load_report(args.baseline),
+        load_report(args.current),
+        threshold=args.threshold,
+        metric=args.metric,
+    )
+    print(format_comparison(comparison))
+    return 1 if comparison["regressions"] else 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    handlers = {"run": _run, "compare": _compare, "generate": _generate, "scale": _scale}
+    try:
+        return handlers[args.command](args)
+    except (ValueError, OSError) as exc:
+        print(f"benchmarks error: {exc}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
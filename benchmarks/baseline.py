@@ -0,0 +1,91 @@
+"""Store benchmark results as JSON baselines and compare them."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+import json
+from pathlib import Path
+import platform
+import sys
+from typing import Any, Dict, List
+
+
+DEFAULT_THRESHOLD = 0.20
+DEFAULT_METRIC = "p50Ms"
+
+
+def build_report(results: Dict[str, Dict[str, float]], scale: int) -> Dict[str, Any]:
+    return {
+        "meta": {
+            "createdAt": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "scale": scale,
+        },
+        "results": results,
+    }
+
+
+def save_report(report: Dict[str, Any], path: str) -> None:
+    Path(path).write_text(json.dumps(report, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_report(path: str) -> Dict[str, Any]:
+    report = json.loads(Path(path).read_text(encoding="utf-8"))
+    if not isinstance(report, dict) or not isinstance(report.get("results"), dict):
+        raise ValueError(f"{path} is not a benchmark report (missing 'results').")
+    return report
+
+
+def compare_reports(
+    baseline: Dict[str, Any],
+    current: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD,
+    metric: str = DEFAULT_METRIC,
+) -> Dict[str, Any]:
+    """Compare ``metric`` per case; a case regresses when it grows by more than ``threshold``."""
+    rows: List[Dict[str, Any]] = []
+    base_results = baseline["results"]
+    current_results = current["results"]
+    for name in sorted(set(base_results) | set(current_results)):
+        base_value = base_results.get(name, {}).get(metric)
+        current_value = current_results.get(name, {}).get(metric)
+        row: Dict[str, Any] = {"name": name, "baseline": base_value, "current": current_value}
+        if base_value is None:
+            row["status"] = "new"
+        elif current_value is None:
+            row["status"] = "missing"
+        else:
+            change = (current_value - base_value) / base_value if base_value > 0 else 0.0
+            row["change"] = change
+            if change > threshold:
+                row["status"] = "regression"
+            elif change < -threshold:
+                row["status"] = "improvement"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return {
+        "metric": metric,
+        "threshold": threshold,
+        "rows": rows,
+        "regressions": [row["name"] for row in rows if row["status"] == "regression"],
+    }
+
+
+def format_comparison(comparison: Dict[str, Any]) -> str:
+    def fmt(value: Any) -> str:
+        return "-" if value is None else f"{value:.3f}"
+
+    lines = [f"{'case':<36} {'baseline':>10} {'current':>10} {'change':>8}  status"]
+    for row in comparison["rows"]:
+        change = row.get("change")
+        change_text = "-" if change is None else f"{change * 100:+.1f}%"
+        lines.append(
+            f"{row['name']:<36} {fmt(row['baseline']):>10} {fmt(row['current']):>10} {change_text:>8}  {row['status']}"
+        )
+    lines.append(
+        f"metric={comparison['metric']} threshold={comparison['threshold'] * 100:.0f}% "
+        f"regressions={len(comparison['regressions'])}"
+    )
+    return "\n".join(lines)
@@ -0,0 +1,171 @@
+"""Generate synthetic scenes that satisfy ``schemas/scene.schema.json``."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import random
+from typing import Any, Dict, List
+
+
+LAYER_TYPES = ("shape", "text", "solid", "null")
+
+ANIMATED_PROPERTIES = (
+    ("ADBE Transform Group.ADBE Position", 2),
+    ("ADBE Transform Group.ADBE Opacity", 1),
+    ("ADBE Transform Group.ADBE Rotate Z", 1),
+    ("ADBE Transform Group.ADBE Scale", 2),
+)
+
+EXPRESSION_TARGETS = (
+    ("ADBE Transform Group.ADBE Rotate Z", "time * 36"),
+    ("ADBE Transform Group.ADBE Opacity", "50 + 50 * Math.sin(time * 2)"),
+    ("ADBE Transform Group.ADBE Position", "wiggle(2, 20)"),
+)
+
+
+@dataclass
+class SceneSpec:
+    """Knobs for :func:`generate_scene`. Counts other than ``layers`` are per layer."""
+
+    layers: int = 10
+    keyframes: int = 0
+    animated_properties: int = 1
+    effects: int = 0
+    expressions: int = 0
+    repeaters: int = 0
+    parent_depth: int = 0
+    layer_types: tuple[str, ...] = LAYER_TYPES
+    comp_name: str = "ae-cli scale bench"
+    width: int = 1920
+    height: int = 1080
+    duration: float = 10.0
+    frame_rate: float = 30.0
+    seed: int = 0
+
+    def validate(self) -> None:
+        if self.layers < 1:
+            raise ValueError("layers must be at least 1.")
+        for name in ("keyframes", "effects", "expressions", "repeaters", "parent_depth"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be 0 or greater.")
+        if not 1 <= self.animated_properties <= len(ANIMATED_PROPERTIES):
+            raise ValueError(f"animated_properties must be between 1 and {len(ANIMATED_PROPERTIES)}.")
+        unknown = [layer_type for layer_type in self.layer_types if layer_type not in LAYER_TYPES]
+        if not self.layer_types or unknown:
+            raise ValueError(f"layer_types must be a non-empty subset of: {', '.join(LAYER_TYPES)}")
+
+
+def _value_for(dimensions: int, rng: random.Random, spread: float, base: float) -> Any:
+    if dimensions == 1:
+        return round(base + rng.uniform(-spread, spread), 3)
+    return [round(base + rng.uniform(-spread, spread), 3) for _ in range(dimensions)]
+
+
+def _keyframes(count: int, dimensions: int, duration: float, rng: random.Random, base: float) -> List[Dict[str, Any]]:
+    step = duration / max(1, count)
+    keyframes: List[Dict[str, Any]] = []
+    for index in range(count):
+        keyframe: Dict[str, Any] = {
+            "time": round(index * step, 4),
+            "value": _value_for(dimensions, rng, spread=base * 0.5, base=base),
+        }
+        if index % 2 == 0:
+            keyframe["outInterp"] = "bezier"
+            keyframe["easeOut"] = [0, 60]
+        else:
+            keyframe["inInterp"] = "bezier"
+            keyframe["easeIn"] = [0, 80]
+        keyframes.append(keyframe)
+    return keyframes
+
+
+def _layer(spec: SceneSpec, index: int, rng: random.Random) -> Dict[str, Any]:
+    layer_type = spec.layer_types[index % len(spec.layer_types)]
+    layer: Dict[str, Any] = {"id": f"scale-{index}", "type": layer_type, "name": f"Scale {index}"}
+
+    if layer_type == "text":
+        layer["text"] = f"Layer {index}"
+    elif layer_type == "solid":
+        layer["width"] = spec.width
+        layer["height"] = spec.height
+        layer["color"] = [rng.randint(0, 255) for _ in range(3)]
+    elif layer_type == "shape":
+        layer["shapeType"] = "rect" if index % 2 else "ellipse"
+        layer["shapeSize"] = [rng.randint(40, 400), rng.randint(40, 400)]
+        layer["shapeFillColor"] = [rng.randint(0, 255) for _ in range(3)]
+
+    layer["transform"] = {
+        "position": [rng.randint(0, spec.width), rng.randint(0, spec.height)],
+        "opacity": 100,
+    }
+
+    if spec.keyframes > 0:
+        bases = {1: 50.0, 2: float(spec.width) / 2}
+        layer["animations"] = [
+            {
+                "propertyPath": property_path,
+                "keyframes": _keyframes(spec.keyframes, dimensions, spec.duration, rng, bases[dimensions]),
+            }
+            for property_path, dimensions in ANIMATED_PROPERTIES[: spec.animated_properties]
+        ]
+
+    if spec.effects > 0:
+        layer["effects"] = [
+            {
+                "matchName": "ADBE Slider Control",
+                "name": f"Slider {effect_index + 1}",
+                "params": [{"propertyIndex": 1, "value": rng.randint(0, 100)}],
+            }
+            for effect_index in range(spec.effects)
+        ]
+
+    if spec.expressions > 0:
+        layer["expressions"] = [
+            {"propertyPath": property_path, "expression": expression}
+            for property_path, expression in (
+                EXPRESSION_TARGETS[expr_index % len(EXPRESSION_TARGETS)] for expr_index in range(spec.expressions)
+            )
+        ]
+
+    if spec.repeaters > 0 and layer_type == "shape":
+        layer["repeaters"] = [
+            {
+                "name": f"Repeater {repeater_index + 1}",
+                "copies": rng.randint(2, 8),
+                "offset": 0,
+                "position": [rng.randint(20, 120), 0],
+                "scale": [100, 100],
+                "rotation": 0,
+            }
+            for repeater_index in range(spec.repeaters)
+        ]
+
+    if spec.parent_depth > 0:
+        chain_position = index % (spec.parent_depth + 1)
+        if chain_position > 0:
+            layer["parentId"] = f"scale-{index - 1}"
+
+    return layer
+
+
+def generate_scene(spec: SceneSpec) -> Dict[str, Any]:
+    """Build a deterministic scene for ``spec``.
+
+    With ``parent_depth=N`` layers form chains of ``N + 1``, each parented to
+    the previous layer in the chain.
+    """
+    spec.validate()
+    rng = random.Random(spec.seed)
+    return {
+        "composition": {
+            "name": spec.comp_name,
+            "width": spec.width,
+            "height": spec.height,
+            "duration": spec.duration,
+            "frameRate": spec.frame_rate,
+            "pixelAspect": 1,
+            "createIfMissing": True,
+            "setActive": True,
+        },
+        "layers": [_layer(spec, index, rng) for index in range(spec.layers)],
+    }
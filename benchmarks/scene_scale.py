@@ -0,0 +1,103 @@
+"""Measure how ``apply-scene`` scales with scene size on a real or stub bridge."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+import json
+import time
+from typing import Any, Callable, Dict, List, Sequence
+
+from ae_cli.client import AEClient
+
+from .scene_generator import SceneSpec, generate_scene
+
+
+DEFAULT_SIZES = (10, 100, 1000, 5000)
+DEFAULT_BEND_FACTOR = 1.5
+
+
+def _count_keyframes(scene: Dict[str, Any]) -> int:
+    return sum(
+        len(animation.get("keyframes", []))
+        for layer in scene["layers"]
+        for animation in layer.get("animations", [])
+    )
+
+
+def measure_scene_apply(
+    client: AEClient,
+    spec: SceneSpec,
+    validate_only: bool = False,
+    mode: str = "clear-all",
+) -> Dict[str, Any]:
+    """Apply one generated scene and return size, payload and timing figures."""
+    scene = generate_scene(spec)
+    payload_bytes = len(
+        json.dumps({"scene": scene, "validateOnly": validate_only, "mode": mode}).encode("utf-8")
+    )
+    timings_before = len(client.timings)
+    started = time.perf_counter()
+    result = client.apply_scene(scene, validate_only=validate_only, mode=mode)
+    wall_ms = (time.perf_counter() - started) * 1000.0
+
+    operations_planned = result.get("operationsPlanned") if isinstance(result, dict) else None
+    point: Dict[str, Any] = {
+        "layers": spec.layers,
+        "keyframes": _count_keyframes(scene),
+        "payloadBytes": payload_bytes,
+        "wallMs": wall_ms,
+        "msPerLayer": wall_ms / spec.layers,
+        "operationsPlanned": operations_planned,
+        "msPerOperation": wall_ms / operations_planned if operations_planned else None,
+    }
+    if len(client.timings) > timings_before:
+        point["server"] = client.timings[-1].get("server", {})
+    return point
+
+
+def find_bend(points: Sequence[Dict[str, Any]], factor: float = DEFAULT_BEND_FACTOR) -> Dict[str, Any] | None:
+    """Return the first size where the marginal cost per layer jumps by more than ``factor``.
+
+    The marginal cost between two runs is ``delta wallMs / delta layers``; a
+    bend means each extra layer costs noticeably more than it did at the
+    previous size.
+    """
+    marginals: List[tuple[Dict[str, Any], float]] = []
+    for previous, current in zip(points, points[1:]):
+        added_layers = current["layers"] - previous["layers"]
+        if added_layers <= 0:
+            continue
+        marginals.append((current, (current["wallMs"] - previous["wallMs"]) / added_layers))
+    for (_, previous_marginal), (point, marginal) in zip(marginals, marginals[1:]):
+        if previous_marginal > 0 and marginal > previous_marginal * factor:
+            return {
+                "layers": point["layers"],
+                "marginalMsPerLayer": marginal,
+                "previousMarginalMsPerLayer": previous_marginal,
+            }
+    return None
+
+
+def run_scale(
+    client: AEClient,
+    spec: SceneSpec,
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    validate_only: bool = False,
+    mode: str = "clear-all",
+    bend_factor: float = DEFAULT_BEND_FACTOR,
+    progress: Callable[[Dict[str, Any]], None] | None = None,
+) -> Dict[str, Any]:
+    """Apply ``spec`` at each layer count in ``sizes`` (ascending) and locate the bend."""
+    points: List[Dict[str, Any]] = []
+    for size in sorted(sizes):
+        point = measure_scene_apply(client, replace(spec, layers=size), validate_only=validate_only, mode=mode)
+        points.append(point)
+        if progress is not None:
+            progress(point)
+    return {
+        "spec": {key: value for key, value in vars(spec).items() if key != "layers"},
+        "validateOnly": validate_only,
+        "mode": mode,
+        "points": points,
+        "bend": find_bend(points, factor=bend_factor),
+    }
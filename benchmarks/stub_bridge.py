@@ -0,0 +1,196 @@
+"""Local stand-in for the CEP bridge HTTP server.
+
+It answers every route the CLI uses with canned payloads shaped like the real
+panel responses, so client-side overhead can be measured without After Effects.
+Like the panel, it accepts gzipped request bodies and gzips responses of at
+least ``gzip_threshold`` bytes when the client sends ``Accept-Encoding: gzip``,
+and it can listen on a Unix domain socket instead of loopback TCP.
+"""
+
+from __future__ import annotations
+
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import os
+import socket
+import socketserver
+import threading
+from typing import Any, Dict, List
+from urllib.parse import urlsplit
+
+
+def _layer_rows(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "id": index,
+            "layerUid": 1000 + index,
+            "name": f"Layer {index}",
+            "type": "shape" if index % 2 else "text",
+            "comment": f"aeSceneId:layer-{index}" if index % 3 == 0 else "",
+        }
+        for index in range(1, count + 1)
+    ]
+
+
+def _property_rows(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "path": f"ADBE Transform Group.Property {index}",
+            "name": f"Property {index}",
+            "value": [index, index * 2],
+            "hasExpression": index % 5 == 0,
+        }
+        for index in range(1, count + 1)
+    ]
+
+
+class _StubBridgeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "_StubBridgeServer | _StubBridgeUnixServer"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        return
+
+    def _accepts_gzip(self) -> bool:
+        codings = (self.headers.get("Accept-Encoding") or "").split(",")
+        return any(coding.split(";")[0].strip() == "gzip" for coding in codings)
+
+    def _send(self, status_code: int, payload: Any) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        threshold = self.server.gzip_threshold
+        compress = threshold is not None and len(body) >= threshold and self._accepts_gzip()
+        if compress:
+            body = gzip.compress(body, compresslevel=1)
+        self.send_response(status_code)
+        self.send_header("Content-Type", "application/json")
+        if compress:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Server-Timing", "host;dur=0.00, total;dur=0.00")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> Any:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length > 0 else b""
+        if not raw:
+            return None
+        if (self.headers.get("Content-Encoding") or "").strip().lower() == "gzip":
+            raw = gzip.decompress(raw)
+        return json.loads(raw)
+
+    def do_GET(self) -> None:  # noqa: N802
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self._send(200, {"status": "ok", "requestEncodings": ["gzip"]})
+            return
+        data = self.server.get_routes.get(path)
+        if data is None:
+            self._send(404, {"status": "error", "message": "Not Found"})
+            return
+        self._send(200, {"status": "success", "data": data})
+
+    def do_POST(self) -> None:  # noqa: N802
+        path = urlsplit(self.path).path
+        try:
+            body = self._read_body()
+        except (ValueError, OSError) as exc:
+            self._send(400, {"status": "error", "message": "Invalid JSON", "error": str(exc)})
+            return
+        if path == "/scene":
+            layers = (body or {}).get("scene", {}).get("layers", [])
+            self._send(
+                200,
+                {
+                    "status": "success",
+                    "data": {
+                        "status": "success",
+                        "layerCount": len(layers),
+                        "operationsPlanned": len(layers),
+                        "validateOnly": bool((body or {}).get("validateOnly")),
+                    },
+                },
+            )
+            return
+        self._send(200, {"status": "success", "data": {"status": "success", "path": path}})
+
+
+class _StubBridgeServer(ThreadingHTTPServer):
+    daemon_threads = True
+    get_routes: Dict[str, Any]
+    gzip_threshold: int | None
+
+    def get_request(self) -> Any:
+        request, client_address = super().get_request()
+        # Node's http server disables Nagle too; without this keep-alive round
+        # trips stall on delayed ACKs.
+        request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        return request, client_address
+
+
+class _StubBridgeUnixServer(socketserver.ThreadingUnixStreamServer):
+    daemon_threads = True
+    get_routes: Dict[str, Any]
+    gzip_threshold: int | None
+
+    def get_request(self) -> Any:
+        request, _ = super().get_request()
+        # BaseHTTPRequestHandler expects a (host, port) client address.
+        return request, ("unix", 0)
+
+
+class StubBridge:
+    """Run the stand-in bridge on an ephemeral localhost port, or on ``unix_socket``.
+
+    Use as a context manager; ``base_url`` is valid inside the block.
+    """
+
+    def __init__(
+        self,
+        layer_count: int = 200,
+        property_count: int = 200,
+        gzip_threshold: int | None = 8192,
+        unix_socket: str | None = None,
+    ):
+        self._unix_socket = unix_socket
+        if unix_socket is not None:
+            self._server = _StubBridgeUnixServer(unix_socket, _StubBridgeHandler)
+        else:
+            self._server = _StubBridgeServer(("127.0.0.1", 0), _StubBridgeHandler)
+        self._server.gzip_threshold = gzip_threshold
+        self._server.get_routes = {
+            "/layers": _layer_rows(layer_count),
+            "/comps": [{"id": index, "name": f"Comp {index}"} for index in range(1, 21)],
+            "/properties": _property_rows(property_count),
+            "/selected-properties": _property_rows(3),
+            "/expression-errors": {"count": 0, "issues": []},
+            "/metrics": {"queue": {"depth": 0, "maxDepth": 64}},
+        }
+        self._thread: threading.Thread | None = None
+
+    @property
+    def base_url(self) -> str:
+        if self._unix_socket is not None:
+            return f"unix://{self._unix_socket}"
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubBridge":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        if self._unix_socket is not None and os.path.exists(self._unix_socket):
+            os.unlink(self._unix_socket)
+
+    def __enter__(self) -> "StubBridge":
+        return self.start()
+
+    def __exit__(self, *_exc: Any) -> None:
+        self.stop()
@@ -0,0 +1,224 @@
+"""Client-side benchmark cases for ae-cli.
+
+Every case runs against :class:`benchmarks.stub_bridge.StubBridge`, so the
+numbers cover AEClient, JSON handling and CLI dispatch, not After Effects.
+"""
+
+from __future__ import annotations
+
+import contextlib
+from dataclasses import dataclass
+import io
+import json
+import os
+import socket
+import statistics
+import tempfile
+import time
+from typing import Any, Callable, Dict, List
+
+import requests
+
+from ae_cli.cli_parser import build_parser
+from ae_cli.cli_runner import run_command
+from ae_cli.client import AEClient, _format_bridge_error_message
+
+from .scene_generator import SceneSpec, generate_scene
+from .stub_bridge import StubBridge
+
+
+@dataclass
+class BenchmarkCase:
+    name: str
+    func: Callable[[], Any]
+    iterations: int
+
+
+def measure(func: Callable[[], Any], iterations: int, warmup: int = 3) -> Dict[str, float]:
+    """Time ``func`` and return latency percentiles (ms) and throughput."""
+    for _ in range(warmup):
+        func()
+    samples: List[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - call_started) * 1000.0)
+    total_seconds = time.perf_counter() - started
+    samples.sort()
+    p95_index = min(len(samples) - 1, max(0, int(round(len(samples) * 0.95)) - 1))
+    return {
+        "iterations": iterations,
+        "meanMs": statistics.fmean(samples),
+        "p50Ms": statistics.median(samples),
+        "p95Ms": samples[p95_index],
+        "minMs": samples[0],
+        "opsPerSec": iterations / total_seconds if total_seconds > 0 else 0.0,
+    }
+
+
+def _validation_error_payload(count: int) -> Dict[str, Any]:
+    return {
+        "status": "error",
+        "message": "Scene validation failed.",
+        "errors": [
+            {
+                "path": f"layers[{index}].transform.position",
+                "message": "Expected numeric array",
+                "expected": [0, 0],
+                "actual": {"x": index, "note": "x" * 200},
+            }
+            for index in range(count)
+        ],
+    }
+
+
+def _client_cases(client: AEClient, scale: int) -> List[BenchmarkCase]:
+    reads = 200 * scale
+    writes = 200 * scale
+    return [
+        BenchmarkCase("client.health", client.health, reads),
+        BenchmarkCase("client.metrics", client.metrics, reads),
+        BenchmarkCase("client.get_layers", client.get_layers, reads),
+        BenchmarkCase(
+            "client.get_layers.filtered",
+            lambda: client.get_layers(layer_types=["text", "shape"], name_prefix="Layer", columns=True),
+            reads,
+        ),
+        BenchmarkCase("client.list_comps", client.list_comps, reads),
+        BenchmarkCase("client.get_properties", lambda: client.get_properties(layer_id=1, max_depth=3), reads),
+        BenchmarkCase("client.get_selected_properties", client.get_selected_properties, reads),
+        BenchmarkCase("client.get_expression_errors", client.get_expression_errors, reads),
+        BenchmarkCase(
+            "client.create_comp",
+            lambda: client.create_comp(name="Main", width=1920, height=1080, duration=8, frame_rate=30),
+            writes,
+        ),
+        BenchmarkCase("client.set_active_comp", lambda: client.set_active_comp(comp_name="Main"), writes),
+        BenchmarkCase(
+            "client.set_expression",
+            lambda: client.set_expression("ADBE Transform Group.ADBE Position", "wiggle(2, 30)", layer_id=1),
+            writes,
+        ),
+        BenchmarkCase(
+            "client.set_property_value",
+            lambda: client.set_property_value("ADBE Transform Group.ADBE Opacity", 50, layer_id=1),
+            writes,
+        ),
+        BenchmarkCase(
+            "client.set_keyframe",
+            lambda: client.set_keyframe(
+                "ADBE Transform Group.ADBE Position",
+                1.0,
+                [960, 540],
+                layer_id=1,
+                in_interp="bezier",
+                ease_in=[0, 80],
+            ),
+            writes,
+        ),
+        BenchmarkCase(
+            "client.add_essential_property",
+            lambda: client.add_essential_property("ADBE Transform Group.ADBE Opacity", layer_id=1),
+            writes,
+        ),
+        BenchmarkCase("client.add_effect", lambda: client.add_effect("ADBE Slider Control", layer_id=1), writes),
+        BenchmarkCase(
+            "client.add_shape_repeater",
+            lambda: client.add_shape_repeater(layer_id=1, copies=5, position=[50, 0]),
+            writes,
+        ),
+        BenchmarkCase("client.add_layer", lambda: client.add_layer("text", name="T", text="Hello"), writes),
+        BenchmarkCase("client.set_in_out_point", lambda: client.set_in_out_point(layer_id=1, in_point=0, out_point=4), writes),
+        BenchmarkCase("client.move_layer_time", lambda: client.move_layer_time(0.5, layer_id=1), writes),
+        BenchmarkCase("client.set_cti", lambda: client.set_cti(1.0), writes),
+        BenchmarkCase("client.set_work_area", lambda: client.set_work_area(0, 4), writes),
+        BenchmarkCase("client.parent_layer", lambda: client.parent_layer(2, parent_layer_id=1), writes),
+        BenchmarkCase("client.precompose", lambda: client.precompose([1, 2, 3], "Pre"), writes),
+        BenchmarkCase("client.duplicate_layer", lambda: client.duplicate_layer(1), writes),
+        BenchmarkCase("client.move_layer_order", lambda: client.move_layer_order(2, to_top=True), writes),
+        BenchmarkCase("client.delete_layer", lambda: client.delete_layer(1), writes),
+        BenchmarkCase("client.delete_comp", lambda: client.delete_comp(comp_name="Main"), writes),
+    ]
+
+
+def _cli_cases(base_url: str, scale: int) -> List[BenchmarkCase]:
+    parser = build_parser()
+
+    def dispatch(argv: List[str]) -> Callable[[], Any]:
+        def run() -> None:
+            args = parser.parse_args(["--base-url", base_url, "--timeout", "10", *argv])
+            with contextlib.redirect_stdout(io.StringIO()):
+                code = run_command(args)
+            if code != 0:
+                raise RuntimeError(f"run_command failed for {argv}")
+
+        return run
+
+    return [
+        BenchmarkCase("cli.dispatch.health", dispatch(["health"]), 100 * scale),
+        BenchmarkCase("cli.dispatch.layers", dispatch(["layers", "--type", "text"]), 100 * scale),
+        BenchmarkCase("cli.dispatch.set_cti", dispatch(["set-cti", "--time", "1"]), 100 * scale),
+        BenchmarkCase("cli.parse_args", lambda: parser.parse_args(["layers", "--type", "text"]), 1000 * scale),
+    ]
+
+
+def _json_cases(client: AEClient, scale: int) -> List[BenchmarkCase]:
+    uncompressed = AEClient(base_url=client.base_url, timeout=client.timeout, gzip_threshold=None)
+    errors_large = _validation_error_payload(10000)
+    errors_small = _validation_error_payload(10)
+    scene_1k = generate_scene(SceneSpec(layers=1000, keyframes=4))
+    scene_5k = generate_scene(SceneSpec(layers=5000, keyframes=4))
+    return [
+        BenchmarkCase("errors.format.10", lambda: _format_bridge_error_message(errors_small), 1000 * scale),
+        BenchmarkCase("errors.format.10000", lambda: _format_bridge_error_message(errors_large), 100 * scale),
+        BenchmarkCase("scene.serialize.1000", lambda: json.dumps(scene_1k), 20 * scale),
+        BenchmarkCase("scene.serialize.5000", lambda: json.dumps(scene_5k), 5 * scale),
+        BenchmarkCase(
+            "client.apply_scene.1000",
+            lambda: client.apply_scene(scene_1k, validate_only=True),
+            20 * scale,
+        ),
+        BenchmarkCase(
+            "client.apply_scene.1000.uncompressed",
+            lambda: uncompressed.apply_scene(scene_1k, validate_only=True),
+            20 * scale,
+        ),
+    ]
+
+
+def _transport_cases(tcp_client: AEClient, unix_client: AEClient, scale: int) -> List[BenchmarkCase]:
+    round_trips = 500 * scale
+    return [
+        BenchmarkCase("transport.tcp.health", tcp_client.health, round_trips),
+        BenchmarkCase("transport.unix.health", unix_client.health, round_trips),
+        BenchmarkCase("transport.tcp.get_layers", tcp_client.get_layers, round_trips),
+        BenchmarkCase("transport.unix.get_layers", unix_client.get_layers, round_trips),
+    ]
+
+
+def run_suite(
+    scale: int = 1,
+    name_filter: str | None = None,
+    progress: Callable[[str, Dict[str, float]], None] | None = None,
+) -> Dict[str, Dict[str, float]]:
+    """Run every benchmark case (optionally only names containing ``name_filter``)."""
+    results: Dict[str, Dict[str, float]] = {}
+    with contextlib.ExitStack() as stack:
+        bridge = stack.enter_context(StubBridge())
+        client = AEClient(base_url=bridge.base_url, timeout=10.0)
+        cases = _client_cases(client, scale) + _cli_cases(bridge.base_url, scale) + _json_cases(client, scale)
+        if hasattr(socket, "AF_UNIX"):
+            socket_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix="ae-bench-"))
+            unix_bridge = stack.enter_context(StubBridge(unix_socket=os.path.join(socket_dir, "bridge.sock")))
+            tcp_client = AEClient(base_url=bridge.base_url, timeout=10.0, session=stack.enter_context(requests.Session()))
+            unix_client = AEClient(base_url=unix_bridge.base_url, timeout=10.0)
+            cases += _transport_cases(tcp_client, unix_client, scale)
+        for case in cases:
+            if name_filter and name_filter not in case.name:
+                continue
+            stats = measure(case.func, case.iterations)
+            results[case.name] = stats
+            if progress is not None:
+                progress(case.name, stats)
+    return results
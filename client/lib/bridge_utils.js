@@ -1,10 +1,144 @@
 const ENCODE_PREFIX = '__ENC__';
+const HOST_TIMING_PREFIX = '__TIME__';
+const SERVER_TIMING_PHASES = ['inflate', 'parse', 'queue', 'eval', 'load', 'host', 'decode', 'encode', 'gzip', 'saved'];
+const DEFAULT_GZIP_THRESHOLD = 8192;
+const GZIP_THRESHOLD = resolveGzipThreshold();
+const FAST_APPLY_PREFIX = 'aeFastApply(function () { return ';
+const FAST_APPLY_BASELINE_WEIGHT = 0.2;
+
+// Moving average of normal (not fast) host ms per unit, keyed by host function.
+const fastApplyBaselines = new Map();
+
+// Timings of the host call whose callback is currently running. Callbacks run
+// synchronously, so sendJson() inside them can attach these to the response.
+let activeHostTiming = null;
+
+// Bodies of at least this many bytes are gzipped; 0 disables compression.
+function resolveGzipThreshold() {
+    const raw = typeof process !== 'undefined' && process.env ? process.env.AE_BRIDGE_GZIP_THRESHOLD : undefined;
+    const parsed = Number(raw);
+    if (raw !== undefined && Number.isInteger(parsed) && parsed >= 0) {
+        return parsed;
+    }
+    return DEFAULT_GZIP_THRESHOLD;
+}
+
+function acceptsGzip(req) {
+    const header = req && req.headers ? req.headers['accept-encoding'] : undefined;
+    if (typeof header !== 'string') {
+        return false;
+    }
+    return header.split(',').some((entry) => {
+        const [coding, ...params] = entry.trim().split(';').map((part) => part.trim());
+        if (coding !== 'gzip' && coding !== '*') {
+            return false;
+        }
+        return !params.some((param) => /^q=0(\.0*)?$/.test(param));
+    });
+}
+
+function splitHostTiming(result) {
+    if (typeof result !== 'string' || !result.startsWith(HOST_TIMING_PREFIX)) {
+        return { result, loadMs: null, hostMs: null };
+    }
+    const separatorIndex = result.indexOf(';');
+    if (separatorIndex < 0) {
+        return { result, loadMs: null, hostMs: null };
+    }
+    const [loadMicros, runMicros] = result.slice(HOST_TIMING_PREFIX.length, separatorIndex).split(',').map(Number);
+    return {
+        result: result.slice(separatorIndex + 1),
+        loadMs: Number.isFinite(loadMicros) ? loadMicros / 1000 : null,
+        hostMs: Number.isFinite(runMicros) ? runMicros / 1000 : null,
+    };
+}
+
+function withHostTiming(timing, callback) {
+    activeHostTiming = timing;
+    try {
+        callback();
+    } finally {
+        activeHostTiming = null;
+    }
+}
+
+// Replays one /batch operation's callback against its own host time. The
+// operation ran under the transaction's fastApply flag, whatever its body said.
+// The enclosing request's timing is restored afterwards.
+function withReplayedHostTiming(hostMs, fastApply, callback) {
+    const outer = activeHostTiming;
+    activeHostTiming = typeof hostMs === 'number' ? { hostMs, replayFastApply: fastApply } : null;
+    try {
+        callback();
+    } finally {
+        activeHostTiming = outer;
+    }
+}
+
+function withFastApply(script, fastApply) {
+    return fastApply ? `${FAST_APPLY_PREFIX}${script}; })` : script;
+}
+
+function validateFastApply(fastApply) {
+    if (fastApply !== undefined && typeof fastApply !== 'boolean') {
+        return 'fastApply must be a boolean when specified';
+    }
+    return null;
+}
+
+// Runs inside a host callback. Normal calls update the per-unit baseline of
+// their host function; fast calls report baseline * units - hostMs as the
+// "saved" Server-Timing phase once a baseline exists.
+function recordFastApplyTiming(contextLabel, fastApply, units) {
+    if (!activeHostTiming || typeof activeHostTiming.hostMs !== 'number' || !(units > 0)) {
+        return;
+    }
+    const key = contextLabel.replace(/\(.*$/, '');
+    const baseline = fastApplyBaselines.get(key);
+    if (fastApply || activeHostTiming.replayFastApply === true) {
+        if (baseline !== undefined) {
+            activeHostTiming.savedMs = baseline * units - activeHostTiming.hostMs;
+        }
+        return;
+    }
+    const perUnit = activeHostTiming.hostMs / units;
+    fastApplyBaselines.set(
+        key,
+        baseline === undefined ? perUnit : baseline + FAST_APPLY_BASELINE_WEIGHT * (perUnit - baseline),
+    );
+}
+
+function beginRequestTiming(req, res) {
+    res.bridgeTiming = { receivedAt: performance.now(), inflateMs: null, parseMs: null };
+    res.bridgeAcceptsGzip = acceptsGzip(req);
+}
+
+function buildServerTimingHeader(res, encodeMs, gzipMs) {
+    const durations = { ...(activeHostTiming || {}), encodeMs };
+    if (gzipMs !== null) {
+        durations.gzipMs = gzipMs;
+    }
+    if (res.bridgeTiming && res.bridgeTiming.inflateMs !== null) {
+        durations.inflateMs = res.bridgeTiming.inflateMs;
+    }
+    if (res.bridgeTiming && res.bridgeTiming.parseMs !== null) {
+        durations.parseMs = res.bridgeTiming.parseMs;
+    }
+    const entries = SERVER_TIMING_PHASES
+        .filter((phase) => typeof durations[`${phase}Ms`] === 'number')
+        .map((phase) => `${phase};dur=${durations[`${phase}Ms`].toFixed(2)}`);
+    if (res.bridgeTiming) {
+        entries.push(`total;dur=${(performance.now() - res.bridgeTiming.receivedAt).toFixed(2)}`);
+    }
+    return entries.join(', ');
+}
 
 function parseBridgeResult(result) {
     if (typeof result !== 'string' || result.length === 0) {
         throw new Error('ExtendScript returned an empty result.');
     }
 
+    const decodeStartedAt = performance.now();
     let decoded = result;
     if (result.startsWith(ENCODE_PREFIX)) {
         const encodedPayload = result.slice(ENCODE_PREFIX.length);
@@ -15,12 +149,31 @@ function parseBridgeResult(result) {
         }
     }
 
-    return JSON.parse(decoded);
+    const parsed = JSON.parse(decoded);
+    if (activeHostTiming) {
+        activeHostTiming.decodeMs = performance.now() - decodeStartedAt;
+    }
+    return parsed;
 }
 
 function sendJson(res, statusCode, payload) {
+    const encodeStartedAt = performance.now();
+    let body = JSON.stringify(payload);
+    const encodeMs = performance.now() - encodeStartedAt;
+    let gzipMs = null;
+    if (zlib && res.bridgeAcceptsGzip && GZIP_THRESHOLD > 0 && Buffer.byteLength(body) >= GZIP_THRESHOLD) {
+        const gzipStartedAt = performance.now();
+        body = zlib.gzipSync(body, { level: zlib.constants.Z_BEST_SPEED });
+        gzipMs = performance.now() - gzipStartedAt;
+        res.setHeader('Content-Encoding', 'gzip');
+        res.setHeader('Vary', 'Accept-Encoding');
+    }
+    const serverTiming = buildServerTimingHeader(res, encodeMs, gzipMs);
+    if (serverTiming.length > 0) {
+        res.setHeader('Server-Timing', serverTiming);
+    }
     res.writeHead(statusCode);
-    res.end(JSON.stringify(payload));
+    res.end(body);
 }
 
 function sendBadRequest(res, message, error) {
@@ -40,14 +193,41 @@ function sendBridgeParseError(res, result, error) {
     });
 }
 
+function decodeRequestBody(req, res, raw) {
+    const encoding = String(req.headers['content-encoding'] || 'identity').trim().toLowerCase();
+    if (encoding === 'identity') {
+        return raw.toString();
+    }
+    if (encoding !== 'gzip' || !zlib) {
+        throw new Error(`Unsupported Content-Encoding: ${encoding}`);
+    }
+    const inflateStartedAt = performance.now();
+    const inflated = zlib.gunzipSync(raw).toString();
+    if (res.bridgeTiming) {
+        res.bridgeTiming.inflateMs = performance.now() - inflateStartedAt;
+    }
+    return inflated;
+}
+
 function readJsonBody(req, res, onParsed) {
-    let body = '';
+    const chunks = [];
     req.on('data', (chunk) => {
-        body += chunk.toString();
+        chunks.push(chunk);
     });
     req.on('end', () => {
+        let body;
+        try {
+            body = decodeRequestBody(req, res, Buffer.concat(chunks));
+        } catch (e) {
+            sendJson(res, 415, { status: 'error', message: 'Could not decode request body', error: e.toString() });
+            return;
+        }
         try {
             const parsed = JSON.parse(body);
+            if (res.bridgeTiming) {
+                res.bridgeTiming.parseMs = performance.now() - res.bridgeTiming.receivedAt
+                    - (res.bridgeTiming.inflateMs || 0);
+            }
             onParsed(parsed);
         } catch (e) {
             sendBadRequest(res, 'Invalid JSON', e);
@@ -10,7 +10,7 @@ function handleCorsPreflight(req, res) {
     res.writeHead(204, {
         'Access-Control-Allow-Origin': '*',
         'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
-        'Access-Control-Allow-Headers': 'Content-Type',
+        'Access-Control-Allow-Headers': 'Content-Type, Content-Encoding',
     });
     res.end();
     return true;
@@ -30,11 +30,16 @@ function handleBridgeDataCall(script, res, contextLabel) {
     });
 }
 
-function handleBridgeMutationCall(script, res, contextLabel, fallbackMessage) {
-    log(`Calling ExtendScript: ${contextLabel}`);
-    evalHostScript(script, (result) => {
+// options.fastApply runs the call through aeFastApply(); options.units sizes the
+// call for the fast-apply baseline (see recordFastApplyTiming).
+function handleBridgeMutationCall(script, res, contextLabel, fallbackMessage, options = {}) {
+    log(`Calling ExtendScript: ${contextLabel}${options.fastApply ? ' [fast]' : ''}`);
+    evalHostScript(withFastApply(script, options.fastApply), (result) => {
         try {
             const parsedResult = parseBridgeResult(result);
+            if (options.units !== undefined && !(parsedResult && parsedResult.status === 'error')) {
+                recordFastApplyTiming(contextLabel, options.fastApply === true, options.units);
+            }
             if (parsedResult && parsedResult.status === 'error') {
                 const payload = {
                     status: 'error',
@@ -49,6 +54,9 @@ function handleBridgeMutationCall(script, res, contextLabel, fallbackMessage) {
             }
             sendJson(res, 200, { status: 'success', data: parsedResult });
             log(`${contextLabel} successful.`);
+            if (typeof notifyBridgeMutation === 'function') {
+                notifyBridgeMutation(contextLabel, parsedResult);
+            }
         } catch (e) {
             sendBridgeParseError(res, result, e);
             log(`${contextLabel} failed: ${e.toString()}`);
@@ -56,11 +64,28 @@ function handleBridgeMutationCall(script, res, contextLabel, fallbackMessage) {
     });
 }
 
-function normalizeLayerSelector(layerIdRaw, layerNameRaw) {
+// Uids are strings on the wire; a number here is usually a misplaced layerId.
+function isLayerUid(value) {
+    return typeof value === 'string' && value.trim().length > 0;
+}
+
+// Host functions take a layer index or a { uid } object in the same argument.
+function layerUidRefLiteral(layerUid) {
+    return `{ uid: ${toExtendScriptStringLiteral(String(layerUid).trim())} }`;
+}
+
+function normalizeLayerSelector(layerIdRaw, layerNameRaw, layerUidRaw) {
     const hasLayerId = layerIdRaw !== undefined && layerIdRaw !== null;
     const hasLayerName = typeof layerNameRaw === 'string' && layerNameRaw.trim().length > 0;
-    if ((hasLayerId && hasLayerName) || (!hasLayerId && !hasLayerName)) {
-        return { ok: false, error: 'Provide exactly one of layerId or layerName' };
+    const hasLayerUid = layerUidRaw !== undefined && layerUidRaw !== null;
+    if ([hasLayerId, hasLayerName, hasLayerUid].filter(Boolean).length !== 1) {
+        return { ok: false, error: 'Provide exactly one of layerId, layerUid or layerName' };
+    }
+    if (hasLayerUid) {
+        if (!isLayerUid(layerUidRaw)) {
+            return { ok: false, error: 'layerUid must be a non-empty string when specified' };
+        }
+        return { ok: true, layerIdLiteral: layerUidRefLiteral(layerUidRaw), layerNameLiteral: 'null' };
     }
     if (hasLayerId) {
         if (typeof layerIdRaw !== 'number' || !Number.isInteger(layerIdRaw) || layerIdRaw <= 0) {
@@ -75,17 +100,166 @@ function normalizeLayerSelector(layerIdRaw, layerNameRaw) {
     };
 }
 
+// For endpoints that address a layer only by index or uid (e.g. parentLayerId / parentLayerUid).
+function normalizeLayerRef(layerIdRaw, layerUidRaw, idLabel, uidLabel) {
+    const hasLayerId = layerIdRaw !== undefined && layerIdRaw !== null;
+    const hasLayerUid = layerUidRaw !== undefined && layerUidRaw !== null;
+    if (hasLayerId && hasLayerUid) {
+        return { ok: false, error: `Provide only one of ${idLabel} or ${uidLabel}` };
+    }
+    if (hasLayerUid) {
+        if (!isLayerUid(layerUidRaw)) {
+            return { ok: false, error: `${uidLabel} must be a non-empty string` };
+        }
+        return { ok: true, present: true, literal: layerUidRefLiteral(layerUidRaw) };
+    }
+    if (hasLayerId) {
+        if (typeof layerIdRaw !== 'number' || !Number.isInteger(layerIdRaw) || layerIdRaw <= 0) {
+            return { ok: false, error: `${idLabel} must be a positive integer` };
+        }
+        return { ok: true, present: true, literal: String(layerIdRaw) };
+    }
+    return { ok: true, present: false, literal: 'null' };
+}
+
+// requestEncodings tells clients which request Content-Encodings are decoded.
 function handleHealth(res) {
-    sendJson(res, 200, { status: 'ok' });
+    sendJson(res, 200, { status: 'ok', requestEncodings: zlib ? ['gzip'] : [] });
     log('Health check responded with ok.');
 }
 
-function handleGetLayers(res) {
-    handleBridgeDataCall('getLayers()', res, 'getLayers()');
+function handleMetrics(res) {
+    const queue = typeof getSchedulerMetrics === 'function' ? getSchedulerMetrics() : null;
+    sendJson(res, 200, { status: 'success', data: { queue } });
 }
 
-function handleGetComps(res) {
-    handleBridgeDataCall('listComps()', res, 'listComps()');
+const LAYER_TYPE_FILTERS = [
+    'text', 'shape', 'precomp', 'video', 'audio', 'solid', 'avlayer', 'camera', 'light', 'unknown',
+];
+
+function parsePositiveIntParam(searchParams, name) {
+    const raw = searchParams.get(name);
+    if (raw === null) {
+        return { ok: true, value: undefined };
+    }
+    const parsed = Number(raw);
+    if (!Number.isInteger(parsed) || parsed <= 0) {
+        return { ok: false, error: `${name} must be a positive integer` };
+    }
+    return { ok: true, value: parsed };
+}
+
+function handleGetLayers(searchParams, res) {
+    const types = [];
+    searchParams.getAll('type').forEach((raw) => {
+        raw.split(',').forEach((part) => {
+            const normalized = part.trim().toLowerCase();
+            if (normalized.length > 0) types.push(normalized);
+        });
+    });
+    const invalidType = types.find((type) => !LAYER_TYPE_FILTERS.includes(type));
+    if (invalidType !== undefined) {
+        sendBadRequest(res, `type must be one of: ${LAYER_TYPE_FILTERS.join(', ')}`);
+        log(`getLayers failed: invalid type "${invalidType}"`);
+        return;
+    }
+
+    const namePrefix = searchParams.get('namePrefix');
+    const nameRegex = searchParams.get('nameRegex');
+    if (nameRegex !== null) {
+        try {
+            new RegExp(nameRegex);
+        } catch (e) {
+            sendBadRequest(res, 'nameRegex must be a valid regular expression', e);
+            log('getLayers failed: invalid nameRegex');
+            return;
+        }
+    }
+
+    const sceneManagedParam = searchParams.get('sceneManaged');
+    if (sceneManagedParam !== null && !['true', 'false'].includes(sceneManagedParam)) {
+        sendBadRequest(res, 'sceneManaged must be true or false');
+        log('getLayers failed: invalid sceneManaged');
+        return;
+    }
+
+    const startIndex = parsePositiveIntParam(searchParams, 'startIndex');
+    const endIndex = parsePositiveIntParam(searchParams, 'endIndex');
+    const indexError = !startIndex.ok ? startIndex.error : (!endIndex.ok ? endIndex.error : null);
+    if (indexError) {
+        sendBadRequest(res, indexError);
+        log(`getLayers failed: ${indexError}`);
+        return;
+    }
+    if (startIndex.value !== undefined && endIndex.value !== undefined && endIndex.value < startIndex.value) {
+        sendBadRequest(res, 'endIndex must be greater than or equal to startIndex');
+        log('getLayers failed: invalid index range');
+        return;
+    }
+
+    const format = searchParams.get('format');
+    if (format !== null && !['objects', 'columns'].includes(format)) {
+        sendBadRequest(res, 'format must be one of: objects, columns');
+        log('getLayers failed: invalid format');
+        return;
+    }
+
+    const options = {};
+    if (types.length > 0) options.types = types;
+    if (namePrefix !== null && namePrefix !== '') options.namePrefix = namePrefix;
+    if (nameRegex !== null && nameRegex !== '') options.nameRegex = nameRegex;
+    if (sceneManagedParam !== null) options.sceneManaged = sceneManagedParam === 'true';
+    if (startIndex.value !== undefined) options.startIndex = startIndex.value;
+    if (endIndex.value !== undefined) options.endIndex = endIndex.value;
+    if (format !== null) options.format = format;
+
+    const optionsLiteral = Object.keys(options).length > 0
+        ? toExtendScriptStringLiteral(JSON.stringify(options))
+        : 'null';
+    const optionsLabel = optionsLiteral === 'null' ? 'null' : 'custom';
+    handleBridgeDataCall(`getLayers(${optionsLiteral})`, res, `getLayers(options=${optionsLabel})`);
+}
+
+function handleGetComps(searchParams, res) {
+    const nameRegex = searchParams.get('nameRegex');
+    if (nameRegex !== null) {
+        try {
+            new RegExp(nameRegex);
+        } catch (e) {
+            sendBadRequest(res, 'nameRegex must be a valid regular expression', e);
+            log('listComps failed: invalid nameRegex');
+            return;
+        }
+    }
+
+    const offsetRaw = searchParams.get('offset');
+    const offset = offsetRaw === null ? undefined : Number(offsetRaw);
+    if (offset !== undefined && (!Number.isInteger(offset) || offset < 0)) {
+        sendBadRequest(res, 'offset must be a non-negative integer');
+        log('listComps failed: invalid offset');
+        return;
+    }
+    const limit = parsePositiveIntParam(searchParams, 'limit');
+    if (!limit.ok) {
+        sendBadRequest(res, limit.error);
+        log(`listComps failed: ${limit.error}`);
+        return;
+    }
+
+    const options = {};
+    const namePrefix = searchParams.get('namePrefix');
+    const folder = searchParams.get('folder');
+    if (namePrefix !== null && namePrefix !== '') options.namePrefix = namePrefix;
+    if (nameRegex !== null && nameRegex !== '') options.nameRegex = nameRegex;
+    if (folder !== null) options.folder = folder;
+    if (offset !== undefined) options.offset = offset;
+    if (limit.value !== undefined) options.limit = limit.value;
+
+    const optionsLiteral = Object.keys(options).length > 0
+        ? toExtendScriptStringLiteral(JSON.stringify(options))
+        : 'null';
+    const optionsLabel = optionsLiteral === 'null' ? 'null' : 'custom';
+    handleBridgeDataCall(`listComps(${optionsLiteral})`, res, `listComps(options=${optionsLabel})`);
 }
 
 function handleGetSelectedProperties(res) {
@@ -166,10 +340,12 @@ function handleSetActiveComp(req, res) {
 function handleGetProperties(searchParams, res) {
     const layerIdParam = searchParams.get('layerId');
     const layerNameParam = searchParams.get('layerName');
+    const layerUidParam = searchParams.get('layerUid');
     const hasLayerId = layerIdParam !== null && layerIdParam !== '';
     const hasLayerName = layerNameParam !== null && layerNameParam.trim() !== '';
-    if ((hasLayerId && hasLayerName) || (!hasLayerId && !hasLayerName)) {
-        sendBadRequest(res, 'Provide exactly one of layerId or layerName');
+    const hasLayerUid = layerUidParam !== null && layerUidParam.trim() !== '';
+    if ([hasLayerId, hasLayerName, hasLayerUid].filter(Boolean).length !== 1) {
+        sendBadRequest(res, 'Provide exactly one of layerId, layerUid or layerName');
         log('getProperties failed: invalid layer selector');
         return;
     }
@@ -232,20 +408,64 @@ function handleGetProperties(searchParams, res) {
         ? toExtendScriptStringLiteral(JSON.stringify(options))
         : 'null';
     const optionsLabel = optionsLiteral === 'null' ? 'null' : 'custom';
-    const layerIdLiteral = layerId === null ? 'null' : String(layerId);
+    let layerIdLiteral = layerId === null ? 'null' : String(layerId);
+    if (hasLayerUid) layerIdLiteral = layerUidRefLiteral(layerUidParam);
     const script = `getProperties(${layerIdLiteral}, ${optionsLiteral})`;
 
     handleBridgeDataCall(script, res, `getProperties(${layerIdLiteral}, options=${optionsLabel})`);
 }
 
+function handleGetKeyframes(searchParams, res) {
+    const layerIds = [];
+    let invalidLayerId = null;
+    searchParams.getAll('layerId').forEach((raw) => {
+        raw.split(',').forEach((part) => {
+            const trimmed = part.trim();
+            if (trimmed.length === 0) return;
+            const parsed = Number(trimmed);
+            if (!Number.isInteger(parsed) || parsed <= 0) {
+                invalidLayerId = trimmed;
+                return;
+            }
+            layerIds.push(parsed);
+        });
+    });
+    if (invalidLayerId !== null) {
+        sendBadRequest(res, 'layerId must be a positive integer');
+        log(`getKeyframes failed: invalid layerId "${invalidLayerId}"`);
+        return;
+    }
+    const layerNames = searchParams.getAll('layerName').map((name) => name.trim()).filter(Boolean);
+    const layerUids = [];
+    searchParams.getAll('layerUid').forEach((raw) => {
+        raw.split(',').map((part) => part.trim()).filter(Boolean).forEach((uid) => layerUids.push(uid));
+    });
+    const layerCount = layerIds.length + layerNames.length + layerUids.length;
+    if (layerCount === 0) {
+        sendBadRequest(res, 'Provide at least one layerId, layerUid or layerName');
+        log('getKeyframes failed: missing layer selector');
+        return;
+    }
+    const propertyPaths = searchParams.getAll('propertyPath').filter(Boolean);
+
+    const optionsLiteral = toExtendScriptStringLiteral(JSON.stringify({
+        layerIds, layerUids, layerNames, propertyPaths,
+    }));
+    handleBridgeDataCall(
+        `getKeyframes(${optionsLiteral})`,
+        res,
+        `getKeyframes(layers=${layerCount}, properties=${propertyPaths.length || 'animated'})`,
+    );
+}
+
 function handleSetExpression(req, res) {
-    readJsonBody(req, res, ({ layerId, layerName, propertyPath, expression }) => {
+    readJsonBody(req, res, ({ layerId, layerName, layerUid, propertyPath, expression }) => {
         if (!propertyPath || expression === undefined) {
             sendBadRequest(res, 'Missing parameters');
             log('setExpression failed: Missing parameters');
             return;
         }
-        const selector = normalizeLayerSelector(layerId, layerName);
+        const selector = normalizeLayerSelector(layerId, layerName, layerUid);
         if (!selector.ok) {
             sendBadRequest(res, selector.error);
             log(`setExpression failed: ${selector.error}`);
@@ -266,6 +486,9 @@ function handleSetExpression(req, res) {
             if (result === 'success') {
                 sendJson(res, 200, { status: 'success', message: 'Expression set successfully' });
                 log('setExpression successful.');
+                if (typeof notifyBridgeMutation === 'function') {
+                    notifyBridgeMutation('setExpression()', { propertyPath });
+                }
                 return;
             }
             sendJson(res, 500, { status: 'error', message: result });
@@ -275,13 +498,13 @@ function handleSetExpression(req, res) {
 }
 
 function handleSetPropertyValue(req, res) {
-    readJsonBody(req, res, ({ layerId, layerName, propertyPath, value }) => {
+    readJsonBody(req, res, ({ layerId, layerName, layerUid, propertyPath, value }) => {
         if (!propertyPath || value === undefined) {
             sendBadRequest(res, 'Missing parameters');
             log('setPropertyValue failed: Missing parameters');
             return;
         }
-        const selector = normalizeLayerSelector(layerId, layerName);
+        const selector = normalizeLayerSelector(layerId, layerName, layerUid);
         if (!selector.ok) {
             sendBadRequest(res, selector.error);
             log(`setPropertyValue failed: ${selector.error}`);
@@ -294,14 +517,61 @@ function handleSetPropertyValue(req, res) {
     });
 }
 
+function handleSetTextsBatch(req, res) {
+    readJsonBody(req, res, ({ texts, fastApply }) => {
+        const fastApplyError = validateFastApply(fastApply);
+        if (fastApplyError) {
+            sendBadRequest(res, fastApplyError);
+            log(`setTextsBatch failed: ${fastApplyError}`);
+            return;
+        }
+        if (!Array.isArray(texts) || texts.length === 0) {
+            sendBadRequest(res, 'texts must be a non-empty array');
+            log('setTextsBatch failed: invalid texts');
+            return;
+        }
+        const entries = [];
+        for (let i = 0; i < texts.length; i += 1) {
+            const item = texts[i] || {};
+            const selector = normalizeLayerSelector(item.layerId, item.layerName, item.layerUid);
+            if (!selector.ok) {
+                sendBadRequest(res, `texts[${i}]: ${selector.error}`);
+                log(`setTextsBatch failed: ${selector.error}`);
+                return;
+            }
+            if (typeof item.text !== 'string') {
+                sendBadRequest(res, `texts[${i}].text must be a string`);
+                log('setTextsBatch failed: invalid text');
+                return;
+            }
+            const entry = { text: item.text };
+            if (item.layerUid !== undefined && item.layerUid !== null) {
+                entry.layerUid = String(item.layerUid).trim();
+            } else if (item.layerId !== undefined && item.layerId !== null) {
+                entry.layerId = item.layerId;
+            } else {
+                entry.layerName = item.layerName.trim();
+            }
+            entries.push(entry);
+        }
+
+        const entriesLiteral = toExtendScriptStringLiteral(JSON.stringify(entries));
+        const script = `setTextsBatch(${entriesLiteral})`;
+        handleBridgeMutationCall(script, res, 'setTextsBatch()', 'Failed to set texts', {
+            fastApply,
+            units: texts.length,
+        });
+    });
+}
+
 function handleSetKeyframe(req, res) {
-    readJsonBody(req, res, ({ layerId, layerName, propertyPath, time, value, inInterp, outInterp, easeIn, easeOut }) => {
+    readJsonBody(req, res, ({ layerId, layerName, layerUid, propertyPath, time, value, inInterp, outInterp, easeIn, easeOut }) => {
         if (!propertyPath || time === undefined || value === undefined) {
             sendBadRequest(res, 'Missing parameters');
             log('setKeyframe failed: Missing parameters');
             return;
         }
-        const selector = normalizeLayerSelector(layerId, layerName);
+        const selector = normalizeLayerSelector(layerId, layerName, layerUid);
         if (!selector.ok) {
             sendBadRequest(res, selector.error);
             log(`setKeyframe failed: ${selector.error}`);
@@ -338,14 +608,82 @@ function handleSetKeyframe(req, res) {
     });
 }
 
+function handleSetKeyframesBatch(req, res) {
+    readJsonBody(req, res, ({
+        layerId, layerName, layerUid, propertyPath, times, values, inInterp, outInterp, easeIn, easeOut, keyEaseIn, keyEaseOut,
+        fastApply,
+    }) => {
+        const fastApplyError = validateFastApply(fastApply);
+        if (fastApplyError) {
+            sendBadRequest(res, fastApplyError);
+            log(`setKeyframesBatch failed: ${fastApplyError}`);
+            return;
+        }
+        if (!propertyPath || times === undefined || values === undefined) {
+            sendBadRequest(res, 'Missing parameters');
+            log('setKeyframesBatch failed: Missing parameters');
+            return;
+        }
+        const selector = normalizeLayerSelector(layerId, layerName, layerUid);
+        if (!selector.ok) {
+            sendBadRequest(res, selector.error);
+            log(`setKeyframesBatch failed: ${selector.error}`);
+            return;
+        }
+        if (!Array.isArray(times) || times.length === 0 || !times.every((t) => typeof t === 'number' && isFinite(t))) {
+            sendBadRequest(res, 'times must be a non-empty array of finite numbers');
+            log('setKeyframesBatch failed: invalid times');
+            return;
+        }
+        if (!Array.isArray(values) || values.length !== times.length) {
+            sendBadRequest(res, 'values must be an array with one entry per time');
+            log('setKeyframesBatch failed: invalid values');
+            return;
+        }
+        if (inInterp !== undefined && !['linear', 'bezier', 'hold'].includes(inInterp)) {
+            sendBadRequest(res, 'inInterp must be one of: linear, bezier, hold');
+            log('setKeyframesBatch failed: invalid inInterp');
+            return;
+        }
+        if (outInterp !== undefined && !['linear', 'bezier', 'hold'].includes(outInterp)) {
+            sendBadRequest(res, 'outInterp must be one of: linear, bezier, hold');
+            log('setKeyframesBatch failed: invalid outInterp');
+            return;
+        }
+
+        const invalidKeyEase = [['keyEaseIn', keyEaseIn], ['keyEaseOut', keyEaseOut]]
+            .find(([, perKey]) => perKey !== undefined && (!Array.isArray(perKey) || perKey.length !== times.length));
+        if (invalidKeyEase) {
+            sendBadRequest(res, `${invalidKeyEase[0]} must be an array with one ease (or null) per time`);
+            log(`setKeyframesBatch failed: invalid ${invalidKeyEase[0]}`);
+            return;
+        }
+
+        const pathLiteral = toExtendScriptStringLiteral(propertyPath);
+        const keyframes = { times, values };
+        if (inInterp !== undefined) keyframes.inInterp = inInterp;
+        if (outInterp !== undefined) keyframes.outInterp = outInterp;
+        if (easeIn !== undefined) keyframes.easeIn = easeIn;
+        if (easeOut !== undefined) keyframes.easeOut = easeOut;
+        if (keyEaseIn !== undefined) keyframes.keyEaseIn = keyEaseIn;
+        if (keyEaseOut !== undefined) keyframes.keyEaseOut = keyEaseOut;
+        const keyframesLiteral = toExtendScriptStringLiteral(JSON.stringify(keyframes));
+        const script = `setKeyframesBatch(${selector.layerIdLiteral}, ${selector.layerNameLiteral}, ${pathLiteral}, ${keyframesLiteral})`;
+        handleBridgeMutationCall(script, res, 'setKeyframesBatch()', 'Failed to set keyframes', {
+            fastApply,
+            units: times.length,
+        });
+    });
+}
+
 function handleAddEffect(req, res) {
-    readJsonBody(req, res, ({ layerId, layerName, effectMatchName, effectName }) => {
+    readJsonBody(req, res, ({ layerId, layerName, layerUid, effectMatchName, effectName }) => {
         if (!effectMatchName) {
             sendBadRequest(res, 'Missing parameters');
             log('addEffect failed: Missing parameters');
             return;
         }
-        const selector = normalizeLayerSelector(layerId, layerName);
+        const selector = normalizeLayerSelector(layerId, layerName, layerUid);
         if (!selector.ok) {
             sendBadRequest(res, selector.error);
             log(`addEffect failed: ${selector.error}`);
@@ -377,6 +715,9 @@ function handleAddEffect(req, res) {
                 }
                 sendJson(res, 200, { status: 'success', data: parsedResult });
                 log('addEffect successful.');
+                if (typeof notifyBridgeMutation === 'function') {
+                    notifyBridgeMutation('addEffect()', parsedResult);
+                }
             } catch (e) {
                 sendBridgeParseError(res, result, e);
                 log(`addEffect failed: ${e.toString()}`);
@@ -385,6 +726,94 @@ function handleAddEffect(req, res) {
     });
 }
 
+// Validates one effect spec for /effects/batch; returns an error string or null.
+function validateBatchEffect(effect, label) {
+    if (!effect || typeof effect !== 'object' || Array.isArray(effect)) {
+        return `${label} must be an object`;
+    }
+    if (typeof effect.matchName !== 'string' || effect.matchName.length === 0) {
+        return `${label}.matchName is required and must be a string`;
+    }
+    if (effect.name !== undefined && typeof effect.name !== 'string') {
+        return `${label}.name must be a string when specified`;
+    }
+    if (effect.params === undefined) {
+        return null;
+    }
+    if (!Array.isArray(effect.params)) {
+        return `${label}.params must be an array when specified`;
+    }
+    for (let p = 0; p < effect.params.length; p += 1) {
+        const param = effect.params[p];
+        const paramLabel = `${label}.params[${p}]`;
+        if (!param || typeof param !== 'object' || Array.isArray(param)) {
+            return `${paramLabel} must be an object`;
+        }
+        const selectors = ['propertyPath', 'matchName', 'propertyIndex'].filter((key) => param[key] !== undefined);
+        if (selectors.length !== 1) {
+            return `${paramLabel} must specify exactly one of propertyPath, matchName, propertyIndex`;
+        }
+        if (param.value === undefined) {
+            return `${paramLabel}.value is required`;
+        }
+    }
+    return null;
+}
+
+function handleApplyEffectsBatch(req, res) {
+    readJsonBody(req, res, ({ layers, effects, fastApply }) => {
+        const fastApplyError = validateFastApply(fastApply);
+        if (fastApplyError) {
+            sendBadRequest(res, fastApplyError);
+            log(`applyEffectsBatch failed: ${fastApplyError}`);
+            return;
+        }
+        if (!Array.isArray(layers) || layers.length === 0) {
+            sendBadRequest(res, 'layers must be a non-empty array of layer selectors');
+            log('applyEffectsBatch failed: invalid layers');
+            return;
+        }
+        if (!Array.isArray(effects) || effects.length === 0) {
+            sendBadRequest(res, 'effects must be a non-empty array');
+            log('applyEffectsBatch failed: invalid effects');
+            return;
+        }
+        const refs = [];
+        for (let i = 0; i < layers.length; i += 1) {
+            const item = layers[i] || {};
+            const selector = normalizeLayerSelector(item.layerId, item.layerName, item.layerUid);
+            if (!selector.ok) {
+                sendBadRequest(res, `layers[${i}]: ${selector.error}`);
+                log(`applyEffectsBatch failed: ${selector.error}`);
+                return;
+            }
+            if (item.layerUid !== undefined && item.layerUid !== null) {
+                refs.push({ layerUid: String(item.layerUid).trim() });
+            } else if (item.layerId !== undefined && item.layerId !== null) {
+                refs.push({ layerId: item.layerId });
+            } else {
+                refs.push({ layerName: item.layerName.trim() });
+            }
+        }
+        for (let i = 0; i < effects.length; i += 1) {
+            const effectError = validateBatchEffect(effects[i], `effects[${i}]`);
+            if (effectError) {
+                sendBadRequest(res, effectError);
+                log(`applyEffectsBatch failed: ${effectError}`);
+                return;
+            }
+        }
+
+        const layersLiteral = toExtendScriptStringLiteral(JSON.stringify(refs));
+        const effectsLiteral = toExtendScriptStringLiteral(JSON.stringify(effects));
+        const script = `applyEffectsBatch(${layersLiteral}, ${effectsLiteral})`;
+        handleBridgeMutationCall(script, res, 'applyEffectsBatch()', 'Failed to apply effects', {
+            fastApply,
+            units: refs.length * effects.length,
+        });
+    });
+}
+
 function handleNotFound(req, res) {
     sendJson(res, 404, { status: 'error', message: 'Not Found' });
     log(`404 Not Found: ${req.method} ${req.url}`);
@@ -397,6 +826,7 @@ function routeRequest(req, res) {
         return;
     }
 
+    beginRequestTiming(req, res);
     applyCommonResponseHeaders(res);
 
     const [pathname, queryString = ''] = req.url.split('?');
@@ -407,12 +837,23 @@ function routeRequest(req, res) {
         handleHealth(res);
         return;
     }
+    if (pathname === '/metrics' && method === 'GET') {
+        handleMetrics(res);
+        return;
+    }
+    if (typeof routeEventsRequest === 'function' && routeEventsRequest(pathname, method, req, res)) {
+        return;
+    }
+    if (typeof isHostQueueFull === 'function' && isHostQueueFull()) {
+        rejectForFullQueue(res);
+        return;
+    }
     if (pathname === '/layers' && method === 'GET') {
-        handleGetLayers(res);
+        handleGetLayers(searchParams, res);
         return;
     }
     if (pathname === '/comps' && method === 'GET') {
-        handleGetComps(res);
+        handleGetComps(searchParams, res);
         return;
     }
     if (typeof routeShapeRequest === 'function' && routeShapeRequest(pathname, method, req, res)) {
@@ -421,6 +862,9 @@ function routeRequest(req, res) {
     if (typeof routeSceneRequest === 'function' && routeSceneRequest(pathname, method, req, res)) {
         return;
     }
+    if (typeof routeBatchRequest === 'function' && routeBatchRequest(pathname, method, req, res)) {
+        return;
+    }
     if (pathname === '/comps' && method === 'POST') {
         handleCreateComp(req, res);
         return;
@@ -449,13 +893,29 @@ function routeRequest(req, res) {
         handleSetPropertyValue(req, res);
         return;
     }
+    if (pathname === '/texts/batch' && method === 'POST') {
+        handleSetTextsBatch(req, res);
+        return;
+    }
+    if (pathname === '/keyframes' && method === 'GET') {
+        handleGetKeyframes(searchParams, res);
+        return;
+    }
     if (pathname === '/keyframes' && method === 'POST') {
         handleSetKeyframe(req, res);
         return;
     }
+    if (pathname === '/keyframes/batch' && method === 'POST') {
+        handleSetKeyframesBatch(req, res);
+        return;
+    }
     if (typeof routeEssentialRequest === 'function' && routeEssentialRequest(pathname, method, req, res)) {
         return;
     }
+    if (pathname === '/effects/batch' && method === 'POST') {
+        handleApplyEffectsBatch(req, res);
+        return;
+    }
     if (pathname === '/effects' && method === 'POST') {
         handleAddEffect(req, res);
         return;
@@ -467,6 +927,9 @@ function routeRequest(req, res) {
         && routeLayerStructureRequest(pathname, method, req, res)) {
         return;
     }
+    if (typeof routeFootageRequest === 'function' && routeFootageRequest(pathname, method, req, res)) {
+        return;
+    }
 
     handleNotFound(req, res);
 }
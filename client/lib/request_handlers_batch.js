@@ -0,0 +1,219 @@
+const BATCH_MAX_OPERATIONS = 1000;
+
+// Feeds a pre-parsed body to readJsonBody synchronously.
+function createBufferedRequest(pathname, body) {
+    const raw = Buffer.from(JSON.stringify(body));
+    return {
+        method: 'POST',
+        url: pathname,
+        headers: {},
+        on(event, listener) {
+            if (event === 'data') {
+                listener(raw);
+            } else if (event === 'end') {
+                listener();
+            }
+            return this;
+        },
+    };
+}
+
+// Records what a handler would have sent instead of writing to a socket.
+function createRecordingResponse() {
+    return {
+        statusCode: null,
+        body: null,
+        finished: false,
+        setHeader() {},
+        writeHead(statusCode) {
+            this.statusCode = statusCode;
+        },
+        end(body) {
+            this.body = body === undefined ? null : String(body);
+            this.finished = true;
+        },
+        payload() {
+            try {
+                return JSON.parse(this.body);
+            } catch (e) {
+                return { status: 'error', message: 'Operation returned no JSON body.' };
+            }
+        },
+    };
+}
+
+// Runs the regular route for one operation with evalHostScript captured, so the
+// handler validates the body and builds its host call without running it.
+function captureBatchOperation(pathname, body) {
+    const req = createBufferedRequest(pathname, body);
+    const res = createRecordingResponse();
+    const captured = [];
+    hostScriptCapture = captured;
+    try {
+        routeRequest(req, res);
+    } finally {
+        hostScriptCapture = null;
+    }
+    if (res.finished) {
+        return { ok: false, statusCode: res.statusCode, payload: res.payload() };
+    }
+    if (captured.length !== 1) {
+        return {
+            ok: false,
+            statusCode: 400,
+            payload: { status: 'error', message: `${pathname} cannot run inside a batch` },
+        };
+    }
+    return { ok: true, script: captured[0].script, callback: captured[0].callback, res };
+}
+
+function validateBatchOperations(operations) {
+    if (!Array.isArray(operations) || operations.length === 0) {
+        return 'operations must be a non-empty array';
+    }
+    if (operations.length > BATCH_MAX_OPERATIONS) {
+        return `operations must not exceed ${BATCH_MAX_OPERATIONS} entries`;
+    }
+    for (let i = 0; i < operations.length; i += 1) {
+        const operation = operations[i];
+        if (!operation || typeof operation !== 'object' || Array.isArray(operation)) {
+            return `operations[${i}] must be an object`;
+        }
+        if (typeof operation.path !== 'string' || !operation.path.startsWith('/')) {
+            return `operations[${i}].path must be a path starting with /`;
+        }
+        if (operation.path.split('?')[0] === '/batch') {
+            return `operations[${i}]: /batch cannot be nested`;
+        }
+        if (!operation.body || typeof operation.body !== 'object' || Array.isArray(operation.body)) {
+            return `operations[${i}].body must be an object`;
+        }
+    }
+    return null;
+}
+
+function batchOperationEntry(index, operation, elapsedMs, payload) {
+    return { index, path: operation.path, elapsedMs, ...payload };
+}
+
+function handleBatch(req, res) {
+    readJsonBody(req, res, ({ label, operations, fastApply }) => {
+        if (label !== undefined && (typeof label !== 'string' || label.length === 0)) {
+            sendBadRequest(res, 'label must be a non-empty string');
+            log('runTransaction failed: invalid label');
+            return;
+        }
+        const fastApplyError = validateFastApply(fastApply);
+        if (fastApplyError) {
+            sendBadRequest(res, fastApplyError);
+            log(`runTransaction failed: ${fastApplyError}`);
+            return;
+        }
+        const operationsError = validateBatchOperations(operations);
+        if (operationsError) {
+            sendBadRequest(res, operationsError);
+            log(`runTransaction failed: ${operationsError}`);
+            return;
+        }
+
+        const prepared = [];
+        for (let i = 0; i < operations.length; i += 1) {
+            const capture = captureBatchOperation(operations[i].path, operations[i].body);
+            if (!capture.ok) {
+                sendJson(res, capture.statusCode || 400, {
+                    status: 'error',
+                    message: `operations[${i}] (${operations[i].path}) was rejected: ${capture.payload.message || 'invalid operation'}`,
+                    details: { failedIndex: i, rolledBack: false, response: capture.payload },
+                });
+                log(`runTransaction failed: operations[${i}] rejected before reaching After Effects`);
+                return;
+            }
+            prepared.push(capture);
+        }
+
+        const transactionLabel = label || 'ae-cli Transaction';
+        const labelLiteral = toExtendScriptStringLiteral(transactionLabel);
+        const scriptsLiteral = toExtendScriptStringLiteral(JSON.stringify(prepared.map((entry) => entry.script)));
+        const script = `runTransaction(${labelLiteral}, ${scriptsLiteral})`;
+        log(`Calling ExtendScript: runTransaction(operations=${prepared.length})${fastApply ? ' [fast]' : ''}`);
+        evalHostScript(withFastApply(script, fastApply), (result) => {
+            let parsed;
+            try {
+                parsed = parseBridgeResult(result);
+            } catch (e) {
+                sendBridgeParseError(res, result, e);
+                log(`runTransaction failed: ${e.toString()}`);
+                return;
+            }
+            if (!parsed || parsed.status === 'error') {
+                sendJson(res, 500, { status: 'error', message: (parsed && parsed.message) || 'Failed to run transaction' });
+                log(`runTransaction failed: ${(parsed && parsed.message) || 'Unknown error'}`);
+                return;
+            }
+
+            // Replay each handler's own response logic on its host result. Operations
+            // undone by a rollback are reported without replay so no mutation events fire.
+            const ran = parsed.operations || [];
+            const entries = operations.map((operation, index) => {
+                const hostEntry = ran[index];
+                if (!hostEntry) {
+                    return batchOperationEntry(index, operation, null, { status: 'skipped' });
+                }
+                if (parsed.rolledBack && index !== parsed.failedIndex) {
+                    return batchOperationEntry(index, operation, hostEntry.elapsedMs, { status: 'rolledBack' });
+                }
+                withReplayedHostTiming(hostEntry.elapsedMs, fastApply === true, () => {
+                    prepared[index].callback(hostEntry.result);
+                });
+                const payload = prepared[index].res.finished
+                    ? prepared[index].res.payload()
+                    : { status: 'error', message: 'Operation produced no response.' };
+                if (index === parsed.failedIndex && payload.status !== 'error') {
+                    return batchOperationEntry(index, operation, hostEntry.elapsedMs, {
+                        status: 'error',
+                        message: parsed.failure,
+                    });
+                }
+                return batchOperationEntry(index, operation, hostEntry.elapsedMs, payload);
+            });
+
+            if (parsed.committed) {
+                recordFastApplyTiming('runTransaction()', fastApply === true, entries.length);
+            }
+            if (!parsed.committed) {
+                const failed = entries[parsed.failedIndex];
+                sendJson(res, 500, {
+                    status: 'error',
+                    message: `Transaction "${parsed.label}" failed at operations[${parsed.failedIndex}] (${failed.path}): `
+                        + `${failed.message || parsed.failure}`,
+                    details: {
+                        label: parsed.label,
+                        failedIndex: parsed.failedIndex,
+                        rolledBack: parsed.rolledBack,
+                        operations: entries,
+                    },
+                });
+                log(`runTransaction failed at operations[${parsed.failedIndex}]; rolledBack=${parsed.rolledBack}`);
+                return;
+            }
+            sendJson(res, 200, {
+                status: 'success',
+                data: {
+                    label: parsed.label,
+                    committed: true,
+                    operationCount: entries.length,
+                    operations: entries,
+                },
+            });
+            log(`runTransaction(operations=${entries.length}) successful.`);
+        });
+    });
+}
+
+function routeBatchRequest(pathname, method, req, res) {
+    if (pathname === '/batch' && method === 'POST') {
+        handleBatch(req, res);
+        return true;
+    }
+    return false;
+}
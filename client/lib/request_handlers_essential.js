@@ -1,11 +1,11 @@
 function handleAddEssentialProperty(req, res) {
-    readJsonBody(req, res, ({ layerId, layerName, propertyPath, essentialName }) => {
+    readJsonBody(req, res, ({ layerId, layerName, layerUid, propertyPath, essentialName }) => {
         if (!propertyPath || typeof propertyPath !== 'string') {
             sendBadRequest(res, 'propertyPath is required and must be a string');
             log('addEssentialProperty failed: invalid propertyPath');
             return;
         }
-        const selector = normalizeLayerSelector(layerId, layerName);
+        const selector = normalizeLayerSelector(layerId, layerName, layerUid);
         if (!selector.ok) {
             sendBadRequest(res, selector.error);
             log(`addEssentialProperty failed: ${selector.error}`);
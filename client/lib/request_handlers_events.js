@@ -0,0 +1,164 @@
+const PROJECT_WATCH_INTERVAL_MS = 1000;
+const EVENT_HEARTBEAT_INTERVAL_MS = 15000;
+
+const eventSubscribers = new Set();
+let bridgeEventSeq = 0;
+let projectWatchTimer = null;
+let eventHeartbeatTimer = null;
+let projectSnapshotInFlight = false;
+let lastProjectSnapshot = null;
+
+function writeBridgeEvent(res, id, type, data) {
+    res.write(`id: ${id}\nevent: ${type}\ndata: ${JSON.stringify(data)}\n\n`);
+}
+
+function emitBridgeEvent(type, data) {
+    if (eventSubscribers.size === 0) {
+        return;
+    }
+    bridgeEventSeq += 1;
+    const payload = { ...data, emittedAt: Date.now() };
+    eventSubscribers.forEach((res) => {
+        try {
+            writeBridgeEvent(res, bridgeEventSeq, type, payload);
+        } catch (e) {
+            eventSubscribers.delete(res);
+        }
+    });
+}
+
+function summarizeMutationResult(result) {
+    const summary = {};
+    if (!result || typeof result !== 'object' || Array.isArray(result)) {
+        return summary;
+    }
+    Object.keys(result).forEach((key) => {
+        const value = result[key];
+        if (value === null || ['string', 'number', 'boolean'].includes(typeof value)) {
+            summary[key] = value;
+        }
+    });
+    return summary;
+}
+
+function notifyBridgeMutation(contextLabel, result) {
+    emitBridgeEvent('mutation', {
+        operation: contextLabel.replace(/\(.*$/, ''),
+        result: summarizeMutationResult(result),
+    });
+}
+
+function sameSelection(previous, current) {
+    return JSON.stringify(previous.selectedLayers) === JSON.stringify(current.selectedLayers)
+        && JSON.stringify(previous.selectedProperties) === JSON.stringify(current.selectedProperties);
+}
+
+function diffProjectSnapshots(previous, current) {
+    if (!previous) {
+        return;
+    }
+    if (previous.activeCompId !== current.activeCompId) {
+        emitBridgeEvent('activeCompChanged', {
+            previous: { compId: previous.activeCompId, compName: previous.activeCompName },
+            current: { compId: current.activeCompId, compName: current.activeCompName },
+        });
+    } else if (previous.layerCount !== current.layerCount) {
+        emitBridgeEvent('layerCountChanged', {
+            compId: current.activeCompId,
+            previous: previous.layerCount,
+            current: current.layerCount,
+        });
+    }
+    if (!sameSelection(previous, current)) {
+        emitBridgeEvent('selectionChanged', {
+            compId: current.activeCompId,
+            selectedLayers: current.selectedLayers,
+            selectedProperties: current.selectedProperties,
+        });
+    }
+}
+
+function pollProjectSnapshot() {
+    if (projectSnapshotInFlight || eventSubscribers.size === 0) {
+        return;
+    }
+    projectSnapshotInFlight = true;
+    evalHostScript('getProjectChangeSnapshot()', (result) => {
+        projectSnapshotInFlight = false;
+        let snapshot;
+        try {
+            snapshot = parseBridgeResult(result);
+        } catch (e) {
+            log(`Project watch failed: ${e.toString()}`);
+            return;
+        }
+        if (!snapshot || snapshot.status === 'error') {
+            return;
+        }
+        diffProjectSnapshots(lastProjectSnapshot, snapshot);
+        lastProjectSnapshot = snapshot;
+    });
+}
+
+function startProjectWatch() {
+    if (projectWatchTimer === null) {
+        projectWatchTimer = setInterval(pollProjectSnapshot, PROJECT_WATCH_INTERVAL_MS);
+        pollProjectSnapshot();
+    }
+    if (eventHeartbeatTimer === null) {
+        eventHeartbeatTimer = setInterval(() => {
+            eventSubscribers.forEach((res) => {
+                try {
+                    res.write(': ping\n\n');
+                } catch (e) {
+                    eventSubscribers.delete(res);
+                }
+            });
+        }, EVENT_HEARTBEAT_INTERVAL_MS);
+    }
+}
+
+function stopProjectWatch() {
+    if (projectWatchTimer !== null) {
+        clearInterval(projectWatchTimer);
+        projectWatchTimer = null;
+    }
+    if (eventHeartbeatTimer !== null) {
+        clearInterval(eventHeartbeatTimer);
+        eventHeartbeatTimer = null;
+    }
+    lastProjectSnapshot = null;
+}
+
+function handleEvents(req, res) {
+    res.writeHead(200, {
+        'Access-Control-Allow-Origin': '*',
+        'Content-Type': 'text/event-stream; charset=utf-8',
+        'Cache-Control': 'no-cache',
+        Connection: 'keep-alive',
+    });
+    res.write('retry: 3000\n\n');
+    eventSubscribers.add(res);
+    writeBridgeEvent(res, bridgeEventSeq, 'ready', {
+        subscribers: eventSubscribers.size,
+        snapshot: lastProjectSnapshot,
+    });
+    log(`Event subscriber connected (${eventSubscribers.size} active).`);
+    startProjectWatch();
+
+    req.on('close', () => {
+        eventSubscribers.delete(res);
+        log(`Event subscriber disconnected (${eventSubscribers.size} active).`);
+        if (eventSubscribers.size === 0) {
+            stopProjectWatch();
+        }
+    });
+}
+
+function routeEventsRequest(pathname, method, req, res) {
+    if (pathname === '/events' && method === 'GET') {
+        handleEvents(req, res);
+        return true;
+    }
+    return false;
+}
@@ -0,0 +1,49 @@
+const FOOTAGE_HASH_PATTERN = /^[0-9a-fA-F]{64}$/;
+
+function handleImportFootage(req, res) {
+    readJsonBody(req, res, ({ files, folder }) => {
+        if (!Array.isArray(files) || files.length === 0) {
+            sendBadRequest(res, 'files must be a non-empty array');
+            log('importFootage failed: invalid files');
+            return;
+        }
+        const entries = [];
+        for (let i = 0; i < files.length; i += 1) {
+            const file = files[i];
+            if (!file || typeof file !== 'object' || Array.isArray(file)) {
+                sendBadRequest(res, `files[${i}] must be an object`);
+                log('importFootage failed: invalid file entry');
+                return;
+            }
+            if (typeof file.path !== 'string' || file.path.length === 0) {
+                sendBadRequest(res, `files[${i}].path must be a non-empty string`);
+                log('importFootage failed: invalid path');
+                return;
+            }
+            if (typeof file.hash !== 'string' || !FOOTAGE_HASH_PATTERN.test(file.hash)) {
+                sendBadRequest(res, `files[${i}].hash must be a SHA-256 hex string`);
+                log('importFootage failed: invalid hash');
+                return;
+            }
+            entries.push({ path: file.path, hash: file.hash.toLowerCase() });
+        }
+        if (folder !== undefined && (typeof folder !== 'string' || folder.length === 0)) {
+            sendBadRequest(res, 'folder must be a non-empty string when specified');
+            log('importFootage failed: invalid folder');
+            return;
+        }
+
+        const filesLiteral = toExtendScriptStringLiteral(JSON.stringify(entries));
+        const optionsLiteral = toExtendScriptStringLiteral(JSON.stringify(folder === undefined ? {} : { folder }));
+        const script = `importFootage(${filesLiteral}, ${optionsLiteral})`;
+        handleBridgeMutationCall(script, res, `importFootage(files=${entries.length})`, 'Failed to import footage');
+    });
+}
+
+function routeFootageRequest(pathname, method, req, res) {
+    if (pathname === '/footage/import' && method === 'POST') {
+        handleImportFootage(req, res);
+        return true;
+    }
+    return false;
+}
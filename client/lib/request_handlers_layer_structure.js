@@ -1,44 +1,103 @@
 function handleParentLayer(req, res) {
-    readJsonBody(req, res, ({ childLayerId, parentLayerId }) => {
-        if (!childLayerId) {
-            sendBadRequest(res, 'childLayerId is required');
-            log('parentLayer failed: missing childLayerId');
+    readJsonBody(req, res, ({ childLayerId, childLayerUid, parentLayerId, parentLayerUid }) => {
+        const child = normalizeLayerRef(childLayerId, childLayerUid, 'childLayerId', 'childLayerUid');
+        if (!child.ok || !child.present) {
+            sendBadRequest(res, child.ok ? 'childLayerId or childLayerUid is required' : child.error);
+            log('parentLayer failed: invalid child layer');
             return;
         }
-        if (parentLayerId !== undefined && parentLayerId !== null && typeof parentLayerId !== 'number') {
-            sendBadRequest(res, 'parentLayerId must be a number when specified');
-            log('parentLayer failed: invalid parentLayerId');
+        const parent = normalizeLayerRef(parentLayerId, parentLayerUid, 'parentLayerId', 'parentLayerUid');
+        if (!parent.ok) {
+            sendBadRequest(res, parent.error);
+            log('parentLayer failed: invalid parent layer');
             return;
         }
 
-        const parentLiteral = parentLayerId === undefined || parentLayerId === null
-            ? 'null'
-            : String(parentLayerId);
-        const script = `parentLayer(${childLayerId}, ${parentLiteral})`;
+        const script = `parentLayer(${child.literal}, ${parent.literal})`;
         handleBridgeMutationCall(script, res, 'parentLayer()', 'Failed to set parent layer');
     });
 }
 
+function layerRefValue(layerId, layerUid) {
+    return layerUid !== undefined && layerUid !== null ? { uid: String(layerUid).trim() } : layerId;
+}
+
+function handleParentLayersBatch(req, res) {
+    readJsonBody(req, res, ({ links, fastApply }) => {
+        const fastApplyError = validateFastApply(fastApply);
+        if (fastApplyError) {
+            sendBadRequest(res, fastApplyError);
+            log(`parentLayersBatch failed: ${fastApplyError}`);
+            return;
+        }
+        if (!Array.isArray(links) || links.length === 0) {
+            sendBadRequest(res, 'links must be a non-empty array');
+            log('parentLayersBatch failed: invalid links');
+            return;
+        }
+        const refs = [];
+        for (let i = 0; i < links.length; i += 1) {
+            const link = links[i];
+            if (!link || typeof link !== 'object' || Array.isArray(link)) {
+                sendBadRequest(res, `links[${i}] must be an object`);
+                log('parentLayersBatch failed: invalid link');
+                return;
+            }
+            const child = normalizeLayerRef(link.childLayerId, link.childLayerUid, 'childLayerId', 'childLayerUid');
+            if (!child.ok || !child.present) {
+                sendBadRequest(res, `links[${i}]: ${child.ok ? 'childLayerId or childLayerUid is required' : child.error}`);
+                log('parentLayersBatch failed: invalid child layer');
+                return;
+            }
+            const parent = normalizeLayerRef(link.parentLayerId, link.parentLayerUid, 'parentLayerId', 'parentLayerUid');
+            if (!parent.ok) {
+                sendBadRequest(res, `links[${i}]: ${parent.error}`);
+                log('parentLayersBatch failed: invalid parent layer');
+                return;
+            }
+            refs.push({
+                child: layerRefValue(link.childLayerId, link.childLayerUid),
+                parent: parent.present ? layerRefValue(link.parentLayerId, link.parentLayerUid) : null,
+            });
+        }
+
+        const linksLiteral = toExtendScriptStringLiteral(JSON.stringify(refs));
+        const script = `parentLayersBatch(${linksLiteral})`;
+        handleBridgeMutationCall(script, res, 'parentLayersBatch()', 'Failed to set parent layers', {
+            fastApply,
+            units: refs.length,
+        });
+    });
+}
+
 function handlePrecompose(req, res) {
-    readJsonBody(req, res, ({ layerIds, name, moveAllAttributes }) => {
-        if (!Array.isArray(layerIds) || layerIds.length === 0 || !name || typeof name !== 'string') {
-            sendBadRequest(res, 'layerIds (non-empty array) and name (string) are required');
+    readJsonBody(req, res, ({ layerIds, layerUids, name, moveAllAttributes }) => {
+        const ids = layerIds === undefined ? [] : layerIds;
+        const uids = layerUids === undefined ? [] : layerUids;
+        if (!Array.isArray(ids) || !Array.isArray(uids) || ids.length + uids.length === 0 || !name || typeof name !== 'string') {
+            sendBadRequest(res, 'layerIds or layerUids (non-empty array) and name (string) are required');
             log('precompose failed: invalid layerIds or name');
             return;
         }
-        const allNumbers = layerIds.every((id) => typeof id === 'number');
+        const allNumbers = ids.every((id) => typeof id === 'number');
         if (!allNumbers) {
             sendBadRequest(res, 'layerIds must be an array of numbers');
             log('precompose failed: invalid layerIds values');
             return;
         }
+        if (!uids.every(isLayerUid)) {
+            sendBadRequest(res, 'layerUids must be an array of layer uid strings');
+            log('precompose failed: invalid layerUids values');
+            return;
+        }
         if (moveAllAttributes !== undefined && typeof moveAllAttributes !== 'boolean') {
             sendBadRequest(res, 'moveAllAttributes must be boolean when specified');
             log('precompose failed: invalid moveAllAttributes');
             return;
         }
 
-        const layerIdsLiteral = toExtendScriptStringLiteral(JSON.stringify(layerIds));
+        const layerRefs = ids.concat(uids.map((uid) => ({ uid: String(uid).trim() })));
+        const layerIdsLiteral = toExtendScriptStringLiteral(JSON.stringify(layerRefs));
         const nameLiteral = toExtendScriptStringLiteral(name);
         const moveLiteral = moveAllAttributes === undefined ? 'false' : String(moveAllAttributes);
         const script = `precomposeLayers(${layerIdsLiteral}, ${nameLiteral}, ${moveLiteral})`;
@@ -47,43 +106,137 @@ function handlePrecompose(req, res) {
 }
 
 function handleDuplicateLayer(req, res) {
-    readJsonBody(req, res, ({ layerId }) => {
-        if (!layerId) {
-            sendBadRequest(res, 'layerId is required');
-            log('duplicateLayer failed: missing layerId');
+    readJsonBody(req, res, ({ layerId, layerUid }) => {
+        const layer = normalizeLayerRef(layerId, layerUid, 'layerId', 'layerUid');
+        if (!layer.ok || !layer.present) {
+            sendBadRequest(res, layer.ok ? 'layerId or layerUid is required' : layer.error);
+            log('duplicateLayer failed: invalid layer');
             return;
         }
-        const script = `duplicateLayer(${layerId})`;
+        const script = `duplicateLayer(${layer.literal})`;
         handleBridgeMutationCall(script, res, 'duplicateLayer()', 'Failed to duplicate layer');
     });
 }
 
+const MAX_DUPLICATE_COUNT = 10000;
+const DUPLICATE_TRANSFORM_KEYS = ['anchorPoint', 'position', 'scale', 'rotation', 'opacity'];
+
+function validateDuplicateOverride(override, index) {
+    const label = `overrides[${index}]`;
+    if (override === null) {
+        return null;
+    }
+    if (typeof override !== 'object' || Array.isArray(override)) {
+        return `${label} must be an object or null`;
+    }
+    if (override.name !== undefined && typeof override.name !== 'string') {
+        return `${label}.name must be a string`;
+    }
+    if (override.text !== undefined && typeof override.text !== 'string') {
+        return `${label}.text must be a string`;
+    }
+    if (override.transform !== undefined) {
+        if (!override.transform || typeof override.transform !== 'object' || Array.isArray(override.transform)) {
+            return `${label}.transform must be an object`;
+        }
+        const unknown = Object.keys(override.transform).find((key) => !DUPLICATE_TRANSFORM_KEYS.includes(key));
+        if (unknown) {
+            return `${label}.transform.${unknown} is not supported (use ${DUPLICATE_TRANSFORM_KEYS.join(', ')})`;
+        }
+    }
+    if (override.propertyValues !== undefined) {
+        const valid = Array.isArray(override.propertyValues) && override.propertyValues.every(
+            (entry) => entry && typeof entry.propertyPath === 'string' && entry.propertyPath.length > 0 && entry.value !== undefined,
+        );
+        if (!valid) {
+            return `${label}.propertyValues must be an array of { propertyPath, value }`;
+        }
+    }
+    return null;
+}
+
+function handleDuplicateLayersBatch(req, res) {
+    readJsonBody(req, res, ({ layerId, layerUid, count, overrides, fastApply }) => {
+        const fastApplyError = validateFastApply(fastApply);
+        if (fastApplyError) {
+            sendBadRequest(res, fastApplyError);
+            log(`duplicateLayersBatch failed: ${fastApplyError}`);
+            return;
+        }
+        const layer = normalizeLayerRef(layerId, layerUid, 'layerId', 'layerUid');
+        if (!layer.ok || !layer.present) {
+            sendBadRequest(res, layer.ok ? 'layerId or layerUid is required' : layer.error);
+            log('duplicateLayersBatch failed: invalid layer');
+            return;
+        }
+        if (overrides !== undefined && !Array.isArray(overrides)) {
+            sendBadRequest(res, 'overrides must be an array when specified');
+            log('duplicateLayersBatch failed: invalid overrides');
+            return;
+        }
+        const overrideList = overrides || [];
+        const copyCount = count === undefined ? overrideList.length : count;
+        if (!Number.isInteger(copyCount) || copyCount < 1 || copyCount > MAX_DUPLICATE_COUNT) {
+            sendBadRequest(res, `count must be an integer between 1 and ${MAX_DUPLICATE_COUNT}`);
+            log('duplicateLayersBatch failed: invalid count');
+            return;
+        }
+        if (overrideList.length > copyCount) {
+            sendBadRequest(res, 'overrides must not have more entries than count');
+            log('duplicateLayersBatch failed: too many overrides');
+            return;
+        }
+        for (let index = 0; index < overrideList.length; index += 1) {
+            const error = validateDuplicateOverride(overrideList[index], index);
+            if (error) {
+                sendBadRequest(res, error);
+                log(`duplicateLayersBatch failed: ${error}`);
+                return;
+            }
+        }
+
+        const overridesLiteral = overrideList.length === 0
+            ? 'null'
+            : toExtendScriptStringLiteral(JSON.stringify(overrideList));
+        const script = `duplicateLayersBatch(${layer.literal}, ${copyCount}, ${overridesLiteral})`;
+        handleBridgeMutationCall(script, res, 'duplicateLayersBatch()', 'Failed to duplicate layers', {
+            fastApply,
+            units: copyCount,
+        });
+    });
+}
+
 function handleMoveLayerOrder(req, res) {
-    readJsonBody(req, res, ({ layerId, beforeLayerId, afterLayerId, toTop, toBottom }) => {
-        if (!layerId) {
-            sendBadRequest(res, 'layerId is required');
-            log('moveLayerOrder failed: missing layerId');
+    readJsonBody(req, res, ({
+        layerId, layerUid, beforeLayerId, beforeLayerUid, afterLayerId, afterLayerUid, toTop, toBottom,
+    }) => {
+        const layer = normalizeLayerRef(layerId, layerUid, 'layerId', 'layerUid');
+        if (!layer.ok || !layer.present) {
+            sendBadRequest(res, layer.ok ? 'layerId or layerUid is required' : layer.error);
+            log('moveLayerOrder failed: invalid layer');
             return;
         }
+        const before = normalizeLayerRef(beforeLayerId, beforeLayerUid, 'beforeLayerId', 'beforeLayerUid');
+        const after = normalizeLayerRef(afterLayerId, afterLayerUid, 'afterLayerId', 'afterLayerUid');
 
         let specified = 0;
-        if (beforeLayerId !== undefined) specified += 1;
-        if (afterLayerId !== undefined) specified += 1;
+        if (beforeLayerId !== undefined || beforeLayerUid !== undefined) specified += 1;
+        if (afterLayerId !== undefined || afterLayerUid !== undefined) specified += 1;
         if (toTop === true) specified += 1;
         if (toBottom === true) specified += 1;
         if (specified !== 1) {
-            sendBadRequest(res, 'Specify exactly one of beforeLayerId, afterLayerId, toTop, toBottom');
+            sendBadRequest(res, 'Specify exactly one of beforeLayerId/Uid, afterLayerId/Uid, toTop, toBottom');
             log('moveLayerOrder failed: invalid target selector');
             return;
         }
-        if (beforeLayerId !== undefined && typeof beforeLayerId !== 'number') {
-            sendBadRequest(res, 'beforeLayerId must be a number');
-            log('moveLayerOrder failed: invalid beforeLayerId');
+        if (!before.ok) {
+            sendBadRequest(res, before.error);
+            log('moveLayerOrder failed: invalid before layer');
             return;
         }
-        if (afterLayerId !== undefined && typeof afterLayerId !== 'number') {
-            sendBadRequest(res, 'afterLayerId must be a number');
-            log('moveLayerOrder failed: invalid afterLayerId');
+        if (!after.ok) {
+            sendBadRequest(res, after.error);
+            log('moveLayerOrder failed: invalid after layer');
             return;
         }
         if (toTop !== undefined && typeof toTop !== 'boolean') {
@@ -97,29 +250,56 @@ function handleMoveLayerOrder(req, res) {
             return;
         }
 
-        const beforeLiteral = beforeLayerId === undefined ? 'null' : String(beforeLayerId);
-        const afterLiteral = afterLayerId === undefined ? 'null' : String(afterLayerId);
         const topLiteral = toTop === true ? 'true' : 'false';
         const bottomLiteral = toBottom === true ? 'true' : 'false';
-        const script = `moveLayerOrder(${layerId}, ${beforeLiteral}, ${afterLiteral}, ${topLiteral}, ${bottomLiteral})`;
+        const script = `moveLayerOrder(${layer.literal}, ${before.literal}, ${after.literal}, ${topLiteral}, ${bottomLiteral})`;
         handleBridgeMutationCall(script, res, 'moveLayerOrder()', 'Failed to move layer order');
     });
 }
 
-function handleDeleteLayer(req, res) {
-    readJsonBody(req, res, ({ layerId }) => {
-        if (!layerId) {
-            sendBadRequest(res, 'layerId is required');
-            log('deleteLayer failed: missing layerId');
+function handleReorderLayers(req, res) {
+    readJsonBody(req, res, ({ order, fastApply }) => {
+        const fastApplyError = validateFastApply(fastApply);
+        if (fastApplyError) {
+            sendBadRequest(res, fastApplyError);
+            log(`reorderLayers failed: ${fastApplyError}`);
+            return;
+        }
+        if (!Array.isArray(order) || order.length === 0) {
+            sendBadRequest(res, 'order must be a non-empty array of layer uids');
+            log('reorderLayers failed: invalid order');
             return;
         }
-        if (typeof layerId !== 'number') {
-            sendBadRequest(res, 'layerId must be a number');
-            log('deleteLayer failed: invalid layerId');
+        if (!order.every((uid) => typeof uid === 'string' && uid.length > 0)) {
+            sendBadRequest(res, 'order must contain layer uid strings');
+            log('reorderLayers failed: invalid uid in order');
             return;
         }
+        if (new Set(order).size !== order.length) {
+            sendBadRequest(res, 'order must not list a layer uid twice');
+            log('reorderLayers failed: duplicate uid');
+            return;
+        }
+
+        const orderLiteral = toExtendScriptStringLiteral(JSON.stringify(order));
+        const script = `reorderLayers(${orderLiteral})`;
+        handleBridgeMutationCall(script, res, 'reorderLayers()', 'Failed to reorder layers', {
+            fastApply,
+            units: order.length,
+        });
+    });
+}
 
-        const script = `deleteLayer(${layerId})`;
+function handleDeleteLayer(req, res) {
+    readJsonBody(req, res, ({ layerId, layerUid }) => {
+        const layer = normalizeLayerRef(layerId, layerUid, 'layerId', 'layerUid');
+        if (!layer.ok || !layer.present) {
+            sendBadRequest(res, layer.ok ? 'layerId or layerUid is required' : layer.error);
+            log('deleteLayer failed: invalid layer');
+            return;
+        }
+
+        const script = `deleteLayer(${layer.literal})`;
         handleBridgeMutationCall(script, res, 'deleteLayer()', 'Failed to delete layer');
     });
 }
@@ -152,6 +332,10 @@ function handleDeleteComp(req, res) {
 }
 
 function routeLayerStructureRequest(pathname, method, req, res) {
+    if (pathname === '/layer-parent/batch' && method === 'POST') {
+        handleParentLayersBatch(req, res);
+        return true;
+    }
     if (pathname === '/layer-parent' && method === 'POST') {
         handleParentLayer(req, res);
         return true;
@@ -160,10 +344,18 @@ function routeLayerStructureRequest(pathname, method, req, res) {
         handlePrecompose(req, res);
         return true;
     }
+    if (pathname === '/duplicate-layer/batch' && method === 'POST') {
+        handleDuplicateLayersBatch(req, res);
+        return true;
+    }
     if (pathname === '/duplicate-layer' && method === 'POST') {
         handleDuplicateLayer(req, res);
         return true;
     }
+    if (pathname === '/layer-order/batch' && method === 'POST') {
+        handleReorderLayers(req, res);
+        return true;
+    }
     if (pathname === '/layer-order' && method === 'POST') {
         handleMoveLayerOrder(req, res);
         return true;
@@ -1,5 +1,5 @@
 function handleApplyScene(req, res) {
-    readJsonBody(req, res, ({ scene, validateOnly, mode }) => {
+    readJsonBody(req, res, ({ scene, validateOnly, mode, fastApply }) => {
         if (!scene || typeof scene !== 'object' || Array.isArray(scene)) {
             sendBadRequest(res, 'scene is required and must be an object');
             log('applyScene failed: invalid scene');
@@ -10,6 +10,12 @@ function handleApplyScene(req, res) {
             log('applyScene failed: invalid validateOnly');
             return;
         }
+        const fastApplyError = validateFastApply(fastApply);
+        if (fastApplyError) {
+            sendBadRequest(res, fastApplyError);
+            log(`applyScene failed: ${fastApplyError}`);
+            return;
+        }
         const normalizedMode = mode === undefined ? 'merge' : String(mode);
         if (!['merge', 'replace-managed', 'clear-all'].includes(normalizedMode)) {
             sendBadRequest(res, 'mode must be one of: merge, replace-managed, clear-all');
@@ -25,7 +31,11 @@ function handleApplyScene(req, res) {
             }),
         );
         const script = `applyScene(${sceneLiteral}, ${optionsLiteral})`;
-        handleBridgeMutationCall(script, res, 'applyScene()', 'Failed to apply scene');
+        const layerCount = Array.isArray(scene.layers) ? scene.layers.length : 0;
+        handleBridgeMutationCall(script, res, 'applyScene()', 'Failed to apply scene', {
+            fastApply,
+            units: validateOnly === true ? undefined : layerCount,
+        });
     });
 }
 
@@ -2,8 +2,8 @@ function handleAddShapeRepeater(req, res) {
     readJsonBody(
         req,
         res,
-        ({ layerId, layerName, groupIndex, name, copies, offset, position, scale, rotation, startOpacity, endOpacity }) => {
-            const selector = normalizeLayerSelector(layerId, layerName);
+        ({ layerId, layerName, layerUid, groupIndex, name, copies, offset, position, scale, rotation, startOpacity, endOpacity }) => {
+            const selector = normalizeLayerSelector(layerId, layerName, layerUid);
             if (!selector.ok) {
                 sendBadRequest(res, selector.error);
                 log(`addShapeRepeater failed: ${selector.error}`);
@@ -81,198 +81,281 @@ function handleAddShapeRepeater(req, res) {
     );
 }
 
-function handleAddLayer(req, res) {
-    readJsonBody(
-        req,
-        res,
-        ({
-            layerType,
-            name,
-            text,
-            width,
-            height,
-            color,
-            duration,
-            shapeType,
-            shapeSize,
-            shapePosition,
-            shapeFillColor,
-            shapeFillOpacity,
-            shapeStrokeColor,
-            shapeStrokeOpacity,
-            shapeStrokeWidth,
-            shapeStrokeLineCap,
-            shapeRoundness,
-        }) => {
-            if (!layerType || typeof layerType !== 'string') {
-                sendBadRequest(res, 'layerType is required and must be a string');
-                log('addLayer failed: invalid layerType');
-                return;
-            }
 
-            const normalizedType = layerType.toLowerCase();
-            if (!['text', 'null', 'solid', 'shape'].includes(normalizedType)) {
-                sendBadRequest(res, 'Unsupported layerType. Use one of: text, null, solid, shape.');
-                log(`addLayer failed: unsupported layerType "${layerType}"`);
-                return;
-            }
-            if (name !== undefined && typeof name !== 'string') {
-                sendBadRequest(res, 'name must be a string when specified');
-                log('addLayer failed: name must be string');
-                return;
-            }
-            if (text !== undefined && typeof text !== 'string') {
-                sendBadRequest(res, 'text must be a string when specified');
-                log('addLayer failed: text must be string');
-                return;
-            }
-            if (width !== undefined && typeof width !== 'number') {
-                sendBadRequest(res, 'width must be a number when specified');
-                log('addLayer failed: width must be number');
-                return;
-            }
-            if (height !== undefined && typeof height !== 'number') {
-                sendBadRequest(res, 'height must be a number when specified');
-                log('addLayer failed: height must be number');
-                return;
-            }
-            if (duration !== undefined && typeof duration !== 'number') {
-                sendBadRequest(res, 'duration must be a number when specified');
-                log('addLayer failed: duration must be number');
-                return;
-            }
-            if (color !== undefined) {
-                const validColor = Array.isArray(color)
-                    && color.length === 3
-                    && color.every((part) => typeof part === 'number');
-                if (!validColor) {
-                    sendBadRequest(res, 'color must be an array of 3 numbers when specified');
-                    log('addLayer failed: color must be [r, g, b]');
-                    return;
-                }
-            }
-            if (shapeType !== undefined && !['ellipse', 'rect'].includes(shapeType)) {
-                sendBadRequest(res, 'shapeType must be one of: ellipse, rect');
-                log('addLayer failed: invalid shapeType');
-                return;
-            }
-            if (shapeSize !== undefined) {
-                const validShapeSize = Array.isArray(shapeSize)
-                    && shapeSize.length === 2
-                    && shapeSize.every((part) => typeof part === 'number' && isFinite(part));
-                if (!validShapeSize) {
-                    sendBadRequest(res, 'shapeSize must be an array of 2 numbers when specified');
-                    log('addLayer failed: invalid shapeSize');
-                    return;
-                }
-            }
-            if (shapePosition !== undefined) {
-                const validShapePosition = Array.isArray(shapePosition)
-                    && shapePosition.length === 2
-                    && shapePosition.every((part) => typeof part === 'number' && isFinite(part));
-                if (!validShapePosition) {
-                    sendBadRequest(res, 'shapePosition must be an array of 2 numbers when specified');
-                    log('addLayer failed: invalid shapePosition');
-                    return;
-                }
-            }
-            if (shapeFillColor !== undefined) {
-                const validShapeFillColor = Array.isArray(shapeFillColor)
-                    && shapeFillColor.length === 3
-                    && shapeFillColor.every((part) => typeof part === 'number' && isFinite(part));
-                if (!validShapeFillColor) {
-                    sendBadRequest(res, 'shapeFillColor must be an array of 3 numbers when specified');
-                    log('addLayer failed: invalid shapeFillColor');
-                    return;
-                }
-            }
-            if (shapeFillOpacity !== undefined && (typeof shapeFillOpacity !== 'number' || !isFinite(shapeFillOpacity))) {
-                sendBadRequest(res, 'shapeFillOpacity must be a finite number when specified');
-                log('addLayer failed: invalid shapeFillOpacity');
-                return;
+const ADD_LAYER_TYPES = ['text', 'null', 'solid', 'shape', 'footage'];
+const ADD_LAYER_OPTION_KEYS = [
+    'name',
+    'text',
+    'width',
+    'height',
+    'color',
+    'duration',
+    'shapeType',
+    'shapeSize',
+    'shapePosition',
+    'shapeFillColor',
+    'shapeFillOpacity',
+    'shapeStrokeColor',
+    'shapeStrokeOpacity',
+    'shapeStrokeWidth',
+    'shapeStrokeLineCap',
+    'shapeRoundness',
+    'shapePaths',
+    'footageHash',
+];
+
+function isFiniteNumberArray(value, length) {
+    return Array.isArray(value)
+        && value.length === length
+        && value.every((part) => typeof part === 'number' && isFinite(part));
+}
+
+const SHAPE_PATH_KEYS = [
+    'name',
+    'contours',
+    'fillColor',
+    'fillOpacity',
+    'fillRule',
+    'strokeColor',
+    'strokeOpacity',
+    'strokeWidth',
+    'strokeLineCap',
+];
+
+function isPointArray(value, length) {
+    return Array.isArray(value)
+        && value.length === length
+        && value.every((point) => isFiniteNumberArray(point, 2));
+}
+
+// Validates shape path groups ({ contours, fill and stroke settings }); returns an error string or null.
+function validateShapePaths(paths, label) {
+    if (!Array.isArray(paths) || paths.length === 0) {
+        return `${label} must be a non-empty array`;
+    }
+    for (let i = 0; i < paths.length; i += 1) {
+        const group = paths[i];
+        const groupLabel = `${label}[${i}]`;
+        if (!group || typeof group !== 'object' || Array.isArray(group)) {
+            return `${groupLabel} must be an object`;
+        }
+        const unknown = Object.keys(group).find((key) => !SHAPE_PATH_KEYS.includes(key));
+        if (unknown !== undefined) {
+            return unknown === 'd'
+                ? `${groupLabel}.d must be converted to contours by the client`
+                : `${groupLabel} has unknown key ${unknown}`;
+        }
+        if (!Array.isArray(group.contours) || group.contours.length === 0) {
+            return `${groupLabel}.contours must be a non-empty array`;
+        }
+        for (let c = 0; c < group.contours.length; c += 1) {
+            const contour = group.contours[c] || {};
+            const contourLabel = `${groupLabel}.contours[${c}]`;
+            const count = Array.isArray(contour.vertices) ? contour.vertices.length : 0;
+            if (count === 0 || !isPointArray(contour.vertices, count)) {
+                return `${contourLabel}.vertices must be a non-empty array of [x, y] numbers`;
             }
-            if (shapeStrokeColor !== undefined) {
-                const validShapeStrokeColor = Array.isArray(shapeStrokeColor)
-                    && shapeStrokeColor.length === 3
-                    && shapeStrokeColor.every((part) => typeof part === 'number' && isFinite(part));
-                if (!validShapeStrokeColor) {
-                    sendBadRequest(res, 'shapeStrokeColor must be an array of 3 numbers when specified');
-                    log('addLayer failed: invalid shapeStrokeColor');
-                    return;
+            for (const key of ['inTangents', 'outTangents']) {
+                if (contour[key] !== undefined && !isPointArray(contour[key], count)) {
+                    return `${contourLabel}.${key} must hold one [x, y] pair per vertex`;
                 }
             }
-            if (
-                shapeStrokeOpacity !== undefined
-                && (typeof shapeStrokeOpacity !== 'number' || !isFinite(shapeStrokeOpacity))
-            ) {
-                sendBadRequest(res, 'shapeStrokeOpacity must be a finite number when specified');
-                log('addLayer failed: invalid shapeStrokeOpacity');
-                return;
+            if (contour.closed !== undefined && typeof contour.closed !== 'boolean') {
+                return `${contourLabel}.closed must be boolean when specified`;
             }
-            if (shapeStrokeWidth !== undefined && (typeof shapeStrokeWidth !== 'number' || !isFinite(shapeStrokeWidth))) {
-                sendBadRequest(res, 'shapeStrokeWidth must be a finite number when specified');
-                log('addLayer failed: invalid shapeStrokeWidth');
-                return;
+        }
+        for (const key of ['fillColor', 'strokeColor']) {
+            if (group[key] !== undefined && !isFiniteNumberArray(group[key], 3)) {
+                return `${groupLabel}.${key} must be an array of 3 numbers when specified`;
             }
-            if (
-                shapeStrokeLineCap !== undefined
-                && !['butt', 'round', 'projecting'].includes(shapeStrokeLineCap)
-            ) {
-                sendBadRequest(res, 'shapeStrokeLineCap must be one of: butt, round, projecting');
-                log('addLayer failed: invalid shapeStrokeLineCap');
-                return;
+        }
+        for (const key of ['fillOpacity', 'strokeOpacity', 'strokeWidth']) {
+            if (group[key] !== undefined && (typeof group[key] !== 'number' || !isFinite(group[key]))) {
+                return `${groupLabel}.${key} must be a finite number when specified`;
             }
-            if (shapeRoundness !== undefined && (typeof shapeRoundness !== 'number' || !isFinite(shapeRoundness))) {
-                sendBadRequest(res, 'shapeRoundness must be a finite number when specified');
-                log('addLayer failed: invalid shapeRoundness');
+        }
+        if (group.fillRule !== undefined && !['nonzero', 'evenodd'].includes(group.fillRule)) {
+            return `${groupLabel}.fillRule must be one of: nonzero, evenodd`;
+        }
+        if (group.strokeLineCap !== undefined && !['butt', 'round', 'projecting'].includes(group.strokeLineCap)) {
+            return `${groupLabel}.strokeLineCap must be one of: butt, round, projecting`;
+        }
+    }
+    return null;
+}
+
+// Validates one addLayer spec and returns { layerType, options } or { error }.
+function normalizeAddLayerSpec(spec) {
+    if (!spec || typeof spec !== 'object' || Array.isArray(spec)) {
+        return { error: 'layer spec must be an object' };
+    }
+    const { layerType, name, text, width, height, color, duration, shapeType } = spec;
+    if (!layerType || typeof layerType !== 'string') {
+        return { error: 'layerType is required and must be a string' };
+    }
+    const normalizedType = layerType.toLowerCase();
+    if (!ADD_LAYER_TYPES.includes(normalizedType)) {
+        return { error: 'Unsupported layerType. Use one of: text, null, solid, shape, footage.' };
+    }
+    if (name !== undefined && typeof name !== 'string') {
+        return { error: 'name must be a string when specified' };
+    }
+    if (text !== undefined && typeof text !== 'string') {
+        return { error: 'text must be a string when specified' };
+    }
+    if (width !== undefined && typeof width !== 'number') {
+        return { error: 'width must be a number when specified' };
+    }
+    if (height !== undefined && typeof height !== 'number') {
+        return { error: 'height must be a number when specified' };
+    }
+    if (duration !== undefined && typeof duration !== 'number') {
+        return { error: 'duration must be a number when specified' };
+    }
+    if (color !== undefined && !(Array.isArray(color) && color.length === 3 && color.every((part) => typeof part === 'number'))) {
+        return { error: 'color must be an array of 3 numbers when specified' };
+    }
+    if (shapeType !== undefined && !['ellipse', 'rect'].includes(shapeType)) {
+        return { error: 'shapeType must be one of: ellipse, rect' };
+    }
+    const vectorChecks = [
+        ['shapeSize', 2],
+        ['shapePosition', 2],
+        ['shapeFillColor', 3],
+        ['shapeStrokeColor', 3],
+    ];
+    for (const [key, length] of vectorChecks) {
+        if (spec[key] !== undefined && !isFiniteNumberArray(spec[key], length)) {
+            return { error: `${key} must be an array of ${length} numbers when specified` };
+        }
+    }
+    const numberKeys = ['shapeFillOpacity', 'shapeStrokeOpacity', 'shapeStrokeWidth', 'shapeRoundness'];
+    for (const key of numberKeys) {
+        if (spec[key] !== undefined && (typeof spec[key] !== 'number' || !isFinite(spec[key]))) {
+            return { error: `${key} must be a finite number when specified` };
+        }
+    }
+    if (
+        spec.shapeStrokeLineCap !== undefined
+        && !['butt', 'round', 'projecting'].includes(spec.shapeStrokeLineCap)
+    ) {
+        return { error: 'shapeStrokeLineCap must be one of: butt, round, projecting' };
+    }
+    if (spec.shapePaths !== undefined) {
+        if (normalizedType !== 'shape') {
+            return { error: 'shapePaths is only supported for shape layers' };
+        }
+        const shapePathsError = validateShapePaths(spec.shapePaths, 'shapePaths');
+        if (shapePathsError) {
+            return { error: shapePathsError };
+        }
+    }
+
+    if (normalizedType === 'footage' || spec.footageHash !== undefined) {
+        if (normalizedType !== 'footage') {
+            return { error: 'footageHash is only supported for footage layers' };
+        }
+        if (typeof spec.footageHash !== 'string' || !FOOTAGE_HASH_PATTERN.test(spec.footageHash)) {
+            return { error: 'footageHash must be a SHA-256 hex string' };
+        }
+    }
+
+    const options = {};
+    ADD_LAYER_OPTION_KEYS.forEach((key) => {
+        if (spec[key] !== undefined) options[key] = spec[key];
+    });
+    return { layerType: normalizedType, options };
+}
+
+function handleAddLayer(req, res) {
+    readJsonBody(req, res, (body) => {
+        const spec = normalizeAddLayerSpec(body);
+        if (spec.error) {
+            sendBadRequest(res, spec.error);
+            log(`addLayer failed: ${spec.error}`);
+            return;
+        }
+
+        const layerTypeLiteral = toExtendScriptStringLiteral(spec.layerType);
+        const optionsLiteral = Object.keys(spec.options).length === 0
+            ? 'null'
+            : toExtendScriptStringLiteral(JSON.stringify(spec.options));
+        const script = `addLayer(${layerTypeLiteral}, ${optionsLiteral})`;
+        handleBridgeMutationCall(script, res, 'addLayer()', 'Failed to add layer');
+    });
+}
+
+function handleAddLayersBatch(req, res) {
+    readJsonBody(req, res, ({ layers, fastApply }) => {
+        const fastApplyError = validateFastApply(fastApply);
+        if (fastApplyError) {
+            sendBadRequest(res, fastApplyError);
+            log(`addLayersBatch failed: ${fastApplyError}`);
+            return;
+        }
+        if (!Array.isArray(layers) || layers.length === 0) {
+            sendBadRequest(res, 'layers must be a non-empty array of layer specs');
+            log('addLayersBatch failed: invalid layers');
+            return;
+        }
+        const specs = [];
+        for (let index = 0; index < layers.length; index += 1) {
+            const spec = normalizeAddLayerSpec(layers[index]);
+            if (spec.error) {
+                sendBadRequest(res, `layers[${index}]: ${spec.error}`);
+                log(`addLayersBatch failed: layers[${index}] ${spec.error}`);
                 return;
             }
+            specs.push({ layerType: spec.layerType, options: spec.options });
+        }
 
-            const options = {};
-            if (name !== undefined) options.name = name;
-            if (text !== undefined) options.text = text;
-            if (width !== undefined) options.width = width;
-            if (height !== undefined) options.height = height;
-            if (color !== undefined) options.color = color;
-            if (duration !== undefined) options.duration = duration;
-            if (shapeType !== undefined) options.shapeType = shapeType;
-            if (shapeSize !== undefined) options.shapeSize = shapeSize;
-            if (shapePosition !== undefined) options.shapePosition = shapePosition;
-            if (shapeFillColor !== undefined) options.shapeFillColor = shapeFillColor;
-            if (shapeFillOpacity !== undefined) options.shapeFillOpacity = shapeFillOpacity;
-            if (shapeStrokeColor !== undefined) options.shapeStrokeColor = shapeStrokeColor;
-            if (shapeStrokeOpacity !== undefined) options.shapeStrokeOpacity = shapeStrokeOpacity;
-            if (shapeStrokeWidth !== undefined) options.shapeStrokeWidth = shapeStrokeWidth;
-            if (shapeStrokeLineCap !== undefined) options.shapeStrokeLineCap = shapeStrokeLineCap;
-            if (shapeRoundness !== undefined) options.shapeRoundness = shapeRoundness;
+        const specsLiteral = toExtendScriptStringLiteral(JSON.stringify(specs));
+        const script = `addLayersBatch(${specsLiteral})`;
+        handleBridgeMutationCall(script, res, 'addLayersBatch()', 'Failed to add layers', {
+            fastApply,
+            units: specs.length,
+        });
+    });
+}
 
-            const layerTypeLiteral = toExtendScriptStringLiteral(normalizedType);
-            const optionsLiteral = Object.keys(options).length === 0
-                ? 'null'
-                : toExtendScriptStringLiteral(JSON.stringify(options));
-            const script = `addLayer(${layerTypeLiteral}, ${optionsLiteral})`;
+function handleAddShapePaths(req, res) {
+    readJsonBody(req, res, ({ layerId, layerName, layerUid, name, paths, fastApply }) => {
+        const fastApplyError = validateFastApply(fastApply);
+        if (fastApplyError) {
+            sendBadRequest(res, fastApplyError);
+            log(`addShapePaths failed: ${fastApplyError}`);
+            return;
+        }
+        let selector = { ok: true, layerIdLiteral: 'null', layerNameLiteral: 'null' };
+        if (layerId !== undefined || layerName !== undefined || layerUid !== undefined) {
+            selector = normalizeLayerSelector(layerId, layerName, layerUid);
+        }
+        if (!selector.ok) {
+            sendBadRequest(res, selector.error);
+            log(`addShapePaths failed: ${selector.error}`);
+            return;
+        }
+        if (name !== undefined && typeof name !== 'string') {
+            sendBadRequest(res, 'name must be a string when specified');
+            log('addShapePaths failed: invalid name');
+            return;
+        }
+        const pathsError = validateShapePaths(paths, 'paths');
+        if (pathsError) {
+            sendBadRequest(res, pathsError);
+            log(`addShapePaths failed: ${pathsError}`);
+            return;
+        }
 
-            log(`Calling ExtendScript: ${script}`);
-            evalHostScript(script, (result) => {
-                try {
-                    const parsedResult = parseBridgeResult(result);
-                    if (parsedResult && parsedResult.status === 'error') {
-                        sendJson(res, 500, {
-                            status: 'error',
-                            message: parsedResult.message || 'Failed to add layer',
-                        });
-                        log(`addLayer failed: ${parsedResult.message || 'Unknown error'}`);
-                        return;
-                    }
-                    sendJson(res, 200, { status: 'success', data: parsedResult });
-                    log('addLayer successful.');
-                } catch (e) {
-                    sendBridgeParseError(res, result, e);
-                    log(`addLayer failed: ${e.toString()}`);
-                }
-            });
-        },
-    );
+        const options = { paths };
+        if (name !== undefined) options.name = name;
+        const optionsLiteral = toExtendScriptStringLiteral(JSON.stringify(options));
+        const script = `addShapePaths(${selector.layerIdLiteral}, ${selector.layerNameLiteral}, ${optionsLiteral})`;
+        handleBridgeMutationCall(script, res, 'addShapePaths()', 'Failed to add shape paths', {
+            fastApply,
+            units: paths.length,
+        });
+    });
 }
 
 function routeShapeRequest(pathname, method, req, res) {
@@ -280,9 +363,17 @@ function routeShapeRequest(pathname, method, req, res) {
         handleAddShapeRepeater(req, res);
         return true;
     }
+    if (pathname === '/shape-paths' && method === 'POST') {
+        handleAddShapePaths(req, res);
+        return true;
+    }
     if (pathname === '/layers' && method === 'POST') {
         handleAddLayer(req, res);
         return true;
     }
+    if (pathname === '/layers/batch' && method === 'POST') {
+        handleAddLayersBatch(req, res);
+        return true;
+    }
     return false;
 }
@@ -1,11 +1,11 @@
 function handleSetInOutPoint(req, res) {
-    readJsonBody(req, res, ({ layerId, layerName, inPoint, outPoint }) => {
+    readJsonBody(req, res, ({ layerId, layerName, layerUid, inPoint, outPoint }) => {
         if (inPoint === undefined && outPoint === undefined) {
             sendBadRequest(res, 'At least one of inPoint/outPoint is required');
             log('setInOutPoint failed: missing parameters');
             return;
         }
-        const selector = normalizeLayerSelector(layerId, layerName);
+        const selector = normalizeLayerSelector(layerId, layerName, layerUid);
         if (!selector.ok) {
             sendBadRequest(res, selector.error);
             log(`setInOutPoint failed: ${selector.error}`);
@@ -30,13 +30,13 @@ function handleSetInOutPoint(req, res) {
 }
 
 function handleMoveLayerTime(req, res) {
-    readJsonBody(req, res, ({ layerId, layerName, delta }) => {
+    readJsonBody(req, res, ({ layerId, layerName, layerUid, delta }) => {
         if (delta === undefined) {
             sendBadRequest(res, 'delta is required');
             log('moveLayerTime failed: missing parameters');
             return;
         }
-        const selector = normalizeLayerSelector(layerId, layerName);
+        const selector = normalizeLayerSelector(layerId, layerName, layerUid);
         if (!selector.ok) {
             sendBadRequest(res, selector.error);
             log(`moveLayerTime failed: ${selector.error}`);
@@ -1,6 +1,9 @@
 let http = null;
 let path = null;
 let fs = null;
+let zlib = null;
+let net = null;
+let os = null;
 let nodeReady = true;
 let nodeInitError = null;
 
@@ -8,6 +11,9 @@ try {
     http = require('http');
     path = require('path');
     fs = require('fs');
+    zlib = require('zlib');
+    net = require('net');
+    os = require('os');
 } catch (e) {
     nodeReady = false;
     nodeInitError = e;
@@ -28,13 +34,42 @@ function toExtendScriptStringLiteral(str) {
     return JSON.stringify(str);
 }
 
+// Set by the /batch handler while it collects the scripts other handlers would run.
+let hostScriptCapture = null;
+
 function evalHostScript(scriptSource, callback) {
+    if (hostScriptCapture) {
+        hostScriptCapture.push({ script: scriptSource, callback });
+        return;
+    }
+    if (typeof enqueueHostScript === 'function') {
+        enqueueHostScript(scriptSource, callback);
+        return;
+    }
+    runHostScriptDirect(scriptSource, (result, timing) => {
+        withHostTiming(timing, () => callback(result));
+    });
+}
+
+function runHostScriptDirect(scriptSource, callback) {
     if (!hostScriptPath) {
-        callback('{"status":"error","message":"Host script unavailable because CEP Node.js is disabled."}');
+        callback('{"status":"error","message":"Host script unavailable because CEP Node.js is disabled."}', {});
         return;
     }
-    const fullScript = `$.evalFile("${hostScriptPath}");${scriptSource}`;
-    csInterface.evalScript(fullScript, callback);
+    const fullScript = `$.hiresTimer;$.evalFile("${hostScriptPath}");`
+        + `aeRunTimed(function () { return ${scriptSource}; }, $.hiresTimer);`;
+    const startedAt = performance.now();
+    csInterface.evalScript(fullScript, (rawResult) => {
+        const roundTripMs = performance.now() - startedAt;
+        const split = splitHostTiming(rawResult);
+        const timing = { evalMs: roundTripMs };
+        if (split.loadMs !== null && split.hostMs !== null) {
+            timing.loadMs = split.loadMs;
+            timing.hostMs = split.hostMs;
+            timing.evalMs = Math.max(0, roundTripMs - split.loadMs - split.hostMs);
+        }
+        callback(split.result, timing);
+    });
 }
 
 function resolveExtensionVersion() {
@@ -0,0 +1,238 @@
+const HOST_PRIORITY_CLASSES = ['read', 'mutation', 'long'];
+const LONG_HOST_FUNCTIONS = ['applyScene', 'precomposeLayers', 'runTransaction'];
+const READ_HOST_FUNCTION_PATTERN = /^(get[A-Z]\w*|listComps)$/;
+const DEFAULT_MAX_QUEUE_DEPTH = 64;
+const SCHEDULER_SAMPLE_LIMIT = 200;
+// Strict priority would let a steady stream of reads (including the change
+// snapshots that follow every mutation) starve mutations and long jobs. At most
+// this many jobs in a row may pass over a waiting lower-priority job ...
+const HOST_PRIORITY_BURST_LIMIT = 8;
+// ... and any job queued this long runs next in arrival order.
+const HOST_JOB_MAX_WAIT_MS = 2000;
+
+const hostQueues = { read: [], mutation: [], long: [] };
+const pendingReads = new Map();
+let activeHostJob = null;
+let hostJobSeq = 0;
+let hostPriorityBurst = 0;
+
+const schedulerStats = {
+    enqueued: 0,
+    coalesced: 0,
+    rejected: 0,
+    completed: 0,
+    promoted: 0,
+    byClass: {
+        read: { completed: 0, waitMs: [], evalMs: [] },
+        mutation: { completed: 0, waitMs: [], evalMs: [] },
+        long: { completed: 0, waitMs: [], evalMs: [] },
+    },
+};
+
+function resolveMaxQueueDepth() {
+    const raw = typeof process !== 'undefined' && process.env ? process.env.AE_BRIDGE_MAX_QUEUE_DEPTH : undefined;
+    const parsed = Number(raw);
+    if (raw !== undefined && Number.isInteger(parsed) && parsed > 0) {
+        return parsed;
+    }
+    return DEFAULT_MAX_QUEUE_DEPTH;
+}
+
+const maxHostQueueDepth = resolveMaxQueueDepth();
+
+function classifyHostScript(scriptSource) {
+    const source = scriptSource.startsWith(FAST_APPLY_PREFIX)
+        ? scriptSource.slice(FAST_APPLY_PREFIX.length)
+        : scriptSource;
+    const match = /^\s*([A-Za-z_$][\w$]*)\s*\(/.exec(source);
+    const functionName = match ? match[1] : '';
+    if (LONG_HOST_FUNCTIONS.includes(functionName)) {
+        return 'long';
+    }
+    if (READ_HOST_FUNCTION_PATTERN.test(functionName)) {
+        return 'read';
+    }
+    return 'mutation';
+}
+
+function getHostQueueDepth() {
+    return HOST_PRIORITY_CLASSES.reduce((total, priority) => total + hostQueues[priority].length, 0);
+}
+
+function isHostQueueFull() {
+    return getHostQueueDepth() >= maxHostQueueDepth;
+}
+
+function recordSchedulerSample(samples, value) {
+    samples.push(value);
+    if (samples.length > SCHEDULER_SAMPLE_LIMIT) {
+        samples.shift();
+    }
+}
+
+function summarizeSamples(samples) {
+    if (samples.length === 0) {
+        return { count: 0, avg: null, p95: null, max: null };
+    }
+    const sorted = samples.slice().sort((a, b) => a - b);
+    const total = sorted.reduce((sum, value) => sum + value, 0);
+    const p95Index = Math.min(sorted.length - 1, Math.ceil(sorted.length * 0.95) - 1);
+    return {
+        count: sorted.length,
+        avg: Math.round((total / sorted.length) * 10) / 10,
+        p95: sorted[p95Index],
+        max: sorted[sorted.length - 1],
+    };
+}
+
+function estimateRetryAfterSeconds() {
+    const allEvalSamples = HOST_PRIORITY_CLASSES.reduce(
+        (samples, priority) => samples.concat(schedulerStats.byClass[priority].evalMs),
+        [],
+    );
+    const avgEvalMs = summarizeSamples(allEvalSamples).avg || 1000;
+    return Math.max(1, Math.ceil((getHostQueueDepth() * avgEvalMs) / 1000));
+}
+
+function oldestQueuedClass(priorities) {
+    return priorities.reduce(
+        (oldest, name) => (oldest === undefined || hostQueues[name][0].id < hostQueues[oldest][0].id ? name : oldest),
+        undefined,
+    );
+}
+
+// Highest non-empty class first, except that an over-age job, or the oldest
+// lower-priority job once the burst limit is reached, is promoted.
+function pickHostPriority(now) {
+    const waiting = HOST_PRIORITY_CLASSES.filter((name) => hostQueues[name].length > 0);
+    if (waiting.length === 0) {
+        return undefined;
+    }
+    const overdue = waiting.filter((name) => now - hostQueues[name][0].enqueuedAt >= HOST_JOB_MAX_WAIT_MS);
+    const lower = waiting.slice(1);
+    let priority = waiting[0];
+    if (overdue.length > 0) {
+        priority = oldestQueuedClass(overdue);
+    } else if (lower.length > 0 && hostPriorityBurst >= HOST_PRIORITY_BURST_LIMIT) {
+        priority = oldestQueuedClass(lower);
+    }
+    if (priority !== waiting[0]) {
+        schedulerStats.promoted += 1;
+    }
+    hostPriorityBurst = priority === waiting[0] && lower.length > 0 ? hostPriorityBurst + 1 : 0;
+    return priority;
+}
+
+function dispatchNextHostJob() {
+    if (activeHostJob !== null) {
+        return;
+    }
+    const priority = pickHostPriority(Date.now());
+    if (priority === undefined) {
+        return;
+    }
+    const job = hostQueues[priority].shift();
+    activeHostJob = job;
+    job.startedAt = Date.now();
+
+    runHostScriptDirect(job.scriptSource, (result, hostTiming) => {
+        const finishedAt = Date.now();
+        const classStats = schedulerStats.byClass[job.priority];
+        classStats.completed += 1;
+        schedulerStats.completed += 1;
+        recordSchedulerSample(classStats.waitMs, job.startedAt - job.enqueuedAt);
+        recordSchedulerSample(classStats.evalMs, finishedAt - job.startedAt);
+        if (job.coalesceKey !== null) {
+            pendingReads.delete(job.coalesceKey);
+        }
+        activeHostJob = null;
+
+        job.callbacks.forEach((waiter) => {
+            try {
+                withHostTiming({ ...hostTiming, queueMs: job.startedAt - waiter.enqueuedAt }, () => {
+                    waiter.callback(result);
+                });
+            } catch (e) {
+                log(`Host job callback failed: ${e.toString()}`);
+            }
+        });
+        dispatchNextHostJob();
+    });
+}
+
+function enqueueHostScript(scriptSource, callback) {
+    const priority = classifyHostScript(scriptSource);
+    const coalesceKey = priority === 'read' ? scriptSource : null;
+
+    if (coalesceKey !== null && pendingReads.has(coalesceKey)) {
+        pendingReads.get(coalesceKey).callbacks.push({ callback, enqueuedAt: Date.now() });
+        schedulerStats.coalesced += 1;
+        return;
+    }
+
+    hostJobSeq += 1;
+    const enqueuedAt = Date.now();
+    const job = {
+        id: hostJobSeq,
+        priority,
+        scriptSource,
+        coalesceKey,
+        callbacks: [{ callback, enqueuedAt }],
+        enqueuedAt,
+        startedAt: null,
+    };
+    if (coalesceKey !== null) {
+        pendingReads.set(coalesceKey, job);
+    }
+    hostQueues[priority].push(job);
+    schedulerStats.enqueued += 1;
+    dispatchNextHostJob();
+}
+
+function rejectForFullQueue(res) {
+    schedulerStats.rejected += 1;
+    const retryAfter = estimateRetryAfterSeconds();
+    res.setHeader('Retry-After', String(retryAfter));
+    sendJson(res, 503, {
+        status: 'error',
+        message: `Bridge queue is full (${getHostQueueDepth()}/${maxHostQueueDepth}). Retry after ${retryAfter}s.`,
+    });
+    log(`Request rejected: host queue full (${getHostQueueDepth()}/${maxHostQueueDepth}).`);
+}
+
+function getSchedulerMetrics() {
+    const now = Date.now();
+    const queued = {};
+    const classes = {};
+    HOST_PRIORITY_CLASSES.forEach((priority) => {
+        const queue = hostQueues[priority];
+        const classStats = schedulerStats.byClass[priority];
+        queued[priority] = queue.length;
+        classes[priority] = {
+            queued: queue.length,
+            oldestWaitMs: queue.length > 0 ? now - queue[0].enqueuedAt : 0,
+            completed: classStats.completed,
+            waitMs: summarizeSamples(classStats.waitMs),
+            evalMs: summarizeSamples(classStats.evalMs),
+        };
+    });
+    return {
+        depth: getHostQueueDepth(),
+        maxDepth: maxHostQueueDepth,
+        queued,
+        active: activeHostJob === null
+            ? null
+            : {
+                id: activeHostJob.id,
+                priority: activeHostJob.priority,
+                runningMs: now - activeHostJob.startedAt,
+                waiters: activeHostJob.callbacks.length,
+            },
+        enqueued: schedulerStats.enqueued,
+        coalesced: schedulerStats.coalesced,
+        rejected: schedulerStats.rejected,
+        completed: schedulerStats.completed,
+        promoted: schedulerStats.promoted,
+        classes,
+    };
+}
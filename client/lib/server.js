@@ -1,4 +1,102 @@
 const BRIDGE_PORT = 8080;
+const BRIDGE_WORKSPACE_NAME = 'ae-agent-skills';
+const BRIDGE_SOCKET_NAME = 'bridge.sock';
+
+// AE_BRIDGE_SOCKET overrides the socket path; "off" keeps the bridge TCP-only.
+function resolveBridgeSocketPath() {
+    if (process.platform === 'win32') {
+        return null;
+    }
+    const raw = process.env.AE_BRIDGE_SOCKET;
+    if (raw !== undefined) {
+        const trimmed = raw.trim();
+        if (['', '0', 'off', 'none'].includes(trimmed.toLowerCase())) {
+            return null;
+        }
+        return trimmed.startsWith('~/') ? path.join(os.homedir(), trimmed.slice(2)) : trimmed;
+    }
+    return path.join(os.homedir(), BRIDGE_WORKSPACE_NAME, BRIDGE_SOCKET_NAME);
+}
+
+// Remove a socket file left behind by a crashed panel, but never one that
+// another After Effects instance is still serving.
+function clearStaleSocket(socketPath, onReady) {
+    let stats = null;
+    try {
+        stats = fs.statSync(socketPath);
+    } catch (e) {
+        onReady(true);
+        return;
+    }
+    if (!stats.isSocket()) {
+        log(`Bridge socket path exists and is not a socket: ${socketPath}`);
+        onReady(false);
+        return;
+    }
+    const probe = net.connect(socketPath);
+    probe.once('connect', () => {
+        probe.destroy();
+        log(`Bridge socket ${socketPath} is already in use; continuing with TCP only.`);
+        onReady(false);
+    });
+    probe.once('error', (err) => {
+        // Only a refused connection proves nobody serves the socket; other errors
+        // (EACCES, ...) leave the file alone.
+        if (!err || err.code !== 'ECONNREFUSED') {
+            log(`Bridge socket ${socketPath} could not be probed (${err ? err.code || err.toString() : 'unknown error'}); continuing with TCP only.`);
+            onReady(false);
+            return;
+        }
+        try {
+            fs.unlinkSync(socketPath);
+            onReady(true);
+        } catch (e) {
+            log(`Failed to remove stale bridge socket: ${e.toString()}`);
+            onReady(false);
+        }
+    });
+}
+
+function startBridgeSocketServer(handler) {
+    const socketPath = resolveBridgeSocketPath();
+    if (!socketPath) {
+        return;
+    }
+    try {
+        fs.mkdirSync(path.dirname(socketPath), { recursive: true, mode: 0o700 });
+    } catch (e) {
+        log(`Failed to prepare bridge socket directory: ${e.toString()}`);
+        return;
+    }
+    clearStaleSocket(socketPath, (ready) => {
+        if (!ready) {
+            return;
+        }
+        const socketServer = http.createServer(handler);
+        socketServer.on('error', (err) => {
+            log(`Failed to start bridge socket: ${err ? err.toString() : 'Unknown error'}`);
+        });
+        const onListening = () => {
+            fs.chmodSync(socketPath, 0o600);
+            log(`Server listening on unix://${socketPath}`);
+            process.once('exit', () => {
+                try {
+                    fs.unlinkSync(socketPath);
+                } catch (e) {
+                    // Already gone.
+                }
+            });
+        };
+        // listen() creates the socket file with the umask's permissions and the
+        // directory may be shared or pre-existing, so tighten the umask around it.
+        const previousUmask = process.umask(0o177);
+        try {
+            socketServer.listen(socketPath, onListening);
+        } finally {
+            process.umask(previousUmask);
+        }
+    });
+}
 
 function startBridgeServer() {
     if (!nodeReady) {
@@ -11,9 +109,10 @@ function startBridgeServer() {
         return;
     }
 
-    const server = http.createServer((req, res) => {
+    const handler = (req, res) => {
         routeRequest(req, res);
-    });
+    };
+    const server = http.createServer(handler);
 
     server.on('error', (err) => {
         if (err && err.code === 'EADDRINUSE') {
@@ -28,6 +127,7 @@ function startBridgeServer() {
         log(`Server listening on http://127.0.0.1:${BRIDGE_PORT}`);
         log('HTTPブリッジを起動しました。CLI から利用してください。');
     });
+    startBridgeSocketServer(handler);
 
     log('main.js loaded.');
 }
@@ -6,6 +6,8 @@ $.evalFile(File(__AE_AGENT_HOST_ROOT + "/lib/query_handlers.jsx"));
 $.evalFile(File(__AE_AGENT_HOST_ROOT + "/lib/mutation_handlers.jsx"));
 $.evalFile(File(__AE_AGENT_HOST_ROOT + "/lib/mutation_keyframe_handlers.jsx"));
 $.evalFile(File(__AE_AGENT_HOST_ROOT + "/lib/mutation_shape_handlers.jsx"));
+$.evalFile(File(__AE_AGENT_HOST_ROOT + "/lib/mutation_footage_handlers.jsx"));
 $.evalFile(File(__AE_AGENT_HOST_ROOT + "/lib/mutation_timeline_handlers.jsx"));
 $.evalFile(File(__AE_AGENT_HOST_ROOT + "/lib/mutation_layer_structure_handlers.jsx"));
 $.evalFile(File(__AE_AGENT_HOST_ROOT + "/lib/mutation_scene_handlers.jsx"));
+$.evalFile(File(__AE_AGENT_HOST_ROOT + "/lib/mutation_transaction_handlers.jsx"));
@@ -14,6 +14,61 @@ function encodePayload(data) {
     }
 }
 
+function aeRunTimed(thunk, loadMicros) {
+    $.hiresTimer;
+    var result = thunk();
+    var runMicros = $.hiresTimer;
+    return "__TIME__" + loadMicros + "," + runMicros + ";" + String(result);
+}
+
+// Fast apply: suppresses dialogs and switches the active viewer's views to
+// wireframe Fast Previews so bulk edits don't redraw full frames. Scripts cannot
+// pause viewer updates outright; wireframe is the cheapest redraw AE offers.
+function aeBeginFastApply() {
+    var state = { dialogs: false, views: [] };
+    try {
+        app.beginSuppressDialogs();
+        state.dialogs = true;
+    } catch (dialogError) {}
+    try {
+        var viewer = app.activeViewer;
+        if (viewer && viewer.views && typeof FastPreviewType !== "undefined") {
+            for (var i = 0; i < viewer.views.length; i++) {
+                var options = viewer.views[i].options;
+                state.views.push({ options: options, fastPreview: options.fastPreview });
+                options.fastPreview = FastPreviewType.FP_WIREFRAME;
+            }
+        }
+    } catch (viewerError) {
+        log("aeBeginFastApply() could not change viewer previews: " + viewerError.toString());
+    }
+    return state;
+}
+
+function aeEndFastApply(state) {
+    for (var i = 0; i < state.views.length; i++) {
+        try {
+            state.views[i].options.fastPreview = state.views[i].fastPreview;
+        } catch (viewerError) {
+            log("aeEndFastApply() could not restore a viewer preview: " + viewerError.toString());
+        }
+    }
+    if (state.dialogs) {
+        try {
+            app.endSuppressDialogs(false);
+        } catch (dialogError) {}
+    }
+}
+
+function aeFastApply(thunk) {
+    var state = aeBeginFastApply();
+    try {
+        return thunk();
+    } finally {
+        aeEndFastApply(state);
+    }
+}
+
 function getLayerTypeName(layer) {
     if (layer instanceof TextLayer) {
         return "Text";
@@ -82,24 +137,88 @@ function aeTryGetLayerUid(layer) {
     return null;
 }
 
+// Layer uid references arrive from the panel as { uid: "123" } in place of a layer index.
+function aeIsLayerUidRef(value) {
+    return value !== null && typeof value === "object" && value.uid !== undefined && value.uid !== null;
+}
+
+function aeIndexLayerUids(comp) {
+    var byUid = {};
+    for (var i = 1; i <= comp.numLayers; i++) {
+        var layer = comp.layer(i);
+        var uid = aeTryGetLayerUid(layer);
+        if (uid !== null) {
+            byUid[uid] = layer;
+        }
+    }
+    return byUid;
+}
+
+function aeLayerUidMaps() {
+    if (!$.global.__aeLayerUidMaps) {
+        $.global.__aeLayerUidMaps = {};
+    }
+    return $.global.__aeLayerUidMaps;
+}
+
+// Replaces the cached uid map of a comp, for callers that just scanned its layers.
+function aeStoreLayerUidMap(comp, byUid) {
+    aeLayerUidMaps()["comp" + comp.id] = byUid;
+}
+
+// uid -> layer maps per comp id, kept across calls in $.global. A cached layer is
+// trusted only if it still reports the same uid and comp; otherwise the comp is
+// re-indexed once.
+function aeFindLayerByUid(comp, uid) {
+    var maps = aeLayerUidMaps();
+    var key = String(uid);
+    var compKey = "comp" + comp.id;
+    var cached = maps[compKey] ? maps[compKey][key] : null;
+    if (cached) {
+        try {
+            if (aeTryGetLayerUid(cached) === key && cached.containingComp.id === comp.id) {
+                return cached;
+            }
+        } catch (eStale) {}
+    }
+    aeStoreLayerUidMap(comp, aeIndexLayerUids(comp));
+    return maps[compKey].hasOwnProperty(key) ? maps[compKey][key] : null;
+}
+
+// Resolves a layer index or { uid } reference. Returns { layer, error }.
+function aeResolveLayerRef(comp, ref, label) {
+    if (!comp || !(comp instanceof CompItem)) {
+        return { layer: null, error: "Active composition not found." };
+    }
+    var what = label || "Layer";
+    if (aeIsLayerUidRef(ref)) {
+        var byUid = aeFindLayerByUid(comp, ref.uid);
+        if (!byUid) {
+            return { layer: null, error: what + " with uid " + ref.uid + " not found." };
+        }
+        return { layer: byUid, error: null };
+    }
+    var index = aeNormalizeLayerId(ref);
+    var byIndex = index === null || index > comp.numLayers ? null : comp.layer(index);
+    if (!byIndex) {
+        return { layer: null, error: what + " with id " + ref + " not found." };
+    }
+    return { layer: byIndex, error: null };
+}
+
 function aeResolveLayer(comp, layerId, layerName) {
     if (!comp || !(comp instanceof CompItem)) {
         return { layer: null, error: "Active composition not found." };
     }
 
-    var normalizedId = aeNormalizeLayerId(layerId);
-    var hasLayerId = normalizedId !== null;
+    var hasLayerId = aeIsLayerUidRef(layerId) || aeNormalizeLayerId(layerId) !== null;
     var hasLayerName = layerName !== null && layerName !== undefined && String(layerName).length > 0;
     if ((hasLayerId && hasLayerName) || (!hasLayerId && !hasLayerName)) {
-        return { layer: null, error: "Provide exactly one of layerId or layerName." };
+        return { layer: null, error: "Provide exactly one of layerId, layerUid or layerName." };
     }
 
     if (hasLayerId) {
-        var layerById = comp.layer(normalizedId);
-        if (!layerById) {
-            return { layer: null, error: "Layer with id " + normalizedId + " not found." };
-        }
-        return { layer: layerById, error: null };
+        return aeResolveLayerRef(comp, layerId);
     }
 
     var targetName = String(layerName);
@@ -121,8 +240,174 @@ function aeResolveLayer(comp, layerId, layerName) {
     if (matchCount > 1) {
         return {
             layer: null,
-            error: "Layer name '" + targetName + "' is ambiguous (" + matchCount + " matches). Use layerId."
+            error: "Layer name '" + targetName + "' is ambiguous (" + matchCount + " matches). Use layerUid or layerId."
         };
     }
     return { layer: matched, error: null };
 }
+
+// Project item index kept across calls in $.global: id -> item, name -> items and
+// type ("comp", "footage", "folder", "other") -> items, each in project order.
+// It is reused while numItems, the project file and the revision counter are
+// unchanged. Handlers that add items extend it with aeIndexProjectItem(); ones
+// that remove or restore items call aeBumpProjectRevision(). Edits made in the
+// UI can keep numItems equal, so lookups re-check the items they return.
+function aeBumpProjectRevision() {
+    $.global.__aeProjectRevision = ($.global.__aeProjectRevision || 0) + 1;
+}
+
+function aeProjectFileKey() {
+    try {
+        return app.project.file ? app.project.file.fsName : "";
+    } catch (e) {
+        return "";
+    }
+}
+
+function aeProjectItemTypeName(item) {
+    if (item instanceof CompItem) {
+        return "comp";
+    }
+    if (item instanceof FootageItem) {
+        return "footage";
+    }
+    if (item instanceof FolderItem) {
+        return "folder";
+    }
+    return "other";
+}
+
+function aeAddToProjectItemIndex(index, item) {
+    var nameKey = "n:" + item.name;
+    index.byId["id" + item.id] = item;
+    if (!index.byName.hasOwnProperty(nameKey)) {
+        index.byName[nameKey] = [];
+    }
+    index.byName[nameKey].push(item);
+    index.byType[aeProjectItemTypeName(item)].push(item);
+}
+
+function aeProjectItemIndex(forceRebuild) {
+    var numItems = app.project.numItems;
+    var revision = $.global.__aeProjectRevision || 0;
+    var fileKey = aeProjectFileKey();
+    var cache = $.global.__aeProjectItemIndex;
+    if (
+        !forceRebuild
+        && cache
+        && cache.numItems === numItems
+        && cache.revision === revision
+        && cache.fileKey === fileKey
+    ) {
+        return cache;
+    }
+    cache = {
+        numItems: numItems,
+        revision: revision,
+        fileKey: fileKey,
+        byId: {},
+        byName: {},
+        byType: { comp: [], footage: [], folder: [], other: [] }
+    };
+    for (var i = 1; i <= numItems; i++) {
+        var item = app.project.item(i);
+        if (item) {
+            aeAddToProjectItemIndex(cache, item);
+        }
+    }
+    $.global.__aeProjectItemIndex = cache;
+    return cache;
+}
+
+// Records an item the caller just added. A cache that was not current before the
+// add is dropped instead, so the next lookup rebuilds it.
+function aeIndexProjectItem(item) {
+    var cache = $.global.__aeProjectItemIndex;
+    if (!cache) {
+        return;
+    }
+    if (cache.numItems !== app.project.numItems - 1 || cache.revision !== ($.global.__aeProjectRevision || 0)) {
+        $.global.__aeProjectItemIndex = null;
+        return;
+    }
+    aeAddToProjectItemIndex(cache, item);
+    cache.numItems = app.project.numItems;
+}
+
+function aeFindIndexedCompById(index, id) {
+    var item = index.byId.hasOwnProperty("id" + id) ? index.byId["id" + id] : null;
+    try {
+        return item && item.id === id && item instanceof CompItem ? item : null;
+    } catch (eStale) {
+        return null;
+    }
+}
+
+function aeFindIndexedCompByName(index, name) {
+    var nameKey = "n:" + name;
+    var candidates = index.byName.hasOwnProperty(nameKey) ? index.byName[nameKey] : [];
+    for (var i = 0; i < candidates.length; i++) {
+        try {
+            if (candidates[i] instanceof CompItem && candidates[i].name === name) {
+                return candidates[i];
+            }
+        } catch (eStale) {}
+    }
+    return null;
+}
+
+// Finds a comp by id, then by name. A miss rebuilds the index once, which covers
+// items renamed or replaced outside the bridge.
+function aeFindCompInProject(compId, compName) {
+    var previous = $.global.__aeProjectItemIndex;
+    var index = aeProjectItemIndex(false);
+    var fresh = index !== previous;
+    for (var attempt = 0; attempt < 2; attempt++) {
+        if (compId !== null) {
+            var byId = aeFindIndexedCompById(index, compId);
+            if (byId) {
+                return byId;
+            }
+        }
+        if (compName) {
+            var byName = aeFindIndexedCompByName(index, compName);
+            if (byName) {
+                return byName;
+            }
+        }
+        if (fresh) {
+            break;
+        }
+        index = aeProjectItemIndex(true);
+        fresh = true;
+    }
+    return null;
+}
+
+// Returns the indexed comps in project order, rebuilding once if any of them
+// was removed since the index was built.
+function aeProjectComps() {
+    var index = aeProjectItemIndex(false);
+    var comps = index.byType.comp;
+    for (var i = 0; i < comps.length; i++) {
+        try {
+            if (comps[i] instanceof CompItem && comps[i].id !== undefined) {
+                continue;
+            }
+        } catch (eStale) {}
+        return aeProjectItemIndex(true).byType.comp;
+    }
+    return comps;
+}
+
+// "Shots/Act 1" for an item in that folder; "" for the root folder.
+function aeProjectItemFolderPath(item) {
+    var names = [];
+    var rootId = app.project.rootFolder.id;
+    var folder = item.parentFolder;
+    while (folder && folder.id !== rootId) {
+        names.unshift(folder.name);
+        folder = folder.parentFolder;
+    }
+    return names.join("/");
+}
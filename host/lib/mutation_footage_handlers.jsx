@@ -0,0 +1,170 @@
+var AE_FOOTAGE_HASH_PREFIX = "aeFootageHash:";
+
+function aeExtractFootageHash(comment) {
+    if (comment === null || comment === undefined) {
+        return null;
+    }
+    var lines = String(comment).split(/\r?\n/);
+    for (var i = 0; i < lines.length; i++) {
+        if (lines[i].indexOf(AE_FOOTAGE_HASH_PREFIX) === 0) {
+            var hash = lines[i].substring(AE_FOOTAGE_HASH_PREFIX.length);
+            if (hash.length > 0) {
+                return hash;
+            }
+        }
+    }
+    return null;
+}
+
+function aeAttachFootageHash(item, hash) {
+    var rawComment = "";
+    try {
+        rawComment = item.comment ? String(item.comment) : "";
+    } catch (eCommentRead) {
+        rawComment = "";
+    }
+    var lines = rawComment.length > 0 ? rawComment.split(/\r?\n/) : [];
+    var nextLines = [];
+    for (var i = 0; i < lines.length; i++) {
+        if (lines[i].indexOf(AE_FOOTAGE_HASH_PREFIX) !== 0) {
+            nextLines.push(lines[i]);
+        }
+    }
+    nextLines.push(AE_FOOTAGE_HASH_PREFIX + hash);
+    item.comment = nextLines.join("\n");
+}
+
+// Hash -> FootageItem index read from the comments of the footage items in the
+// project item index. It is cached across host calls for as long as that index
+// is; hits re-check the item's comment, so a stale entry (item replaced at the
+// same count) also forces a rebuild.
+function aeFootageHashIndex(forceRebuild) {
+    var items = aeProjectItemIndex(forceRebuild);
+    var cache = $.global.__aeFootageHashIndex;
+    if (!forceRebuild && cache && cache.items === items) {
+        return cache;
+    }
+    var byHash = {};
+    var footage = items.byType.footage;
+    for (var i = 0; i < footage.length; i++) {
+        var hash = aeExtractFootageHash(footage[i].comment);
+        if (hash && !byHash.hasOwnProperty(hash)) {
+            byHash[hash] = footage[i];
+        }
+    }
+    cache = { items: items, byHash: byHash };
+    $.global.__aeFootageHashIndex = cache;
+    return cache;
+}
+
+function aeFootageIndexEntryValid(item, hash) {
+    try {
+        return item instanceof FootageItem && aeExtractFootageHash(item.comment) === hash;
+    } catch (e) {
+        return false;
+    }
+}
+
+function aeFindFootageByHash(hash) {
+    if (!hash) {
+        return null;
+    }
+    var key = String(hash).toLowerCase();
+    var index = aeFootageHashIndex(false);
+    if (!index.byHash.hasOwnProperty(key)) {
+        return null;
+    }
+    if (aeFootageIndexEntryValid(index.byHash[key], key)) {
+        return index.byHash[key];
+    }
+    index = aeFootageHashIndex(true);
+    return index.byHash.hasOwnProperty(key) ? index.byHash[key] : null;
+}
+
+function aeFindOrCreateRootFolder(name) {
+    var folders = aeProjectItemIndex(false).byType.folder;
+    for (var i = 0; i < folders.length; i++) {
+        try {
+            if (folders[i].name === name && folders[i].parentFolder.id === app.project.rootFolder.id) {
+                return folders[i];
+            }
+        } catch (eStale) {}
+    }
+    var folder = app.project.items.addFolder(name);
+    aeIndexProjectItem(folder);
+    return folder;
+}
+
+// Imports files as footage in one undo group. files: [{ path, hash }] with
+// lowercase SHA-256 hex hashes computed by the client. Files whose hash is
+// already tagged on a project item are skipped; per-file failures are reported
+// inline and do not stop the rest.
+function importFootage(filesJSON, optionsJSON) {
+    var undoOpened = false;
+    try {
+        ensureJSON();
+        var files = JSON.parse(filesJSON);
+        if (!(files instanceof Array) || files.length === 0) {
+            return encodePayload({ status: "error", message: "files must be a non-empty array." });
+        }
+        var options = optionsJSON && optionsJSON !== "null" ? JSON.parse(optionsJSON) : {};
+
+        app.beginUndoGroup("Import Footage");
+        undoOpened = true;
+        var folder = options.folder ? aeFindOrCreateRootFolder(String(options.folder)) : null;
+        var imported = [];
+        var skipped = [];
+        var errors = [];
+        for (var n = 0; n < files.length; n++) {
+            var path = String(files[n].path);
+            var hash = String(files[n].hash).toLowerCase();
+            var existing = aeFindFootageByHash(hash);
+            if (existing) {
+                skipped.push({ index: n, path: path, hash: hash, itemId: existing.id, itemName: existing.name });
+                continue;
+            }
+            try {
+                var file = new File(path);
+                if (!file.exists) {
+                    errors.push({ index: n, path: path, hash: hash, error: "File not found." });
+                    continue;
+                }
+                var importOptions = new ImportOptions(file);
+                if (!importOptions.canImportAs(ImportAsType.FOOTAGE)) {
+                    errors.push({ index: n, path: path, hash: hash, error: "File cannot be imported as footage." });
+                    continue;
+                }
+                importOptions.importAs = ImportAsType.FOOTAGE;
+                var item = app.project.importFile(importOptions);
+                aeAttachFootageHash(item, hash);
+                if (folder) {
+                    item.parentFolder = folder;
+                }
+                // The lookup above left both indexes current, so extend them instead of rescanning.
+                aeIndexProjectItem(item);
+                $.global.__aeFootageHashIndex.byHash[hash] = item;
+                imported.push({ index: n, path: path, hash: hash, itemId: item.id, itemName: item.name });
+            } catch (importError) {
+                errors.push({ index: n, path: path, hash: hash, error: importError.toString() });
+            }
+        }
+        app.endUndoGroup();
+        undoOpened = false;
+
+        return encodePayload({
+            status: "success",
+            importedCount: imported.length,
+            skippedCount: skipped.length,
+            errorCount: errors.length,
+            imported: imported,
+            skipped: skipped,
+            errors: errors
+        });
+    } catch (e) {
+        if (undoOpened) {
+            app.endUndoGroup();
+        }
+        log("importFootage() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
@@ -65,19 +65,7 @@ function findCompByIdOrName(compId, compName) {
         }
     }
 
-    for (var i = 1; i <= app.project.numItems; i++) {
-        var item = app.project.item(i);
-        if (!item || !(item instanceof CompItem)) {
-            continue;
-        }
-        if (targetId !== null && item.id === targetId) {
-            return item;
-        }
-        if (compName && item.name === compName) {
-            return item;
-        }
-    }
-    return null;
+    return aeFindCompInProject(targetId, compName ? String(compName) : null);
 }
 
 function setExpression(layerId, layerName, propertyPath, expression) {
@@ -149,6 +137,89 @@ function addEffect(layerId, layerName, effectMatchName, effectName) {
     }
 }
 
+// Applies the same effect stack to many layers. layers: [{ layerId | layerUid | layerName }],
+// effects: [{ matchName, name, params }]. Existing effects (same matchName and name) are
+// reused and only parameters that differ are written. Unresolved layers are reported inline.
+function applyEffectsBatch(layersJSON, effectsJSON) {
+    var undoOpened = false;
+    try {
+        ensureJSON();
+        var comp = app.project.activeItem;
+        if (!comp || !(comp instanceof CompItem)) {
+            return encodePayload({ status: "error", message: "Active composition not found." });
+        }
+        var layerRefs = JSON.parse(layersJSON);
+        var effects = JSON.parse(effectsJSON);
+
+        app.beginUndoGroup("Apply Effects");
+        undoOpened = true;
+        var results = [];
+        var totals = { added: 0, reused: 0, paramsSet: 0, errors: 0 };
+        for (var i = 0; i < layerRefs.length; i++) {
+            var ref = layerRefs[i];
+            var resolved = ref.layerUid !== undefined
+                ? aeResolveLayerRef(comp, { uid: ref.layerUid })
+                : aeResolveLayer(comp, ref.layerId !== undefined ? ref.layerId : null, ref.layerName !== undefined ? ref.layerName : null);
+            if (resolved.error) {
+                results.push({ index: i, error: resolved.error });
+                totals.errors += 1;
+                continue;
+            }
+            var layer = resolved.layer;
+            var entry = { index: i, layerId: layer.index, layerUid: aeTryGetLayerUid(layer), layerName: layer.name, added: 0, reused: 0, paramsSet: 0 };
+            try {
+                var effectGroup = layer.property("ADBE Effect Parade");
+                if (!effectGroup) {
+                    throw new Error("Effects group not found on layer.");
+                }
+                for (var j = 0; j < effects.length; j++) {
+                    var effectSpec = effects[j];
+                    var effectName = effectSpec.name !== undefined ? effectSpec.name : null;
+                    var effect = aeFindExistingEffect(layer, effectSpec.matchName, effectName);
+                    if (effect) {
+                        entry.reused += 1;
+                    } else {
+                        effect = effectGroup.addProperty(effectSpec.matchName);
+                        if (!effect) {
+                            throw new Error("Failed to add effect: " + effectSpec.matchName);
+                        }
+                        if (effectName) {
+                            effect.name = effectName;
+                        }
+                        entry.added += 1;
+                    }
+                    entry.paramsSet += aeApplyEffectParams(effect, effectSpec.params);
+                }
+            } catch (eLayer) {
+                entry.error = eLayer.toString();
+                totals.errors += 1;
+            }
+            totals.added += entry.added;
+            totals.reused += entry.reused;
+            totals.paramsSet += entry.paramsSet;
+            results.push(entry);
+        }
+        app.endUndoGroup();
+        undoOpened = false;
+
+        return encodePayload({
+            status: "success",
+            layerCount: layerRefs.length,
+            effectsAdded: totals.added,
+            effectsReused: totals.reused,
+            paramsSet: totals.paramsSet,
+            errorCount: totals.errors,
+            layers: results
+        });
+    } catch (e) {
+        if (undoOpened) {
+            app.endUndoGroup();
+        }
+        log("applyEffectsBatch() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
+
 function addEssentialProperty(layerId, layerName, propertyPath, essentialName) {
     try {
         ensureJSON();
@@ -272,6 +343,7 @@ function createComp(name, width, height, pixelAspect, duration, frameRate) {
         if (!comp) {
             return encodePayload({ status: "error", message: "Failed to create comp." });
         }
+        aeIndexProjectItem(comp);
         comp.openInViewer();
 
         return encodePayload({
@@ -356,3 +428,104 @@ function setPropertyValue(layerId, layerName, propertyPath, valueJSON) {
         return encodePayload({ status: "error", message: e.toString() });
     }
 }
+
+// Sets the Source Text of many text layers. entries: [{ layerId | layerUid | layerName, text }].
+// Layers are looked up in one pass over the comp; missing, ambiguous and non-text
+// layers are reported and skipped. A layer listed twice gets its last text.
+function setTextsBatch(entriesJSON) {
+    var undoOpened = false;
+    try {
+        ensureJSON();
+        var comp = app.project.activeItem;
+        if (!comp || !(comp instanceof CompItem)) {
+            return encodePayload({ status: "error", message: "Active composition not found." });
+        }
+        var entries = JSON.parse(entriesJSON);
+        if (!(entries instanceof Array) || entries.length === 0) {
+            return encodePayload({ status: "error", message: "texts must be a non-empty array." });
+        }
+
+        var byName = {};
+        var byUid = {};
+        for (var i = 1; i <= comp.numLayers; i++) {
+            var candidate = comp.layer(i);
+            var nameKey = "n" + candidate.name;
+            if (!byName.hasOwnProperty(nameKey)) {
+                byName[nameKey] = [];
+            }
+            byName[nameKey].push(candidate);
+            var uid = aeTryGetLayerUid(candidate);
+            if (uid !== null) {
+                byUid[uid] = candidate;
+            }
+        }
+        // The scan doubles as a fresh uid index for later uid lookups.
+        aeStoreLayerUidMap(comp, byUid);
+
+        var notFound = [];
+        var skipped = [];
+        var targets = [];
+        var targetByIndex = {};
+        for (var n = 0; n < entries.length; n++) {
+            var entry = entries[n];
+            var layer = null;
+            if (entry.layerUid !== undefined && entry.layerUid !== null) {
+                layer = byUid.hasOwnProperty(String(entry.layerUid)) ? byUid[String(entry.layerUid)] : null;
+            } else if (entry.layerId !== undefined && entry.layerId !== null) {
+                layer = entry.layerId >= 1 && entry.layerId <= comp.numLayers ? comp.layer(entry.layerId) : null;
+            } else {
+                var matches = byName["n" + entry.layerName] || [];
+                if (matches.length > 1) {
+                    skipped.push({ index: n, layerName: entry.layerName, reason: "ambiguous name (" + matches.length + " matches)" });
+                    continue;
+                }
+                layer = matches.length === 1 ? matches[0] : null;
+            }
+            if (!layer) {
+                notFound.push({ index: n, layerId: entry.layerId, layerUid: entry.layerUid, layerName: entry.layerName });
+                continue;
+            }
+            if (!(layer instanceof TextLayer)) {
+                skipped.push({ index: n, layerId: layer.index, layerName: layer.name, reason: "not a text layer" });
+                continue;
+            }
+            if (!targetByIndex.hasOwnProperty(layer.index)) {
+                targetByIndex[layer.index] = targets.length;
+                targets.push({ layer: layer, text: null });
+            }
+            targets[targetByIndex[layer.index]].text = String(entry.text);
+        }
+
+        app.beginUndoGroup("Set Texts");
+        undoOpened = true;
+        var updated = 0;
+        var unchanged = 0;
+        for (var t = 0; t < targets.length; t++) {
+            var textProp = targets[t].layer.property("ADBE Text Properties").property("ADBE Text Document");
+            var textDoc = textProp.value;
+            if (textDoc.text === targets[t].text) {
+                unchanged += 1;
+                continue;
+            }
+            textDoc.text = targets[t].text;
+            textProp.setValue(textDoc);
+            updated += 1;
+        }
+        app.endUndoGroup();
+        undoOpened = false;
+
+        return encodePayload({
+            status: "success",
+            updatedCount: updated,
+            unchangedCount: unchanged,
+            notFound: notFound,
+            skipped: skipped
+        });
+    } catch (e) {
+        if (undoOpened) {
+            app.endUndoGroup();
+        }
+        log("setTextsBatch() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
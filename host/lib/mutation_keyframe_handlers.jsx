@@ -98,6 +98,19 @@ function toTemporalEaseArray(spec, dimensions, label) {
         for (var i = 0; i < dimensions; i += 1) {
             pairs.push([spec[0], spec[1]]);
         }
+    } else if (dimensions === 1 && spec instanceof Array && spec.length > 1 && spec[0] instanceof Array) {
+        // Per-dimension eases for a spatial property (one temporal dimension):
+        // speed along the path is the magnitude, influence the mean.
+        var squaredSpeed = 0;
+        var influenceSum = 0;
+        for (var c = 0; c < spec.length; c += 1) {
+            if (!(spec[c] instanceof Array) || spec[c].length !== 2) {
+                throw new Error(label + " must be [speed,influence] or an array of [speed,influence] per dimension.");
+            }
+            squaredSpeed += Number(spec[c][0]) * Number(spec[c][0]);
+            influenceSum += Number(spec[c][1]);
+        }
+        pairs.push([Math.sqrt(squaredSpeed), influenceSum / spec.length]);
     } else if (spec instanceof Array && spec.length === dimensions) {
         for (var j = 0; j < spec.length; j += 1) {
             var part = spec[j];
@@ -263,3 +276,127 @@ function setKeyframe(layerId, layerName, propertyPath, time, valueJSON, optionsJ
         return encodePayload({ status: "error", message: e.toString() });
     }
 }
+
+function setKeyframesBatch(layerId, layerName, propertyPath, keyframesJSON) {
+    var undoOpened = false;
+    try {
+        ensureJSON();
+        var comp = app.project.activeItem;
+        var resolvedLayer = aeResolveLayer(comp, layerId, layerName);
+        if (resolvedLayer.error) {
+            return encodePayload({ status: "error", message: resolvedLayer.error });
+        }
+        var layer = resolvedLayer.layer;
+
+        var prop = resolveProperty(layer, propertyPath);
+        if (!prop) {
+            return encodePayload({ status: "error", message: "Property with path '" + propertyPath + "' not found." });
+        }
+        if (typeof prop.canVaryOverTime === "boolean" && !prop.canVaryOverTime) {
+            return encodePayload({ status: "error", message: "Property cannot be keyframed." });
+        }
+
+        var keyframes = JSON.parse(keyframesJSON);
+        var times = keyframes.times;
+        var values = keyframes.values;
+        if (!(times instanceof Array) || !(values instanceof Array) || times.length !== values.length || times.length === 0) {
+            return encodePayload({ status: "error", message: "times and values must be non-empty arrays of equal length." });
+        }
+
+        // Dimensions are checked once for the property, then per value against it.
+        var expectedDimensions = getPropertyValueDimensions(prop);
+        var normalizedValues = [];
+        for (var i = 0; i < values.length; i += 1) {
+            var gotDimensions = getValueDimensions(values[i]);
+            var normalizedValue = normalizeValueDimensions(values[i], expectedDimensions, gotDimensions);
+            if (normalizedValue === null) {
+                return encodePayload({
+                    status: "error",
+                    message: "Value dimension mismatch at index " + i + ": expected " + expectedDimensions + "D, got " + gotDimensions + "D.",
+                    index: i,
+                    expectedDimensions: expectedDimensions,
+                    gotDimensions: gotDimensions
+                });
+            }
+            normalizedValues.push(normalizedValue);
+        }
+
+        var inType = null;
+        var outType = null;
+        if (keyframes.inInterp !== undefined) {
+            inType = getKeyInterpTypeByName(keyframes.inInterp);
+        }
+        if (keyframes.outInterp !== undefined) {
+            outType = getKeyInterpTypeByName(keyframes.outInterp);
+        }
+        if ((keyframes.inInterp !== undefined && !inType) || (keyframes.outInterp !== undefined && !outType)) {
+            return encodePayload({ status: "error", message: "Invalid interpolation type. Use linear, bezier, or hold." });
+        }
+        var temporalDimensions = getPropertyTemporalDimensions(prop);
+        var inEase = toTemporalEaseArray(keyframes.easeIn, temporalDimensions, "easeIn");
+        var outEase = toTemporalEaseArray(keyframes.easeOut, temporalDimensions, "easeOut");
+        var keyInEases = null;
+        var keyOutEases = null;
+        if (keyframes.keyEaseIn instanceof Array || keyframes.keyEaseOut instanceof Array) {
+            keyInEases = [];
+            keyOutEases = [];
+            for (var e = 0; e < times.length; e += 1) {
+                keyInEases.push(keyframes.keyEaseIn ? toTemporalEaseArray(keyframes.keyEaseIn[e], temporalDimensions, "keyEaseIn[" + e + "]") : null);
+                keyOutEases.push(keyframes.keyEaseOut ? toTemporalEaseArray(keyframes.keyEaseOut[e], temporalDimensions, "keyEaseOut[" + e + "]") : null);
+            }
+        }
+
+        app.beginUndoGroup("Set Keyframes");
+        undoOpened = true;
+
+        if (typeof prop.setValuesAtTimes === "function") {
+            prop.setValuesAtTimes(times, normalizedValues);
+        } else {
+            for (var j = 0; j < times.length; j += 1) {
+                prop.setValueAtTime(times[j], normalizedValues[j]);
+            }
+        }
+
+        if (inType || outType || inEase || outEase || keyInEases) {
+            for (var k = 0; k < times.length; k += 1) {
+                var keyIndex = prop.nearestKeyIndex(times[k]);
+                if (inType || outType) {
+                    prop.setInterpolationTypeAtKey(
+                        keyIndex,
+                        inType || prop.keyInInterpolationType(keyIndex),
+                        outType || prop.keyOutInterpolationType(keyIndex)
+                    );
+                }
+                var keyInEase = (keyInEases && keyInEases[k]) || inEase;
+                var keyOutEase = (keyOutEases && keyOutEases[k]) || outEase;
+                if (keyInEase || keyOutEase) {
+                    prop.setTemporalEaseAtKey(
+                        keyIndex,
+                        keyInEase || prop.keyInTemporalEase(keyIndex),
+                        keyOutEase || prop.keyOutTemporalEase(keyIndex)
+                    );
+                }
+            }
+        }
+
+        app.endUndoGroup();
+        undoOpened = false;
+
+        return encodePayload({
+            status: "success",
+            layerId: layer.index,
+            layerUid: aeTryGetLayerUid(layer),
+            layerName: layer.name,
+            propertyPath: propertyPath,
+            keyframeCount: times.length,
+            numKeys: prop.numKeys,
+            dimensions: expectedDimensions
+        });
+    } catch (e) {
+        if (undoOpened) {
+            app.endUndoGroup();
+        }
+        log("setKeyframesBatch() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
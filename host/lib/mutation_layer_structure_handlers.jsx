@@ -6,17 +6,19 @@ function parentLayer(childLayerId, parentLayerId) {
             return encodePayload({ status: "error", message: "Active composition not found." });
         }
 
-        var child = comp.layer(childLayerId);
-        if (!child) {
-            return encodePayload({ status: "error", message: "Child layer with id " + childLayerId + " not found." });
+        var resolvedChild = aeResolveLayerRef(comp, childLayerId, "Child layer");
+        if (resolvedChild.error) {
+            return encodePayload({ status: "error", message: resolvedChild.error });
         }
+        var child = resolvedChild.layer;
 
         var parent = null;
         if (parentLayerId !== null && parentLayerId !== undefined) {
-            parent = comp.layer(parentLayerId);
-            if (!parent) {
-                return encodePayload({ status: "error", message: "Parent layer with id " + parentLayerId + " not found." });
+            var resolvedParent = aeResolveLayerRef(comp, parentLayerId, "Parent layer");
+            if (resolvedParent.error) {
+                return encodePayload({ status: "error", message: resolvedParent.error });
             }
+            parent = resolvedParent.layer;
             if (parent.index === child.index) {
                 return encodePayload({ status: "error", message: "A layer cannot be parented to itself." });
             }
@@ -27,8 +29,10 @@ function parentLayer(childLayerId, parentLayerId) {
         return encodePayload({
             status: "success",
             childLayerId: child.index,
+            childLayerUid: aeTryGetLayerUid(child),
             childLayerName: child.name,
             parentLayerId: parent ? parent.index : null,
+            parentLayerUid: parent ? aeTryGetLayerUid(parent) : null,
             parentLayerName: parent ? parent.name : null
         });
     } catch (e) {
@@ -37,6 +41,123 @@ function parentLayer(childLayerId, parentLayerId) {
     }
 }
 
+// Sets many parent links at once. links: [{ child: Layer, parent: Layer|null }].
+// The final parent graph (requested links over current parents) is checked for
+// cycles before anything changes. Returns { changed, unchanged } or { error, cycle }.
+function aeApplyParentLinks(links) {
+    var finalParent = {};
+    var layersByIndex = {};
+    for (var i = 0; i < links.length; i++) {
+        var childIndex = links[i].child.index;
+        if (finalParent.hasOwnProperty(childIndex)) {
+            return { error: "Layer " + childIndex + " is listed as a child more than once." };
+        }
+        finalParent[childIndex] = links[i].parent ? links[i].parent.index : null;
+        layersByIndex[childIndex] = links[i].child;
+    }
+
+    function parentOf(index) {
+        if (!finalParent.hasOwnProperty(index)) {
+            var current = layersByIndex[index] || links[0].child.containingComp.layer(index);
+            layersByIndex[index] = current;
+            finalParent[index] = current.parent ? current.parent.index : null;
+        }
+        return finalParent[index];
+    }
+
+    // 1 = on the current walk, 2 = known to reach a root.
+    var state = {};
+    for (var j = 0; j < links.length; j++) {
+        var walk = [];
+        var cursor = links[j].child.index;
+        while (cursor !== null && state[cursor] !== 2) {
+            if (state[cursor] === 1) {
+                var cycle = [];
+                for (var w = walk.length - 1; w >= 0; w--) {
+                    cycle.unshift(layersByIndex[walk[w]].name);
+                    if (walk[w] === cursor) {
+                        break;
+                    }
+                }
+                return { error: "Parent links form a cycle: " + cycle.join(" -> ") + " -> " + cycle[0] + ".", cycle: cycle };
+            }
+            state[cursor] = 1;
+            walk.push(cursor);
+            cursor = parentOf(cursor);
+        }
+        for (var k = 0; k < walk.length; k++) {
+            state[walk[k]] = 2;
+        }
+    }
+
+    var changed = 0;
+    for (var n = 0; n < links.length; n++) {
+        var child = links[n].child;
+        var parent = links[n].parent;
+        var currentParent = child.parent;
+        if ((currentParent === null && parent === null) || (currentParent && parent && currentParent.index === parent.index)) {
+            continue;
+        }
+        child.parent = parent;
+        changed += 1;
+    }
+    return { changed: changed, unchanged: links.length - changed };
+}
+
+function parentLayersBatch(linksJSON) {
+    var undoOpened = false;
+    try {
+        ensureJSON();
+        var comp = app.project.activeItem;
+        if (!comp || !(comp instanceof CompItem)) {
+            return encodePayload({ status: "error", message: "Active composition not found." });
+        }
+
+        var requested = JSON.parse(linksJSON);
+        if (!(requested instanceof Array) || requested.length === 0) {
+            return encodePayload({ status: "error", message: "links must be a non-empty array." });
+        }
+        var links = [];
+        for (var i = 0; i < requested.length; i++) {
+            var child = aeResolveLayerRef(comp, requested[i].child, "Child layer");
+            if (child.error) {
+                return encodePayload({ status: "error", message: "links[" + i + "]: " + child.error, index: i });
+            }
+            var parent = null;
+            if (requested[i].parent !== null && requested[i].parent !== undefined) {
+                var resolvedParent = aeResolveLayerRef(comp, requested[i].parent, "Parent layer");
+                if (resolvedParent.error) {
+                    return encodePayload({ status: "error", message: "links[" + i + "]: " + resolvedParent.error, index: i });
+                }
+                parent = resolvedParent.layer;
+            }
+            links.push({ child: child.layer, parent: parent });
+        }
+
+        app.beginUndoGroup("Parent Layers");
+        undoOpened = true;
+        var applied = aeApplyParentLinks(links);
+        app.endUndoGroup();
+        undoOpened = false;
+        if (applied.error) {
+            return encodePayload({ status: "error", message: applied.error, details: applied.cycle ? { cycle: applied.cycle } : undefined });
+        }
+
+        return encodePayload({
+            status: "success",
+            linkCount: links.length,
+            changedCount: applied.changed,
+            unchangedCount: applied.unchanged
+        });
+    } catch (e) {
+        if (undoOpened) {
+            app.endUndoGroup();
+        }
+        log("parentLayersBatch() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
+
 function precomposeLayers(layerIdsJSON, name, moveAllAttributes) {
     try {
         ensureJSON();
@@ -60,21 +181,21 @@ function precomposeLayers(layerIdsJSON, name, moveAllAttributes) {
 
         var indices = [];
         for (var i = 0; i < layerIds.length; i++) {
-            var layerIndex = Number(layerIds[i]);
-            if (isNaN(layerIndex)) {
-                return encodePayload({ status: "error", message: "layerIds must contain only numbers." });
+            if (!aeIsLayerUidRef(layerIds[i]) && isNaN(Number(layerIds[i]))) {
+                return encodePayload({ status: "error", message: "layerIds must contain only numbers or uid references." });
             }
-            var layer = comp.layer(layerIndex);
-            if (!layer) {
-                return encodePayload({ status: "error", message: "Layer with id " + layerIndex + " not found." });
+            var resolved = aeResolveLayerRef(comp, layerIds[i]);
+            if (resolved.error) {
+                return encodePayload({ status: "error", message: resolved.error });
             }
-            indices.push(layerIndex);
+            indices.push(resolved.layer.index);
         }
 
         var createdComp = comp.layers.precompose(indices, String(name), moveAllAttributes === true);
         if (!createdComp) {
             return encodePayload({ status: "error", message: "Failed to precompose layers." });
         }
+        aeIndexProjectItem(createdComp);
 
         return encodePayload({
             status: "success",
@@ -96,10 +217,11 @@ function duplicateLayer(layerId) {
             return encodePayload({ status: "error", message: "Active composition not found." });
         }
 
-        var layer = comp.layer(layerId);
-        if (!layer) {
-            return encodePayload({ status: "error", message: "Layer with id " + layerId + " not found." });
+        var resolvedLayer = aeResolveLayerRef(comp, layerId);
+        if (resolvedLayer.error) {
+            return encodePayload({ status: "error", message: resolvedLayer.error });
         }
+        var layer = resolvedLayer.layer;
 
         var duplicated = layer.duplicate();
         if (!duplicated) {
@@ -109,8 +231,10 @@ function duplicateLayer(layerId) {
         return encodePayload({
             status: "success",
             sourceLayerId: layer.index,
+            sourceLayerUid: aeTryGetLayerUid(layer),
             sourceLayerName: layer.name,
             duplicatedLayerId: duplicated.index,
+            duplicatedLayerUid: aeTryGetLayerUid(duplicated),
             duplicatedLayerName: duplicated.name
         });
     } catch (e) {
@@ -119,6 +243,122 @@ function duplicateLayer(layerId) {
     }
 }
 
+// Applies one copy's name/text/transform/propertyValues overrides directly on the layer.
+function aeApplyDuplicateOverrides(layer, overrides) {
+    if (!overrides) {
+        return;
+    }
+    if (overrides.name !== undefined && overrides.name !== null) {
+        layer.name = String(overrides.name);
+    }
+    if (overrides.text !== undefined && overrides.text !== null) {
+        aeSetTextLayerValue(layer, overrides.text);
+    }
+    var values = [];
+    var transformPaths = {
+        anchorPoint: "ADBE Transform Group.ADBE Anchor Point",
+        position: "ADBE Transform Group.ADBE Position",
+        scale: "ADBE Transform Group.ADBE Scale",
+        rotation: "ADBE Transform Group.ADBE Rotate Z",
+        opacity: "ADBE Transform Group.ADBE Opacity"
+    };
+    var transform = overrides.transform || {};
+    for (var key in transformPaths) {
+        if (transformPaths.hasOwnProperty(key) && transform[key] !== undefined) {
+            values.push({ propertyPath: transformPaths[key], value: transform[key] });
+        }
+    }
+    var propertyValues = overrides.propertyValues || [];
+    for (var i = 0; i < propertyValues.length; i++) {
+        values.push(propertyValues[i]);
+    }
+    for (var j = 0; j < values.length; j++) {
+        var prop = resolveProperty(layer, values[j].propertyPath);
+        if (!prop || typeof prop.setValue !== "function") {
+            throw new Error("Property with path '" + values[j].propertyPath + "' not found or not settable.");
+        }
+        prop.setValue(aeNormalizeSetValueInputForProp(prop, values[j].value));
+    }
+}
+
+function duplicateLayersBatch(layerId, count, overridesJSON) {
+    var undoOpened = false;
+    try {
+        ensureJSON();
+        var comp = app.project.activeItem;
+        if (!comp || !(comp instanceof CompItem)) {
+            return encodePayload({ status: "error", message: "Active composition not found." });
+        }
+
+        var resolvedLayer = aeResolveLayerRef(comp, layerId);
+        if (resolvedLayer.error) {
+            return encodePayload({ status: "error", message: resolvedLayer.error });
+        }
+        var source = resolvedLayer.layer;
+
+        var overrides = [];
+        if (overridesJSON && overridesJSON !== "null") {
+            overrides = JSON.parse(overridesJSON);
+        }
+        var copyCount = Number(count);
+        if (isNaN(copyCount) || copyCount < 1 || copyCount < overrides.length) {
+            return encodePayload({ status: "error", message: "count must be at least 1 and at least the number of overrides." });
+        }
+
+        app.beginUndoGroup("Duplicate Layers");
+        undoOpened = true;
+
+        // Each duplicate lands directly above the source, so copies end up top to bottom in creation order.
+        var copies = [];
+        var errors = [];
+        for (var i = 0; i < copyCount; i++) {
+            var copy = source.duplicate();
+            if (!copy) {
+                throw new Error("Failed to duplicate layer (copy " + i + ").");
+            }
+            copies.push(copy);
+            errors.push(null);
+            try {
+                aeApplyDuplicateOverrides(copy, overrides[i]);
+            } catch (eOverride) {
+                errors[i] = eOverride.toString();
+            }
+        }
+
+        app.endUndoGroup();
+        undoOpened = false;
+
+        var layers = [];
+        var failedCount = 0;
+        for (var j = 0; j < copies.length; j++) {
+            var entry = {
+                layerId: copies[j].index,
+                layerUid: aeTryGetLayerUid(copies[j]),
+                layerName: copies[j].name
+            };
+            if (errors[j] !== null) {
+                entry.error = errors[j];
+                failedCount += 1;
+            }
+            layers.push(entry);
+        }
+        return encodePayload({
+            status: "success",
+            sourceLayerId: source.index,
+            sourceLayerUid: aeTryGetLayerUid(source),
+            duplicatedCount: copies.length,
+            overrideErrorCount: failedCount,
+            layers: layers
+        });
+    } catch (e) {
+        if (undoOpened) {
+            app.endUndoGroup();
+        }
+        log("duplicateLayersBatch() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
+
 function moveLayerOrder(layerId, beforeLayerId, afterLayerId, toTop, toBottom) {
     try {
         ensureJSON();
@@ -127,10 +367,11 @@ function moveLayerOrder(layerId, beforeLayerId, afterLayerId, toTop, toBottom) {
             return encodePayload({ status: "error", message: "Active composition not found." });
         }
 
-        var layer = comp.layer(layerId);
-        if (!layer) {
-            return encodePayload({ status: "error", message: "Layer with id " + layerId + " not found." });
+        var resolvedLayer = aeResolveLayerRef(comp, layerId);
+        if (resolvedLayer.error) {
+            return encodePayload({ status: "error", message: resolvedLayer.error });
         }
+        var layer = resolvedLayer.layer;
 
         var hasBefore = beforeLayerId !== null && beforeLayerId !== undefined;
         var hasAfter = afterLayerId !== null && afterLayerId !== undefined;
@@ -149,7 +390,7 @@ function moveLayerOrder(layerId, beforeLayerId, afterLayerId, toTop, toBottom) {
         }
 
         if (hasBefore) {
-            var beforeLayer = comp.layer(beforeLayerId);
+            var beforeLayer = aeResolveLayerRef(comp, beforeLayerId).layer;
             if (!beforeLayer) {
                 return encodePayload({ status: "error", message: "beforeLayerId target not found." });
             }
@@ -158,7 +399,7 @@ function moveLayerOrder(layerId, beforeLayerId, afterLayerId, toTop, toBottom) {
             }
             layer.moveBefore(beforeLayer);
         } else if (hasAfter) {
-            var afterLayer = comp.layer(afterLayerId);
+            var afterLayer = aeResolveLayerRef(comp, afterLayerId).layer;
             if (!afterLayer) {
                 return encodePayload({ status: "error", message: "afterLayerId target not found." });
             }
@@ -175,6 +416,7 @@ function moveLayerOrder(layerId, beforeLayerId, afterLayerId, toTop, toBottom) {
         return encodePayload({
             status: "success",
             layerId: layer.index,
+            layerUid: aeTryGetLayerUid(layer),
             layerName: layer.name
         });
     } catch (e) {
@@ -183,6 +425,133 @@ function moveLayerOrder(layerId, beforeLayerId, afterLayerId, toTop, toBottom) {
     }
 }
 
+// Indices (into ranks) of one longest strictly increasing subsequence.
+function aeLongestIncreasingRun(ranks) {
+    var tails = [];
+    var previous = [];
+    for (var i = 0; i < ranks.length; i += 1) {
+        var low = 0;
+        var high = tails.length;
+        while (low < high) {
+            var mid = (low + high) >> 1;
+            if (ranks[tails[mid]] < ranks[i]) {
+                low = mid + 1;
+            } else {
+                high = mid;
+            }
+        }
+        previous[i] = low > 0 ? tails[low - 1] : -1;
+        tails[low] = i;
+    }
+    var run = [];
+    var cursor = tails.length > 0 ? tails[tails.length - 1] : -1;
+    while (cursor >= 0) {
+        run.unshift(cursor);
+        cursor = previous[cursor];
+    }
+    return run;
+}
+
+function reorderLayers(orderJSON) {
+    var undoOpened = false;
+    try {
+        ensureJSON();
+        var comp = app.project.activeItem;
+        if (!comp || !(comp instanceof CompItem)) {
+            return encodePayload({ status: "error", message: "Active composition not found." });
+        }
+
+        var order = JSON.parse(orderJSON);
+        if (!(order instanceof Array) || order.length === 0) {
+            return encodePayload({ status: "error", message: "order must be a non-empty array of layer uids." });
+        }
+
+        var current = [];
+        var layersByUid = {};
+        for (var i = 1; i <= comp.numLayers; i += 1) {
+            var layer = comp.layer(i);
+            var uid = aeTryGetLayerUid(layer);
+            if (uid === null) {
+                return encodePayload({ status: "error", message: "Layer uids are not available in this After Effects version." });
+            }
+            current.push(uid);
+            layersByUid[uid] = layer;
+        }
+
+        // Listed layers are permuted among the slots they occupy now; unlisted layers keep their place.
+        var requested = {};
+        for (var j = 0; j < order.length; j += 1) {
+            var requestedUid = String(order[j]);
+            if (!layersByUid.hasOwnProperty(requestedUid)) {
+                return encodePayload({ status: "error", message: "Layer with uid " + requestedUid + " not found.", index: j });
+            }
+            if (requested.hasOwnProperty(requestedUid)) {
+                return encodePayload({ status: "error", message: "Layer uid " + requestedUid + " is listed twice.", index: j });
+            }
+            requested[requestedUid] = true;
+        }
+        var target = [];
+        var nextRequested = 0;
+        for (var k = 0; k < current.length; k += 1) {
+            target.push(requested.hasOwnProperty(current[k]) ? String(order[nextRequested++]) : current[k]);
+        }
+
+        var rankByUid = {};
+        for (var r = 0; r < target.length; r += 1) {
+            rankByUid[target[r]] = r;
+        }
+        var ranks = [];
+        for (var c = 0; c < current.length; c += 1) {
+            ranks.push(rankByUid[current[c]]);
+        }
+
+        // Layers on a longest increasing run are already in relative order and stay put;
+        // every other layer is moved once, directly below its predecessor in the target order.
+        var staying = {};
+        var run = aeLongestIncreasingRun(ranks);
+        for (var s = 0; s < run.length; s += 1) {
+            staying[current[run[s]]] = true;
+        }
+
+        var moves = 0;
+        if (run.length < target.length) {
+            app.beginUndoGroup("Reorder Layers");
+            undoOpened = true;
+            for (var t = 0; t < target.length; t += 1) {
+                if (staying.hasOwnProperty(target[t])) {
+                    continue;
+                }
+                if (t === 0) {
+                    layersByUid[target[t]].moveToBeginning();
+                } else {
+                    layersByUid[target[t]].moveAfter(layersByUid[target[t - 1]]);
+                }
+                moves += 1;
+            }
+            app.endUndoGroup();
+            undoOpened = false;
+        }
+
+        var layers = [];
+        for (var n = 0; n < order.length; n += 1) {
+            var moved = layersByUid[String(order[n])];
+            layers.push({ layerId: moved.index, layerUid: String(order[n]), layerName: moved.name });
+        }
+        return encodePayload({
+            status: "success",
+            moveCount: moves,
+            layerCount: current.length,
+            layers: layers
+        });
+    } catch (e) {
+        if (undoOpened) {
+            app.endUndoGroup();
+        }
+        log("reorderLayers() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
+
 function deleteLayer(layerId) {
     try {
         ensureJSON();
@@ -191,18 +560,21 @@ function deleteLayer(layerId) {
             return encodePayload({ status: "error", message: "Active composition not found." });
         }
 
-        var layer = comp.layer(layerId);
-        if (!layer) {
-            return encodePayload({ status: "error", message: "Layer with id " + layerId + " not found." });
+        var resolvedLayer = aeResolveLayerRef(comp, layerId);
+        if (resolvedLayer.error) {
+            return encodePayload({ status: "error", message: resolvedLayer.error });
         }
+        var layer = resolvedLayer.layer;
 
         var removedLayerId = layer.index;
+        var removedLayerUid = aeTryGetLayerUid(layer);
         var removedLayerName = layer.name;
         layer.remove();
 
         return encodePayload({
             status: "success",
             layerId: removedLayerId,
+            layerUid: removedLayerUid,
             layerName: removedLayerName
         });
     } catch (e) {
@@ -222,6 +594,7 @@ function deleteComp(compId, compName) {
         var removedCompId = comp.id;
         var removedCompName = comp.name;
         comp.remove();
+        aeBumpProjectRevision();
 
         return encodePayload({
             status: "success",
@@ -193,7 +193,9 @@ function aeFindUntaggedLayerByNameAndType(comp, name, expectedType) {
             continue;
         }
         var existingType = String(getLayerTypeName(layer)).toLowerCase();
-        if (existingType === "video") {
+        if (aeIsFileFootageLayer(layer)) {
+            existingType = "footage";
+        } else if (existingType === "video") {
             existingType = "solid";
         }
         if (existingType === expectedType) {
@@ -210,12 +212,23 @@ function aeFindUntaggedLayerByNameAndType(comp, name, expectedType) {
     return { layer: null, error: null, ambiguous: false };
 }
 
+function aeIsFileFootageLayer(layer) {
+    try {
+        return layer.source instanceof FootageItem && layer.source.mainSource instanceof FileSource;
+    } catch (e) {
+        return false;
+    }
+}
+
 function aeNormalizeLayerTypeForScene(layer) {
     try {
         if (layer && layer.nullLayer === true) {
             return "null";
         }
     } catch (eNullType) {}
+    if (aeIsFileFootageLayer(layer)) {
+        return "footage";
+    }
     var typeName = String(getLayerTypeName(layer)).toLowerCase();
     if (typeName === "video") {
         return "solid";
@@ -334,6 +347,41 @@ function aeResolveEffectParamProperty(effect, paramSpec) {
     return null;
 }
 
+// True when a static property already holds value (numbers compared with a small tolerance).
+function aeEffectParamMatches(prop, value) {
+    var current;
+    try {
+        if (prop.numKeys > 0 || prop.expressionEnabled) {
+            return false;
+        }
+        current = prop.value;
+    } catch (eValue) {
+        return false;
+    }
+    function same(a, b) {
+        if (typeof a === "number" && typeof b === "number") {
+            return Math.abs(a - b) <= 1e-6;
+        }
+        if (typeof b === "boolean" && typeof a === "number") {
+            return a === (b ? 1 : 0);
+        }
+        return a === b;
+    }
+    if (value instanceof Array) {
+        if (!(current instanceof Array) || current.length !== value.length) {
+            return false;
+        }
+        for (var i = 0; i < value.length; i++) {
+            if (!same(current[i], value[i])) {
+                return false;
+            }
+        }
+        return true;
+    }
+    return same(current, value);
+}
+
+// Sets each parameter that differs from its spec; returns the number of values written.
 function aeApplyEffectParams(effect, paramSpecs) {
     if (!(paramSpecs instanceof Array)) {
         return 0;
@@ -349,6 +397,9 @@ function aeApplyEffectParams(effect, paramSpecs) {
             throw new Error("Effect parameter does not support setValue().");
         }
         var value = aeNormalizeSetValueInputForProp(prop, paramSpec.value);
+        if (aeEffectParamMatches(prop, value)) {
+            continue;
+        }
         prop.setValue(value);
         count += 1;
     }
@@ -467,8 +518,18 @@ function aeValidateSceneSpec(scene) {
                         && normalizedType !== "null"
                         && normalizedType !== "solid"
                         && normalizedType !== "shape"
+                        && normalizedType !== "footage"
                     ) {
-                        errors.push(prefix + ".type must be one of: text, null, solid, shape.");
+                        errors.push(prefix + ".type must be one of: text, null, solid, shape, footage.");
+                    }
+                }
+                if (String(layer.type).toLowerCase() === "footage" || layer.footageHash !== undefined) {
+                    if (String(layer.type).toLowerCase() !== "footage") {
+                        errors.push(prefix + ".footageHash is only supported on footage layers.");
+                    } else if (typeof layer.footageHash !== "string" || !/^[0-9a-fA-F]{64}$/.test(layer.footageHash)) {
+                        errors.push(prefix + ".footageHash must be a SHA-256 hex string.");
+                    } else if (!aeFindFootageByHash(layer.footageHash)) {
+                        errors.push(prefix + ".footageHash " + layer.footageHash + " is not in the project; import it with /footage/import first.");
                     }
                 }
                 if (layer.name !== undefined && typeof layer.name !== "string") {
@@ -477,6 +538,16 @@ function aeValidateSceneSpec(scene) {
                 if (layer.text !== undefined && typeof layer.text !== "string") {
                     errors.push(prefix + ".text must be a string when specified.");
                 }
+                if (layer.shapePaths !== undefined) {
+                    if (String(layer.type).toLowerCase() !== "shape") {
+                        errors.push(prefix + ".shapePaths is only supported on shape layers.");
+                    } else {
+                        var shapePathErrors = aeValidateShapePaths(layer.shapePaths, prefix + ".shapePaths");
+                        for (var sp = 0; sp < shapePathErrors.length; sp++) {
+                            errors.push(shapePathErrors[sp]);
+                        }
+                    }
+                }
 
                 var timing = layer.timing;
                 if (timing !== undefined) {
@@ -838,6 +909,8 @@ function aeBuildLayerCreateOptions(layerSpec) {
     if (layerSpec.shapeStrokeWidth !== undefined) options.shapeStrokeWidth = layerSpec.shapeStrokeWidth;
     if (layerSpec.shapeStrokeLineCap !== undefined) options.shapeStrokeLineCap = layerSpec.shapeStrokeLineCap;
     if (layerSpec.shapeRoundness !== undefined) options.shapeRoundness = layerSpec.shapeRoundness;
+    if (layerSpec.shapePaths !== undefined) options.shapePaths = layerSpec.shapePaths;
+    if (layerSpec.footageHash !== undefined) options.footageHash = layerSpec.footageHash;
     return options;
 }
 
@@ -906,6 +979,13 @@ function aeApplySceneLayer(comp, layerSpec, layerIndex, sceneLayerIndex) {
         aeSetTextLayerValue(layer, layerSpec.text);
         operationCount += 1;
     }
+    if (!resolved.created && layerSpec.footageHash !== undefined) {
+        var footage = aeFindFootageByHash(layerSpec.footageHash);
+        if (footage && layer.source.id !== footage.id) {
+            layer.replaceSource(footage, false);
+            operationCount += 1;
+        }
+    }
 
     var skipPropertyPaths = {};
     var animationsForSkip = layerSpec.animations || [];
@@ -1175,6 +1255,8 @@ function applyScene(sceneJSON, optionsJSON) {
                     sceneIdToLayerId[appliedLayer.id] = appliedLayer.layerId;
                 }
             }
+            var parentLinks = [];
+            var parentLinkOwners = [];
             for (var v = 0; v < layers.length; v++) {
                 var layerSpec = layers[v];
                 if (layerSpec.parentId === undefined) {
@@ -1192,13 +1274,22 @@ function applyScene(sceneJSON, optionsJSON) {
                     // Already in desired state for scene identity mapping.
                     continue;
                 }
-                aeInvokeMutation(
-                    parentLayer,
-                    [childApplied.layerId, parentLayerId],
-                    "parentLayer"
-                );
-                childApplied.operations += 1;
-                parentAppliedCount += 1;
+                parentLinks.push({
+                    child: comp.layer(childApplied.layerId),
+                    parent: parentLayerId === null ? null : comp.layer(parentLayerId)
+                });
+                parentLinkOwners.push(childApplied);
+            }
+            if (parentLinks.length > 0) {
+                // One pass for every link: cycles are rejected before any parent changes.
+                var parentResult = aeApplyParentLinks(parentLinks);
+                if (parentResult.error) {
+                    throw new Error(parentResult.error);
+                }
+                for (var w = 0; w < parentLinkOwners.length; w++) {
+                    parentLinkOwners[w].operations += 1;
+                }
+                parentAppliedCount += parentLinks.length;
             }
         } finally {
             app.endUndoGroup();
@@ -137,119 +137,321 @@ function addShapeRepeater(layerId, layerName, optionsJSON) {
     }
 }
 
-function addLayer(layerType, optionsJSON) {
+// Accepts 0-1 or 0-255 RGB components.
+function aeColor01(value, fallback) {
+    if (!(value instanceof Array) || value.length !== 3) {
+        return fallback;
+    }
+    var color = [];
+    for (var i = 0; i < 3; i++) {
+        var part = Number(value[i]);
+        if (isNaN(part)) {
+            return fallback;
+        }
+        if (part > 1) {
+            part = part / 255;
+        }
+        if (part < 0) {
+            part = 0;
+        }
+        if (part > 1) {
+            part = 1;
+        }
+        color.push(part);
+    }
+    return color;
+}
+
+function aeShapeLineCap(value) {
+    var normalized = value === null || value === undefined ? "" : String(value).toLowerCase();
+    if (normalized === "round") {
+        return 2;
+    }
+    if (normalized === "projecting") {
+        return 3;
+    }
+    return 1;
+}
+
+// Checks shape path group specs ({ name, contours, fill*, stroke* }); returns error strings.
+function aeValidateShapePaths(specs, prefix) {
+    var errors = [];
+    if (!(specs instanceof Array) || specs.length === 0) {
+        errors.push(prefix + " must be a non-empty array.");
+        return errors;
+    }
+    function isPointList(points, count) {
+        if (!(points instanceof Array) || points.length !== count) {
+            return false;
+        }
+        for (var p = 0; p < points.length; p++) {
+            var point = points[p];
+            if (!(point instanceof Array) || point.length !== 2 || !aeIsFiniteNumber(point[0]) || !aeIsFiniteNumber(point[1])) {
+                return false;
+            }
+        }
+        return true;
+    }
+    for (var i = 0; i < specs.length; i++) {
+        var spec = specs[i];
+        var specPrefix = prefix + "[" + i + "]";
+        if (!spec || typeof spec !== "object" || spec instanceof Array) {
+            errors.push(specPrefix + " must be an object.");
+            continue;
+        }
+        if (spec.name !== undefined && typeof spec.name !== "string") {
+            errors.push(specPrefix + ".name must be a string when specified.");
+        }
+        if (spec.fillRule !== undefined && spec.fillRule !== "nonzero" && spec.fillRule !== "evenodd") {
+            errors.push(specPrefix + ".fillRule must be nonzero or evenodd.");
+        }
+        if (!(spec.contours instanceof Array) || spec.contours.length === 0) {
+            errors.push(specPrefix + ".contours must be a non-empty array.");
+            continue;
+        }
+        for (var c = 0; c < spec.contours.length; c++) {
+            var contour = spec.contours[c];
+            var contourPrefix = specPrefix + ".contours[" + c + "]";
+            if (!contour || !(contour.vertices instanceof Array) || contour.vertices.length === 0) {
+                errors.push(contourPrefix + ".vertices must be a non-empty array.");
+                continue;
+            }
+            var count = contour.vertices.length;
+            if (!isPointList(contour.vertices, count)) {
+                errors.push(contourPrefix + ".vertices must hold [x, y] number pairs.");
+            }
+            if (contour.inTangents !== undefined && !isPointList(contour.inTangents, count)) {
+                errors.push(contourPrefix + ".inTangents must hold one [x, y] pair per vertex.");
+            }
+            if (contour.outTangents !== undefined && !isPointList(contour.outTangents, count)) {
+                errors.push(contourPrefix + ".outTangents must hold one [x, y] pair per vertex.");
+            }
+            if (contour.closed !== undefined && typeof contour.closed !== "boolean") {
+                errors.push(contourPrefix + ".closed must be a boolean when specified.");
+            }
+        }
+    }
+    return errors;
+}
+
+// Checks the shapePaths of add-layer options; returns error strings.
+function aeValidateLayerShapePaths(options, prefix) {
+    if (!options || options.shapePaths === undefined) {
+        return [];
+    }
+    return aeValidateShapePaths(options.shapePaths, prefix + "shapePaths");
+}
+
+// Adds one vector group per spec, each holding its contours as path shapes plus a fill and/or stroke.
+// specs must already have passed aeValidateShapePaths. Returns { groupCount, contourCount } or { error }.
+function aeBuildShapePaths(layer, specs) {
+    var rootVectors = layer.property("ADBE Root Vectors Group");
+    if (!rootVectors) {
+        return { error: "Shape root vectors not found." };
+    }
+
+    function zeros(count) {
+        var result = [];
+        for (var z = 0; z < count; z++) {
+            result.push([0, 0]);
+        }
+        return result;
+    }
+
+    var contourCount = 0;
+    for (var i = 0; i < specs.length; i++) {
+        var spec = specs[i];
+        var group = rootVectors.addProperty("ADBE Vector Group");
+        if (!group) {
+            return { error: "Failed to create shape vector group for shapePaths[" + i + "]." };
+        }
+        group.name = spec.name && spec.name.length > 0 ? spec.name : "Path " + (i + 1);
+        var contents = group.property("ADBE Vectors Group");
+
+        for (var c = 0; c < spec.contours.length; c++) {
+            var contour = spec.contours[c];
+            var shape = new Shape();
+            shape.vertices = contour.vertices;
+            shape.inTangents = contour.inTangents || zeros(contour.vertices.length);
+            shape.outTangents = contour.outTangents || zeros(contour.vertices.length);
+            shape.closed = contour.closed !== false;
+            contents.addProperty("ADBE Vector Shape - Group").property("ADBE Vector Shape").setValue(shape);
+            contourCount += 1;
+        }
+
+        var hasStroke =
+            spec.strokeColor !== undefined ||
+            spec.strokeOpacity !== undefined ||
+            spec.strokeWidth !== undefined ||
+            spec.strokeLineCap !== undefined;
+        if (spec.fillColor !== undefined || spec.fillOpacity !== undefined || spec.fillRule !== undefined || !hasStroke) {
+            var fill = contents.addProperty("ADBE Vector Graphic - Fill");
+            fill.property("ADBE Vector Fill Color").setValue(aeColor01(spec.fillColor, [1, 1, 1]));
+            fill.property("ADBE Vector Fill Opacity").setValue(Math.max(0, Math.min(100, Number(spec.fillOpacity === undefined ? 100 : spec.fillOpacity))));
+            fill.property("ADBE Vector Fill Rule").setValue(spec.fillRule === "evenodd" ? 2 : 1);
+        }
+        if (hasStroke) {
+            var stroke = contents.addProperty("ADBE Vector Graphic - Stroke");
+            stroke.property("ADBE Vector Stroke Color").setValue(aeColor01(spec.strokeColor, [1, 1, 1]));
+            stroke.property("ADBE Vector Stroke Opacity").setValue(Math.max(0, Math.min(100, Number(spec.strokeOpacity === undefined ? 100 : spec.strokeOpacity))));
+            stroke.property("ADBE Vector Stroke Width").setValue(Math.max(0, Number(spec.strokeWidth === undefined ? 4 : spec.strokeWidth)));
+            stroke.property("ADBE Vector Stroke Line Cap").setValue(aeShapeLineCap(spec.strokeLineCap));
+        }
+    }
+    return { groupCount: specs.length, contourCount: contourCount };
+}
+
+// Adds shape path groups to a shape layer, or to a new shape layer when no layer is given.
+function addShapePaths(layerId, layerName, optionsJSON) {
+    var undoOpened = false;
     try {
         ensureJSON();
         var comp = app.project.activeItem;
         if (!comp || !(comp instanceof CompItem)) {
             return encodePayload({ status: "error", message: "Active composition not found." });
         }
-
-        var requestedType = (layerType || "null").toString().toLowerCase();
-        var options = {};
-        if (optionsJSON && optionsJSON !== "null") {
-            try {
-                options = JSON.parse(optionsJSON);
-            } catch (eParse) {
-                return encodePayload({ status: "error", message: "Invalid options JSON: " + eParse.toString() });
-            }
+        var options;
+        try {
+            options = JSON.parse(optionsJSON);
+        } catch (eParse) {
+            return encodePayload({ status: "error", message: "Invalid options JSON: " + eParse.toString() });
+        }
+        var errors = aeValidateShapePaths(options.paths, "paths");
+        if (errors.length > 0) {
+            return encodePayload({ status: "error", message: "Invalid shape paths.", errors: errors });
         }
 
-        function getNumber(value, fallback) {
-            if (value === null || value === undefined) {
-                return fallback;
+        var layer = null;
+        if (layerId !== null || layerName !== null) {
+            var resolvedLayer = aeResolveLayer(comp, layerId, layerName);
+            if (resolvedLayer.error) {
+                return encodePayload({ status: "error", message: resolvedLayer.error });
             }
-            var parsed = Number(value);
-            if (isNaN(parsed)) {
-                return fallback;
+            layer = resolvedLayer.layer;
+            if (layer.matchName !== "ADBE Vector Layer") {
+                return encodePayload({ status: "error", message: "Target layer is not a shape layer." });
             }
-            return parsed;
         }
 
-        function toColor01(value, fallback) {
-            if (!(value instanceof Array) || value.length !== 3) {
-                return fallback;
-            }
-            var color = [];
-            for (var i = 0; i < 3; i++) {
-                var part = Number(value[i]);
-                if (isNaN(part)) {
-                    return fallback;
-                }
-                if (part > 1) {
-                    part = part / 255;
-                }
-                if (part < 0) {
-                    part = 0;
-                }
-                if (part > 1) {
-                    part = 1;
-                }
-                color.push(part);
+        app.beginUndoGroup("Add Shape Paths");
+        undoOpened = true;
+        var created = false;
+        if (!layer) {
+            layer = comp.layers.addShape();
+            if (options.name) {
+                layer.name = options.name;
             }
-            return color;
+            created = true;
+        }
+        var built = aeBuildShapePaths(layer, options.paths);
+        app.endUndoGroup();
+        undoOpened = false;
+        if (built.error) {
+            return encodePayload({ status: "error", message: built.error });
         }
 
-        function clamp(value, minValue, maxValue) {
-            if (value < minValue) {
-                return minValue;
-            }
-            if (value > maxValue) {
-                return maxValue;
-            }
-            return value;
+        return encodePayload({
+            status: "success",
+            layerId: layer.index,
+            layerUid: aeTryGetLayerUid(layer),
+            layerName: layer.name,
+            created: created,
+            groupCount: built.groupCount,
+            contourCount: built.contourCount
+        });
+    } catch (e) {
+        if (undoOpened) {
+            app.endUndoGroup();
         }
+        log("addShapePaths() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
 
-        function toVec2(value, fallback) {
-            if (!(value instanceof Array) || value.length !== 2) {
-                return fallback;
-            }
-            var first = Number(value[0]);
-            var second = Number(value[1]);
-            if (isNaN(first) || isNaN(second)) {
-                return fallback;
-            }
-            return [first, second];
+// Creates one layer of requestedType in comp. Returns { layer, shapeType } or { error }.
+function aeCreateLayer(comp, requestedType, options) {
+    // A failed build must not leave a half-made layer behind; new layers always land at index 1.
+    var layerCount = comp.numLayers;
+    var created;
+    try {
+        created = aeBuildLayer(comp, requestedType, options);
+    } catch (eBuild) {
+        created = { error: eBuild.toString() };
+    }
+    if (created.error && comp.numLayers > layerCount) {
+        comp.layer(1).remove();
+    }
+    return created;
+}
+
+function aeBuildLayer(comp, requestedType, options) {
+    function getNumber(value, fallback) {
+        if (value === null || value === undefined) {
+            return fallback;
+        }
+        var parsed = Number(value);
+        if (isNaN(parsed)) {
+            return fallback;
         }
+        return parsed;
+    }
 
-        function toLineCapValue(value) {
-            var normalized = value === null || value === undefined ? "" : String(value).toLowerCase();
-            if (normalized === "round") {
-                return 2;
-            }
-            if (normalized === "projecting") {
-                return 3;
-            }
-            return 1;
+    function clamp(value, minValue, maxValue) {
+        if (value < minValue) {
+            return minValue;
+        }
+        if (value > maxValue) {
+            return maxValue;
         }
+        return value;
+    }
 
-        var layer = null;
-        var name = options.name && options.name.length > 0 ? options.name : null;
-        var createdShapeType = null;
-
-        if (requestedType === "text") {
-            var text = options.text;
-            if (text === null || text === undefined) {
-                text = "";
-            }
-            layer = comp.layers.addText(String(text));
-        } else if (requestedType === "null") {
-            layer = comp.layers.addNull();
-        } else if (requestedType === "shape") {
-            layer = comp.layers.addShape();
-            var rootVectors = layer.property("ADBE Root Vectors Group");
-            if (!rootVectors) {
-                return encodePayload({ status: "error", message: "Shape root vectors not found." });
-            }
+    function toVec2(value, fallback) {
+        if (!(value instanceof Array) || value.length !== 2) {
+            return fallback;
+        }
+        var first = Number(value[0]);
+        var second = Number(value[1]);
+        if (isNaN(first) || isNaN(second)) {
+            return fallback;
+        }
+        return [first, second];
+    }
+
+    var layer = null;
+    var name = options.name && options.name.length > 0 ? options.name : null;
+    var createdShapeType = null;
 
+    if (requestedType === "text") {
+        var text = options.text;
+        if (text === null || text === undefined) {
+            text = "";
+        }
+        layer = comp.layers.addText(String(text));
+    } else if (requestedType === "null") {
+        layer = comp.layers.addNull();
+    } else if (requestedType === "shape") {
+        layer = comp.layers.addShape();
+        var rootVectors = layer.property("ADBE Root Vectors Group");
+        if (!rootVectors) {
+            return { error: "Shape root vectors not found." };
+        }
+
+        if (options.shapePaths instanceof Array && options.shapePaths.length > 0) {
+            var built = aeBuildShapePaths(layer, options.shapePaths);
+            if (built.error) {
+                return { error: built.error };
+            }
+            createdShapeType = "path";
+        } else {
             var vectorGroup = rootVectors.addProperty("ADBE Vector Group");
             if (!vectorGroup) {
-                return encodePayload({ status: "error", message: "Failed to create shape vector group." });
+                return { error: "Failed to create shape vector group." };
             }
 
             var groupContents = vectorGroup.property("ADBE Vectors Group");
             if (!groupContents) {
-                return encodePayload({ status: "error", message: "Failed to access shape group contents." });
+                return { error: "Failed to access shape group contents." };
             }
 
             var shapeType = options.shapeType ? String(options.shapeType).toLowerCase() : "ellipse";
@@ -271,7 +473,7 @@ function addLayer(layerType, optionsJSON) {
                 vectorGroup.name = "Rect";
                 var rectPath = groupContents.addProperty("ADBE Vector Shape - Rect");
                 if (!rectPath) {
-                    return encodePayload({ status: "error", message: "Failed to create rectangle shape." });
+                    return { error: "Failed to create rectangle shape." };
                 }
                 rectPath.property("ADBE Vector Rect Size").setValue(shapeSize);
                 rectPath.property("ADBE Vector Rect Position").setValue(shapePosition);
@@ -284,7 +486,7 @@ function addLayer(layerType, optionsJSON) {
                 vectorGroup.name = "Ellipse";
                 var ellipsePath = groupContents.addProperty("ADBE Vector Shape - Ellipse");
                 if (!ellipsePath) {
-                    return encodePayload({ status: "error", message: "Failed to create ellipse shape." });
+                    return { error: "Failed to create ellipse shape." };
                 }
                 ellipsePath.property("ADBE Vector Ellipse Size").setValue(shapeSize);
                 ellipsePath.property("ADBE Vector Ellipse Position").setValue(shapePosition);
@@ -292,7 +494,7 @@ function addLayer(layerType, optionsJSON) {
 
             var fill = groupContents.addProperty("ADBE Vector Graphic - Fill");
             if (fill) {
-                var fillColor = toColor01(options.shapeFillColor, [1, 1, 1]);
+                var fillColor = aeColor01(options.shapeFillColor, [1, 1, 1]);
                 var fillOpacity = clamp(getNumber(options.shapeFillOpacity, 100), 0, 100);
                 fill.property("ADBE Vector Fill Color").setValue(fillColor);
                 fill.property("ADBE Vector Fill Opacity").setValue(fillOpacity);
@@ -306,7 +508,7 @@ function addLayer(layerType, optionsJSON) {
             if (shouldAddStroke) {
                 var stroke = groupContents.addProperty("ADBE Vector Graphic - Stroke");
                 if (stroke) {
-                    var strokeColor = toColor01(options.shapeStrokeColor, [1, 1, 1]);
+                    var strokeColor = aeColor01(options.shapeStrokeColor, [1, 1, 1]);
                     var strokeOpacity = clamp(getNumber(options.shapeStrokeOpacity, 100), 0, 100);
                     var strokeWidth = getNumber(options.shapeStrokeWidth, 4);
                     if (strokeWidth < 0) {
@@ -315,33 +517,69 @@ function addLayer(layerType, optionsJSON) {
                     stroke.property("ADBE Vector Stroke Color").setValue(strokeColor);
                     stroke.property("ADBE Vector Stroke Opacity").setValue(strokeOpacity);
                     stroke.property("ADBE Vector Stroke Width").setValue(strokeWidth);
-                    stroke.property("ADBE Vector Stroke Line Cap").setValue(toLineCapValue(options.shapeStrokeLineCap));
+                    stroke.property("ADBE Vector Stroke Line Cap").setValue(aeShapeLineCap(options.shapeStrokeLineCap));
                 }
             }
-        } else if (requestedType === "solid") {
-            var solidName = name || "Solid";
-            var solidColor = toColor01(options.color, [0.5, 0.5, 0.5]);
-            var solidWidth = Math.max(1, Math.round(getNumber(options.width, comp.width)));
-            var solidHeight = Math.max(1, Math.round(getNumber(options.height, comp.height)));
-            var solidDuration = getNumber(options.duration, comp.duration);
-            if (solidDuration <= 0) {
-                solidDuration = comp.duration;
+        }
+    } else if (requestedType === "solid") {
+        var solidName = name || "Solid";
+        var solidColor = aeColor01(options.color, [0.5, 0.5, 0.5]);
+        var solidWidth = Math.max(1, Math.round(getNumber(options.width, comp.width)));
+        var solidHeight = Math.max(1, Math.round(getNumber(options.height, comp.height)));
+        var solidDuration = getNumber(options.duration, comp.duration);
+        if (solidDuration <= 0) {
+            solidDuration = comp.duration;
+        }
+        layer = comp.layers.addSolid(solidColor, solidName, solidWidth, solidHeight, 1.0, solidDuration);
+    } else if (requestedType === "footage") {
+        var footage = aeFindFootageByHash(options.footageHash);
+        if (!footage) {
+            return { error: "No footage with hash " + options.footageHash + " in the project. Import it with /footage/import first." };
+        }
+        layer = comp.layers.add(footage);
+    } else {
+        return { error: "Unsupported layerType. Use one of: text, null, solid, shape, footage." };
+    }
+
+    if (!layer) {
+        return { error: "Failed to add layer." };
+    }
+
+    if (name && requestedType !== "solid") {
+        layer.name = name;
+    }
+
+    return { layer: layer, shapeType: createdShapeType };
+}
+
+function addLayer(layerType, optionsJSON) {
+    try {
+        ensureJSON();
+        var comp = app.project.activeItem;
+        if (!comp || !(comp instanceof CompItem)) {
+            return encodePayload({ status: "error", message: "Active composition not found." });
+        }
+
+        var requestedType = (layerType || "null").toString().toLowerCase();
+        var options = {};
+        if (optionsJSON && optionsJSON !== "null") {
+            try {
+                options = JSON.parse(optionsJSON);
+            } catch (eParse) {
+                return encodePayload({ status: "error", message: "Invalid options JSON: " + eParse.toString() });
             }
-            layer = comp.layers.addSolid(solidColor, solidName, solidWidth, solidHeight, 1.0, solidDuration);
-        } else {
-            return encodePayload({
-                status: "error",
-                message: "Unsupported layerType. Use one of: text, null, solid, shape."
-            });
         }
 
-        if (!layer) {
-            return encodePayload({ status: "error", message: "Failed to add layer." });
+        var shapePathErrors = aeValidateLayerShapePaths(options, "");
+        if (shapePathErrors.length > 0) {
+            return encodePayload({ status: "error", message: "Invalid shape paths.", errors: shapePathErrors });
         }
 
-        if (name && requestedType !== "solid") {
-            layer.name = name;
+        var created = aeCreateLayer(comp, requestedType, options);
+        if (created.error) {
+            return encodePayload({ status: "error", message: created.error });
         }
+        var layer = created.layer;
 
         return encodePayload({
             status: "success",
@@ -349,10 +587,88 @@ function addLayer(layerType, optionsJSON) {
             layerUid: aeTryGetLayerUid(layer),
             layerName: layer.name,
             layerType: getLayerTypeName(layer),
-            shapeType: createdShapeType
+            shapeType: created.shapeType
         });
     } catch (e) {
         log("addLayer() threw: " + e.toString());
         return encodePayload({ status: "error", message: e.toString() });
     }
 }
+
+function addLayersBatch(specsJSON) {
+    var undoOpened = false;
+    try {
+        ensureJSON();
+        var comp = app.project.activeItem;
+        if (!comp || !(comp instanceof CompItem)) {
+            return encodePayload({ status: "error", message: "Active composition not found." });
+        }
+
+        var specs;
+        try {
+            specs = JSON.parse(specsJSON);
+        } catch (eParse) {
+            return encodePayload({ status: "error", message: "Invalid layers JSON: " + eParse.toString() });
+        }
+        if (!(specs instanceof Array) || specs.length === 0) {
+            return encodePayload({ status: "error", message: "layers must be a non-empty array." });
+        }
+        var shapePathErrors = [];
+        for (var v = 0; v < specs.length; v += 1) {
+            shapePathErrors = shapePathErrors.concat(
+                aeValidateLayerShapePaths(specs[v] ? specs[v].options : null, "layers[" + v + "].")
+            );
+        }
+        if (shapePathErrors.length > 0) {
+            return encodePayload({ status: "error", message: "Invalid shape paths.", errors: shapePathErrors });
+        }
+
+        app.beginUndoGroup("Add Layers");
+        undoOpened = true;
+
+        // Every new layer is inserted at index 1, so indices are read after the loop.
+        // A failed entry is reported in place and does not stop the rest.
+        var created = [];
+        var createdCount = 0;
+        for (var i = 0; i < specs.length; i += 1) {
+            var spec = specs[i] || {};
+            var requestedType = (spec.layerType || "null").toString().toLowerCase();
+            created.push(aeCreateLayer(comp, requestedType, spec.options || {}));
+            if (!created[i].error) {
+                createdCount += 1;
+            }
+        }
+
+        app.endUndoGroup();
+        undoOpened = false;
+
+        var results = [];
+        for (var j = 0; j < created.length; j += 1) {
+            if (created[j].error) {
+                results.push({ index: j, error: created[j].error });
+                continue;
+            }
+            var layer = created[j].layer;
+            results.push({
+                index: j,
+                layerId: layer.index,
+                layerUid: aeTryGetLayerUid(layer),
+                layerName: layer.name,
+                layerType: getLayerTypeName(layer),
+                shapeType: created[j].shapeType
+            });
+        }
+        return encodePayload({
+            status: "success",
+            createdCount: createdCount,
+            errorCount: created.length - createdCount,
+            layers: results
+        });
+    } catch (e) {
+        if (undoOpened) {
+            app.endUndoGroup();
+        }
+        log("addLayersBatch() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
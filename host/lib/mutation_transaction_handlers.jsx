@@ -0,0 +1,111 @@
+// Returns the failure message carried by one handler result, or null on success.
+// Handlers answer with encoded payloads ({ status: "error" }) or plain
+// "Error: ..." strings.
+function aeTransactionFailure(result) {
+    if (typeof result !== "string") {
+        return null;
+    }
+    var text = result;
+    if (text.indexOf("__ENC__") === 0) {
+        try {
+            text = decodeURIComponent(text.substring(7));
+        } catch (e) {
+            return null;
+        }
+    }
+    if (text.indexOf("Error") === 0) {
+        return text;
+    }
+    if (text.charAt(0) !== "{") {
+        return null;
+    }
+    var parsed = null;
+    try {
+        parsed = JSON.parse(text);
+    } catch (parseError) {
+        return null;
+    }
+    if (parsed && typeof parsed.status === "string" && parsed.status.toLowerCase() === "error") {
+        return parsed.message ? String(parsed.message) : "Operation failed.";
+    }
+    return null;
+}
+
+// Gives the open group an undo entry of its own: a folder added and removed
+// right away. The group is then always the latest undo entry, even when no
+// operation changed the project, so rolling back never reaches the user's work.
+function aeMarkTransactionGroup() {
+    var marker = app.project.items.addFolder("ae-cli transaction");
+    marker.remove();
+}
+
+// Undoes the closed transaction group with Edit > Undo (16). Command ids do not
+// depend on the UI language, unlike the "Undo <label>" menu text.
+function aeUndoTransaction() {
+    app.executeCommand(16);
+    aeBumpProjectRevision();
+    return true;
+}
+
+// Runs handler calls prepared by the panel inside one undo group.
+// scriptsJSON: ["setTextsBatch(...)", ...]. Stops at the first failing call and
+// undoes the group. Each operation reports its raw result and elapsedMs.
+function runTransaction(label, scriptsJSON) {
+    var undoOpened = false;
+    try {
+        ensureJSON();
+        var scripts = JSON.parse(scriptsJSON);
+        if (!(scripts instanceof Array) || scripts.length === 0) {
+            return encodePayload({ status: "error", message: "scripts must be a non-empty array." });
+        }
+        var undoLabel = label ? String(label) : "ae-cli Transaction";
+
+        var operations = [];
+        var failedIndex = -1;
+        var failure = null;
+        app.beginUndoGroup(undoLabel);
+        undoOpened = true;
+        aeMarkTransactionGroup();
+        for (var i = 0; i < scripts.length; i++) {
+            var started = new Date().getTime();
+            var result = null;
+            try {
+                result = eval(String(scripts[i]));
+                failure = aeTransactionFailure(result);
+            } catch (opError) {
+                failure = opError.toString();
+            }
+            operations.push({
+                result: result === null || result === undefined ? null : String(result),
+                elapsedMs: new Date().getTime() - started
+            });
+            if (failure !== null) {
+                failedIndex = i;
+                break;
+            }
+        }
+        app.endUndoGroup();
+        undoOpened = false;
+
+        var rolledBack = false;
+        if (failedIndex >= 0) {
+            rolledBack = aeUndoTransaction();
+        }
+
+        return encodePayload({
+            status: "success",
+            label: undoLabel,
+            committed: failedIndex < 0,
+            failedIndex: failedIndex < 0 ? null : failedIndex,
+            failure: failure,
+            rolledBack: rolledBack,
+            operations: operations
+        });
+    } catch (e) {
+        if (undoOpened) {
+            app.endUndoGroup();
+        }
+        log("runTransaction() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
@@ -103,3 +103,27 @@ function aeGetPropertyIdentifier(prop, fallbackIndex) {
     }
     return "Property";
 }
+
+function aeBuildPropertyPath(prop) {
+    var segments = [];
+    var current = prop;
+    var guard = 0;
+    while (current && guard < 100) {
+        var parent = null;
+        try {
+            parent = current.parentProperty;
+        } catch (eParent) {
+            parent = null;
+        }
+        if (!parent) {
+            break;
+        }
+        segments.unshift(aeGetPropertyIdentifier(current, null));
+        current = parent;
+        guard += 1;
+    }
+    if (segments.length === 0) {
+        return "";
+    }
+    return segments.join(".");
+}
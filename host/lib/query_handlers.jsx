@@ -1,4 +1,4 @@
-function getLayers() {
+function getLayers(optionsJSON) {
     try {
         ensureJSON();
         var comp = app.project.activeItem;
@@ -7,14 +7,89 @@ function getLayers() {
             return encodePayload({ status: "error", message: "Active composition not found." });
         }
 
+        var options = {};
+        if (optionsJSON && optionsJSON !== "null") {
+            try {
+                options = JSON.parse(optionsJSON);
+            } catch (eParse) {
+                return encodePayload({ status: "error", message: "Invalid options JSON: " + eParse.toString() });
+            }
+        }
+
+        var typeFilter = null;
+        if (options.types instanceof Array && options.types.length > 0) {
+            typeFilter = {};
+            for (var t = 0; t < options.types.length; t++) {
+                typeFilter[String(options.types[t]).toLowerCase()] = true;
+            }
+        }
+        var namePrefix = typeof options.namePrefix === "string" && options.namePrefix.length > 0
+            ? options.namePrefix
+            : null;
+        var nameRegex = null;
+        if (typeof options.nameRegex === "string" && options.nameRegex.length > 0) {
+            try {
+                nameRegex = new RegExp(options.nameRegex);
+            } catch (eRegex) {
+                return encodePayload({ status: "error", message: "Invalid nameRegex: " + eRegex.toString() });
+            }
+        }
+        var sceneManaged = typeof options.sceneManaged === "boolean" ? options.sceneManaged : null;
+        var startIndex = aeNormalizeLayerId(options.startIndex);
+        var endIndex = aeNormalizeLayerId(options.endIndex);
+        var first = startIndex !== null ? startIndex : 1;
+        var last = endIndex !== null && endIndex < comp.numLayers ? endIndex : comp.numLayers;
+        var asColumns = options.format === "columns";
+
+        var ids = [];
+        var layerUids = [];
+        var names = [];
+        var types = [];
         var layers = [];
-        for (var i = 1; i <= comp.numLayers; i++) {
+        for (var i = first; i <= last; i++) {
             var layer = comp.layer(i);
+            if (!layer) {
+                continue;
+            }
+            // Cheapest checks first: name reads are cheaper than type probing or comment parsing.
+            var layerName = layer.name;
+            if (namePrefix !== null && layerName.substring(0, namePrefix.length) !== namePrefix) {
+                continue;
+            }
+            if (nameRegex !== null && !nameRegex.test(layerName)) {
+                continue;
+            }
+            var typeName = getLayerTypeName(layer);
+            if (typeFilter !== null && !typeFilter[typeName.toLowerCase()]) {
+                continue;
+            }
+            if (sceneManaged !== null) {
+                var isManaged = aeExtractSceneIdFromComment(layer.comment) !== null;
+                if (isManaged !== sceneManaged) {
+                    continue;
+                }
+            }
+            if (asColumns) {
+                ids.push(layer.index);
+                layerUids.push(aeTryGetLayerUid(layer));
+                names.push(layerName);
+                types.push(typeName);
+                continue;
+            }
             layers.push({
                 id: layer.index,
                 layerUid: aeTryGetLayerUid(layer),
-                name: layer.name,
-                type: getLayerTypeName(layer)
+                name: layerName,
+                type: typeName
+            });
+        }
+        if (asColumns) {
+            return encodePayload({
+                count: ids.length,
+                id: ids,
+                layerUid: layerUids,
+                name: names,
+                type: types
             });
         }
         return encodePayload(layers);
@@ -24,13 +99,42 @@ function getLayers() {
     }
 }
 
-function listComps() {
+// options: { namePrefix, nameRegex, folder, offset, limit }. folder matches the
+// parent folder path from the root ("Shots/Act 1"; "" for the root). With offset
+// or limit the result is a page: { comps, total, offset, nextOffset }.
+function listComps(optionsJSON) {
     try {
         ensureJSON();
         if (!app.project) {
             return encodePayload([]);
         }
 
+        var options = {};
+        if (optionsJSON && optionsJSON !== "null") {
+            try {
+                options = JSON.parse(optionsJSON);
+            } catch (eParse) {
+                return encodePayload({ status: "error", message: "Invalid options JSON: " + eParse.toString() });
+            }
+        }
+        var namePrefix = typeof options.namePrefix === "string" && options.namePrefix.length > 0
+            ? options.namePrefix
+            : null;
+        var nameRegex = null;
+        if (typeof options.nameRegex === "string" && options.nameRegex.length > 0) {
+            try {
+                nameRegex = new RegExp(options.nameRegex);
+            } catch (eRegex) {
+                return encodePayload({ status: "error", message: "Invalid nameRegex: " + eRegex.toString() });
+            }
+        }
+        var folderPath = typeof options.folder === "string"
+            ? options.folder.replace(/^\/+|\/+$/g, "")
+            : null;
+        var paged = options.offset !== undefined || options.limit !== undefined;
+        var offset = options.offset !== undefined ? Math.max(0, parseInt(options.offset, 10) || 0) : 0;
+        var limit = options.limit !== undefined ? parseInt(options.limit, 10) : null;
+
         var activeComp = app.project.activeItem;
         var activeCompId = null;
         if (activeComp && activeComp instanceof CompItem) {
@@ -38,14 +142,27 @@ function listComps() {
         }
 
         var comps = [];
-        for (var i = 1; i <= app.project.numItems; i++) {
-            var item = app.project.item(i);
-            if (!item || !(item instanceof CompItem)) {
+        var total = 0;
+        var indexed = aeProjectComps();
+        for (var i = 0; i < indexed.length; i++) {
+            var item = indexed[i];
+            var compName = item.name;
+            if (namePrefix !== null && compName.substring(0, namePrefix.length) !== namePrefix) {
+                continue;
+            }
+            if (nameRegex !== null && !nameRegex.test(compName)) {
+                continue;
+            }
+            if (folderPath !== null && aeProjectItemFolderPath(item) !== folderPath) {
+                continue;
+            }
+            total += 1;
+            if (total <= offset || (limit !== null && comps.length >= limit)) {
                 continue;
             }
             comps.push({
                 id: item.id,
-                name: item.name,
+                name: compName,
                 width: item.width,
                 height: item.height,
                 pixelAspect: item.pixelAspect,
@@ -54,7 +171,15 @@ function listComps() {
                 isActive: activeCompId !== null && item.id === activeCompId
             });
         }
-        return encodePayload(comps);
+        if (!paged) {
+            return encodePayload(comps);
+        }
+        return encodePayload({
+            comps: comps,
+            total: total,
+            offset: offset,
+            nextOffset: offset + comps.length < total ? offset + comps.length : null
+        });
     } catch (e) {
         log("listComps() threw: " + e.toString());
         return encodePayload({ status: "error", message: e.toString() });
@@ -235,34 +360,6 @@ function getSelectedProperties() {
             return encodePayload([]);
         }
 
-        function getPathIdentifier(prop) {
-            return aeGetPropertyIdentifier(prop, null);
-        }
-
-        function buildPropertyPath(prop) {
-            var segments = [];
-            var current = prop;
-            var guard = 0;
-            while (current && guard < 100) {
-                var parent = null;
-                try {
-                    parent = current.parentProperty;
-                } catch (eParent) {
-                    parent = null;
-                }
-                if (!parent) {
-                    break;
-                }
-                segments.unshift(getPathIdentifier(current));
-                current = parent;
-                guard += 1;
-            }
-            if (segments.length === 0) {
-                return "";
-            }
-            return segments.join(".");
-        }
-
         var selectedPropsPayload = [];
         for (var i = 0; i < selectedLayers.length; i++) {
             var layer = selectedLayers[i];
@@ -284,7 +381,7 @@ function getSelectedProperties() {
                     continue;
                 }
 
-                var path = buildPropertyPath(prop);
+                var path = aeBuildPropertyPath(prop);
                 if (!path || path.length === 0) {
                     continue;
                 }
@@ -320,34 +417,6 @@ function getExpressionErrors() {
             return encodePayload({ status: "Error", message: "Active composition not found." });
         }
 
-        function getPathIdentifier(prop) {
-            return aeGetPropertyIdentifier(prop, null);
-        }
-
-        function buildPropertyPath(prop) {
-            var segments = [];
-            var current = prop;
-            var guard = 0;
-            while (current && guard < 100) {
-                var parent = null;
-                try {
-                    parent = current.parentProperty;
-                } catch (eParent) {
-                    parent = null;
-                }
-                if (!parent) {
-                    break;
-                }
-                segments.unshift(getPathIdentifier(current));
-                current = parent;
-                guard += 1;
-            }
-            if (segments.length === 0) {
-                return "";
-            }
-            return segments.join(".");
-        }
-
         function collectLayerExpressionErrors(layer) {
             var issues = [];
             function scan(prop) {
@@ -392,7 +461,7 @@ function getExpressionErrors() {
                     layerId: layer.index,
                     layerUid: aeTryGetLayerUid(layer),
                     layerName: layer.name,
-                    propertyPath: buildPropertyPath(prop),
+                    propertyPath: aeBuildPropertyPath(prop),
                     propertyName: prop.name,
                     message: errorMessage
                 });
@@ -425,3 +494,250 @@ function getExpressionErrors() {
         return encodePayload({ status: "Error", message: e.toString() });
     }
 }
+
+function getProjectChangeSnapshot() {
+    try {
+        ensureJSON();
+        var snapshot = {
+            activeCompId: null,
+            activeCompName: null,
+            layerCount: null,
+            selectedLayers: [],
+            selectedProperties: []
+        };
+        if (!app.project) {
+            return encodePayload(snapshot);
+        }
+        var comp = app.project.activeItem;
+        if (!comp || !(comp instanceof CompItem)) {
+            return encodePayload(snapshot);
+        }
+        snapshot.activeCompId = comp.id;
+        snapshot.activeCompName = comp.name;
+        snapshot.layerCount = comp.numLayers;
+
+        var selectedLayers = comp.selectedLayers || [];
+        for (var i = 0; i < selectedLayers.length; i++) {
+            var layer = selectedLayers[i];
+            if (!layer) {
+                continue;
+            }
+            snapshot.selectedLayers.push({
+                layerId: layer.index,
+                layerUid: aeTryGetLayerUid(layer)
+            });
+            var props;
+            try {
+                props = layer.selectedProperties;
+            } catch (eProps) {
+                props = null;
+            }
+            if (!props) {
+                continue;
+            }
+            for (var j = 0; j < props.length; j++) {
+                var prop = props[j];
+                if (!prop || !aeIsPropertyNode(prop)) {
+                    continue;
+                }
+                snapshot.selectedProperties.push({
+                    layerId: layer.index,
+                    path: aeBuildPropertyPath(prop)
+                });
+            }
+        }
+        return encodePayload(snapshot);
+    } catch (e) {
+        log("getProjectChangeSnapshot() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
+
+function aeInterpolationTypeName(type) {
+    if (type === KeyframeInterpolationType.BEZIER) {
+        return "bezier";
+    }
+    if (type === KeyframeInterpolationType.HOLD) {
+        return "hold";
+    }
+    return "linear";
+}
+
+function aeIsNumericKeyValue(value) {
+    if (typeof value === "number") {
+        return true;
+    }
+    if (!(value instanceof Array) || value.length === 0) {
+        return false;
+    }
+    for (var i = 0; i < value.length; i++) {
+        if (typeof value[i] !== "number") {
+            return false;
+        }
+    }
+    return true;
+}
+
+function aePushNumbers(target, value) {
+    if (value instanceof Array) {
+        for (var i = 0; i < value.length; i++) {
+            target.push(value[i]);
+        }
+    } else {
+        target.push(value);
+    }
+}
+
+function aePushEases(target, eases) {
+    for (var i = 0; i < eases.length; i++) {
+        target.push(eases[i].speed);
+        target.push(eases[i].influence);
+    }
+}
+
+// Keys are packed per property: times[i] pairs with values[i * dimensions ...],
+// easeIn/easeOut[(i * easeDimensions + d) * 2 ...] as [speed, influence] and,
+// for spatial properties, inTangents/outTangents[i * dimensions ...].
+function aeReadPackedKeyframes(prop, path) {
+    var count = prop.numKeys;
+    var dimensions = getPropertyValueDimensions(prop);
+    var easeDimensions = getPropertyTemporalDimensions(prop);
+    var spatial = false;
+    try {
+        spatial = prop.isSpatial === true;
+    } catch (eSpatial) {}
+
+    var packed = {
+        path: path,
+        name: prop.name,
+        count: count,
+        dimensions: dimensions,
+        easeDimensions: easeDimensions,
+        // Text, shape and marker values cannot be packed; they come back as strings.
+        numeric: count > 0 && aeIsNumericKeyValue(prop.keyValue(1)),
+        times: [],
+        values: [],
+        inInterp: [],
+        outInterp: [],
+        easeIn: [],
+        easeOut: []
+    };
+    if (spatial) {
+        packed.inTangents = [];
+        packed.outTangents = [];
+    }
+
+    for (var k = 1; k <= count; k++) {
+        packed.times.push(prop.keyTime(k));
+        var value = prop.keyValue(k);
+        if (packed.numeric) {
+            aePushNumbers(packed.values, value);
+        } else {
+            packed.values.push(String(value));
+        }
+        packed.inInterp.push(aeInterpolationTypeName(prop.keyInInterpolationType(k)));
+        packed.outInterp.push(aeInterpolationTypeName(prop.keyOutInterpolationType(k)));
+        try {
+            aePushEases(packed.easeIn, prop.keyInTemporalEase(k));
+            aePushEases(packed.easeOut, prop.keyOutTemporalEase(k));
+        } catch (eEase) {}
+        if (spatial) {
+            aePushNumbers(packed.inTangents, prop.keyInSpatialTangent(k));
+            aePushNumbers(packed.outTangents, prop.keyOutSpatialTangent(k));
+        }
+    }
+    return packed;
+}
+
+function aeCollectAnimatedProperties(propGroup, pathPrefix, result) {
+    if (!propGroup || typeof propGroup.numProperties !== "number") {
+        return;
+    }
+    for (var i = 1; i <= propGroup.numProperties; i++) {
+        var prop = propGroup.property(i);
+        if (!prop) {
+            continue;
+        }
+        var currentPath = (pathPrefix ? pathPrefix + "." : "") + aeGetPropertyIdentifier(prop, i);
+        if (aeIsPropertyNode(prop)) {
+            var numKeys = 0;
+            try {
+                numKeys = prop.numKeys;
+            } catch (eKeys) {}
+            if (numKeys > 0) {
+                result.push({ prop: prop, path: currentPath });
+            }
+        }
+        if (aeCanTraverseProperty(prop)) {
+            aeCollectAnimatedProperties(prop, currentPath, result);
+        }
+    }
+}
+
+function getKeyframes(optionsJSON) {
+    try {
+        ensureJSON();
+        var comp = app.project.activeItem;
+        if (!comp || !(comp instanceof CompItem)) {
+            return encodePayload({ status: "error", message: "Active composition not found." });
+        }
+        var options = JSON.parse(optionsJSON);
+        var selectors = [];
+        var i;
+        var layerIds = options.layerIds || [];
+        var layerUids = options.layerUids || [];
+        var layerNames = options.layerNames || [];
+        for (i = 0; i < layerIds.length; i++) {
+            selectors.push({ layerId: layerIds[i], layerName: null });
+        }
+        for (i = 0; i < layerUids.length; i++) {
+            selectors.push({ layerId: { uid: layerUids[i] }, layerName: null });
+        }
+        for (i = 0; i < layerNames.length; i++) {
+            selectors.push({ layerId: null, layerName: layerNames[i] });
+        }
+        var propertyPaths = options.propertyPaths || [];
+
+        var layers = [];
+        for (i = 0; i < selectors.length; i++) {
+            var resolvedLayer = aeResolveLayer(comp, selectors[i].layerId, selectors[i].layerName);
+            if (resolvedLayer.error) {
+                var failedRef = selectors[i].layerId;
+                layers.push({
+                    layerId: aeIsLayerUidRef(failedRef) ? null : failedRef,
+                    layerUid: aeIsLayerUidRef(failedRef) ? String(failedRef.uid) : null,
+                    layerName: selectors[i].layerName,
+                    error: resolvedLayer.error
+                });
+                continue;
+            }
+            var layer = resolvedLayer.layer;
+            var targets = [];
+            if (propertyPaths.length === 0) {
+                aeCollectAnimatedProperties(layer, "", targets);
+            } else {
+                for (var p = 0; p < propertyPaths.length; p++) {
+                    targets.push({ prop: resolveProperty(layer, propertyPaths[p]), path: propertyPaths[p] });
+                }
+            }
+            var properties = [];
+            for (var t = 0; t < targets.length; t++) {
+                if (!targets[t].prop || !aeIsPropertyNode(targets[t].prop)) {
+                    properties.push({ path: targets[t].path, error: "Property not found." });
+                    continue;
+                }
+                properties.push(aeReadPackedKeyframes(targets[t].prop, targets[t].path));
+            }
+            layers.push({
+                layerId: layer.index,
+                layerUid: aeTryGetLayerUid(layer),
+                layerName: layer.name,
+                properties: properties
+            });
+        }
+        return encodePayload({ layers: layers });
+    } catch (e) {
+        log("getKeyframes() threw: " + e.toString());
+        return encodePayload({ status: "error", message: e.toString() });
+    }
+}
@@ -0,0 +1,249 @@
+"""Replay recorded ae-cli commands from a JSONL file."""
+
+from __future__ import annotations
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping
+
+import requests
+
+from .cli_parser import CommandParseError, parse_command
+from .client import AEBridgeError, AEClient
+from .latency import LatencyStats
+
+
+READ_ONLY_COMMANDS = frozenset(
+    {
+        "health",
+        "metrics",
+        "layers",
+        "list-comps",
+        "selected-properties",
+        "expression-errors",
+        "properties",
+        "keyframes",
+    }
+)
+UNBATCHABLE_COMMANDS = frozenset({"batch", "events"})
+
+BatchHandler = Callable[[AEClient, argparse.Namespace], Any]
+
+
+@dataclass
+class BatchOperation:
+    """One validated command from a batch file."""
+
+    index: int
+    line: int
+    argv: List[str]
+    args: argparse.Namespace
+    op_id: Any = None
+
+    @property
+    def read_only(self) -> bool:
+        return self.args.command in READ_ONLY_COMMANDS
+
+
+def load_operations(path: str) -> List[BatchOperation]:
+    """Parse and validate every line of a batch file before anything runs.
+
+    Each non-blank line is either an argv array (``["layers", "--type", "text"]``)
+    or an object ``{"id": ..., "argv": [...]}``. Lines starting with ``#`` are ignored.
+    All problems are collected and raised together as one ``ValueError``.
+    """
+    operations: List[BatchOperation] = []
+    errors: List[str] = []
+    text = Path(path).read_text(encoding="utf-8")
+    for line_no, raw_line in enumerate(text.splitlines(), start=1):
+        stripped = raw_line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        try:
+            entry = json.loads(stripped)
+        except json.JSONDecodeError as exc:
+            errors.append(f"line {line_no}: invalid JSON: {exc}")
+            continue
+
+        op_id = None
+        if isinstance(entry, dict):
+            op_id = entry.get("id")
+            entry = entry.get("argv")
+        if not isinstance(entry, list) or not entry or not all(isinstance(token, str) for token in entry):
+            errors.append(f"line {line_no}: expected a non-empty array of strings")
+            continue
+
+        try:
+            args = parse_command(entry)
+        except CommandParseError as exc:
+            errors.append(f"line {line_no}: {exc}")
+            continue
+        if args.command in UNBATCHABLE_COMMANDS:
+            errors.append(f"line {line_no}: '{args.command}' cannot run inside a batch")
+            continue
+
+        operations.append(
+            BatchOperation(index=len(operations), line=line_no, argv=entry, args=args, op_id=op_id)
+        )
+
+    if errors:
+        raise ValueError("Invalid batch file:\n" + "\n".join(f"  {error}" for error in errors))
+    return operations
+
+
+def _group_operations(operations: List[BatchOperation]) -> List[List[BatchOperation]]:
+    """Split into runs of consecutive read-only commands and single mutations, keeping order."""
+    groups: List[List[BatchOperation]] = []
+    for operation in operations:
+        if operation.read_only and groups and groups[-1][0].read_only:
+            groups[-1].append(operation)
+        else:
+            groups.append([operation])
+    return groups
+
+
+class _ClientPool:
+    """Hands out one keep-alive client per thread.
+
+    When ``timings`` is given every client traces into that shared list.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        timeout: float,
+        latency: LatencyStats | None = None,
+        timings: List[Dict[str, Any]] | None = None,
+    ):
+        self._base_url = base_url
+        self._timeout = timeout
+        self._latency = latency
+        self._timings = timings
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._sessions: List[requests.Session] = []
+
+    def get(self) -> AEClient:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            session = requests.Session()
+            with self._lock:
+                self._sessions.append(session)
+            client = AEClient(
+                base_url=self._base_url,
+                timeout=self._timeout,
+                session=session,
+                latency=self._latency,
+                trace=self._timings is not None,
+                timings=self._timings if self._timings is not None else [],
+            )
+            self._local.client = client
+        return client
+
+    def close(self) -> None:
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+
+
+def _base_record(operation: BatchOperation) -> Dict[str, Any]:
+    record: Dict[str, Any] = {"index": operation.index, "line": operation.line}
+    if operation.op_id is not None:
+        record["id"] = operation.op_id
+    record["command"] = operation.args.command
+    return record
+
+
+def _run_operation(
+    handlers: Mapping[str, BatchHandler],
+    pool: _ClientPool,
+    operation: BatchOperation,
+) -> Dict[str, Any]:
+    record = _base_record(operation)
+    started = time.perf_counter()
+    try:
+        result = handlers[operation.args.command](pool.get(), operation.args)
+    except (AEBridgeError, requests.RequestException, OSError, ValueError, ImportError) as exc:
+        record["status"] = "error"
+        record["error"] = str(exc)
+    else:
+        record["status"] = "success"
+        record["result"] = result
+    record["elapsedMs"] = round((time.perf_counter() - started) * 1000.0, 3)
+    return record
+
+
+def execute_operations(
+    operations: List[BatchOperation],
+    handlers: Mapping[str, BatchHandler],
+    base_url: str,
+    timeout: float,
+    latency: LatencyStats | None = None,
+    max_workers: int = 4,
+    stop_on_error: bool = False,
+    on_result: Callable[[Dict[str, Any]], None] | None = None,
+    timings: List[Dict[str, Any]] | None = None,
+) -> Dict[str, Any]:
+    """Run validated operations and report each result in input order.
+
+    Mutations run one after another on a single keep-alive connection. Runs of
+    consecutive read-only commands have no dependency on each other and are
+    spread across up to ``max_workers`` connections. Passing ``timings`` turns on
+    request tracing and collects every connection's records into that list.
+    """
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+
+    counts = {"success": 0, "error": 0, "skipped": 0}
+    started = time.perf_counter()
+    pool = _ClientPool(base_url=base_url, timeout=timeout, latency=latency, timings=timings)
+    executor: ThreadPoolExecutor | None = None
+    stopped = False
+
+    def emit(record: Dict[str, Any]) -> None:
+        counts[record["status"]] += 1
+        if on_result is not None:
+            on_result(record)
+
+    try:
+        for group in _group_operations(operations):
+            if stopped:
+                for operation in group:
+                    emit({**_base_record(operation), "status": "skipped"})
+                continue
+
+            if len(group) > 1 and max_workers > 1:
+                if executor is None:
+                    executor = ThreadPoolExecutor(max_workers=max_workers)
+                for record in executor.map(lambda op: _run_operation(handlers, pool, op), group):
+                    emit(record)
+                    if record["status"] == "error" and stop_on_error:
+                        stopped = True
+                continue
+
+            for operation in group:
+                if stopped:
+                    emit({**_base_record(operation), "status": "skipped"})
+                    continue
+                record = _run_operation(handlers, pool, operation)
+                emit(record)
+                if record["status"] == "error" and stop_on_error:
+                    stopped = True
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=True)
+        pool.close()
+
+    return {
+        "total": len(operations),
+        "succeeded": counts["success"],
+        "failed": counts["error"],
+        "skipped": counts["skipped"],
+        "elapsedMs": round((time.perf_counter() - started) * 1000.0, 3),
+    }
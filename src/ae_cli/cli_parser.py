@@ -2,42 +2,134 @@ from __future__ import annotations
 
 import argparse
 import os
+from typing import Any, NoReturn, Sequence
 
 
 DEFAULT_BRIDGE_URL = os.environ.get("AE_BRIDGE_URL", "http://127.0.0.1:8080")
 
 
-def _add_layer_selector(parser: argparse.ArgumentParser) -> None:
-    selector_group = parser.add_mutually_exclusive_group(required=True)
+def _add_layer_selector(parser: argparse.ArgumentParser, required: bool = True) -> None:
+    selector_group = parser.add_mutually_exclusive_group(required=required)
     selector_group.add_argument("--layer-id", type=int)
+    selector_group.add_argument("--layer-uid", help="Stable layer uid (layerUid from layers); survives reordering")
     selector_group.add_argument("--layer-name")
 
 
-def build_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
+def _add_layer_ref(parser: argparse.ArgumentParser, prefix: str, required: bool = True) -> Any:
+    group = parser.add_mutually_exclusive_group(required=required)
+    group.add_argument(f"--{prefix}-id", type=int)
+    group.add_argument(f"--{prefix}-uid")
+    return group
+
+
+class CommandParseError(ValueError):
+    """Raised by the strict parser instead of exiting the process."""
+
+
+class _StrictArgumentParser(argparse.ArgumentParser):
+    def error(self, message: str) -> NoReturn:
+        raise CommandParseError(f"{self.prog}: {message}")
+
+    def exit(self, status: int = 0, message: str | None = None) -> NoReturn:
+        raise CommandParseError(message.strip() if message else f"{self.prog}: exited with status {status}")
+
+
+def build_parser(parser_class: type[argparse.ArgumentParser] = argparse.ArgumentParser) -> argparse.ArgumentParser:
+    parser = parser_class(
         prog="ae-cli",
         description="Control After Effects CEP bridge without MCP.",
     )
     parser.add_argument(
         "--base-url",
-        default=DEFAULT_BRIDGE_URL,
-        help=f"After Effects bridge URL (default: {DEFAULT_BRIDGE_URL})",
+        default=None,
+        help=(
+            "After Effects bridge URL, http://host:port or unix:///path/to/socket "
+            f"(default: the panel socket when present, else {DEFAULT_BRIDGE_URL})"
+        ),
     )
     parser.add_argument(
         "--timeout",
         type=float,
-        default=10.0,
-        help="HTTP timeout in seconds (default: 10.0)",
+        default=None,
+        help=(
+            "Fixed HTTP timeout in seconds. By default timeouts adapt per endpoint "
+            "from latency stats recorded in AE_CLI_STATS_FILE"
+        ),
+    )
+    parser.add_argument(
+        "--trace",
+        action="store_true",
+        help="Print a per-phase timing breakdown of each bridge request to stderr",
+    )
+    parser.add_argument(
+        "--trace-file",
+        help="Write the timing breakdown as JSON to this path",
     )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     subparsers.add_parser("health", help="Check bridge health")
-    subparsers.add_parser("layers", help="Get active composition layers")
-    subparsers.add_parser("list-comps", help="List compositions in the current project")
+    subparsers.add_parser("metrics", help="Show bridge queue depth and wait times")
+    layers_parser = subparsers.add_parser("layers", help="Get active composition layers")
+    layers_parser.add_argument(
+        "--type",
+        dest="layer_types",
+        action="append",
+        default=[],
+        help="Only include layers of this type (repeatable, e.g. text, shape, solid)",
+    )
+    layers_parser.add_argument("--name-prefix", help="Only include layers whose name starts with this prefix")
+    layers_parser.add_argument("--name-regex", help="Only include layers whose name matches this regex")
+    scene_managed_group = layers_parser.add_mutually_exclusive_group()
+    scene_managed_group.add_argument(
+        "--scene-managed",
+        dest="scene_managed",
+        action="store_const",
+        const=True,
+        help="Only include layers tagged by apply-scene",
+    )
+    scene_managed_group.add_argument(
+        "--unmanaged",
+        dest="scene_managed",
+        action="store_const",
+        const=False,
+        help="Only include layers not tagged by apply-scene",
+    )
+    layers_parser.add_argument("--start-index", type=int, help="First layer index to scan (1-based)")
+    layers_parser.add_argument("--end-index", type=int, help="Last layer index to scan (inclusive)")
+    layers_parser.add_argument(
+        "--columns",
+        action="store_true",
+        help="Return parallel arrays instead of one object per layer",
+    )
+    comps_parser = subparsers.add_parser("list-comps", help="List compositions in the current project")
+    comps_parser.add_argument("--name-prefix", help="Only include comps whose name starts with this")
+    comps_parser.add_argument("--name-regex", help="Only include comps whose name matches this regex")
+    comps_parser.add_argument(
+        "--folder",
+        help='Only include comps in this project folder path (e.g. "Shots/Act 1"; "" for the root)',
+    )
+    comps_parser.add_argument("--offset", type=int, help="Skip this many matching comps (returns a page)")
+    comps_parser.add_argument("--limit", type=int, help="Return at most this many comps (returns a page)")
     subparsers.add_parser("selected-properties", help="Get currently selected properties")
     subparsers.add_parser("expression-errors", help="Get expression errors in the active composition")
 
+    events_parser = subparsers.add_parser(
+        "events",
+        help="Stream project change and mutation events as JSON lines",
+    )
+    events_parser.add_argument(
+        "--type",
+        dest="event_types",
+        action="append",
+        help="Only print events of this type (repeatable, e.g. selectionChanged, mutation)",
+    )
+    events_parser.add_argument(
+        "--max-events",
+        type=int,
+        help="Exit after printing this many events",
+    )
+
     create_comp_parser = subparsers.add_parser("create-comp", help="Create a composition")
     create_comp_parser.add_argument("--name", required=True)
     create_comp_parser.add_argument("--width", type=int, required=True)
@@ -84,6 +176,26 @@ def build_parser() -> argparse.ArgumentParser:
     )
     property_value_group.add_argument("--value-file", help="Path to a UTF-8 JSON file")
 
+    set_texts_parser = subparsers.add_parser(
+        "set-texts",
+        help="Set the text of many text layers from a CSV file in a single call",
+    )
+    set_texts_parser.add_argument(
+        "--csv",
+        required=True,
+        help="UTF-8 CSV with a header: one of name, uid or id, plus the text column",
+    )
+    set_texts_parser.add_argument(
+        "--text-column",
+        default="text",
+        help="Column holding the new text (default: text), e.g. ja for a translation column",
+    )
+    set_texts_parser.add_argument(
+        "--clear-empty",
+        action="store_true",
+        help="Set layers with an empty text cell to empty text (default: leave them unchanged)",
+    )
+
     essential_property_parser = subparsers.add_parser(
         "add-essential-property",
         help="Add a layer property to Essential Graphics",
@@ -124,11 +236,83 @@ def build_parser() -> argparse.ArgumentParser:
         help='Outgoing temporal ease as JSON. Example: "[0,66]" or "[[0,66],[0,66]]"',
     )
 
+    get_keyframes_parser = subparsers.add_parser(
+        "keyframes",
+        help="Read existing keyframes of layers (packed per property)",
+    )
+    get_keyframes_parser.add_argument(
+        "--layer-id",
+        type=int,
+        action="append",
+        help="Layer index (repeatable)",
+    )
+    get_keyframes_parser.add_argument(
+        "--layer-uid",
+        action="append",
+        help="Layer uid (repeatable)",
+    )
+    get_keyframes_parser.add_argument(
+        "--layer-name",
+        action="append",
+        help="Layer name (repeatable)",
+    )
+    get_keyframes_parser.add_argument(
+        "--property-path",
+        action="append",
+        help="Property path to read (repeatable). Default: every animated property",
+    )
+
+    keyframes_parser = subparsers.add_parser(
+        "set-keyframes",
+        help="Set many keyframes on one property in a single call",
+    )
+    _add_layer_selector(keyframes_parser)
+    keyframes_parser.add_argument("--property-path", required=True)
+    keyframes_parser.add_argument(
+        "--keyframes-file",
+        required=True,
+        help='JSON file: {"times": [...], "values": [...]} or [{"time": 0, "value": 100}, ...]',
+    )
+    keyframes_parser.add_argument(
+        "--interp",
+        choices=["linear", "bezier", "hold"],
+        help="Interpolation type for both sides of every keyframe",
+    )
+    keyframes_parser.add_argument(
+        "--ease",
+        help='Temporal ease for both sides of every keyframe as JSON. Example: "[0,66]"',
+    )
+    keyframes_parser.add_argument(
+        "--simplify",
+        type=float,
+        metavar="TOLERANCE",
+        help="Drop keyframes while staying within TOLERANCE property units (requires NumPy)",
+    )
+    keyframes_parser.add_argument(
+        "--fit-ease",
+        action="store_true",
+        help="With --simplify, fit bezier eases to the kept keyframes",
+    )
+
     effect_parser = subparsers.add_parser("add-effect", help="Add an effect to a layer")
     _add_layer_selector(effect_parser)
     effect_parser.add_argument("--effect-match-name", required=True)
     effect_parser.add_argument("--effect-name")
 
+    apply_effects_parser = subparsers.add_parser(
+        "apply-effects",
+        help="Apply effects with parameters to many layers in a single call",
+    )
+    apply_effects_layers = apply_effects_parser.add_mutually_exclusive_group(required=True)
+    apply_effects_layers.add_argument("--layer-id", type=int, action="append")
+    apply_effects_layers.add_argument("--layer-uid", action="append")
+    apply_effects_layers.add_argument("--layer-name", action="append")
+    apply_effects_parser.add_argument(
+        "--effects-file",
+        required=True,
+        help='JSON file: [{"matchName": "ADBE Gaussian Blur 2", "params": {"Blurriness": 12}}, ...] or {"effects": [...]}',
+    )
+
     shape_repeater_parser = subparsers.add_parser(
         "add-shape-repeater",
         help="Add a Repeater operator to a shape group",
@@ -164,7 +348,7 @@ def build_parser() -> argparse.ArgumentParser:
     layer_parser = subparsers.add_parser("add-layer", help="Add a layer to the active composition")
     layer_parser.add_argument(
         "--layer-type",
-        choices=["text", "null", "solid", "shape"],
+        choices=["text", "null", "solid", "shape", "footage"],
         default="null",
         help="Layer type to add (default: null)",
     )
@@ -238,6 +422,70 @@ def build_parser() -> argparse.ArgumentParser:
         type=float,
         help="Rectangle roundness in pixels (rect only)",
     )
+    layer_parser.add_argument(
+        "--footage-hash",
+        help="SHA-256 of footage imported with import-footage (footage layers only)",
+    )
+
+    layers_parser = subparsers.add_parser(
+        "add-layers",
+        help="Add many layers to the active composition in a single call",
+    )
+    layers_parser.add_argument(
+        "--layers-file",
+        required=True,
+        help='JSON file: [{"layerType": "text", "name": "Title", "text": "Hello"}, ...] or {"layers": [...]}',
+    )
+
+    shape_paths_parser = subparsers.add_parser(
+        "add-shape-paths",
+        help="Add SVG path groups to a shape layer (or a new one) in a single call",
+    )
+    _add_layer_selector(shape_paths_parser, required=False)
+    shape_paths_parser.add_argument("--name", help="Name of the new shape layer when no layer is given")
+    shape_paths_source = shape_paths_parser.add_mutually_exclusive_group(required=True)
+    shape_paths_source.add_argument(
+        "--path",
+        action="append",
+        help="SVG path data for one group (repeatable)",
+    )
+    shape_paths_source.add_argument(
+        "--paths-file",
+        help='JSON file: [{"d": "M0 0 L100 0 Z", "fillColor": [1, 0, 0]}, ...] or {"paths": [...]}',
+    )
+    shape_paths_parser.add_argument(
+        "--fill-color",
+        nargs=3,
+        type=float,
+        metavar=("R", "G", "B"),
+        help="Fill color for --path groups (0-1 or 0-255)",
+    )
+    shape_paths_parser.add_argument(
+        "--stroke-color",
+        nargs=3,
+        type=float,
+        metavar=("R", "G", "B"),
+        help="Stroke color for --path groups (0-1 or 0-255)",
+    )
+    shape_paths_parser.add_argument("--stroke-width", type=float, help="Stroke width for --path groups")
+    shape_paths_parser.add_argument(
+        "--fill-rule",
+        choices=["nonzero", "evenodd"],
+        help="Fill rule for --path groups",
+    )
+
+    import_footage_parser = subparsers.add_parser(
+        "import-footage",
+        help="Import files as footage, skipping files already in the project (by content hash)",
+    )
+    import_footage_parser.add_argument("paths", nargs="+", help="Files to import")
+    import_footage_parser.add_argument("--folder", help="Project root folder to put new items in")
+    import_footage_parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Threads used to hash files (default: 4)",
+    )
 
     set_in_out_parser = subparsers.add_parser("set-in-out-point", help="Set layer in/out points")
     _add_layer_selector(set_in_out_parser)
@@ -256,13 +504,23 @@ def build_parser() -> argparse.ArgumentParser:
     set_work_area_parser.add_argument("--duration", type=float, required=True)
 
     parent_layer_parser = subparsers.add_parser("parent-layer", help="Set or clear layer parent")
-    parent_layer_parser.add_argument("--child-layer-id", type=int, required=True)
-    parent_group = parent_layer_parser.add_mutually_exclusive_group(required=True)
-    parent_group.add_argument("--parent-layer-id", type=int)
+    _add_layer_ref(parent_layer_parser, "child-layer")
+    parent_group = _add_layer_ref(parent_layer_parser, "parent-layer")
     parent_group.add_argument("--clear-parent", action="store_true")
 
+    parent_layers_parser = subparsers.add_parser(
+        "parent-layers",
+        help="Set many child -> parent links in a single call",
+    )
+    parent_layers_parser.add_argument(
+        "--links-file",
+        required=True,
+        help='JSON file: {"<child uid>": "<parent uid>" | null, ...} or [[child, parent], ...] with uids or indices',
+    )
+
     precompose_parser = subparsers.add_parser("precompose", help="Precompose layers")
-    precompose_parser.add_argument("--layer-id", type=int, action="append", required=True)
+    precompose_parser.add_argument("--layer-id", type=int, action="append")
+    precompose_parser.add_argument("--layer-uid", action="append")
     precompose_parser.add_argument("--name", required=True)
     precompose_parser.add_argument(
         "--move-all-attributes",
@@ -271,18 +529,42 @@ def build_parser() -> argparse.ArgumentParser:
     )
 
     duplicate_layer_parser = subparsers.add_parser("duplicate-layer", help="Duplicate a layer")
-    duplicate_layer_parser.add_argument("--layer-id", type=int, required=True)
+    _add_layer_ref(duplicate_layer_parser, "layer")
+
+    duplicate_layers_parser = subparsers.add_parser(
+        "duplicate-layers",
+        help="Duplicate a layer many times with per-copy overrides in a single call",
+    )
+    _add_layer_ref(duplicate_layers_parser, "layer")
+    duplicate_layers_parser.add_argument("--count", type=int, help="Number of copies (default: number of overrides)")
+    duplicate_layers_parser.add_argument(
+        "--overrides-file",
+        help='JSON file: [{"name": "Row 1", "text": "Alice", "transform": {"position": [960, 200]}}, ...]',
+    )
 
     move_layer_order_parser = subparsers.add_parser("move-layer-order", help="Reorder a layer")
-    move_layer_order_parser.add_argument("--layer-id", type=int, required=True)
+    _add_layer_ref(move_layer_order_parser, "layer")
     order_group = move_layer_order_parser.add_mutually_exclusive_group(required=True)
     order_group.add_argument("--before-layer-id", type=int)
+    order_group.add_argument("--before-layer-uid")
     order_group.add_argument("--after-layer-id", type=int)
+    order_group.add_argument("--after-layer-uid")
     order_group.add_argument("--to-top", action="store_true")
     order_group.add_argument("--to-bottom", action="store_true")
 
+    reorder_layers_parser = subparsers.add_parser(
+        "reorder-layers",
+        help="Reorder many layers by uid in a single call",
+    )
+    reorder_layers_parser.add_argument(
+        "--layer-uid",
+        action="append",
+        required=True,
+        help="Layer uid in the desired top-to-bottom order (repeatable)",
+    )
+
     delete_layer_parser = subparsers.add_parser("delete-layer", help="Delete a layer")
-    delete_layer_parser.add_argument("--layer-id", type=int, required=True)
+    _add_layer_ref(delete_layer_parser, "layer")
 
     delete_comp_parser = subparsers.add_parser("delete-comp", help="Delete a composition by id or name")
     delete_comp_group = delete_comp_parser.add_mutually_exclusive_group(required=True)
@@ -312,5 +594,52 @@ def build_parser() -> argparse.ArgumentParser:
             "(delete managed layers not declared), clear-all (delete all comp layers first)"
         ),
     )
+    apply_scene_parser.add_argument(
+        "--simplify",
+        type=float,
+        metavar="TOLERANCE",
+        help="Drop keyframes while staying within TOLERANCE property units (requires NumPy)",
+    )
+    apply_scene_parser.add_argument(
+        "--fit-ease",
+        action="store_true",
+        help="With --simplify, fit bezier eases to the kept keyframes",
+    )
+    apply_scene_parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="Suppress dialogs and use wireframe viewer previews while applying",
+    )
+
+    batch_parser = subparsers.add_parser(
+        "batch",
+        help="Replay a JSONL file of ae-cli commands",
+    )
+    batch_parser.add_argument(
+        "--file",
+        required=True,
+        help="UTF-8 JSONL file; each line is an argv array or an object with an 'argv' array",
+    )
+    batch_parser.add_argument(
+        "--output",
+        default="-",
+        help="Write per-operation results as JSONL to this path (default: stdout)",
+    )
+    batch_parser.add_argument(
+        "--stop-on-error",
+        action="store_true",
+        help="Skip the remaining operations after the first failure",
+    )
+    batch_parser.add_argument(
+        "--max-workers",
+        type=int,
+        default=4,
+        help="Concurrent connections for runs of read-only commands (default: 4)",
+    )
 
     return parser
+
+
+def parse_command(argv: Sequence[str]) -> argparse.Namespace:
+    """Parse one command line with the CLI rules, raising CommandParseError on failure."""
+    return build_parser(parser_class=_StrictArgumentParser).parse_args(list(argv))
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 import argparse
+import csv
 import json
 import sys
+import time
 from pathlib import Path
 from typing import Any, Callable
 
 import requests
 
+from .batch import execute_operations, load_operations
+from .cli_parser import DEFAULT_BRIDGE_URL
 from .client import AEBridgeError, AEClient
+from .latency import LatencyStats
+from .transport import resolve_base_url
 
 
 def _print_json(data: Any) -> None:
@@ -53,281 +59,563 @@ def _layer_selector_kwargs(args: argparse.Namespace) -> dict[str, Any]:
     return {
         "layer_id": getattr(args, "layer_id", None),
         "layer_name": getattr(args, "layer_name", None),
+        "layer_uid": getattr(args, "layer_uid", None),
     }
 
 
-def _run_health(client: AEClient, _args: argparse.Namespace) -> None:
-    _print_json(client.health())
+def _run_health(client: AEClient, _args: argparse.Namespace) -> Any:
+    return client.health()
 
 
-def _run_layers(client: AEClient, _args: argparse.Namespace) -> None:
-    _print_json(client.get_layers())
+def _run_metrics(client: AEClient, _args: argparse.Namespace) -> Any:
+    return client.metrics()
 
 
-def _run_list_comps(client: AEClient, _args: argparse.Namespace) -> None:
-    _print_json(client.list_comps())
+def _run_layers(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.get_layers(
+        layer_types=args.layer_types,
+        name_prefix=args.name_prefix,
+        name_regex=args.name_regex,
+        scene_managed=args.scene_managed,
+        start_index=args.start_index,
+        end_index=args.end_index,
+        columns=args.columns,
+    )
 
 
-def _run_create_comp(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(
-        client.create_comp(
-            name=args.name,
-            width=args.width,
-            height=args.height,
-            duration=args.duration,
-            frame_rate=args.frame_rate,
-            pixel_aspect=args.pixel_aspect,
-        )
+def _run_list_comps(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.list_comps(
+        name_prefix=args.name_prefix,
+        name_regex=args.name_regex,
+        folder=args.folder,
+        offset=args.offset,
+        limit=args.limit,
     )
 
 
-def _run_set_active_comp(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(client.set_active_comp(comp_id=args.comp_id, comp_name=args.comp_name))
+def _run_events(client: AEClient, args: argparse.Namespace) -> None:
+    event_types = set(args.event_types or [])
+    printed = 0
+    try:
+        for event in client.events():
+            if event_types and event.get("event") not in event_types:
+                continue
+            print(json.dumps(event, ensure_ascii=False), flush=True)
+            printed += 1
+            if args.max_events is not None and printed >= args.max_events:
+                break
+    except KeyboardInterrupt:
+        pass
+
+
+def _run_create_comp(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.create_comp(
+        name=args.name,
+        width=args.width,
+        height=args.height,
+        duration=args.duration,
+        frame_rate=args.frame_rate,
+        pixel_aspect=args.pixel_aspect,
+    )
 
 
-def _run_selected_properties(client: AEClient, _args: argparse.Namespace) -> None:
-    _print_json(client.get_selected_properties())
+def _run_set_active_comp(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.set_active_comp(comp_id=args.comp_id, comp_name=args.comp_name)
 
 
-def _run_expression_errors(client: AEClient, _args: argparse.Namespace) -> None:
-    _print_json(client.get_expression_errors())
+def _run_selected_properties(client: AEClient, _args: argparse.Namespace) -> Any:
+    return client.get_selected_properties()
 
 
-def _run_properties(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(
-        client.get_properties(
-            **_layer_selector_kwargs(args),
-            include_groups=args.include_group,
-            exclude_groups=args.exclude_group,
-            max_depth=args.max_depth,
-            include_group_children=args.include_group_children,
-            time=args.time,
-        )
+def _run_expression_errors(client: AEClient, _args: argparse.Namespace) -> Any:
+    return client.get_expression_errors()
+
+
+def _run_properties(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.get_properties(
+        **_layer_selector_kwargs(args),
+        include_groups=args.include_group,
+        exclude_groups=args.exclude_group,
+        max_depth=args.max_depth,
+        include_group_children=args.include_group_children,
+        time=args.time,
     )
 
 
-def _run_set_expression(client: AEClient, args: argparse.Namespace) -> None:
+def _run_set_expression(client: AEClient, args: argparse.Namespace) -> Any:
     expression = _read_expression(args)
-    _print_json(
-        client.set_expression(
-            property_path=args.property_path,
-            expression=expression,
-            **_layer_selector_kwargs(args),
-        )
+    return client.set_expression(
+        property_path=args.property_path,
+        expression=expression,
+        **_layer_selector_kwargs(args),
     )
 
 
-def _run_set_property(client: AEClient, args: argparse.Namespace) -> None:
+def _run_set_property(client: AEClient, args: argparse.Namespace) -> Any:
     value = _read_json_value(args)
-    _print_json(
-        client.set_property_value(
-            property_path=args.property_path,
-            value=value,
-            **_layer_selector_kwargs(args),
-        )
+    return client.set_property_value(
+        property_path=args.property_path,
+        value=value,
+        **_layer_selector_kwargs(args),
     )
 
 
-def _run_set_keyframe(client: AEClient, args: argparse.Namespace) -> None:
+def _run_set_texts(client: AEClient, args: argparse.Namespace) -> Any:
+    with Path(args.csv).open(encoding="utf-8-sig", newline="") as handle:
+        reader = csv.DictReader(handle)
+        columns = reader.fieldnames or []
+        selector_columns = [column for column in ("name", "uid", "id") if column in columns]
+        if len(selector_columns) != 1:
+            raise ValueError("CSV header needs exactly one of the columns name, uid or id.")
+        if args.text_column not in columns:
+            raise ValueError(f"CSV header has no {args.text_column!r} column.")
+        selector_column = selector_columns[0]
+        texts: dict[str | int, str] = {}
+        lines: dict[str | int, int] = {}
+        for line, row in enumerate(reader, start=2):
+            raw_key = (row.get(selector_column) or "").strip()
+            if not raw_key:
+                continue
+            key: str | int = raw_key
+            if selector_column == "id":
+                try:
+                    key = int(raw_key)
+                except ValueError as exc:
+                    raise ValueError(f"CSV line {line}: id must be an integer, got {raw_key!r}.") from exc
+            if key in lines:
+                raise ValueError(f"CSV line {line}: {selector_column} {raw_key!r} already appears on line {lines[key]}.")
+            lines[key] = line
+            # An empty cell usually means a missing translation, so it keeps the current text.
+            text = row.get(args.text_column) or ""
+            if text or args.clear_empty:
+                texts[key] = text
+    if not texts:
+        raise ValueError("CSV has no rows to apply.")
+    return client.set_texts(texts, by="uid" if selector_column == "uid" else "name")
+
+
+def _run_set_keyframe(client: AEClient, args: argparse.Namespace) -> Any:
     value = _read_json_value(args)
     ease_in = _read_json_optional(args.ease_in, "ease-in")
     ease_out = _read_json_optional(args.ease_out, "ease-out")
-    _print_json(
-        client.set_keyframe(
-            property_path=args.property_path,
-            time=args.time,
-            value=value,
-            in_interp=args.in_interp,
-            out_interp=args.out_interp,
-            ease_in=ease_in,
-            ease_out=ease_out,
-            **_layer_selector_kwargs(args),
-        )
+    return client.set_keyframe(
+        property_path=args.property_path,
+        time=args.time,
+        value=value,
+        in_interp=args.in_interp,
+        out_interp=args.out_interp,
+        ease_in=ease_in,
+        ease_out=ease_out,
+        **_layer_selector_kwargs(args),
     )
 
 
-def _run_add_essential_property(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(
-        client.add_essential_property(
-            property_path=args.property_path,
-            essential_name=args.essential_name,
-            **_layer_selector_kwargs(args),
-        )
+def _run_keyframes(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.get_keyframes(
+        layer_ids=args.layer_id,
+        layer_names=args.layer_name,
+        property_paths=args.property_path,
+        layer_uids=args.layer_uid,
     )
 
 
-def _run_add_effect(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(
-        client.add_effect(
-            effect_match_name=args.effect_match_name,
-            effect_name=args.effect_name,
-            **_layer_selector_kwargs(args),
-        )
+def _read_keyframes_file(path: str) -> tuple[list[Any], list[Any]]:
+    data = _read_json_file(path, "keyframes-file")
+    if isinstance(data, dict) and "times" in data and "values" in data:
+        return data["times"], data["values"]
+    if isinstance(data, list) and all(isinstance(entry, dict) and "time" in entry and "value" in entry for entry in data):
+        return [entry["time"] for entry in data], [entry["value"] for entry in data]
+    raise ValueError('keyframes-file must hold {"times": [...], "values": [...]} or a list of {"time", "value"} objects.')
+
+
+def _run_set_keyframes(client: AEClient, args: argparse.Namespace) -> Any:
+    times, values = _read_keyframes_file(args.keyframes_file)
+    return client.set_keyframes(
+        property_path=args.property_path,
+        times=times,
+        values=values,
+        interp=args.interp,
+        ease=_read_json_optional(args.ease, "ease"),
+        simplify=args.simplify,
+        fit_ease=args.fit_ease,
+        **_layer_selector_kwargs(args),
     )
 
 
-def _run_add_shape_repeater(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(
-        client.add_shape_repeater(
-            group_index=args.group_index,
-            name=args.name,
-            copies=args.copies,
-            offset=args.offset,
-            position=args.position,
-            scale=args.scale,
-            rotation=args.rotation,
-            start_opacity=args.start_opacity,
-            end_opacity=args.end_opacity,
-            **_layer_selector_kwargs(args),
-        )
+def _run_add_essential_property(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.add_essential_property(
+        property_path=args.property_path,
+        essential_name=args.essential_name,
+        **_layer_selector_kwargs(args),
     )
 
 
-def _run_add_layer(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(
-        client.add_layer(
-            layer_type=args.layer_type,
-            name=args.name,
-            text=args.text,
-            width=args.width,
-            height=args.height,
-            color=args.color,
-            duration=args.duration,
-            shape_type=args.shape_type,
-            shape_size=args.shape_size,
-            shape_position=args.shape_position,
-            shape_fill_color=args.shape_fill_color,
-            shape_fill_opacity=args.shape_fill_opacity,
-            shape_stroke_color=args.shape_stroke_color,
-            shape_stroke_opacity=args.shape_stroke_opacity,
-            shape_stroke_width=args.shape_stroke_width,
-            shape_stroke_line_cap=args.shape_stroke_line_cap,
-            shape_roundness=args.shape_roundness,
-        )
+def _run_add_effect(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.add_effect(
+        effect_match_name=args.effect_match_name,
+        effect_name=args.effect_name,
+        **_layer_selector_kwargs(args),
+    )
+
+
+def _run_apply_effects(client: AEClient, args: argparse.Namespace) -> Any:
+    data = _read_json_file(args.effects_file, "effects-file")
+    effects = data.get("effects") if isinstance(data, dict) else data
+    if not isinstance(effects, list):
+        raise ValueError('effects-file must hold a list of effect objects or {"effects": [...]}.')
+    if args.layer_uid:
+        return client.apply_effects(args.layer_uid, effects, by="uid")
+    return client.apply_effects(args.layer_id or args.layer_name, effects)
+
+
+def _run_add_shape_repeater(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.add_shape_repeater(
+        group_index=args.group_index,
+        name=args.name,
+        copies=args.copies,
+        offset=args.offset,
+        position=args.position,
+        scale=args.scale,
+        rotation=args.rotation,
+        start_opacity=args.start_opacity,
+        end_opacity=args.end_opacity,
+        **_layer_selector_kwargs(args),
+    )
+
+
+def _run_add_layer(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.add_layer(
+        layer_type=args.layer_type,
+        name=args.name,
+        text=args.text,
+        width=args.width,
+        height=args.height,
+        color=args.color,
+        duration=args.duration,
+        shape_type=args.shape_type,
+        shape_size=args.shape_size,
+        shape_position=args.shape_position,
+        shape_fill_color=args.shape_fill_color,
+        shape_fill_opacity=args.shape_fill_opacity,
+        shape_stroke_color=args.shape_stroke_color,
+        shape_stroke_opacity=args.shape_stroke_opacity,
+        shape_stroke_width=args.shape_stroke_width,
+        shape_stroke_line_cap=args.shape_stroke_line_cap,
+        shape_roundness=args.shape_roundness,
+        footage_hash=args.footage_hash,
     )
 
 
-def _run_set_in_out_point(client: AEClient, args: argparse.Namespace) -> None:
+def _run_add_layers(client: AEClient, args: argparse.Namespace) -> Any:
+    data = _read_json_file(args.layers_file, "layers-file")
+    layers = data.get("layers") if isinstance(data, dict) else data
+    if not isinstance(layers, list):
+        raise ValueError('layers-file must hold a list of layer objects or {"layers": [...]}.')
+    return client.add_layers(layers)
+
+
+def _run_add_shape_paths(client: AEClient, args: argparse.Namespace) -> Any:
+    if args.paths_file:
+        data = _read_json_file(args.paths_file, "paths-file")
+        paths = data.get("paths") if isinstance(data, dict) else data
+        if not isinstance(paths, list):
+            raise ValueError('paths-file must hold a list of path groups or {"paths": [...]}.')
+    else:
+        style = {
+            "fill_color": args.fill_color,
+            "stroke_color": args.stroke_color,
+            "stroke_width": args.stroke_width,
+            "fill_rule": args.fill_rule,
+        }
+        style = {key: value for key, value in style.items() if value is not None}
+        paths = [{"d": d, **style} for d in args.path]
+    return client.add_shape_paths(paths, name=args.name, **_layer_selector_kwargs(args))
+
+
+def _run_import_footage(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.import_footage(args.paths, folder=args.folder, max_workers=args.max_workers)
+
+
+def _run_set_in_out_point(client: AEClient, args: argparse.Namespace) -> Any:
     if args.in_point is None and args.out_point is None:
         raise ValueError("At least one of --in-point or --out-point is required.")
-    _print_json(
-        client.set_in_out_point(
-            in_point=args.in_point,
-            out_point=args.out_point,
-            **_layer_selector_kwargs(args),
-        )
+    return client.set_in_out_point(
+        in_point=args.in_point,
+        out_point=args.out_point,
+        **_layer_selector_kwargs(args),
     )
 
 
-def _run_move_layer_time(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(client.move_layer_time(delta=args.delta, **_layer_selector_kwargs(args)))
+def _run_move_layer_time(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.move_layer_time(delta=args.delta, **_layer_selector_kwargs(args))
 
 
-def _run_set_cti(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(client.set_cti(time=args.time))
+def _run_set_cti(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.set_cti(time=args.time)
 
 
-def _run_set_work_area(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(client.set_work_area(start=args.start, duration=args.duration))
+def _run_set_work_area(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.set_work_area(start=args.start, duration=args.duration)
 
 
-def _run_parent_layer(client: AEClient, args: argparse.Namespace) -> None:
-    parent_layer_id = None if args.clear_parent else args.parent_layer_id
-    _print_json(
-        client.parent_layer(
-            child_layer_id=args.child_layer_id,
-            parent_layer_id=parent_layer_id,
-        )
+def _run_parent_layer(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.parent_layer(
+        child_layer_id=args.child_layer_id,
+        parent_layer_id=None if args.clear_parent else args.parent_layer_id,
+        child_layer_uid=args.child_layer_uid,
+        parent_layer_uid=None if args.clear_parent else args.parent_layer_uid,
     )
 
 
-def _run_precompose(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(
-        client.precompose(
-            layer_ids=args.layer_id,
-            name=args.name,
-            move_all_attributes=args.move_all_attributes,
-        )
+def _run_parent_layers(client: AEClient, args: argparse.Namespace) -> Any:
+    data = _read_json_file(args.links_file, "links-file")
+    if isinstance(data, dict) and "links" in data:
+        data = data["links"]
+    if isinstance(data, list):
+        if not all(isinstance(pair, list) and len(pair) == 2 for pair in data):
+            raise ValueError("links-file lists must hold [child, parent] pairs.")
+        data = {child: parent for child, parent in data}
+    if not isinstance(data, dict):
+        raise ValueError('links-file must hold {"child": "parent", ...} or [[child, parent], ...].')
+    return client.parent_layers(data)
+
+
+def _run_precompose(client: AEClient, args: argparse.Namespace) -> Any:
+    if not args.layer_id and not args.layer_uid:
+        raise ValueError("precompose needs at least one --layer-id or --layer-uid.")
+    return client.precompose(
+        layer_ids=args.layer_id,
+        name=args.name,
+        move_all_attributes=args.move_all_attributes,
+        layer_uids=args.layer_uid,
     )
 
 
-def _run_duplicate_layer(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(client.duplicate_layer(layer_id=args.layer_id))
+def _run_duplicate_layer(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.duplicate_layer(layer_id=args.layer_id, layer_uid=args.layer_uid)
+
+
+def _run_duplicate_layers(client: AEClient, args: argparse.Namespace) -> Any:
+    overrides = None
+    if args.overrides_file:
+        data = _read_json_file(args.overrides_file, "overrides-file")
+        overrides = data.get("overrides") if isinstance(data, dict) else data
+        if not isinstance(overrides, list):
+            raise ValueError('overrides-file must hold a list of override objects or {"overrides": [...]}.')
+    if overrides is None and args.count is None:
+        raise ValueError("duplicate-layers needs --count or --overrides-file.")
+    return client.duplicate_layer_many(
+        layer_id=args.layer_id,
+        count=args.count,
+        overrides=overrides,
+        layer_uid=args.layer_uid,
+    )
 
 
-def _run_move_layer_order(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(
-        client.move_layer_order(
-            layer_id=args.layer_id,
-            before_layer_id=args.before_layer_id,
-            after_layer_id=args.after_layer_id,
-            to_top=args.to_top,
-            to_bottom=args.to_bottom,
-        )
+def _run_move_layer_order(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.move_layer_order(
+        layer_id=args.layer_id,
+        before_layer_id=args.before_layer_id,
+        after_layer_id=args.after_layer_id,
+        to_top=args.to_top,
+        to_bottom=args.to_bottom,
+        layer_uid=args.layer_uid,
+        before_layer_uid=args.before_layer_uid,
+        after_layer_uid=args.after_layer_uid,
     )
 
 
-def _run_delete_layer(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(client.delete_layer(layer_id=args.layer_id))
+def _run_reorder_layers(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.reorder_layers(args.layer_uid)
+
 
+def _run_delete_layer(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.delete_layer(layer_id=args.layer_id, layer_uid=args.layer_uid)
 
-def _run_delete_comp(client: AEClient, args: argparse.Namespace) -> None:
-    _print_json(client.delete_comp(comp_id=args.comp_id, comp_name=args.comp_name))
 
+def _run_delete_comp(client: AEClient, args: argparse.Namespace) -> Any:
+    return client.delete_comp(comp_id=args.comp_id, comp_name=args.comp_name)
 
-def _run_apply_scene(client: AEClient, args: argparse.Namespace) -> None:
+
+def _run_apply_scene(client: AEClient, args: argparse.Namespace) -> Any:
     scene = _read_json_file(args.scene_file, "scene-file")
-    _print_json(
-        client.apply_scene(
-            scene=scene,
-            validate_only=args.validate_only,
-            mode=args.mode,
-        )
+    return client.apply_scene(
+        scene=scene,
+        validate_only=args.validate_only,
+        mode=args.mode,
+        simplify=args.simplify,
+        fit_ease=args.fit_ease,
+        fast=args.fast,
     )
 
 
-CommandHandler = Callable[[AEClient, argparse.Namespace], None]
+def _run_batch(client: AEClient, args: argparse.Namespace) -> None:
+    if args.max_workers < 1:
+        raise ValueError("--max-workers must be at least 1.")
+    operations = load_operations(args.file)
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    def write_result(record: dict[str, Any]) -> None:
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+
+    try:
+        summary = execute_operations(
+            operations,
+            COMMAND_HANDLERS,
+            base_url=client.base_url,
+            timeout=client.timeout,
+            latency=client.latency,
+            max_workers=args.max_workers,
+            stop_on_error=args.stop_on_error,
+            on_result=write_result,
+            timings=client.timings if client.trace else None,
+        )
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(json.dumps(summary, ensure_ascii=False), file=sys.stderr)
+    if summary["failed"]:
+        raise ValueError(f"{summary['failed']} of {summary['total']} batch operations failed.")
+
+
+CommandHandler = Callable[[AEClient, argparse.Namespace], Any]
 
 COMMAND_HANDLERS: dict[str, CommandHandler] = {
     "health": _run_health,
+    "metrics": _run_metrics,
     "layers": _run_layers,
     "list-comps": _run_list_comps,
     "create-comp": _run_create_comp,
     "set-active-comp": _run_set_active_comp,
     "selected-properties": _run_selected_properties,
     "expression-errors": _run_expression_errors,
+    "events": _run_events,
     "properties": _run_properties,
     "set-expression": _run_set_expression,
     "set-property": _run_set_property,
+    "set-texts": _run_set_texts,
     "set-keyframe": _run_set_keyframe,
+    "keyframes": _run_keyframes,
+    "set-keyframes": _run_set_keyframes,
     "add-essential-property": _run_add_essential_property,
     "add-effect": _run_add_effect,
+    "apply-effects": _run_apply_effects,
     "add-shape-repeater": _run_add_shape_repeater,
     "add-layer": _run_add_layer,
+    "add-layers": _run_add_layers,
+    "add-shape-paths": _run_add_shape_paths,
+    "import-footage": _run_import_footage,
     "set-in-out-point": _run_set_in_out_point,
     "move-layer-time": _run_move_layer_time,
     "set-cti": _run_set_cti,
     "set-work-area": _run_set_work_area,
     "parent-layer": _run_parent_layer,
+    "parent-layers": _run_parent_layers,
     "precompose": _run_precompose,
     "duplicate-layer": _run_duplicate_layer,
+    "duplicate-layers": _run_duplicate_layers,
     "move-layer-order": _run_move_layer_order,
+    "reorder-layers": _run_reorder_layers,
     "delete-layer": _run_delete_layer,
     "delete-comp": _run_delete_comp,
     "apply-scene": _run_apply_scene,
+    "batch": _run_batch,
 }
 
 
-def run_command(args: argparse.Namespace) -> int:
-    client = AEClient(base_url=args.base_url, timeout=args.timeout)
+DEFAULT_TIMEOUT = 10.0
+SERVER_TIMING_PHASES = ("inflate", "parse", "queue", "eval", "load", "host", "decode", "encode", "gzip", "saved")
+
+
+def _build_trace_report(
+    command: str,
+    startup_ms: float | None,
+    command_ms: float,
+    timings: list[dict[str, Any]],
+) -> dict[str, Any]:
+    requests_report = []
+    for entry in timings:
+        server = entry.get("server") or {}
+        client_ms = entry.get("clientMs")
+        server_total = server.get("total")
+        transport_ms = None
+        if client_ms is not None and server_total is not None:
+            transport_ms = max(0.0, client_ms - server_total)
+        requests_report.append({**entry, "transportMs": transport_ms})
+    return {
+        "command": command,
+        "startupMs": startup_ms,
+        "commandMs": command_ms,
+        "requests": requests_report,
+    }
+
+
+def _format_ms(value: float | None) -> str:
+    return "-" if value is None else f"{value:.2f}ms"
+
+
+def _print_trace_report(report: dict[str, Any]) -> None:
+    lines = [
+        f"trace: {report['command']}",
+        f"  startup    {_format_ms(report['startupMs'])}",
+        f"  command    {_format_ms(report['commandMs'])}",
+    ]
+    for entry in report["requests"]:
+        lines.append(
+            f"  {entry.get('method') or '?'} {entry.get('url') or '?'} "
+            f"-> {entry.get('statusCode') or '?'} ({_format_ms(entry.get('clientMs'))})"
+        )
+        if entry.get("gzipMs") is not None:
+            lines.append(f"    client gzip {_format_ms(entry['gzipMs'])}")
+        lines.append(f"    transport  {_format_ms(entry.get('transportMs'))}")
+        server = entry.get("server") or {}
+        for phase in SERVER_TIMING_PHASES:
+            if phase in server:
+                lines.append(f"    {phase:<10} {_format_ms(server[phase])}")
+    print("\n".join(lines), file=sys.stderr)
+
+
+def run_command(args: argparse.Namespace, startup_ms: float | None = None) -> int:
+    trace = bool(getattr(args, "trace", False))
+    trace_file = getattr(args, "trace_file", None)
+    fixed_timeout = getattr(args, "timeout", None)
+    client = AEClient(
+        base_url=resolve_base_url(getattr(args, "base_url", None), DEFAULT_BRIDGE_URL),
+        timeout=fixed_timeout if fixed_timeout is not None else DEFAULT_TIMEOUT,
+        trace=trace or bool(trace_file),
+        latency=LatencyStats.load() if fixed_timeout is None else None,
+    )
+    started = time.perf_counter()
 
     try:
         handler = COMMAND_HANDLERS.get(args.command)
         if handler is None:
             print(f"ae-cli error: Unknown command: {args.command}", file=sys.stderr)
             return 2
-        handler(client, args)
+        result = handler(client, args)
+        if result is not None:
+            _print_json(result)
         return 0
-    except (AEBridgeError, requests.RequestException, OSError, ValueError) as exc:
+    except (AEBridgeError, requests.RequestException, OSError, ValueError, ImportError) as exc:
         print(f"ae-cli error: {exc}", file=sys.stderr)
         return 1
+    finally:
+        if client.latency is not None:
+            try:
+                client.latency.save()
+            except OSError as exc:
+                print(f"ae-cli warning: could not save latency stats: {exc}", file=sys.stderr)
+        if client.trace:
+            report = _build_trace_report(
+                args.command,
+                startup_ms,
+                (time.perf_counter() - started) * 1000.0,
+                client.timings,
+            )
+            if trace:
+                _print_trace_report(report)
+            if trace_file:
+                Path(trace_file).write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding="utf-8")
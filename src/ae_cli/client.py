@@ -2,12 +2,42 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import copy
+from dataclasses import dataclass, field
+import gzip
+import hashlib
 import json
-from typing import Any, Dict, List
+import os
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Sequence
 
 import requests
 
+from .curves import simplify_keyframes, simplify_scene_animations
+from .latency import LatencyStats
+from .svg_paths import normalize_scene_shape_paths, normalize_shape_path
+from .transport import UNIX_HTTP_PREFIX, UnixSocketAdapter, unix_socket_path
+
+
+DEFAULT_GZIP_THRESHOLD = 8192
+HASH_CHUNK_BYTES = 1 << 20
+
+
+def _default_gzip_threshold() -> int | None:
+    """Read ``AE_BRIDGE_GZIP_THRESHOLD`` (bytes, shared with the panel); 0 disables compression."""
+    raw = os.environ.get("AE_BRIDGE_GZIP_THRESHOLD")
+    if raw is None:
+        return DEFAULT_GZIP_THRESHOLD
+    try:
+        threshold = int(raw)
+    except ValueError:
+        return DEFAULT_GZIP_THRESHOLD
+    if threshold < 0:
+        return DEFAULT_GZIP_THRESHOLD
+    return threshold or None
+
 
 class AEBridgeError(RuntimeError):
     """Raised when the CEP bridge returns an error payload."""
@@ -80,19 +110,240 @@ def _format_bridge_error_message(payload: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+def _as_list(values: Any, label: str) -> List[Any]:
+    """Convert a list, tuple or array-like with ``tolist()`` (e.g. a NumPy array) to a plain list."""
+    if hasattr(values, "tolist"):
+        values = values.tolist()
+    if isinstance(values, (str, bytes)) or not isinstance(values, Iterable):
+        raise ValueError(f"{label} must be a sequence or an array.")
+    return list(values)
+
+
+def _camel_case(key: str) -> str:
+    head, *rest = key.split("_")
+    return head + "".join(part[:1].upper() + part[1:] for part in rest)
+
+
+def _layer_ref_args(ref: str | int) -> tuple[int | None, str | None]:
+    """Split a layer reference into ``(layer_id, layer_uid)``: strings are uids, ints are indices."""
+    if isinstance(ref, str):
+        return None, ref
+    if isinstance(ref, int) and not isinstance(ref, bool):
+        return ref, None
+    raise ValueError(f"Layer references must be uid strings or int indices, got {ref!r}.")
+
+
+def _layer_key_payload(selector: str | int, by: str) -> Dict[str, Any]:
+    """Selector for bulk endpoints keyed by layer: ints are indices, strings names or uids per ``by``."""
+    if by not in ("name", "uid"):
+        raise ValueError("by must be 'name' or 'uid'.")
+    if isinstance(selector, int) and not isinstance(selector, bool):
+        return {"layerId": selector}
+    if isinstance(selector, str):
+        return {"layerName": selector} if by == "name" else {"layerUid": selector}
+    raise ValueError(f"Layer selectors must be names, uids or int indices, got {selector!r}.")
+
+
+def _effect_payload(effect: Any, label: str) -> Dict[str, Any]:
+    if not isinstance(effect, dict):
+        raise ValueError(f"{label} must be a dict with match_name and optional name/params.")
+    spec = {_camel_case(key): value for key, value in effect.items() if value is not None}
+    if not isinstance(spec.get("matchName"), str) or not spec["matchName"]:
+        raise ValueError(f"{label} is missing match_name.")
+    params = spec.get("params")
+    if isinstance(params, dict):
+        # {"Blurriness": 12, "ADBE Gaussian Blur 2-0001": 12}: ADBE keys are match names, others paths.
+        spec["params"] = [
+            {"matchName" if key.startswith("ADBE ") else "propertyPath": key, "value": _plain_value(value)}
+            for key, value in params.items()
+        ]
+    elif params is not None:
+        spec["params"] = [
+            {_camel_case(key): _plain_value(value) for key, value in param.items()} for param in _as_list(params, f"{label}.params")
+        ]
+    return spec
+
+
+def _plain_value(value: Any) -> Any:
+    return value.tolist() if hasattr(value, "tolist") else value
+
+
+def _shape_paths_payload(paths: Any, label: str) -> List[Dict[str, Any]]:
+    groups = _as_list(paths, label)
+    if not groups:
+        raise ValueError(f"{label} must not be empty.")
+    return [normalize_shape_path(group, f"{label}[{index}]") for index, group in enumerate(groups)]
+
+
+def file_sha256(path: str | os.PathLike[str]) -> str:
+    """Return the SHA-256 hex digest of a file's contents, read in 1 MiB chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as handle:
+        for chunk in iter(lambda: handle.read(HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def hash_files(paths: Sequence[str | os.PathLike[str]], max_workers: int = 4) -> List[str]:
+    """Hash files in input order, spreading them over threads (hashlib releases the GIL)."""
+    if max_workers < 1:
+        raise ValueError("max_workers must be at least 1.")
+    if len(paths) < 2 or max_workers == 1:
+        return [file_sha256(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(file_sha256, paths))
+
+
+def _with_fast_apply(payload: Dict[str, Any], fast: bool) -> Dict[str, Any]:
+    """Add ``fastApply`` to a bulk payload when requested (see :meth:`AEClient.apply_scene`)."""
+    if fast:
+        payload["fastApply"] = True
+    return payload
+
+
+def _unpack_keyframes_numpy(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Reshape one packed keyframe entry from ``GET /keyframes`` into NumPy arrays."""
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImportError("as_numpy=True requires NumPy: pip install 'ae-agent-skills[numpy]'") from exc
+
+    count = entry["count"]
+    dimensions = entry["dimensions"]
+    unpacked = dict(entry)
+    unpacked["times"] = np.asarray(entry["times"], dtype=float)
+    if entry.get("numeric"):
+        values = np.asarray(entry["values"], dtype=float)
+        unpacked["values"] = values.reshape(count, dimensions) if dimensions > 1 else values
+    unpacked["inInterp"] = np.asarray(entry["inInterp"])
+    unpacked["outInterp"] = np.asarray(entry["outInterp"])
+    for key in ("easeIn", "easeOut"):
+        ease = np.asarray(entry[key], dtype=float)
+        if ease.size == count * entry["easeDimensions"] * 2:
+            ease = ease.reshape(count, entry["easeDimensions"], 2)
+        unpacked[key] = ease
+    for key in ("inTangents", "outTangents"):
+        if key in entry:
+            unpacked[key] = np.asarray(entry[key], dtype=float).reshape(count, dimensions)
+    return unpacked
+
+
+def _parse_server_timing(header: str | None) -> Dict[str, float]:
+    """Parse a ``Server-Timing`` header into ``{phase: milliseconds}``."""
+    phases: Dict[str, float] = {}
+    if not header:
+        return phases
+    for entry in header.split(","):
+        parts = [part.strip() for part in entry.split(";")]
+        name = parts[0]
+        if not name:
+            continue
+        for param in parts[1:]:
+            key, _, value = param.partition("=")
+            if key.strip() == "dur":
+                try:
+                    phases[name] = float(value)
+                except ValueError:
+                    pass
+    return phases
+
+
+def _iter_sse_events(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Parse a server-sent event stream into ``{"id", "event", "data"}`` dicts."""
+    event_id: str | None = None
+    event_type = "message"
+    data_lines: List[str] = []
+    for raw_line in lines:
+        line = raw_line.rstrip("\r")
+        if line == "":
+            if data_lines:
+                data_text = "\n".join(data_lines)
+                try:
+                    data: Any = json.loads(data_text)
+                except ValueError:
+                    data = data_text
+                yield {"id": event_id, "event": event_type, "data": data}
+            event_type = "message"
+            data_lines = []
+            continue
+        if line.startswith(":"):
+            continue
+        field, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if field == "event":
+            event_type = value
+        elif field == "data":
+            data_lines.append(value)
+        elif field == "id":
+            event_id = value
+
+
+@dataclass
+class Transaction:
+    """Calls buffered by :meth:`AEClient.transaction`; ``result`` is filled once the block commits."""
+
+    label: str
+    operations: List[Dict[str, Any]] = field(default_factory=list)
+    units: int = 0
+    result: Dict[str, Any] | None = None
+
+
+@dataclass(frozen=True)
+class _QueuedCall:
+    """Stand-in response for a call buffered inside a transaction."""
+
+    label: str
+    index: int
+
+
 @dataclass
 class AEClient:
-    """Simple wrapper around the CEP HTTP API."""
+    """Simple wrapper around the CEP HTTP API.
+
+    ``base_url`` may be ``unix:///path/to/bridge.sock`` to talk to the panel's
+    Unix domain socket instead of loopback TCP.
+    """
 
     base_url: str = "http://127.0.0.1:8080"
     timeout: float = 10.0
+    session: requests.Session | None = None
+    trace: bool = False
+    latency: LatencyStats | None = None
+    gzip_threshold: int | None = field(default_factory=_default_gzip_threshold)
+    timings: List[Dict[str, Any]] = field(default_factory=list)
+    _gzip_ms: float | None = field(default=None, init=False, repr=False)
+    _request_gzip: bool | None = field(default=None, init=False, repr=False)
+    _transaction: Transaction | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        socket_path = unix_socket_path(self.base_url)
+        if socket_path is None:
+            return
+        if self.session is None:
+            self.session = requests.Session()
+        self.session.trust_env = False
+        self.session.mount(UNIX_HTTP_PREFIX, UnixSocketAdapter(socket_path))
 
     @staticmethod
-    def _layer_selector_payload(layer_id: int | None = None, layer_name: str | None = None) -> Dict[str, Any]:
+    def _layer_selector_payload(
+        layer_id: int | None = None,
+        layer_name: str | None = None,
+        layer_uid: str | None = None,
+    ) -> Dict[str, Any]:
+        """Build the layer selector; a ``layer_uid`` wins over ``layer_id``/``layer_name``.
+
+        Uids survive creates, deletes and reorders, so callers holding both the
+        index and the uid from ``get_layers`` can pass both safely.
+        """
+        if layer_uid is not None:
+            if not str(layer_uid):
+                raise ValueError("layer_uid must not be empty.")
+            return {"layerUid": str(layer_uid)}
         has_id = layer_id is not None
         has_name = layer_name is not None and len(layer_name) > 0
         if has_id == has_name:
-            raise ValueError("Provide exactly one of layer_id or layer_name.")
+            raise ValueError("Provide exactly one of layer_id or layer_name (or a layer_uid).")
         payload: Dict[str, Any] = {}
         if has_id:
             payload["layerId"] = layer_id
@@ -100,10 +351,125 @@ class AEClient:
             payload["layerName"] = layer_name
         return payload
 
+    @staticmethod
+    def _layer_ref_payload(key: str, layer_id: int | None, layer_uid: str | None, required: bool = True) -> Dict[str, Any]:
+        """Return ``{key}Uid`` (preferred) or ``{key}Id`` for endpoints addressing a layer by index or uid."""
+        if layer_uid is not None:
+            return {f"{key}Uid": str(layer_uid)}
+        if layer_id is not None:
+            return {f"{key}Id": layer_id}
+        if required:
+            raise ValueError(f"Provide {key}Id or {key}Uid.")
+        return {}
+
+    def _http(self) -> Any:
+        """Return the persistent session when one is attached, else the ``requests`` module."""
+        if self.session is not None:
+            return self.session
+        return requests
+
     def _url(self, path: str) -> str:
+        if unix_socket_path(self.base_url) is not None:
+            return f"{UNIX_HTTP_PREFIX}{path}"
         return f"{self.base_url.rstrip('/')}{path}"
 
+    def _timeout_for(self, endpoint: str, units: int | None = None) -> float:
+        """Return the adaptive timeout when latency stats are attached, else ``timeout``."""
+        if self.latency is None:
+            return self.timeout
+        return self.latency.timeout_for(endpoint, units=units)
+
+    def _send(self, method: str, path: str, units: int | None = None, **kwargs: Any) -> requests.Response:
+        endpoint = f"{method} {path}"
+        timeout = self._timeout_for(endpoint, units=units)
+        started = time.perf_counter()
+        try:
+            response = getattr(self._http(), method.lower())(self._url(path), **kwargs, timeout=timeout)
+        except requests.Timeout:
+            if self.latency is not None:
+                self.latency.record(endpoint, timeout * 1000.0, units=units)
+            raise
+        if self.latency is not None:
+            self.latency.record(endpoint, (time.perf_counter() - started) * 1000.0, units=units)
+        return response
+
+    def _get(self, path: str, params: Any = None) -> requests.Response:
+        self._gzip_ms = None
+        if params is None:
+            return self._send("GET", path)
+        return self._send("GET", path, params=params)
+
+    def _panel_accepts_gzip(self) -> bool:
+        """Whether the panel decodes gzipped request bodies, read once from ``/health``.
+
+        Panels that predate request compression do not list ``requestEncodings``.
+        A failed probe is not cached, so the next large body asks again.
+        """
+        if self._request_gzip is None:
+            try:
+                health = self._get("/health").json()
+            except (requests.RequestException, ValueError):
+                return False
+            encodings = health.get("requestEncodings") if isinstance(health, dict) else None
+            self._request_gzip = isinstance(encodings, list) and "gzip" in encodings
+        return self._request_gzip
+
+    def _post(self, path: str, payload: Any, units: int | None = None) -> requests.Response:
+        """POST ``payload`` as JSON, gzipped when it reaches ``gzip_threshold`` bytes.
+
+        Compression is only used once the panel advertises it (see
+        :meth:`_panel_accepts_gzip`); a 415 answer resends the body uncompressed.
+        Inside :meth:`transaction` the call is buffered instead of sent.
+        """
+        self._gzip_ms = None
+        if self._transaction is not None:
+            transaction = self._transaction
+            transaction.operations.append({"path": path, "body": payload})
+            transaction.units += max(1, units or 1)
+            return _QueuedCall(label=transaction.label, index=len(transaction.operations) - 1)  # type: ignore[return-value]
+        if self.gzip_threshold is None:
+            return self._send("POST", path, units=units, json=payload)
+        body = json.dumps(payload).encode("utf-8")
+        json_headers = {"Content-Type": "application/json"}
+        if len(body) < self.gzip_threshold or not self._panel_accepts_gzip():
+            return self._send("POST", path, units=units, data=body, headers=json_headers)
+        started = time.perf_counter()
+        compressed = gzip.compress(body, compresslevel=1)
+        gzip_ms = (time.perf_counter() - started) * 1000.0
+        response = self._send(
+            "POST",
+            path,
+            units=units,
+            data=compressed,
+            headers={**json_headers, "Content-Encoding": "gzip"},
+        )
+        if getattr(response, "status_code", None) == 415:
+            self._request_gzip = False
+            return self._send("POST", path, units=units, data=body, headers=json_headers)
+        self._gzip_ms = gzip_ms
+        return response
+
+    def _record_timing(self, response: requests.Response) -> None:
+        if not self.trace:
+            return
+        headers = getattr(response, "headers", None) or {}
+        request = getattr(response, "request", None)
+        elapsed = getattr(response, "elapsed", None)
+        entry: Dict[str, Any] = {
+            "method": getattr(request, "method", None),
+            "url": getattr(response, "url", None),
+            "statusCode": getattr(response, "status_code", None),
+            "clientMs": elapsed.total_seconds() * 1000.0 if elapsed is not None else None,
+            "server": _parse_server_timing(headers.get("Server-Timing")),
+        }
+        if self._gzip_ms is not None:
+            entry["gzipMs"] = self._gzip_ms
+        self.timings.append(entry)
+
     def _handle_response(self, response: requests.Response) -> Any:
+        if isinstance(response, _QueuedCall):
+            return {"queued": True, "transaction": response.label, "index": response.index}
+        self._record_timing(response)
         payload: Any = None
         try:
             payload = response.json()
@@ -124,20 +490,141 @@ class AEClient:
             return payload.get("data", payload)
         return payload
 
+    @contextmanager
+    def transaction(self, label: str, fast: bool = False) -> Iterator[Transaction]:
+        """Buffer mutations and run them as one ``POST /batch`` under a single undo entry.
+
+        Inside the block, mutating methods return ``{"queued": True, "index": n}``
+        instead of their result. Reads still go straight to the bridge and see
+        the project as it was before the block. On exit the calls run in order
+        in one host invocation inside an undo group named ``label``; the first
+        failing call stops the rest and the group is undone. The raised
+        :class:`AEBridgeError` then carries ``failedIndex``, ``rolledBack`` and
+        per-operation ``elapsedMs`` in ``payload["details"]``. On success the
+        same per-operation report is in ``transaction.result``. An exception
+        inside the block discards the buffered calls. ``fast`` runs the whole
+        transaction in fast-apply mode (see :meth:`apply_scene`).
+
+        ::
+
+            with client.transaction("Retime intro") as txn:
+                client.move_layer_time(1.0, layer_name="Title")
+                client.set_in_out_point(layer_name="Title", out_point=4.0)
+            txn.result["operations"]
+        """
+        if not isinstance(label, str) or not label:
+            raise ValueError("label must be a non-empty string.")
+        if self._transaction is not None:
+            raise RuntimeError("Transactions cannot be nested.")
+        transaction = Transaction(label=label)
+        self._transaction = transaction
+        try:
+            yield transaction
+        finally:
+            self._transaction = None
+        if transaction.operations:
+            response = self._post(
+                "/batch",
+                _with_fast_apply({"label": label, "operations": transaction.operations}, fast),
+                units=transaction.units,
+            )
+            transaction.result = self._handle_response(response)
+
     def health(self) -> Dict[str, Any]:
         """Check bridge health endpoint."""
-        response = requests.get(self._url("/health"), timeout=self.timeout)
+        response = self._get("/health")
+        self._record_timing(response)
         response.raise_for_status()
         return response.json()
 
-    def get_layers(self) -> List[Dict[str, Any]]:
-        """Return the list of layers in the active composition."""
-        response = requests.get(self._url("/layers"), timeout=self.timeout)
+    def metrics(self) -> Dict[str, Any]:
+        """Return bridge queue depth, coalescing counters and wait/eval times."""
+        response = self._get("/metrics")
+        return self._handle_response(response)
+
+    def events(self, read_timeout: float | None = None) -> Iterator[Dict[str, Any]]:
+        """Stream project change and mutation events from the bridge.
+
+        Yields one dict per server-sent event until the connection closes.
+        ``read_timeout`` bounds the wait between events (``None`` waits forever).
+        """
+        response = self._http().get(
+            self._url("/events"),
+            stream=True,
+            timeout=(self.timeout, read_timeout),
+        )
+        try:
+            response.raise_for_status()
+            # SSE is always UTF-8; without a charset requests would decode as ISO-8859-1.
+            response.encoding = "utf-8"
+            yield from _iter_sse_events(response.iter_lines(decode_unicode=True))
+        finally:
+            response.close()
+
+    def get_layers(
+        self,
+        layer_types: List[str] | None = None,
+        name_prefix: str | None = None,
+        name_regex: str | None = None,
+        scene_managed: bool | None = None,
+        start_index: int | None = None,
+        end_index: int | None = None,
+        columns: bool = False,
+    ) -> List[Dict[str, Any]] | Dict[str, Any]:
+        """Return layers in the active composition, filtered on the host.
+
+        With ``columns=True`` the bridge returns parallel arrays
+        (``id``, ``layerUid``, ``name``, ``type``) instead of one object per layer.
+        """
+        params: List[tuple[str, Any]] = []
+        if layer_types:
+            for layer_type in layer_types:
+                if layer_type:
+                    params.append(("type", layer_type))
+        if name_prefix:
+            params.append(("namePrefix", name_prefix))
+        if name_regex:
+            params.append(("nameRegex", name_regex))
+        if scene_managed is not None:
+            params.append(("sceneManaged", "true" if scene_managed else "false"))
+        if start_index is not None:
+            params.append(("startIndex", start_index))
+        if end_index is not None:
+            params.append(("endIndex", end_index))
+        if columns:
+            params.append(("format", "columns"))
+
+        response = self._get("/layers", params=params)
         return self._handle_response(response)
 
-    def list_comps(self) -> List[Dict[str, Any]]:
-        """Return the list of compositions in the current project."""
-        response = requests.get(self._url("/comps"), timeout=self.timeout)
+    def list_comps(
+        self,
+        name_prefix: str | None = None,
+        name_regex: str | None = None,
+        folder: str | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+    ) -> List[Dict[str, Any]] | Dict[str, Any]:
+        """Return compositions in the current project, filtered on the host.
+
+        ``folder`` is the parent folder path from the project root (for example
+        ``"Shots/Act 1"``; ``""`` for comps at the root). With ``offset`` or
+        ``limit`` the bridge returns one page: ``comps``, ``total`` (matches
+        across all pages), ``offset`` and ``nextOffset`` (None on the last page).
+        """
+        params: List[tuple[str, Any]] = []
+        if name_prefix:
+            params.append(("namePrefix", name_prefix))
+        if name_regex:
+            params.append(("nameRegex", name_regex))
+        if folder is not None:
+            params.append(("folder", folder))
+        if offset is not None:
+            params.append(("offset", offset))
+        if limit is not None:
+            params.append(("limit", limit))
+
+        response = self._get("/comps", params=params or None)
         return self._handle_response(response)
 
     def create_comp(
@@ -150,9 +637,9 @@ class AEClient:
         pixel_aspect: float = 1.0,
     ) -> Dict[str, Any]:
         """Create a composition in the current project."""
-        response = requests.post(
-            self._url("/comps"),
-            json={
+        response = self._post(
+            "/comps",
+            {
                 "name": name,
                 "width": width,
                 "height": height,
@@ -160,7 +647,6 @@ class AEClient:
                 "frameRate": frame_rate,
                 "pixelAspect": pixel_aspect,
             },
-            timeout=self.timeout,
         )
         return self._handle_response(response)
 
@@ -171,21 +657,17 @@ class AEClient:
             payload["compId"] = comp_id
         if comp_name is not None:
             payload["compName"] = comp_name
-        response = requests.post(
-            self._url("/active-comp"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/active-comp", payload)
         return self._handle_response(response)
 
     def get_selected_properties(self) -> List[Dict[str, Any]]:
         """Return the currently selected properties across layers."""
-        response = requests.get(self._url("/selected-properties"), timeout=self.timeout)
+        response = self._get("/selected-properties")
         return self._handle_response(response)
 
     def get_expression_errors(self) -> Dict[str, Any]:
         """Return expression error diagnostics for the active composition."""
-        response = requests.get(self._url("/expression-errors"), timeout=self.timeout)
+        response = self._get("/expression-errors")
         return self._handle_response(response)
 
     def get_properties(
@@ -197,14 +679,12 @@ class AEClient:
         max_depth: int | None = None,
         include_group_children: bool = False,
         time: float | None = None,
+        layer_uid: str | None = None,
     ) -> List[Dict[str, Any]]:
         """Return the property tree for the specified layer."""
         params: List[tuple[str, Any]] = []
-        selector = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name)
-        if "layerId" in selector:
-            params.append(("layerId", selector["layerId"]))
-        else:
-            params.append(("layerName", selector["layerName"]))
+        selector = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name, layer_uid=layer_uid)
+        params.extend(selector.items())
         if include_groups:
             for group in include_groups:
                 if group:
@@ -220,29 +700,65 @@ class AEClient:
         if time is not None:
             params.append(("time", time))
 
-        response = requests.get(
-            self._url("/properties"),
-            params=params,
-            timeout=self.timeout,
-        )
+        response = self._get("/properties", params=params)
         return self._handle_response(response)
 
+    def get_keyframes(
+        self,
+        layer_ids: List[int] | None = None,
+        layer_names: List[str] | None = None,
+        property_paths: List[str] | None = None,
+        as_numpy: bool = False,
+        layer_uids: List[str] | None = None,
+    ) -> Dict[str, Any]:
+        """Return existing keyframes for the given layers, packed per property.
+
+        Without ``property_paths`` every animated property of each layer is
+        returned. Each property entry holds parallel arrays: ``times``,
+        ``values`` (flattened, ``count * dimensions``), ``inInterp``/``outInterp``,
+        ``easeIn``/``easeOut`` (flattened ``[speed, influence]`` per ease
+        dimension) and, for spatial properties, ``inTangents``/``outTangents``.
+        ``as_numpy=True`` reshapes them into NumPy arrays (requires NumPy).
+        """
+        params: List[tuple[str, Any]] = []
+        for layer_uid in layer_uids or []:
+            params.append(("layerUid", str(layer_uid)))
+        for layer_id in layer_ids or []:
+            params.append(("layerId", layer_id))
+        for layer_name in layer_names or []:
+            if layer_name:
+                params.append(("layerName", layer_name))
+        if not params:
+            raise ValueError("Provide at least one layer uid, id or name.")
+        for property_path in property_paths or []:
+            if property_path:
+                params.append(("propertyPath", property_path))
+
+        response = self._get("/keyframes", params=params)
+        data = self._handle_response(response)
+        if isinstance(data, dict) and data.get("status") == "error":
+            raise AEBridgeError(_format_bridge_error_message(data), payload=data)
+        if as_numpy:
+            for layer in data.get("layers", []):
+                layer["properties"] = [
+                    entry if "error" in entry else _unpack_keyframes_numpy(entry)
+                    for entry in layer.get("properties", [])
+                ]
+        return data
+
     def set_expression(
         self,
         property_path: str,
         expression: str,
         layer_id: int | None = None,
         layer_name: str | None = None,
+        layer_uid: str | None = None,
     ) -> Dict[str, Any]:
         """Apply an expression to the given property."""
-        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name)
+        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name, layer_uid=layer_uid)
         payload["propertyPath"] = property_path
         payload["expression"] = expression
-        response = requests.post(
-            self._url("/expression"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/expression", payload)
         return self._handle_response(response)
 
     def set_property_value(
@@ -251,16 +767,59 @@ class AEClient:
         value: Any,
         layer_id: int | None = None,
         layer_name: str | None = None,
+        layer_uid: str | None = None,
     ) -> Dict[str, Any]:
         """Set a property value on the given property path."""
-        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name)
+        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name, layer_uid=layer_uid)
         payload["propertyPath"] = property_path
         payload["value"] = value
-        response = requests.post(
-            self._url("/property-value"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/property-value", payload)
+        return self._handle_response(response)
+
+    def set_texts(self, texts: Mapping[str | int, str], by: str = "name", fast: bool = False) -> Dict[str, Any]:
+        """Set the Source Text of many text layers in one bridge call and undo group.
+
+        Keys select layers: ints are layer indices, strings are layer names
+        (``by="name"``) or uids (``by="uid"``). The host resolves every key
+        through one scan of the comp and writes each text document once; keys
+        it cannot resolve come back in ``notFound`` (or ``skipped`` for
+        ambiguous names and non-text layers) while the rest are still applied.
+        """
+        if not texts:
+            raise ValueError("texts must not be empty.")
+        entries: List[Dict[str, Any]] = []
+        for selector, text in texts.items():
+            entry = _layer_key_payload(selector, by)
+            entry["text"] = str(text)
+            entries.append(entry)
+        response = self._post("/texts/batch", _with_fast_apply({"texts": entries}, fast), units=len(entries))
+        return self._handle_response(response)
+
+    def apply_effects(
+        self,
+        layer_selectors: Sequence[str | int],
+        effects: Sequence[Dict[str, Any]],
+        by: str = "name",
+        fast: bool = False,
+    ) -> Dict[str, Any]:
+        """Apply an effect stack with parameters to many layers in one bridge call and undo group.
+
+        ``layer_selectors`` follow :meth:`set_texts` (ints are indices, strings
+        names or uids per ``by``). Each effect is ``{"match_name", "name",
+        "params"}`` where ``params`` is a list of ``{"match_name" |
+        "property_path" | "property_index", "value"}`` or a dict of
+        parameter name (or ADBE match name) to value. An effect already on the
+        layer with the same match name and name is reused, and only parameters
+        that differ are written. Per-layer problems are reported inline.
+        """
+        layers = [_layer_key_payload(selector, by) for selector in _as_list(layer_selectors, "layer_selectors")]
+        if not layers:
+            raise ValueError("layer_selectors must not be empty.")
+        specs = [_effect_payload(effect, f"effects[{index}]") for index, effect in enumerate(effects)]
+        if not specs:
+            raise ValueError("effects must not be empty.")
+        units = len(layers) * sum(1 + len(spec.get("params") or []) for spec in specs)
+        response = self._post("/effects/batch", _with_fast_apply({"layers": layers, "effects": specs}, fast), units=units)
         return self._handle_response(response)
 
     def set_keyframe(
@@ -274,9 +833,10 @@ class AEClient:
         out_interp: str | None = None,
         ease_in: Any | None = None,
         ease_out: Any | None = None,
+        layer_uid: str | None = None,
     ) -> Dict[str, Any]:
         """Set a keyframe value at a specific time."""
-        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name)
+        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name, layer_uid=layer_uid)
         payload["propertyPath"] = property_path
         payload["time"] = time
         payload["value"] = value
@@ -289,30 +849,104 @@ class AEClient:
         if ease_out is not None:
             payload["easeOut"] = ease_out
 
-        response = requests.post(
-            self._url("/keyframes"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/keyframes", payload)
         return self._handle_response(response)
 
+    def set_keyframes(
+        self,
+        property_path: str,
+        times: Any,
+        values: Any,
+        layer_id: int | None = None,
+        layer_name: str | None = None,
+        interp: str | None = None,
+        ease: Any | None = None,
+        in_interp: str | None = None,
+        out_interp: str | None = None,
+        ease_in: Any | None = None,
+        ease_out: Any | None = None,
+        key_ease_in: Sequence[Any] | None = None,
+        key_ease_out: Sequence[Any] | None = None,
+        simplify: float | None = None,
+        fit_ease: bool = False,
+        fast: bool = False,
+        layer_uid: str | None = None,
+    ) -> Dict[str, Any]:
+        """Set many keyframes on one property in a single bridge call.
+
+        ``times`` is a 1D sequence and ``values`` has one entry per time (a
+        number or a list); both may be NumPy arrays, e.g. ``values`` of shape
+        ``(n, 2)`` for Position. ``interp`` and ``ease`` apply to both sides of
+        every key; ``in_interp``/``out_interp``/``ease_in``/``ease_out`` override
+        one side, and ``key_ease_in``/``key_ease_out`` give one ease per key.
+
+        ``simplify`` drops keys whose removal keeps the curve within that
+        tolerance (property units) before upload; ``fit_ease`` also fits bezier
+        eases to the kept keys. Both need NumPy; the result then includes a
+        ``simplification`` report (``before``, ``after``, ``maxError``).
+        """
+        time_list = _as_list(times, "times")
+        value_list = _as_list(values, "values")
+        if not time_list:
+            raise ValueError("times must not be empty.")
+        if len(time_list) != len(value_list):
+            raise ValueError(f"times and values differ in length ({len(time_list)} != {len(value_list)}).")
+
+        report: Dict[str, Any] | None = None
+        if fit_ease and simplify is None:
+            raise ValueError("fit_ease requires simplify (use 0 to keep every key that is not collinear).")
+        if simplify is not None:
+            curve = simplify_keyframes(time_list, value_list, simplify, fit_ease=fit_ease)
+            time_list, value_list = curve.times, curve.values
+            report = curve.report()
+            if curve.ease_in is not None:
+                key_ease_in, key_ease_out = curve.ease_in, curve.ease_out
+                interp = interp or "bezier"
+
+        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name, layer_uid=layer_uid)
+        payload["propertyPath"] = property_path
+        payload["times"] = time_list
+        payload["values"] = value_list
+        in_interp = in_interp if in_interp is not None else interp
+        out_interp = out_interp if out_interp is not None else interp
+        ease_in = ease_in if ease_in is not None else ease
+        ease_out = ease_out if ease_out is not None else ease
+        if in_interp is not None:
+            payload["inInterp"] = in_interp
+        if out_interp is not None:
+            payload["outInterp"] = out_interp
+        if ease_in is not None:
+            payload["easeIn"] = _as_list(ease_in, "ease_in")
+        if ease_out is not None:
+            payload["easeOut"] = _as_list(ease_out, "ease_out")
+        for key, per_key in (("keyEaseIn", key_ease_in), ("keyEaseOut", key_ease_out)):
+            if per_key is None:
+                continue
+            per_key_list = _as_list(per_key, key)
+            if len(per_key_list) != len(time_list):
+                raise ValueError(f"{key} needs one entry per keyframe.")
+            payload[key] = per_key_list
+
+        response = self._post("/keyframes/batch", _with_fast_apply(payload, fast), units=len(time_list))
+        result = self._handle_response(response)
+        if report is not None and isinstance(result, dict):
+            result["simplification"] = report
+        return result
+
     def add_essential_property(
         self,
         property_path: str,
         layer_id: int | None = None,
         layer_name: str | None = None,
         essential_name: str | None = None,
+        layer_uid: str | None = None,
     ) -> Dict[str, Any]:
         """Add a layer property to Essential Graphics in the active comp."""
-        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name)
+        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name, layer_uid=layer_uid)
         payload["propertyPath"] = property_path
         if essential_name is not None:
             payload["essentialName"] = essential_name
-        response = requests.post(
-            self._url("/essential-property"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/essential-property", payload)
         return self._handle_response(response)
 
     def add_effect(
@@ -321,18 +955,15 @@ class AEClient:
         layer_id: int | None = None,
         layer_name: str | None = None,
         effect_name: str | None = None,
+        layer_uid: str | None = None,
     ) -> Dict[str, Any]:
         """Add an effect to the specified layer."""
-        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name)
+        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name, layer_uid=layer_uid)
         payload["effectMatchName"] = effect_match_name
         if effect_name:
             payload["effectName"] = effect_name
 
-        response = requests.post(
-            self._url("/effects"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/effects", payload)
         return self._handle_response(response)
 
     def add_shape_repeater(
@@ -348,9 +979,10 @@ class AEClient:
         rotation: float | None = None,
         start_opacity: float | None = None,
         end_opacity: float | None = None,
+        layer_uid: str | None = None,
     ) -> Dict[str, Any]:
         """Add a shape repeater operator to the specified shape group."""
-        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name)
+        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name, layer_uid=layer_uid)
         payload["groupIndex"] = group_index
         if name is not None:
             payload["name"] = name
@@ -369,11 +1001,7 @@ class AEClient:
         if end_opacity is not None:
             payload["endOpacity"] = end_opacity
 
-        response = requests.post(
-            self._url("/shape-repeater"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/shape-repeater", payload)
         return self._handle_response(response)
 
     def add_layer(
@@ -395,8 +1023,15 @@ class AEClient:
         shape_stroke_width: float | None = None,
         shape_stroke_line_cap: str | None = None,
         shape_roundness: float | None = None,
+        shape_paths: Sequence[Dict[str, Any]] | None = None,
+        footage_hash: str | None = None,
     ) -> Dict[str, Any]:
-        """Add a new layer to the active composition."""
+        """Add a new layer to the active composition.
+
+        ``shape_paths`` builds a shape layer from path groups instead of one
+        primitive (see :meth:`add_shape_paths`). ``layer_type="footage"`` with
+        ``footage_hash`` places footage imported by :meth:`import_footage`.
+        """
         payload: Dict[str, Any] = {"layerType": layer_type}
         if name is not None:
             payload["name"] = name
@@ -430,12 +1065,101 @@ class AEClient:
             payload["shapeStrokeLineCap"] = shape_stroke_line_cap
         if shape_roundness is not None:
             payload["shapeRoundness"] = shape_roundness
+        if shape_paths is not None:
+            payload["shapePaths"] = _shape_paths_payload(shape_paths, "shape_paths")
+        if footage_hash is not None:
+            payload["footageHash"] = footage_hash
 
-        response = requests.post(
-            self._url("/layers"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/layers", payload)
+        return self._handle_response(response)
+
+    def add_layers(self, layers: Sequence[Dict[str, Any]], fast: bool = False) -> Dict[str, Any]:
+        """Add several layers to the active composition in one bridge call and undo group.
+
+        Each item takes the ``add_layer`` options as a dict, with either
+        ``add_layer`` keyword names (``layer_type``, ``shape_fill_color``) or
+        the bridge's camelCase keys (``layerType``, ``shapeFillColor``). The
+        result lists ``layerId``/``layerUid`` for every created layer in input
+        order. Like ``apply_effects``, the call is not all-or-nothing: an entry
+        that fails is reported as ``{"index": i, "error": ...}`` in place, leaves
+        no layer behind, and does not stop the remaining entries; ``errorCount``
+        counts them.
+        """
+        specs: List[Dict[str, Any]] = []
+        for index, layer in enumerate(layers):
+            if not isinstance(layer, dict):
+                raise ValueError(f"layers[{index}] must be a dict of add_layer options.")
+            spec = {
+                _camel_case(key): value.tolist() if hasattr(value, "tolist") else value
+                for key, value in layer.items()
+                if value is not None
+            }
+            if "layerType" not in spec:
+                raise ValueError(f"layers[{index}] is missing layer_type.")
+            if "shapePaths" in spec:
+                spec["shapePaths"] = _shape_paths_payload(spec["shapePaths"], f"layers[{index}].shape_paths")
+            specs.append(spec)
+        if not specs:
+            raise ValueError("layers must not be empty.")
+
+        response = self._post("/layers/batch", _with_fast_apply({"layers": specs}, fast), units=len(specs))
+        return self._handle_response(response)
+
+    def add_shape_paths(
+        self,
+        paths: Sequence[Dict[str, Any]],
+        layer_id: int | None = None,
+        layer_name: str | None = None,
+        layer_uid: str | None = None,
+        name: str | None = None,
+        fast: bool = False,
+    ) -> Dict[str, Any]:
+        """Add path groups to a shape layer in one bridge call and undo group.
+
+        Each group holds ``d`` (SVG path data, parsed here) or ``contours``
+        (``vertices`` with optional ``in_tangents``/``out_tangents`` relative to
+        each vertex, and ``closed``), plus optional ``fill_color``,
+        ``fill_opacity``, ``fill_rule`` (``nonzero``/``evenodd``),
+        ``stroke_color``, ``stroke_opacity``, ``stroke_width`` and
+        ``stroke_line_cap``. Without a layer selector a new shape layer named
+        ``name`` is created.
+        """
+        payload: Dict[str, Any] = {"paths": _shape_paths_payload(paths, "paths")}
+        if layer_id is not None or layer_name is not None or layer_uid is not None:
+            payload.update(self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name, layer_uid=layer_uid))
+        if name is not None:
+            payload["name"] = name
+        contours = sum(len(group["contours"]) for group in payload["paths"])
+        response = self._post("/shape-paths", _with_fast_apply(payload, fast), units=contours)
+        return self._handle_response(response)
+
+    def import_footage(
+        self,
+        paths: Sequence[str | os.PathLike[str]],
+        folder: str | None = None,
+        max_workers: int = 4,
+    ) -> Dict[str, Any]:
+        """Import files as footage in one bridge call and undo group.
+
+        Each file's SHA-256 is computed here, over up to ``max_workers``
+        threads. The host tags imported items with their hash in the item
+        comment and skips files whose hash is already in the project, so
+        re-running an import is cheap. ``folder`` puts new items in a root
+        folder of that name. Every entry of ``imported``/``skipped`` carries
+        the ``hash``, which scene layers of type ``footage`` use as
+        ``footageHash``; per-file failures come back in ``errors``.
+        """
+        resolved = [os.path.abspath(os.fspath(path)) for path in _as_list(paths, "paths")]
+        if not resolved:
+            raise ValueError("paths must not be empty.")
+        missing = [path for path in resolved if not os.path.isfile(path)]
+        if missing:
+            raise ValueError(f"Not a file: {', '.join(missing)}")
+        hashes = hash_files(resolved, max_workers=max_workers)
+        payload: Dict[str, Any] = {"files": [{"path": path, "hash": digest} for path, digest in zip(resolved, hashes)]}
+        if folder is not None:
+            payload["folder"] = folder
+        response = self._post("/footage/import", payload, units=len(resolved))
         return self._handle_response(response)
 
     def set_in_out_point(
@@ -444,19 +1168,16 @@ class AEClient:
         layer_name: str | None = None,
         in_point: float | None = None,
         out_point: float | None = None,
+        layer_uid: str | None = None,
     ) -> Dict[str, Any]:
         """Set in/out points for the specified layer."""
-        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name)
+        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name, layer_uid=layer_uid)
         if in_point is not None:
             payload["inPoint"] = in_point
         if out_point is not None:
             payload["outPoint"] = out_point
 
-        response = requests.post(
-            self._url("/layer-in-out"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/layer-in-out", payload)
         return self._handle_response(response)
 
     def move_layer_time(
@@ -464,110 +1185,177 @@ class AEClient:
         delta: float,
         layer_id: int | None = None,
         layer_name: str | None = None,
+        layer_uid: str | None = None,
     ) -> Dict[str, Any]:
         """Move layer timing by delta seconds."""
-        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name)
+        payload = self._layer_selector_payload(layer_id=layer_id, layer_name=layer_name, layer_uid=layer_uid)
         payload["delta"] = delta
-        response = requests.post(
-            self._url("/layer-time"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/layer-time", payload)
         return self._handle_response(response)
 
     def set_cti(self, time: float) -> Dict[str, Any]:
         """Set composition current time indicator."""
-        response = requests.post(
-            self._url("/cti"),
-            json={"time": time},
-            timeout=self.timeout,
-        )
+        response = self._post("/cti", {"time": time})
         return self._handle_response(response)
 
     def set_work_area(self, start: float, duration: float) -> Dict[str, Any]:
         """Set composition work area start and duration."""
-        response = requests.post(
-            self._url("/work-area"),
-            json={
+        response = self._post(
+            "/work-area",
+            {
                 "start": start,
                 "duration": duration,
             },
-            timeout=self.timeout,
         )
         return self._handle_response(response)
 
-    def parent_layer(self, child_layer_id: int, parent_layer_id: int | None = None) -> Dict[str, Any]:
+    def parent_layer(
+        self,
+        child_layer_id: int | None = None,
+        parent_layer_id: int | None = None,
+        child_layer_uid: str | None = None,
+        parent_layer_uid: str | None = None,
+    ) -> Dict[str, Any]:
         """Set or clear parent relationship for a layer."""
-        payload: Dict[str, Any] = {"childLayerId": child_layer_id}
-        if parent_layer_id is not None:
-            payload["parentLayerId"] = parent_layer_id
-        response = requests.post(
-            self._url("/layer-parent"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        payload = self._layer_ref_payload("childLayer", child_layer_id, child_layer_uid)
+        payload.update(self._layer_ref_payload("parentLayer", parent_layer_id, parent_layer_uid, required=False))
+        response = self._post("/layer-parent", payload)
+        return self._handle_response(response)
+
+    def parent_layers(self, links: Mapping[str | int, str | int | None], fast: bool = False) -> Dict[str, Any]:
+        """Set many child -> parent links in one bridge call and undo group.
+
+        Keys are child layers and values their parents (``None`` clears the
+        parent). A string is a layer uid and an int a layer index. Cycles are
+        rejected before anything changes: here among ``links`` themselves, and
+        on the host against the parents of layers not listed.
+        """
+        if not links:
+            raise ValueError("links must not be empty.")
+        for start in links:
+            seen = {start}
+            cursor = links[start]
+            while cursor is not None and cursor in links:
+                if cursor in seen:
+                    raise ValueError(f"Parent links form a cycle through layer {cursor!r}.")
+                seen.add(cursor)
+                cursor = links[cursor]
+        payload_links = []
+        for child, parent in links.items():
+            link = self._layer_ref_payload("childLayer", *_layer_ref_args(child))
+            if parent is not None:
+                link.update(self._layer_ref_payload("parentLayer", *_layer_ref_args(parent)))
+            payload_links.append(link)
+        response = self._post("/layer-parent/batch", _with_fast_apply({"links": payload_links}, fast), units=len(payload_links))
         return self._handle_response(response)
 
     def precompose(
         self,
-        layer_ids: List[int],
+        layer_ids: List[int] | None,
         name: str,
         move_all_attributes: bool = False,
+        layer_uids: List[str] | None = None,
     ) -> Dict[str, Any]:
-        """Precompose selected layers."""
-        response = requests.post(
-            self._url("/precompose"),
-            json={
-                "layerIds": layer_ids,
-                "name": name,
-                "moveAllAttributes": move_all_attributes,
-            },
-            timeout=self.timeout,
-        )
+        """Precompose selected layers (by index, uid, or both)."""
+        payload: Dict[str, Any] = {"name": name, "moveAllAttributes": move_all_attributes}
+        if layer_uids:
+            payload["layerUids"] = [str(uid) for uid in layer_uids]
+        if layer_ids or not layer_uids:
+            payload["layerIds"] = layer_ids or []
+        response = self._post("/precompose", payload)
         return self._handle_response(response)
 
-    def duplicate_layer(self, layer_id: int) -> Dict[str, Any]:
+    def duplicate_layer(self, layer_id: int | None = None, layer_uid: str | None = None) -> Dict[str, Any]:
         """Duplicate a layer."""
-        response = requests.post(
-            self._url("/duplicate-layer"),
-            json={"layerId": layer_id},
-            timeout=self.timeout,
-        )
+        response = self._post("/duplicate-layer", self._layer_ref_payload("layer", layer_id, layer_uid))
+        return self._handle_response(response)
+
+    def duplicate_layer_many(
+        self,
+        layer_id: int | None = None,
+        count: int | None = None,
+        overrides: Sequence[Dict[str, Any] | None] | None = None,
+        layer_uid: str | None = None,
+        fast: bool = False,
+    ) -> Dict[str, Any]:
+        """Duplicate one layer ``count`` times in one bridge call and undo group.
+
+        ``overrides[i]`` customizes copy ``i`` with ``name``, ``text``,
+        ``transform`` (``position``, ``scale``, ``rotation``, ``opacity``,
+        ``anchor_point``) and ``property_values`` (``[{"propertyPath", "value"}]``);
+        camelCase keys work as well. ``count`` defaults to ``len(overrides)``.
+        Copies are stacked above the source in order; the result lists their
+        ``layerUid``s, with an ``error`` on copies whose overrides failed.
+        """
+        specs: List[Dict[str, Any] | None] = []
+        for index, override in enumerate(overrides or []):
+            if override is None:
+                specs.append(None)
+                continue
+            if not isinstance(override, dict):
+                raise ValueError(f"overrides[{index}] must be a dict or None.")
+            spec = {_camel_case(key): value for key, value in override.items() if value is not None}
+            if isinstance(spec.get("transform"), dict):
+                spec["transform"] = {
+                    _camel_case(key): value.tolist() if hasattr(value, "tolist") else value
+                    for key, value in spec["transform"].items()
+                }
+            specs.append(spec)
+        copy_count = len(specs) if count is None else count
+        if copy_count < 1:
+            raise ValueError("count must be at least 1 (or pass overrides).")
+        if len(specs) > copy_count:
+            raise ValueError("overrides must not have more entries than count.")
+
+        payload = self._layer_ref_payload("layer", layer_id, layer_uid)
+        payload["count"] = copy_count
+        if specs:
+            payload["overrides"] = specs
+        response = self._post("/duplicate-layer/batch", _with_fast_apply(payload, fast), units=copy_count)
         return self._handle_response(response)
 
     def move_layer_order(
         self,
-        layer_id: int,
+        layer_id: int | None = None,
         before_layer_id: int | None = None,
         after_layer_id: int | None = None,
         to_top: bool = False,
         to_bottom: bool = False,
+        layer_uid: str | None = None,
+        before_layer_uid: str | None = None,
+        after_layer_uid: str | None = None,
     ) -> Dict[str, Any]:
         """Move layer order relative to another layer or to top/bottom."""
-        payload: Dict[str, Any] = {"layerId": layer_id}
-        if before_layer_id is not None:
-            payload["beforeLayerId"] = before_layer_id
-        if after_layer_id is not None:
-            payload["afterLayerId"] = after_layer_id
+        payload = self._layer_ref_payload("layer", layer_id, layer_uid)
+        payload.update(self._layer_ref_payload("beforeLayer", before_layer_id, before_layer_uid, required=False))
+        payload.update(self._layer_ref_payload("afterLayer", after_layer_id, after_layer_uid, required=False))
         if to_top:
             payload["toTop"] = True
         if to_bottom:
             payload["toBottom"] = True
 
-        response = requests.post(
-            self._url("/layer-order"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/layer-order", payload)
+        return self._handle_response(response)
+
+    def reorder_layers(self, order: Sequence[str | int], fast: bool = False) -> Dict[str, Any]:
+        """Reorder layers of the active comp by uid in one bridge call and undo group.
+
+        ``order`` lists layer uids (``layerUid`` from ``get_layers``) top to
+        bottom. Listed layers are rearranged among the positions they occupy;
+        unlisted layers stay where they are. The host moves only the layers
+        outside the longest already-ordered run and reports ``moveCount``.
+        """
+        uids = [str(uid) for uid in _as_list(order, "order")]
+        if not uids:
+            raise ValueError("order must not be empty.")
+        if len(set(uids)) != len(uids):
+            raise ValueError("order must not list a layer uid twice.")
+        response = self._post("/layer-order/batch", _with_fast_apply({"order": uids}, fast), units=len(uids))
         return self._handle_response(response)
 
-    def delete_layer(self, layer_id: int) -> Dict[str, Any]:
+    def delete_layer(self, layer_id: int | None = None, layer_uid: str | None = None) -> Dict[str, Any]:
         """Delete a layer in the active composition."""
-        response = requests.post(
-            self._url("/delete-layer"),
-            json={"layerId": layer_id},
-            timeout=self.timeout,
-        )
+        response = self._post("/delete-layer", self._layer_ref_payload("layer", layer_id, layer_uid))
         return self._handle_response(response)
 
     def delete_comp(self, comp_id: int | None = None, comp_name: str | None = None) -> Dict[str, Any]:
@@ -578,11 +1366,7 @@ class AEClient:
         if comp_name is not None:
             payload["compName"] = comp_name
 
-        response = requests.post(
-            self._url("/delete-comp"),
-            json=payload,
-            timeout=self.timeout,
-        )
+        response = self._post("/delete-comp", payload)
         return self._handle_response(response)
 
     def apply_scene(
@@ -590,15 +1374,48 @@ class AEClient:
         scene: Dict[str, Any],
         validate_only: bool = False,
         mode: str = "merge",
+        simplify: float | None = None,
+        fit_ease: bool = False,
+        fast: bool = False,
     ) -> Dict[str, Any]:
-        """Apply a declarative scene JSON payload."""
-        response = requests.post(
-            self._url("/scene"),
-            json={
-                "scene": scene,
-                "validateOnly": validate_only,
-                "mode": mode,
-            },
-            timeout=self.timeout,
+        """Apply a declarative scene JSON payload.
+
+        ``simplify``/``fit_ease`` reduce numeric ``animations[].keyframes`` on
+        a copy of ``scene`` before upload (see :meth:`set_keyframes`); the
+        result then includes a ``simplification`` report. ``shapePaths`` SVG
+        ``d`` strings are likewise parsed into contours on a copy.
+
+        ``fast`` sends ``fastApply``: the host suppresses dialogs and switches
+        the active viewer to wireframe previews for the call, then restores
+        both. The bulk methods take the same flag. Once the panel has timed a
+        normal call of the same kind, the estimated time saved comes back as
+        the ``saved`` phase of the ``Server-Timing`` header.
+        """
+        report: Dict[str, Any] | None = None
+        if fit_ease and simplify is None:
+            raise ValueError("fit_ease requires simplify.")
+        if simplify is not None:
+            scene = copy.deepcopy(scene)
+            report = simplify_scene_animations(scene, simplify, fit_ease=fit_ease)
+        layers = scene.get("layers") if isinstance(scene, dict) else None
+        if isinstance(layers, list) and any(isinstance(layer, dict) and layer.get("shapePaths") for layer in layers):
+            if simplify is None:
+                scene = copy.deepcopy(scene)
+                layers = scene["layers"]
+            normalize_scene_shape_paths(scene)
+        response = self._post(
+            "/scene",
+            _with_fast_apply(
+                {
+                    "scene": scene,
+                    "validateOnly": validate_only,
+                    "mode": mode,
+                },
+                fast,
+            ),
+            units=len(layers) if isinstance(layers, list) else None,
         )
-        return self._handle_response(response)
+        result = self._handle_response(response)
+        if report is not None and isinstance(result, dict):
+            result["simplification"] = report
+        return result
@@ -0,0 +1,222 @@
+"""Keyframe curve simplification and bezier ease fitting.
+
+Works on sampled animation data (one key per frame, baked simulations) and
+returns a smaller key set that stays within a tolerance given in property
+units. Requires NumPy (``pip install 'ae-agent-skills[numpy]'``).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List, Sequence, Tuple
+
+# Influence candidates (percent) tried per segment when fitting eases. AE clamps
+# influence to 0.1-100; 0.1 with slope-matched speeds is visually linear.
+EASE_INFLUENCE_GRID = (0.1, 10.0, 16.667, 25.0, 33.333, 45.0, 60.0, 75.0, 90.0)
+BEZIER_SAMPLES = 64
+
+
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImportError("Keyframe simplification requires NumPy: pip install 'ae-agent-skills[numpy]'") from exc
+    return np
+
+
+@dataclass
+class SimplifiedCurve:
+    """Result of :func:`simplify_keyframes`.
+
+    ``ease_in``/``ease_out`` hold one temporal ease spec per kept key (a list
+    of ``[speed, influence]`` per dimension) when eases were fitted.
+    """
+
+    indices: List[int]
+    times: List[float]
+    values: List[Any]
+    before: int
+    max_error: float
+    ease_in: List[Any] | None = None
+    ease_out: List[Any] | None = None
+
+    @property
+    def after(self) -> int:
+        return len(self.indices)
+
+    def report(self) -> Dict[str, Any]:
+        return {"before": self.before, "after": self.after, "maxError": self.max_error}
+
+
+def _as_arrays(times: Any, values: Any) -> Tuple[Any, Any, bool]:
+    np = _numpy()
+    t = np.asarray(times.tolist() if hasattr(times, "tolist") else list(times), dtype=float)
+    raw_values = values.tolist() if hasattr(values, "tolist") else list(values)
+    try:
+        v = np.asarray(raw_values, dtype=float)
+    except (TypeError, ValueError) as exc:
+        raise ValueError("Only numeric keyframe values can be simplified.") from exc
+    if t.ndim != 1 or len(t) != len(v):
+        raise ValueError("times must be 1D and match the number of values.")
+    if len(t) > 1 and np.any(np.diff(t) <= 0):
+        raise ValueError("times must be strictly increasing.")
+    scalar = v.ndim == 1
+    if scalar:
+        v = v[:, None]
+    elif v.ndim != 2:
+        raise ValueError("values must be numbers or equal-length numeric arrays.")
+    return t, v, scalar
+
+
+def _linear_errors(t: Any, v: Any, kept: Any) -> Any:
+    """Distance (norm over dimensions) of every sample from the piecewise-linear curve through ``kept``."""
+    np = _numpy()
+    approx = np.column_stack([np.interp(t, t[kept], v[kept, dim]) for dim in range(v.shape[1])])
+    return np.linalg.norm(v - approx, axis=1)
+
+
+def simplify_indices(t: Any, v: Any, tolerance: float) -> Any:
+    """Ramer-Douglas-Peucker over time: keep the fewest keys whose linear interpolation stays within ``tolerance``.
+
+    Deviation is measured in value space at each sample time (time and value
+    units are not comparable, so perpendicular distance is not used).
+    """
+    np = _numpy()
+    count = len(t)
+    if count <= 2:
+        return np.arange(count)
+    keep = np.zeros(count, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, count - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        inner_t = t[start + 1:end]
+        ratio = ((inner_t - t[start]) / (t[end] - t[start]))[:, None]
+        line = v[start] + ratio * (v[end] - v[start])
+        errors = np.linalg.norm(v[start + 1:end] - line, axis=1)
+        worst = int(np.argmax(errors))
+        if errors[worst] > tolerance:
+            split = start + 1 + worst
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return np.flatnonzero(keep)
+
+
+def _bezier_segment(t0: float, t1: float, v0: Any, v1: Any, speed_out: Any, speed_in: Any, influence: float, sample_t: Any) -> Any:
+    """Evaluate AE's temporal bezier between two keys at ``sample_t`` for every dimension."""
+    np = _numpy()
+    s = np.linspace(0.0, 1.0, BEZIER_SAMPLES)[:, None]
+    dt = t1 - t0
+    reach = influence / 100.0 * dt
+    # Time handles are the same for every dimension, so x(s) is shared.
+    x = ((1 - s) ** 3 * t0 + 3 * (1 - s) ** 2 * s * (t0 + reach) + 3 * (1 - s) * s ** 2 * (t1 - reach) + s ** 3 * t1)[:, 0]
+    y = (
+        (1 - s) ** 3 * v0
+        + 3 * (1 - s) ** 2 * s * (v0 + speed_out * reach)
+        + 3 * (1 - s) * s ** 2 * (v1 - speed_in * reach)
+        + s ** 3 * v1
+    )
+    return np.column_stack([np.interp(sample_t, x, y[:, dim]) for dim in range(y.shape[1])])
+
+
+def fit_eases(t: Any, v: Any, kept: Any) -> Tuple[List[Any], List[Any], float]:
+    """Fit bezier eases for the keys in ``kept`` against the original samples.
+
+    Speeds come from the local slope of the original data at each kept key;
+    each segment then gets the influence from :data:`EASE_INFLUENCE_GRID`
+    with the smallest maximum error. Returns per-key ``ease_in``, ``ease_out``
+    specs and the overall maximum error.
+    """
+    np = _numpy()
+    velocity = np.gradient(v, t, axis=0) if len(t) > 1 else np.zeros_like(v)
+    influences_out = np.full(len(kept), 33.333)
+    influences_in = np.full(len(kept), 33.333)
+    max_error = 0.0
+    for position in range(len(kept) - 1):
+        start, end = int(kept[position]), int(kept[position + 1])
+        inner = slice(start + 1, end)
+        best_influence, best_error = EASE_INFLUENCE_GRID[0], 0.0
+        if end - start >= 2:
+            best_error = float("inf")
+            for influence in EASE_INFLUENCE_GRID:
+                curve = _bezier_segment(
+                    t[start], t[end], v[start], v[end], velocity[start], velocity[end], influence, t[inner]
+                )
+                error = float(np.max(np.linalg.norm(v[inner] - curve, axis=1)))
+                if error < best_error:
+                    best_influence, best_error = influence, error
+        influences_out[position] = best_influence
+        influences_in[position + 1] = best_influence
+        max_error = max(max_error, best_error)
+
+    def spec(index: int, influence: float) -> List[List[float]]:
+        return [[float(speed), float(influence)] for speed in velocity[index]]
+
+    ease_in = [spec(int(index), influences_in[position]) for position, index in enumerate(kept)]
+    ease_out = [spec(int(index), influences_out[position]) for position, index in enumerate(kept)]
+    return ease_in, ease_out, max_error
+
+
+def simplify_keyframes(times: Any, values: Any, tolerance: float, fit_ease: bool = False) -> SimplifiedCurve:
+    """Reduce sampled keys to those needed within ``tolerance`` (property units).
+
+    ``values`` may be numbers or equal-length numeric arrays (lists or NumPy).
+    With ``fit_ease=True`` the kept keys also get bezier eases, and
+    ``max_error`` reflects the eased curve instead of linear interpolation.
+    """
+    if tolerance < 0:
+        raise ValueError("tolerance must be 0 or greater.")
+    t, v, scalar = _as_arrays(times, values)
+    kept = simplify_indices(t, v, tolerance)
+    kept_values = v[kept, 0].tolist() if scalar else v[kept].tolist()
+    result = SimplifiedCurve(
+        indices=[int(index) for index in kept],
+        times=t[kept].tolist(),
+        values=kept_values,
+        before=len(t),
+        max_error=float(_linear_errors(t, v, kept).max()) if len(t) else 0.0,
+    )
+    if fit_ease and len(kept) > 1:
+        result.ease_in, result.ease_out, eased_error = fit_eases(t, v, kept)
+        result.max_error = eased_error
+    return result
+
+
+def simplify_scene_animations(scene: Dict[str, Any], tolerance: float, fit_ease: bool = False) -> Dict[str, Any]:
+    """Simplify every numeric ``layers[].animations[].keyframes`` list of ``scene`` in place.
+
+    Kept keys keep their own interpolation fields unless eases are fitted, in
+    which case they become bezier keys with the fitted eases. Returns a report
+    with key counts before and after and the largest error over all animations.
+    """
+    report: Dict[str, Any] = {"animations": 0, "before": 0, "after": 0, "maxError": 0.0, "skipped": 0}
+    for layer in scene.get("layers", []):
+        for animation in layer.get("animations", []) or []:
+            keyframes: Sequence[Dict[str, Any]] = animation.get("keyframes", []) or []
+            if len(keyframes) < 3:
+                continue
+            try:
+                curve = simplify_keyframes(
+                    [key["time"] for key in keyframes],
+                    [key["value"] for key in keyframes],
+                    tolerance,
+                    fit_ease=fit_ease,
+                )
+            except (KeyError, ValueError):
+                report["skipped"] += 1
+                continue
+            reduced = [dict(keyframes[index]) for index in curve.indices]
+            if curve.ease_in is not None and curve.ease_out is not None:
+                for key, ease_in, ease_out in zip(reduced, curve.ease_in, curve.ease_out):
+                    key["inInterp"] = key["outInterp"] = "bezier"
+                    key["easeIn"] = ease_in
+                    key["easeOut"] = ease_out
+            animation["keyframes"] = reduced
+            report["animations"] += 1
+            report["before"] += curve.before
+            report["after"] += curve.after
+            report["maxError"] = max(report["maxError"], curve.max_error)
+    return report
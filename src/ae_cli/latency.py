@@ -0,0 +1,154 @@
+"""Per-endpoint latency histograms and the adaptive timeouts derived from them."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from dataclasses import dataclass
+import json
+import os
+from pathlib import Path
+import threading
+from typing import Any, Dict, List
+
+
+STATS_VERSION = 1
+DEFAULT_STATS_PATH = Path.home() / "ae-agent-skills" / "latency-stats.json"
+
+# Upper bounds (ms) of the histogram buckets; the last bucket is open-ended.
+BUCKET_BOUNDS_MS: List[float] = [
+    5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 60000, 120000, 300000, 600000,
+]
+
+TIMEOUT_PERCENTILE = 0.99
+TIMEOUT_HEADROOM = 2.0
+MIN_SAMPLES = 5
+
+
+@dataclass(frozen=True)
+class TimeoutPolicy:
+    """Bounds for one endpoint's timeout, in seconds.
+
+    ``per_unit`` is the fallback cost of one payload unit (for example one scene
+    layer) used until enough samples exist. Endpoints with ``per_unit`` record
+    their samples as milliseconds per unit.
+    """
+
+    floor: float
+    ceiling: float
+    default: float
+    per_unit: float | None = None
+
+
+READ_POLICY = TimeoutPolicy(floor=2.0, ceiling=60.0, default=10.0)
+MUTATION_POLICY = TimeoutPolicy(floor=3.0, ceiling=120.0, default=15.0)
+
+ENDPOINT_POLICIES: Dict[str, TimeoutPolicy] = {
+    "GET /health": TimeoutPolicy(floor=0.5, ceiling=3.0, default=2.0),
+    "GET /metrics": TimeoutPolicy(floor=0.5, ceiling=3.0, default=2.0),
+    "GET /properties": TimeoutPolicy(floor=2.0, ceiling=120.0, default=15.0),
+    "GET /expression-errors": TimeoutPolicy(floor=2.0, ceiling=120.0, default=15.0),
+    "POST /precompose": TimeoutPolicy(floor=5.0, ceiling=300.0, default=30.0),
+    "POST /scene": TimeoutPolicy(floor=10.0, ceiling=1800.0, default=10.0, per_unit=0.25),
+    "POST /batch": TimeoutPolicy(floor=10.0, ceiling=1800.0, default=10.0, per_unit=0.1),
+    "POST /keyframes/batch": TimeoutPolicy(floor=5.0, ceiling=900.0, default=5.0, per_unit=0.01),
+    "POST /texts/batch": TimeoutPolicy(floor=5.0, ceiling=600.0, default=5.0, per_unit=0.01),
+    "POST /effects/batch": TimeoutPolicy(floor=5.0, ceiling=900.0, default=5.0, per_unit=0.01),
+    "POST /layers/batch": TimeoutPolicy(floor=5.0, ceiling=900.0, default=5.0, per_unit=0.05),
+    "POST /footage/import": TimeoutPolicy(floor=10.0, ceiling=1800.0, default=10.0, per_unit=1.0),
+    "POST /shape-paths": TimeoutPolicy(floor=5.0, ceiling=600.0, default=5.0, per_unit=0.02),
+    "POST /duplicate-layer/batch": TimeoutPolicy(floor=5.0, ceiling=900.0, default=5.0, per_unit=0.05),
+    "POST /layer-order/batch": TimeoutPolicy(floor=5.0, ceiling=600.0, default=5.0, per_unit=0.02),
+    "POST /layer-parent/batch": TimeoutPolicy(floor=5.0, ceiling=600.0, default=5.0, per_unit=0.02),
+}
+
+
+def policy_for(endpoint: str) -> TimeoutPolicy:
+    policy = ENDPOINT_POLICIES.get(endpoint)
+    if policy is not None:
+        return policy
+    return READ_POLICY if endpoint.startswith("GET ") else MUTATION_POLICY
+
+
+def _clamp(value: float, lower: float, upper: float) -> float:
+    return max(lower, min(upper, value))
+
+
+class LatencyStats:
+    """Latency histograms per ``"METHOD /path"``, stored in a small JSON file."""
+
+    def __init__(self, path: Path | None = None, endpoints: Dict[str, Dict[str, Any]] | None = None):
+        self.path = path
+        self.endpoints: Dict[str, Dict[str, Any]] = endpoints or {}
+        self.dirty = False
+        self._lock = threading.Lock()
+
+    @classmethod
+    def load(cls, path: str | Path | None = None) -> "LatencyStats":
+        """Load stats from ``path`` (default: ``AE_CLI_STATS_FILE`` or the workspace file).
+
+        A missing or unreadable file yields empty stats rather than an error.
+        """
+        resolved = Path(path or os.environ.get("AE_CLI_STATS_FILE") or DEFAULT_STATS_PATH).expanduser()
+        try:
+            raw = json.loads(resolved.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path=resolved)
+        if not isinstance(raw, dict) or raw.get("version") != STATS_VERSION or raw.get("bounds") != BUCKET_BOUNDS_MS:
+            return cls(path=resolved)
+        endpoints = raw.get("endpoints")
+        return cls(path=resolved, endpoints=endpoints if isinstance(endpoints, dict) else {})
+
+    def record(self, endpoint: str, elapsed_ms: float, units: int | None = None) -> None:
+        """Add one sample; endpoints with a ``per_unit`` policy store ms per unit."""
+        value = elapsed_ms
+        if policy_for(endpoint).per_unit is not None:
+            value = elapsed_ms / max(1, units or 1)
+        with self._lock:
+            entry = self.endpoints.setdefault(endpoint, {"count": 0, "buckets": [0] * (len(BUCKET_BOUNDS_MS) + 1)})
+            entry["buckets"][bisect_left(BUCKET_BOUNDS_MS, value)] += 1
+            entry["count"] += 1
+            self.dirty = True
+
+    def percentile(self, endpoint: str, quantile: float) -> float | None:
+        """Return the bucket upper bound (ms) reaching ``quantile``, or None without enough samples."""
+        entry = self.endpoints.get(endpoint)
+        if not entry or entry.get("count", 0) < MIN_SAMPLES:
+            return None
+        target = quantile * entry["count"]
+        seen = 0
+        for index, bucket_count in enumerate(entry["buckets"]):
+            seen += bucket_count
+            if seen >= target:
+                if index < len(BUCKET_BOUNDS_MS):
+                    return float(BUCKET_BOUNDS_MS[index])
+                return float(BUCKET_BOUNDS_MS[-1]) * 2
+        return float(BUCKET_BOUNDS_MS[-1]) * 2
+
+    def timeout_for(self, endpoint: str, units: int | None = None) -> float:
+        """Derive a timeout in seconds from the high percentile, clamped to the endpoint policy."""
+        policy = policy_for(endpoint)
+        observed_ms = self.percentile(endpoint, TIMEOUT_PERCENTILE)
+        if policy.per_unit is not None:
+            unit_count = max(1, units or 1)
+            if observed_ms is None:
+                seconds = policy.default + policy.per_unit * unit_count
+            else:
+                seconds = observed_ms / 1000.0 * unit_count * TIMEOUT_HEADROOM
+        elif observed_ms is None:
+            seconds = policy.default
+        else:
+            seconds = observed_ms / 1000.0 * TIMEOUT_HEADROOM
+        return _clamp(seconds, policy.floor, policy.ceiling)
+
+    def save(self) -> None:
+        """Write the stats file atomically if anything was recorded."""
+        if self.path is None or not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(
+            json.dumps({"version": STATS_VERSION, "bounds": BUCKET_BOUNDS_MS, "endpoints": self.endpoints}),
+            encoding="utf-8",
+        )
+        os.replace(tmp_path, self.path)
+        self.dirty = False
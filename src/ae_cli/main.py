@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from .cli_parser import build_parser
-from .cli_runner import run_command
+import time
+
+_IMPORT_STARTED = time.perf_counter()
+
+from .cli_parser import build_parser  # noqa: E402
+from .cli_runner import run_command  # noqa: E402
 
 
 def run(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
-    return run_command(args)
+    startup_ms = (time.perf_counter() - _IMPORT_STARTED) * 1000.0
+    return run_command(args, startup_ms=startup_ms)
 
 
 if __name__ == "__main__":
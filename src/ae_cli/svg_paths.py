@@ -0,0 +1,357 @@
+"""SVG path data to After Effects shape paths.
+
+Parses SVG ``d`` strings into contours of vertices with in/out tangents
+(relative to each vertex, as AE's ``Shape`` expects). Every segment is turned
+into a cubic first; quadratics and arcs are converted in bulk with NumPy
+(``pip install 'ae-agent-skills[numpy]'``).
+"""
+
+from __future__ import annotations
+
+import math
+import re
+from typing import Any, Dict, List, Sequence, Tuple
+
+
+# Distance under which a closing segment's end point counts as the start point.
+CLOSE_EPSILON = 1e-6
+
+_COMMAND_RE = re.compile(r"[MmLlHhVvCcSsQqTtAaZz]")
+_NUMBER_RE = re.compile(r"[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?")
+_SEPARATOR_RE = re.compile(r"[\s,]*")
+_ARGUMENT_COUNTS = {"M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "A": 7, "Z": 0}
+
+_SHAPE_PATH_KEYS = {
+    "name": "name",
+    "d": "d",
+    "contours": "contours",
+    "fill_color": "fillColor",
+    "fill_opacity": "fillOpacity",
+    "fill_rule": "fillRule",
+    "stroke_color": "strokeColor",
+    "stroke_opacity": "strokeOpacity",
+    "stroke_width": "strokeWidth",
+    "stroke_line_cap": "strokeLineCap",
+}
+
+
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError as exc:
+        raise ImportError("SVG path conversion requires NumPy: pip install 'ae-agent-skills[numpy]'") from exc
+    return np
+
+
+class _Scanner:
+    def __init__(self, d: str):
+        self.d = d
+        self.pos = 0
+
+    def _skip(self) -> None:
+        self.pos = _SEPARATOR_RE.match(self.d, self.pos).end()
+
+    def at_end(self) -> bool:
+        self._skip()
+        return self.pos >= len(self.d)
+
+    def command(self) -> str | None:
+        self._skip()
+        match = _COMMAND_RE.match(self.d, self.pos)
+        if match is None:
+            return None
+        self.pos = match.end()
+        return match.group()
+
+    def has_number(self) -> bool:
+        self._skip()
+        return _NUMBER_RE.match(self.d, self.pos) is not None
+
+    def number(self) -> float:
+        self._skip()
+        match = _NUMBER_RE.match(self.d, self.pos)
+        if match is None:
+            raise ValueError(f"Expected a number at offset {self.pos} of SVG path data.")
+        self.pos = match.end()
+        return float(match.group())
+
+    def flag(self) -> float:
+        # Arc flags may be written without separators ("a1 1 0 011 1").
+        self._skip()
+        char = self.d[self.pos:self.pos + 1]
+        if char not in ("0", "1"):
+            raise ValueError(f"Expected an arc flag (0 or 1) at offset {self.pos} of SVG path data.")
+        self.pos += 1
+        return float(char)
+
+
+def _tokenize(d: str) -> List[Tuple[str, List[float]]]:
+    """Split path data into ``(command, args)`` with one entry per implicit repeat."""
+    scanner = _Scanner(d)
+    commands: List[Tuple[str, List[float]]] = []
+    while not scanner.at_end():
+        command = scanner.command()
+        if command is None:
+            raise ValueError(f"Expected a path command at offset {scanner.pos} of SVG path data.")
+        count = _ARGUMENT_COUNTS[command.upper()]
+        if count == 0:
+            commands.append((command, []))
+            continue
+        first = True
+        while first or scanner.has_number():
+            if command.upper() == "A":
+                args = [scanner.number() for _ in range(3)] + [scanner.flag(), scanner.flag()]
+                args += [scanner.number(), scanner.number()]
+            else:
+                args = [scanner.number() for _ in range(count)]
+            commands.append((command, args))
+            # Extra pairs after a moveto are implicit linetos.
+            if command in ("M", "m"):
+                command = "L" if command == "M" else "l"
+            first = False
+    return commands
+
+
+def _arc_to_cubics(start: Sequence[float], args: Sequence[float]) -> Any:
+    """Convert one SVG elliptical arc to cubic segments, shape ``(n, 4, 2)`` (SVG spec F.6.5)."""
+    np = _numpy()
+    rx, ry, rotation, large_arc, sweep, x, y = args
+    x0, y0 = start
+    if (x0, y0) == (x, y):
+        return np.empty((0, 4, 2))
+    rx, ry = abs(rx), abs(ry)
+    if rx == 0 or ry == 0:
+        return np.array([[[x0, y0], [x0, y0], [x, y], [x, y]]], dtype=float)
+    phi = math.radians(rotation % 360.0)
+    cos_phi, sin_phi = math.cos(phi), math.sin(phi)
+    dx, dy = (x0 - x) / 2.0, (y0 - y) / 2.0
+    x1p = cos_phi * dx + sin_phi * dy
+    y1p = -sin_phi * dx + cos_phi * dy
+    scale = (x1p * x1p) / (rx * rx) + (y1p * y1p) / (ry * ry)
+    if scale > 1:
+        rx, ry = rx * math.sqrt(scale), ry * math.sqrt(scale)
+    numerator = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    denominator = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    factor = math.sqrt(max(0.0, numerator / denominator))
+    if large_arc == sweep:
+        factor = -factor
+    cxp, cyp = factor * rx * y1p / ry, -factor * ry * x1p / rx
+    cx = cos_phi * cxp - sin_phi * cyp + (x0 + x) / 2.0
+    cy = sin_phi * cxp + cos_phi * cyp + (y0 + y) / 2.0
+
+    def angle(ux: float, uy: float, vx: float, vy: float) -> float:
+        return math.atan2(ux * vy - uy * vx, ux * vx + uy * vy)
+
+    theta = angle(1.0, 0.0, (x1p - cxp) / rx, (y1p - cyp) / ry)
+    delta = angle((x1p - cxp) / rx, (y1p - cyp) / ry, (-x1p - cxp) / rx, (-y1p - cyp) / ry)
+    if not sweep and delta > 0:
+        delta -= 2 * math.pi
+    elif sweep and delta < 0:
+        delta += 2 * math.pi
+
+    pieces = max(1, int(math.ceil(abs(delta) / (math.pi / 2) - 1e-9)))
+    step = delta / pieces
+    starts = theta + step * np.arange(pieces)
+    ends = starts + step
+    k = 4.0 / 3.0 * math.tan(step / 4.0)
+    # Unit-circle cubic for each piece, then scale by the radii, rotate and move to the center.
+    unit = np.stack(
+        [
+            np.column_stack([np.cos(starts), np.sin(starts)]),
+            np.column_stack([np.cos(starts) - k * np.sin(starts), np.sin(starts) + k * np.cos(starts)]),
+            np.column_stack([np.cos(ends) + k * np.sin(ends), np.sin(ends) - k * np.cos(ends)]),
+            np.column_stack([np.cos(ends), np.sin(ends)]),
+        ],
+        axis=1,
+    )
+    scaled = unit * np.array([rx, ry])
+    rotated = scaled @ np.array([[cos_phi, sin_phi], [-sin_phi, cos_phi]])
+    cubics = rotated + np.array([cx, cy])
+    # Pin the end points exactly so consecutive segments share vertices.
+    cubics[0, 0] = (x0, y0)
+    cubics[-1, 3] = (x, y)
+    return cubics
+
+
+def _contour_from_segments(points: Any, kinds: Any, closed: bool) -> Dict[str, Any]:
+    """Turn a subpath's segments (``(n, 4, 2)`` rows of cubic or quadratic points) into an AE contour."""
+    np = _numpy()
+    quadratic = kinds == 1
+    if quadratic.any():
+        # Quadratic rows hold [p0, q, q, p3]; raise them to cubics in one pass.
+        p0, q, p3 = points[quadratic, 0], points[quadratic, 1], points[quadratic, 3]
+        points[quadratic, 1] = p0 + 2.0 / 3.0 * (q - p0)
+        points[quadratic, 2] = p3 + 2.0 / 3.0 * (q - p3)
+
+    vertices = points[:, 0]
+    out_tangents = points[:, 1] - points[:, 0]
+    in_tangents = np.zeros_like(vertices)
+    in_tangents[1:] = points[:-1, 2] - points[:-1, 3]
+    last_in = points[-1, 2] - points[-1, 3]
+    end = points[-1, 3]
+    if closed:
+        if np.linalg.norm(end - vertices[0]) <= CLOSE_EPSILON:
+            in_tangents[0] = last_in
+        else:
+            vertices = np.vstack([vertices, end])
+            in_tangents = np.vstack([in_tangents, last_in])
+            out_tangents = np.vstack([out_tangents, np.zeros(2)])
+    else:
+        vertices = np.vstack([vertices, end])
+        in_tangents = np.vstack([in_tangents, last_in])
+        out_tangents = np.vstack([out_tangents, np.zeros(2)])
+    return {
+        "vertices": vertices.tolist(),
+        "inTangents": in_tangents.tolist(),
+        "outTangents": out_tangents.tolist(),
+        "closed": closed,
+    }
+
+
+def parse_svg_path(d: str) -> List[Dict[str, Any]]:
+    """Parse SVG path data into AE contours.
+
+    Returns one ``{"vertices", "inTangents", "outTangents", "closed"}`` dict
+    per subpath. Tangents are relative to their vertex. All path commands are
+    supported, absolute and relative.
+    """
+    np = _numpy()
+    contours: List[Dict[str, Any]] = []
+    rows: List[Any] = []
+    kinds: List[int] = []
+    current = (0.0, 0.0)
+    start = (0.0, 0.0)
+    last_control: Tuple[float, float] | None = None
+    last_command = ""
+
+    def flush(closed: bool) -> None:
+        if rows:
+            contours.append(_contour_from_segments(np.array(rows, dtype=float), np.array(kinds), closed))
+        rows.clear()
+        kinds.clear()
+
+    for command, args in _tokenize(d):
+        upper = command.upper()
+        relative = command.islower() and upper != "Z"
+        ox, oy = current if relative else (0.0, 0.0)
+        if upper == "M":
+            flush(False)
+            current = start = (ox + args[0], oy + args[1])
+            last_control = None
+        elif upper in ("L", "H", "V"):
+            if upper == "L":
+                target = (ox + args[0], oy + args[1])
+            elif upper == "H":
+                target = (ox + args[0] if relative else args[0], current[1])
+            else:
+                target = (current[0], oy + args[0] if relative else args[0])
+            rows.append([current, current, target, target])
+            kinds.append(0)
+            current = target
+            last_control = None
+        elif upper in ("C", "S"):
+            if upper == "C":
+                c1 = (ox + args[0], oy + args[1])
+                rest = args[2:]
+            else:
+                reflect = last_command in ("C", "S") and last_control is not None
+                c1 = (2 * current[0] - last_control[0], 2 * current[1] - last_control[1]) if reflect else current
+                rest = args
+            c2 = (ox + rest[0], oy + rest[1])
+            target = (ox + rest[2], oy + rest[3])
+            rows.append([current, c1, c2, target])
+            kinds.append(0)
+            current, last_control = target, c2
+        elif upper in ("Q", "T"):
+            if upper == "Q":
+                control = (ox + args[0], oy + args[1])
+                target = (ox + args[2], oy + args[3])
+            else:
+                reflect = last_command in ("Q", "T") and last_control is not None
+                control = (2 * current[0] - last_control[0], 2 * current[1] - last_control[1]) if reflect else current
+                target = (ox + args[0], oy + args[1])
+            rows.append([current, control, control, target])
+            kinds.append(1)
+            current, last_control = target, control
+        elif upper == "A":
+            target = (ox + args[5], oy + args[6])
+            cubics = _arc_to_cubics(current, args[:5] + [target[0], target[1]])
+            rows.extend(cubics.tolist())
+            kinds.extend([0] * len(cubics))
+            current = target
+            last_control = None
+        else:
+            flush(True)
+            current = start
+            last_control = None
+        last_command = upper
+    flush(False)
+    return contours
+
+
+def _normalize_contour(contour: Any, label: str) -> Dict[str, Any]:
+    if not isinstance(contour, dict):
+        raise ValueError(f"{label} must be an object.")
+    vertices = contour.get("vertices")
+    if hasattr(vertices, "tolist"):
+        vertices = vertices.tolist()
+    if not isinstance(vertices, list) or not vertices:
+        raise ValueError(f"{label}.vertices must be a non-empty list of [x, y] points.")
+    normalized: Dict[str, Any] = {"vertices": vertices, "closed": bool(contour.get("closed", True))}
+    for snake, camel in (("in_tangents", "inTangents"), ("out_tangents", "outTangents")):
+        tangents = contour.get(camel, contour.get(snake))
+        if hasattr(tangents, "tolist"):
+            tangents = tangents.tolist()
+        if tangents is None:
+            tangents = [[0.0, 0.0] for _ in vertices]
+        if not isinstance(tangents, list) or len(tangents) != len(vertices):
+            raise ValueError(f"{label}.{camel} must have one [x, y] entry per vertex.")
+        normalized[camel] = tangents
+    return normalized
+
+
+def normalize_shape_path(spec: Dict[str, Any], label: str = "shapePaths[0]") -> Dict[str, Any]:
+    """Return the wire form of one shape path group: SVG ``d`` parsed into ``contours``, keys camelCased.
+
+    ``spec`` holds either ``d`` (SVG path data) or ``contours`` (vertex and
+    tangent lists, plain or NumPy) plus optional fill and stroke settings.
+    """
+    if not isinstance(spec, dict):
+        raise ValueError(f"{label} must be an object.")
+    normalized: Dict[str, Any] = {}
+    for key, value in spec.items():
+        wire_key = _SHAPE_PATH_KEYS.get(key, key)
+        if wire_key not in _SHAPE_PATH_KEYS.values():
+            raise ValueError(f"{label} has unknown key {key!r}.")
+        normalized[wire_key] = value
+    d = normalized.pop("d", None)
+    if (d is None) == ("contours" not in normalized):
+        raise ValueError(f"{label} needs exactly one of d or contours.")
+    if d is not None:
+        contours = parse_svg_path(d)
+        if not contours:
+            raise ValueError(f"{label}.d has no drawable segments.")
+        normalized["contours"] = contours
+    else:
+        raw = normalized["contours"]
+        if not isinstance(raw, list) or not raw:
+            raise ValueError(f"{label}.contours must be a non-empty list.")
+        normalized["contours"] = [
+            _normalize_contour(contour, f"{label}.contours[{index}]") for index, contour in enumerate(raw)
+        ]
+    return normalized
+
+
+def normalize_scene_shape_paths(scene: Dict[str, Any]) -> int:
+    """Convert every ``layers[].shapePaths`` entry of ``scene`` in place; returns the number of groups."""
+    count = 0
+    for layer_index, layer in enumerate(scene.get("layers", []) or []):
+        shape_paths = layer.get("shapePaths") if isinstance(layer, dict) else None
+        if not shape_paths:
+            continue
+        layer["shapePaths"] = [
+            normalize_shape_path(spec, f"layers[{layer_index}].shapePaths[{index}]")
+            for index, spec in enumerate(shape_paths)
+        ]
+        count += len(shape_paths)
+    return count
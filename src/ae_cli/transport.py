@@ -0,0 +1,99 @@
+"""Unix domain socket transport for talking to the bridge without loopback TCP."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+import socket
+from typing import Any
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.connectionpool import HTTPConnectionPool
+
+
+UNIX_SCHEME = "unix://"
+DEFAULT_SOCKET_PATH = Path.home() / "ae-agent-skills" / "bridge.sock"
+
+# requests only routes http(s) URLs to adapters, so unix base URLs are rewritten
+# to this prefix and a UnixSocketAdapter is mounted on it.
+UNIX_HTTP_PREFIX = "http://ae-bridge.sock"
+
+
+def default_socket_path() -> Path | None:
+    """Return the socket path from ``AE_BRIDGE_SOCKET`` (``off`` disables), else the workspace default."""
+    raw = os.environ.get("AE_BRIDGE_SOCKET")
+    if raw is None:
+        return DEFAULT_SOCKET_PATH
+    if raw.strip().lower() in ("", "0", "off", "none"):
+        return None
+    return Path(raw).expanduser()
+
+
+def unix_socket_path(base_url: str) -> str | None:
+    """Return the socket path of a ``unix:///path`` base URL, or None for http URLs."""
+    if not base_url.startswith(UNIX_SCHEME):
+        return None
+    path = base_url[len(UNIX_SCHEME):]
+    if not path:
+        raise ValueError(f"Unix base URL needs an absolute socket path: {base_url}")
+    return path
+
+
+def resolve_base_url(explicit: str | None, fallback: str) -> str:
+    """Pick the bridge URL: ``explicit``, then ``AE_BRIDGE_URL``, then the socket if present, then ``fallback``."""
+    if explicit:
+        return explicit
+    from_env = os.environ.get("AE_BRIDGE_URL")
+    if from_env:
+        return from_env
+    socket_path = default_socket_path()
+    if socket_path is not None and hasattr(socket, "AF_UNIX") and socket_path.is_socket():
+        return f"{UNIX_SCHEME}{socket_path}"
+    return fallback
+
+
+class _UnixHTTPConnection(HTTPConnection):
+    def __init__(self, *args: Any, socket_path: str, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._socket_path = socket_path
+
+    def _new_conn(self) -> socket.socket:
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        timeout = self.timeout if isinstance(self.timeout, (int, float)) else socket.getdefaulttimeout()
+        sock.settimeout(timeout)
+        try:
+            sock.connect(self._socket_path)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+
+class _UnixHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _UnixHTTPConnection
+
+    def __init__(self, socket_path: str, **kwargs: Any):
+        super().__init__("localhost", **kwargs)
+        self.conn_kw["socket_path"] = socket_path
+
+
+class UnixSocketAdapter(HTTPAdapter):
+    """Send every request through one keep-alive pool bound to ``socket_path``."""
+
+    def __init__(self, socket_path: str, pool_maxsize: int = 10):
+        super().__init__()
+        self._pool = _UnixHTTPConnectionPool(socket_path, maxsize=pool_maxsize)
+
+    def get_connection_with_tls_context(self, request: Any, verify: Any, proxies: Any = None, cert: Any = None) -> Any:
+        return self._pool
+
+    def get_connection(self, url: str, proxies: Any = None) -> Any:
+        return self._pool
+
+    def request_url(self, request: Any, proxies: Any) -> str:
+        return request.path_url
+
+    def close(self) -> None:
+        super().close()
+        self._pool.close()
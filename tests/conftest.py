@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_workspace(monkeypatch, tmp_path) -> None:
+    """Keep run_command away from the real workspace's latency stats and bridge socket."""
+    monkeypatch.setenv("AE_CLI_STATS_FILE", str(tmp_path / "latency-stats.json"))
+    monkeypatch.setenv("AE_BRIDGE_SOCKET", "off")
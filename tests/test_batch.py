@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import threading
+from typing import Any
+
+import pytest
+
+from ae_cli.batch import execute_operations, load_operations
+
+
+def _write_ops(tmp_path, text: str) -> str:
+    path = tmp_path / "ops.jsonl"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_load_operations_accepts_arrays_and_objects(tmp_path) -> None:
+    path = _write_ops(
+        tmp_path,
+        "# recorded session\n"
+        '["layers", "--type", "text"]\n'
+        "\n"
+        '{"id": "cti", "argv": ["set-cti", "--time", "1.5"]}\n',
+    )
+    operations = load_operations(path)
+    assert [op.args.command for op in operations] == ["layers", "set-cti"]
+    assert operations[0].read_only is True
+    assert operations[1].read_only is False
+    assert operations[1].op_id == "cti"
+    assert operations[1].line == 4
+    assert operations[1].args.time == 1.5
+
+
+def test_load_operations_reports_every_invalid_line(tmp_path) -> None:
+    path = _write_ops(
+        tmp_path,
+        '["set-cti"]\n'
+        "not json\n"
+        '["events"]\n'
+        '["health"]\n',
+    )
+    with pytest.raises(ValueError) as excinfo:
+        load_operations(path)
+    message = str(excinfo.value)
+    assert "line 1:" in message and "--time" in message
+    assert "line 2: invalid JSON" in message
+    assert "line 3: 'events' cannot run inside a batch" in message
+    assert "line 4" not in message
+
+
+def test_execute_operations_runs_reads_concurrently_and_mutations_in_order(tmp_path) -> None:
+    path = _write_ops(
+        tmp_path,
+        '["set-cti", "--time", "0"]\n'
+        '["health"]\n'
+        '["list-comps"]\n'
+        '["set-cti", "--time", "1"]\n',
+    )
+    operations = load_operations(path)
+    calls: list[str] = []
+    threads: dict[str, int] = {}
+    barrier = threading.Barrier(2, timeout=5)
+
+    def read_handler(client: Any, args: Any) -> Any:
+        barrier.wait()
+        threads[args.command] = threading.get_ident()
+        calls.append(args.command)
+        return {"command": args.command}
+
+    def set_cti_handler(client: Any, args: Any) -> Any:
+        assert client.session is not None
+        calls.append(f"set-cti:{args.time}")
+        return {"time": args.time}
+
+    handlers = {"health": read_handler, "list-comps": read_handler, "set-cti": set_cti_handler}
+    records: list[dict[str, Any]] = []
+    summary = execute_operations(
+        operations,
+        handlers,
+        base_url="http://127.0.0.1:8080",
+        timeout=5.0,
+        max_workers=2,
+        on_result=records.append,
+    )
+
+    assert calls[0] == "set-cti:0.0"
+    assert calls[-1] == "set-cti:1.0"
+    assert threads["health"] != threads["list-comps"]
+    assert [record["index"] for record in records] == [0, 1, 2, 3]
+    assert all(record["status"] == "success" for record in records)
+    assert all("elapsedMs" in record for record in records)
+    assert summary["succeeded"] == 4 and summary["failed"] == 0
+
+
+def test_execute_operations_stop_on_error_skips_remaining(tmp_path) -> None:
+    path = _write_ops(
+        tmp_path,
+        '["set-cti", "--time", "0"]\n'
+        '["set-cti", "--time", "1"]\n'
+        '["health"]\n',
+    )
+    operations = load_operations(path)
+
+    def failing_handler(client: Any, args: Any) -> Any:
+        raise ValueError("boom")
+
+    records: list[dict[str, Any]] = []
+    summary = execute_operations(
+        operations,
+        {"set-cti": failing_handler, "health": failing_handler},
+        base_url="http://127.0.0.1:8080",
+        timeout=5.0,
+        stop_on_error=True,
+        on_result=records.append,
+    )
+
+    assert [record["status"] for record in records] == ["error", "skipped", "skipped"]
+    assert records[0]["error"] == "boom"
+    assert summary == {**summary, "total": 3, "succeeded": 0, "failed": 1, "skipped": 2}
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from benchmarks.baseline import compare_reports
+from benchmarks.scene_generator import SceneSpec, generate_scene
+from benchmarks.scene_scale import find_bend, run_scale
+from benchmarks.stub_bridge import StubBridge
+from benchmarks.suite import measure
+
+from ae_cli.client import AEClient
+
+
+def _report(results: dict[str, float]) -> dict:
+    return {"results": {name: {"p50Ms": value} for name, value in results.items()}}
+
+
+def test_compare_reports_flags_regressions_above_threshold() -> None:
+    comparison = compare_reports(
+        _report({"a": 1.0, "b": 1.0, "c": 1.0, "gone": 1.0}),
+        _report({"a": 1.1, "b": 1.5, "c": 0.5, "added": 2.0}),
+        threshold=0.2,
+    )
+    statuses = {row["name"]: row["status"] for row in comparison["rows"]}
+    assert statuses == {
+        "a": "ok",
+        "b": "regression",
+        "c": "improvement",
+        "gone": "missing",
+        "added": "new",
+    }
+    assert comparison["regressions"] == ["b"]
+
+
+def test_stub_bridge_serves_client_calls() -> None:
+    with StubBridge(layer_count=5) as bridge:
+        client = AEClient(base_url=bridge.base_url, timeout=5.0)
+        assert client.health()["status"] == "ok"
+        assert len(client.get_layers()) == 5
+        assert client.set_cti(1.0)["status"] == "success"
+        stats = measure(client.list_comps, iterations=3, warmup=0)
+    assert stats["iterations"] == 3
+    assert stats["minMs"] <= stats["p50Ms"] <= stats["p95Ms"]
+
+
+def _schema() -> dict:
+    return json.loads((Path(__file__).resolve().parents[1] / "schemas" / "scene.schema.json").read_text(encoding="utf-8"))
+
+
+def _assert_keys_allowed(value: dict, definition: dict, label: str) -> None:
+    allowed = set(definition["properties"])
+    assert set(value) <= allowed, f"{label}: unexpected keys {set(value) - allowed}"
+    for required in definition.get("required", []):
+        assert required in value, f"{label}: missing {required}"
+
+
+def test_generate_scene_matches_schema_shape() -> None:
+    scene = generate_scene(
+        SceneSpec(layers=12, keyframes=3, animated_properties=4, effects=2, expressions=2, repeaters=1, parent_depth=2)
+    )
+    defs = _schema()["$defs"]
+    _assert_keys_allowed(scene["composition"], defs["composition"], "composition")
+    layer_ids = set()
+    for layer in scene["layers"]:
+        _assert_keys_allowed(layer, defs["layer"], layer["id"])
+        assert layer["type"] in defs["layer"]["properties"]["type"]["enum"]
+        for animation in layer.get("animations", []):
+            _assert_keys_allowed(animation, defs["animation"], "animation")
+            for keyframe in animation["keyframes"]:
+                _assert_keys_allowed(keyframe, defs["keyframe"], "keyframe")
+        for effect in layer.get("effects", []):
+            _assert_keys_allowed(effect, defs["effect"], "effect")
+        for expression in layer.get("expressions", []):
+            _assert_keys_allowed(expression, defs["expressionBinding"], "expression")
+        for repeater in layer.get("repeaters", []):
+            assert layer["type"] == "shape"
+            _assert_keys_allowed(repeater, defs["repeater"], "repeater")
+        if "parentId" in layer:
+            assert layer["parentId"] in layer_ids
+        layer_ids.add(layer["id"])
+    assert sum(1 for layer in scene["layers"] if "parentId" in layer) == 8
+
+
+def test_generate_scene_validates_with_jsonschema() -> None:
+    jsonschema = pytest.importorskip("jsonschema")
+    scene = generate_scene(SceneSpec(layers=8, keyframes=2, effects=1, expressions=1, repeaters=1, parent_depth=1))
+    jsonschema.validate(scene, _schema())
+
+
+def test_find_bend_reports_first_superlinear_step() -> None:
+    points = [
+        {"layers": 10, "wallMs": 10.0},
+        {"layers": 100, "wallMs": 100.0},
+        {"layers": 1000, "wallMs": 1000.0},
+        {"layers": 5000, "wallMs": 13000.0},
+    ]
+    assert find_bend(points) == {"layers": 5000, "marginalMsPerLayer": 3.0, "previousMarginalMsPerLayer": 1.0}
+    assert find_bend(points[:3]) is None
+
+
+def test_run_scale_against_stub_bridge() -> None:
+    with StubBridge() as bridge:
+        client = AEClient(base_url=bridge.base_url, timeout=5.0, trace=True)
+        report = run_scale(client, SceneSpec(keyframes=2), sizes=[20, 5], validate_only=True)
+    assert [point["layers"] for point in report["points"]] == [5, 20]
+    assert report["points"][1]["keyframes"] == 40
+    assert report["points"][1]["operationsPlanned"] == 20
+    assert report["points"][1]["payloadBytes"] > report["points"][0]["payloadBytes"]
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import json
 from types import SimpleNamespace
+from typing import Any
 
-from ae_cli.cli_parser import build_parser
+import pytest
+import requests
+
+from ae_cli.cli_parser import CommandParseError, build_parser, parse_command
 from ae_cli.cli_runner import run_command
 
 
@@ -52,6 +57,35 @@ def test_build_parser_parses_properties_layer_name_and_time_options() -> None:
     assert args.time == 1.25
 
 
+def test_build_parser_parses_layers_filters() -> None:
+    parser = build_parser()
+    args = parser.parse_args(
+        [
+            "layers",
+            "--type",
+            "text",
+            "--type",
+            "shape",
+            "--name-prefix",
+            "LT_",
+            "--unmanaged",
+            "--start-index",
+            "5",
+            "--end-index",
+            "50",
+            "--columns",
+        ]
+    )
+    assert args.command == "layers"
+    assert args.layer_types == ["text", "shape"]
+    assert args.name_prefix == "LT_"
+    assert args.name_regex is None
+    assert args.scene_managed is False
+    assert args.start_index == 5
+    assert args.end_index == 50
+    assert args.columns is True
+
+
 def test_build_parser_parses_add_layer_color() -> None:
     parser = build_parser()
     args = parser.parse_args(
@@ -189,6 +223,14 @@ def test_build_parser_parses_expression_errors() -> None:
     assert args.command == "expression-errors"
 
 
+def test_build_parser_parses_events_filters() -> None:
+    parser = build_parser()
+    args = parser.parse_args(["events", "--type", "selectionChanged", "--type", "mutation", "--max-events", "5"])
+    assert args.command == "events"
+    assert args.event_types == ["selectionChanged", "mutation"]
+    assert args.max_events == 5
+
+
 def test_build_parser_parses_set_keyframe_json_value() -> None:
     parser = build_parser()
     args = parser.parse_args(
@@ -240,6 +282,274 @@ def test_build_parser_parses_set_keyframe_easing_options() -> None:
     assert args.ease_out == "[0,40]"
 
 
+def test_run_command_add_layers_reads_layers_file(monkeypatch, tmp_path) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_add_layers(self, layers: Any) -> dict[str, Any]:
+        captured["layers"] = layers
+        return {"createdCount": len(layers)}
+
+    monkeypatch.setattr("ae_cli.client.AEClient.add_layers", fake_add_layers)
+    layers = [{"layerType": "null", "name": "Rig"}, {"layerType": "text", "text": "Hi"}]
+    layers_path = tmp_path / "layers.json"
+    layers_path.write_text(json.dumps({"layers": layers}), encoding="utf-8")
+
+    args = build_parser().parse_args(["--base-url", "http://x", "add-layers", "--layers-file", str(layers_path)])
+    assert run_command(args) == 0
+    assert captured["layers"] == layers
+
+
+def test_run_command_add_shape_paths_builds_groups_from_svg(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_add_shape_paths(self, paths: Any, **kwargs: Any) -> dict[str, Any]:
+        captured["paths"] = paths
+        captured.update(kwargs)
+        return {"groupCount": len(paths)}
+
+    monkeypatch.setattr("ae_cli.client.AEClient.add_shape_paths", fake_add_shape_paths)
+    args = build_parser().parse_args(
+        [
+            "--base-url",
+            "http://x",
+            "add-shape-paths",
+            "--name",
+            "Logo",
+            "--path",
+            "M0 0 L10 0 Z",
+            "--path",
+            "M5 5 L6 6",
+            "--fill-color",
+            "1",
+            "0",
+            "0",
+        ]
+    )
+    assert run_command(args) == 0
+    assert captured["paths"] == [
+        {"d": "M0 0 L10 0 Z", "fill_color": [1.0, 0.0, 0.0]},
+        {"d": "M5 5 L6 6", "fill_color": [1.0, 0.0, 0.0]},
+    ]
+    assert captured["name"] == "Logo"
+    assert captured["layer_id"] is None
+
+
+def test_run_command_set_texts_reads_csv_column(monkeypatch, tmp_path) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_set_texts(self, texts: Any, by: str = "name") -> dict[str, Any]:
+        captured["texts"] = texts
+        captured["by"] = by
+        return {"updatedCount": len(texts)}
+
+    monkeypatch.setattr("ae_cli.client.AEClient.set_texts", fake_set_texts)
+    csv_path = tmp_path / "strings.csv"
+    csv_path.write_text("uid,en,ja\n812,Hello,こんにちは\n813,\"Bye, now\",さようなら\n\n", encoding="utf-8")
+
+    args = build_parser().parse_args(
+        ["--base-url", "http://x", "set-texts", "--csv", str(csv_path), "--text-column", "en"]
+    )
+    assert run_command(args) == 0
+    assert captured == {"texts": {"812": "Hello", "813": "Bye, now"}, "by": "uid"}
+
+
+def test_run_command_set_texts_skips_empty_cells_unless_clearing(monkeypatch, tmp_path) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_set_texts(self, texts: Any, by: str = "name") -> dict[str, Any]:
+        captured["texts"] = texts
+        return {"updatedCount": len(texts)}
+
+    monkeypatch.setattr("ae_cli.client.AEClient.set_texts", fake_set_texts)
+    csv_path = tmp_path / "strings.csv"
+    csv_path.write_text("name,ja\nTitle,こんにちは\nSubtitle,\n", encoding="utf-8")
+
+    base = ["--base-url", "http://x", "set-texts", "--csv", str(csv_path), "--text-column", "ja"]
+    assert run_command(build_parser().parse_args(base)) == 0
+    assert captured["texts"] == {"Title": "こんにちは"}
+    assert run_command(build_parser().parse_args([*base, "--clear-empty"])) == 0
+    assert captured["texts"] == {"Title": "こんにちは", "Subtitle": ""}
+
+
+def test_run_command_set_texts_rejects_duplicate_keys(monkeypatch, tmp_path, capsys) -> None:
+    monkeypatch.setattr(
+        "ae_cli.client.AEClient.set_texts",
+        lambda self, texts, by="name": pytest.fail("should not send"),
+    )
+    csv_path = tmp_path / "strings.csv"
+    csv_path.write_text("id,text\n1,A\n2,B\n01,C\n", encoding="utf-8")
+
+    args = build_parser().parse_args(["--base-url", "http://x", "set-texts", "--csv", str(csv_path)])
+    assert run_command(args) == 1
+    assert "line 4" in capsys.readouterr().err
+
+
+def test_run_command_apply_effects_reads_effects_file(monkeypatch, tmp_path) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_apply_effects(self, layer_selectors: Any, effects: Any, by: str = "name") -> dict[str, Any]:
+        captured.update({"layers": layer_selectors, "effects": effects, "by": by})
+        return {"effectsAdded": 2}
+
+    monkeypatch.setattr("ae_cli.client.AEClient.apply_effects", fake_apply_effects)
+    effects = [{"matchName": "ADBE Gaussian Blur 2", "params": {"Blurriness": 12}}]
+    effects_path = tmp_path / "look.json"
+    effects_path.write_text(json.dumps({"effects": effects}), encoding="utf-8")
+
+    args = build_parser().parse_args(
+        [
+            "--base-url",
+            "http://x",
+            "apply-effects",
+            "--layer-uid",
+            "12",
+            "--layer-uid",
+            "13",
+            "--effects-file",
+            str(effects_path),
+        ]
+    )
+    assert run_command(args) == 0
+    assert captured == {"layers": ["12", "13"], "effects": effects, "by": "uid"}
+
+
+def test_run_command_reorder_layers_passes_uids_in_order(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_reorder_layers(self, order: Any) -> dict[str, Any]:
+        captured["order"] = order
+        return {"moveCount": 1}
+
+    monkeypatch.setattr("ae_cli.client.AEClient.reorder_layers", fake_reorder_layers)
+    args = build_parser().parse_args(
+        ["--base-url", "http://x", "reorder-layers", "--layer-uid", "12", "--layer-uid", "7"]
+    )
+    assert run_command(args) == 0
+    assert captured["order"] == ["12", "7"]
+
+
+def test_run_command_parent_layers_reads_links_file(monkeypatch, tmp_path) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_parent_layers(self, links: Any) -> dict[str, Any]:
+        captured["links"] = links
+        return {"linkCount": len(links)}
+
+    monkeypatch.setattr("ae_cli.client.AEClient.parent_layers", fake_parent_layers)
+    links_path = tmp_path / "rig.json"
+    links_path.write_text(json.dumps([["12", "7"], [4, 1], ["9", None]]), encoding="utf-8")
+
+    args = build_parser().parse_args(["--base-url", "http://x", "parent-layers", "--links-file", str(links_path)])
+    assert run_command(args) == 0
+    assert captured["links"] == {"12": "7", 4: 1, "9": None}
+
+
+def test_run_command_passes_layer_uid_selector(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_set_expression(self, **kwargs: Any) -> dict[str, Any]:
+        captured.update(kwargs)
+        return {"status": "success"}
+
+    monkeypatch.setattr("ae_cli.client.AEClient.set_expression", fake_set_expression)
+    args = build_parser().parse_args(
+        [
+            "--base-url",
+            "http://x",
+            "set-expression",
+            "--layer-uid",
+            "812",
+            "--property-path",
+            "ADBE Transform Group.ADBE Opacity",
+            "--expression",
+            "50",
+        ]
+    )
+    assert run_command(args) == 0
+    assert captured["layer_uid"] == "812"
+    assert captured["layer_id"] is None
+
+
+def test_run_command_duplicate_layers_reads_overrides_file(monkeypatch, tmp_path) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_duplicate_layer_many(self, **kwargs: Any) -> dict[str, Any]:
+        captured.update(kwargs)
+        return {"duplicatedCount": 2}
+
+    monkeypatch.setattr("ae_cli.client.AEClient.duplicate_layer_many", fake_duplicate_layer_many)
+    overrides = [{"name": "A"}, {"text": "B"}]
+    overrides_path = tmp_path / "rows.json"
+    overrides_path.write_text(json.dumps(overrides), encoding="utf-8")
+
+    args = build_parser().parse_args(
+        ["--base-url", "http://x", "duplicate-layers", "--layer-uid", "812", "--overrides-file", str(overrides_path)]
+    )
+    assert run_command(args) == 0
+    assert captured == {"layer_id": None, "count": None, "overrides": overrides, "layer_uid": "812"}
+
+
+def test_run_command_set_keyframes_reads_keyframe_file(monkeypatch, tmp_path) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_set_keyframes(self, **kwargs: Any) -> dict[str, Any]:
+        captured.update(kwargs)
+        return {"keyframeCount": 2}
+
+    monkeypatch.setattr("ae_cli.client.AEClient.set_keyframes", fake_set_keyframes)
+    keyframes_path = tmp_path / "keys.json"
+    keyframes_path.write_text(json.dumps([{"time": 0, "value": [0, 0]}, {"time": 1, "value": [100, 50]}]), encoding="utf-8")
+
+    args = build_parser().parse_args(
+        [
+            "--base-url",
+            "http://x",
+            "set-keyframes",
+            "--layer-id",
+            "2",
+            "--property-path",
+            "ADBE Transform Group.ADBE Position",
+            "--keyframes-file",
+            str(keyframes_path),
+            "--interp",
+            "linear",
+        ]
+    )
+    assert run_command(args) == 0
+    assert captured == {
+        "property_path": "ADBE Transform Group.ADBE Position",
+        "times": [0, 1],
+        "values": [[0, 0], [100, 50]],
+        "interp": "linear",
+        "ease": None,
+        "simplify": None,
+        "fit_ease": False,
+        "layer_id": 2,
+        "layer_name": None,
+        "layer_uid": None,
+    }
+
+
+def test_build_parser_parses_keyframes_selectors() -> None:
+    args = build_parser().parse_args(
+        [
+            "keyframes",
+            "--layer-id",
+            "1",
+            "--layer-id",
+            "3",
+            "--layer-name",
+            "Ball",
+            "--property-path",
+            "ADBE Transform Group.ADBE Position",
+        ]
+    )
+    assert args.command == "keyframes"
+    assert args.layer_id == [1, 3]
+    assert args.layer_name == ["Ball"]
+    assert args.property_path == ["ADBE Transform Group.ADBE Position"]
+
+
 def test_build_parser_parses_add_essential_property() -> None:
     parser = build_parser()
     args = parser.parse_args(
@@ -371,6 +681,7 @@ def test_build_parser_parses_apply_scene() -> None:
     assert args.scene_file == "examples/scene.example.json"
     assert args.validate_only is True
     assert args.mode == "merge"
+    assert args.fast is False
 
 
 def test_build_parser_parses_apply_scene_mode() -> None:
@@ -382,12 +693,31 @@ def test_build_parser_parses_apply_scene_mode() -> None:
             "examples/scene.example.json",
             "--mode",
             "clear-all",
+            "--fast",
         ]
     )
     assert args.command == "apply-scene"
     assert args.scene_file == "examples/scene.example.json"
     assert args.validate_only is False
     assert args.mode == "clear-all"
+    assert args.fast is True
+
+
+def test_build_parser_parses_batch() -> None:
+    parser = build_parser()
+    args = parser.parse_args(["batch", "--file", "ops.jsonl", "--output", "out.jsonl", "--stop-on-error"])
+    assert args.command == "batch"
+    assert args.file == "ops.jsonl"
+    assert args.output == "out.jsonl"
+    assert args.stop_on_error is True
+    assert args.max_workers == 4
+
+
+def test_parse_command_raises_instead_of_exiting() -> None:
+    with pytest.raises(CommandParseError):
+        parse_command(["set-cti"])
+    with pytest.raises(CommandParseError):
+        parse_command(["layers", "--help"])
 
 
 def test_run_command_returns_2_for_unknown_command(capsys) -> None:
@@ -396,3 +726,96 @@ def test_run_command_returns_2_for_unknown_command(capsys) -> None:
     captured = capsys.readouterr()
     assert code == 2
     assert "Unknown command" in captured.err
+
+
+def test_run_command_writes_trace_file(monkeypatch, tmp_path) -> None:
+    class TimedResponse:
+        headers = {"Server-Timing": "encode;dur=0.10, total;dur=0.50"}
+        url = "http://x/health"
+        status_code = 200
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict:
+            return {"status": "ok"}
+
+    monkeypatch.setattr(requests, "get", lambda url, timeout: TimedResponse())
+
+    trace_path = tmp_path / "trace.json"
+    args = build_parser().parse_args(["--base-url", "http://x", "--trace-file", str(trace_path), "health"])
+    assert run_command(args, startup_ms=12.0) == 0
+
+    report = json.loads(trace_path.read_text(encoding="utf-8"))
+    assert report["command"] == "health"
+    assert report["startupMs"] == 12.0
+    assert report["requests"][0]["server"] == {"encode": 0.1, "total": 0.5}
+
+
+def test_run_command_traces_batch_operations(monkeypatch, tmp_path) -> None:
+    class TimedResponse:
+        headers = {"Server-Timing": "total;dur=0.50"}
+        url = "http://x/health"
+        status_code = 200
+
+        def raise_for_status(self) -> None:
+            return None
+
+        def json(self) -> dict:
+            return {"status": "ok"}
+
+    monkeypatch.setattr(requests.Session, "get", lambda self, url, timeout: TimedResponse())
+
+    ops_path = tmp_path / "ops.jsonl"
+    ops_path.write_text('["health"]\n["health"]\n', encoding="utf-8")
+    trace_path = tmp_path / "trace.json"
+    args = build_parser().parse_args(
+        [
+            "--base-url",
+            "http://x",
+            "--trace-file",
+            str(trace_path),
+            "batch",
+            "--file",
+            str(ops_path),
+            "--output",
+            str(tmp_path / "out.jsonl"),
+        ]
+    )
+    assert run_command(args) == 0
+
+    report = json.loads(trace_path.read_text(encoding="utf-8"))
+    assert report["command"] == "batch"
+    assert len(report["requests"]) == 2
+    assert all(entry["server"] == {"total": 0.5} for entry in report["requests"])
+
+
+def test_run_command_import_footage_passes_paths_and_folder(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_import_footage(self, paths: Any, **kwargs: Any) -> dict[str, Any]:
+        captured["paths"] = paths
+        captured.update(kwargs)
+        return {"importedCount": len(paths)}
+
+    monkeypatch.setattr("ae_cli.client.AEClient.import_footage", fake_import_footage)
+    args = build_parser().parse_args(
+        ["--base-url", "http://x", "import-footage", "a.mov", "b.png", "--folder", "Assets", "--max-workers", "2"]
+    )
+    assert run_command(args) == 0
+    assert captured == {"paths": ["a.mov", "b.png"], "folder": "Assets", "max_workers": 2}
+
+
+def test_run_command_list_comps_passes_filters(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_list_comps(self, **kwargs: Any) -> list[dict[str, Any]]:
+        captured.update(kwargs)
+        return []
+
+    monkeypatch.setattr("ae_cli.client.AEClient.list_comps", fake_list_comps)
+    args = build_parser().parse_args(
+        ["--base-url", "http://x", "list-comps", "--name-prefix", "SH", "--folder", "Shots/Act 1", "--limit", "10"]
+    )
+    assert run_command(args) == 0
+    assert captured == {"name_prefix": "SH", "name_regex": None, "folder": "Shots/Act 1", "offset": None, "limit": 10}
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
+import io
+import json
 from typing import Any
 
+import pytest
 import requests
 
-from ae_cli.client import AEBridgeError, AEClient
+from ae_cli.client import AEBridgeError, AEClient, _iter_sse_events, _parse_server_timing, hash_files
 
 
 class DummyResponse:
@@ -20,6 +25,11 @@ class DummyResponse:
         return self._payload
 
 
+def posted_json(kwargs: dict[str, Any]) -> Any:
+    """Return the JSON body of a fake ``requests.post`` call, sent as ``json=`` or encoded ``data=``."""
+    return kwargs["json"] if "json" in kwargs else json.loads(kwargs["data"])
+
+
 def test_handle_response_returns_data_payload() -> None:
     client = AEClient()
     response = DummyResponse({"status": "success", "data": [{"id": 1}]})
@@ -114,6 +124,76 @@ def test_get_properties_supports_layer_name(monkeypatch) -> None:
     assert captured["params"] == [("layerName", "Control")]
 
 
+def test_get_properties_prefers_layer_uid(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_get(url: str, params: Any, timeout: float) -> DummyResponse:
+        captured["params"] = params
+        return DummyResponse({"status": "success", "data": []})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    AEClient(base_url="http://127.0.0.1:8080", timeout=5.0).get_properties(layer_id=3, layer_uid=812)
+    assert captured["params"] == [("layerUid", "812")]
+
+
+def test_get_layers_builds_filter_params(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_get(url: str, params: Any, timeout: float) -> DummyResponse:
+        captured["url"] = url
+        captured["params"] = params
+        return DummyResponse({"status": "success", "data": {"count": 0, "id": []}})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    client = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0)
+    client.get_layers(
+        layer_types=["text", ""],
+        name_prefix="LT_",
+        name_regex="^LT_[0-9]+$",
+        scene_managed=False,
+        start_index=10,
+        end_index=200,
+        columns=True,
+    )
+
+    assert captured["url"] == "http://127.0.0.1:8080/layers"
+    assert captured["params"] == [
+        ("type", "text"),
+        ("namePrefix", "LT_"),
+        ("nameRegex", "^LT_[0-9]+$"),
+        ("sceneManaged", "false"),
+        ("startIndex", 10),
+        ("endIndex", 200),
+        ("format", "columns"),
+    ]
+
+
+def test_list_comps_builds_filter_and_page_params(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_get(url: str, params: Any, timeout: float) -> DummyResponse:
+        captured["url"] = url
+        captured["params"] = params
+        return DummyResponse(
+            {"status": "success", "data": {"comps": [], "total": 0, "offset": 50, "nextOffset": None}}
+        )
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    result = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0).list_comps(
+        name_regex="^SH[0-9]+$",
+        folder="",
+        offset=50,
+        limit=25,
+    )
+
+    assert result["nextOffset"] is None
+    assert captured["url"] == "http://127.0.0.1:8080/comps"
+    assert captured["params"] == [("nameRegex", "^SH[0-9]+$"), ("folder", ""), ("offset", 50), ("limit", 25)]
+
+
 def test_get_expression_errors_calls_expected_endpoint(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
@@ -131,10 +211,141 @@ def test_get_expression_errors_calls_expected_endpoint(monkeypatch) -> None:
     assert captured["timeout"] == 5.0
 
 
+def test_parse_server_timing_reads_durations() -> None:
+    header = "parse;dur=0.40, queue;dur=12.5, host;desc=\"ExtendScript\";dur=30, bogus;dur=x, total"
+    assert _parse_server_timing(header) == {"parse": 0.4, "queue": 12.5, "host": 30.0}
+    assert _parse_server_timing(None) == {}
+
+
+def test_client_records_server_timing_when_tracing(monkeypatch) -> None:
+    class TimedResponse(DummyResponse):
+        headers = {"Server-Timing": "queue;dur=2.00, host;dur=5.50, total;dur=9.00"}
+        url = "http://127.0.0.1:8080/comps"
+        status_code = 200
+
+    def fake_get(url: str, timeout: float) -> DummyResponse:
+        return TimedResponse({"status": "success", "data": []})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    client = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0, trace=True)
+    client.list_comps()
+
+    assert client.timings == [
+        {
+            "method": None,
+            "url": "http://127.0.0.1:8080/comps",
+            "statusCode": 200,
+            "clientMs": None,
+            "server": {"queue": 2.0, "host": 5.5, "total": 9.0},
+        }
+    ]
+
+
+def test_metrics_calls_metrics_endpoint(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_get(url: str, timeout: float) -> DummyResponse:
+        captured["url"] = url
+        return DummyResponse({"status": "success", "data": {"queue": {"depth": 2, "maxDepth": 64}}})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    client = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0)
+    assert client.metrics() == {"queue": {"depth": 2, "maxDepth": 64}}
+    assert captured["url"] == "http://127.0.0.1:8080/metrics"
+
+
+def test_iter_sse_events_parses_stream() -> None:
+    lines = [
+        "retry: 3000",
+        "",
+        ": ping",
+        "",
+        "id: 3",
+        "event: selectionChanged",
+        'data: {"compId": 1, "selectedLayers": []}',
+        "",
+        "data: plain",
+        "",
+    ]
+    events = list(_iter_sse_events(lines))
+    assert events == [
+        {"id": "3", "event": "selectionChanged", "data": {"compId": 1, "selectedLayers": []}},
+        {"id": "3", "event": "message", "data": "plain"},
+    ]
+
+
+def test_events_streams_from_events_endpoint(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    class StreamResponse(DummyResponse):
+        closed = False
+
+        def iter_lines(self, decode_unicode: bool = False):
+            captured["decode_unicode"] = decode_unicode
+            return iter(["id: 1", "event: mutation", 'data: {"operation": "addLayer"}', ""])
+
+        def close(self) -> None:
+            StreamResponse.closed = True
+
+    def fake_get(url: str, stream: bool, timeout: Any) -> DummyResponse:
+        captured["url"] = url
+        captured["stream"] = stream
+        captured["timeout"] = timeout
+        return StreamResponse(None)
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    client = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0)
+    events = list(client.events(read_timeout=30.0))
+
+    assert captured["url"] == "http://127.0.0.1:8080/events"
+    assert captured["stream"] is True
+    assert captured["timeout"] == (5.0, 30.0)
+    assert captured["decode_unicode"] is True
+    assert events == [{"id": "1", "event": "mutation", "data": {"operation": "addLayer"}}]
+    assert StreamResponse.closed is True
+
+
+def test_events_decodes_non_ascii_payloads_as_utf8(monkeypatch) -> None:
+    def fake_get(url: str, stream: bool, timeout: Any) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "text/event-stream"
+        response.raw = io.BytesIO('event: mutation\ndata: {"layerName": "タイトル"}\n\n'.encode("utf-8"))
+        return response
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    events = list(AEClient().events())
+
+    assert events == [{"id": None, "event": "mutation", "data": {"layerName": "タイトル"}}]
+
+
+def test_client_uses_attached_session(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    class FakeSession:
+        def get(self, url: str, timeout: float) -> DummyResponse:
+            captured["url"] = url
+            return DummyResponse({"status": "success", "data": []})
+
+    def fail_get(*_args: Any, **_kwargs: Any) -> DummyResponse:
+        raise AssertionError("module-level requests.get should not be used")
+
+    monkeypatch.setattr(requests, "get", fail_get)
+
+    client = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0, session=FakeSession())
+    assert client.list_comps() == []
+    assert captured["url"] == "http://127.0.0.1:8080/comps"
+
+
 def test_create_comp_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -166,7 +377,8 @@ def test_create_comp_posts_expected_payload(monkeypatch) -> None:
 def test_set_keyframe_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -192,10 +404,464 @@ def test_set_keyframe_posts_expected_payload(monkeypatch) -> None:
     }
 
 
+def test_set_keyframes_posts_batch_payload(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["url"] = url
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {"keyframeCount": 3}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    client = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0)
+    client.set_keyframes(
+        "ADBE Transform Group.ADBE Opacity",
+        times=(0.0, 0.5, 1.0),
+        values=[0, 50, 100],
+        layer_name="Title",
+        interp="bezier",
+        ease=[0, 66],
+        out_interp="hold",
+    )
+
+    assert captured["url"] == "http://127.0.0.1:8080/keyframes/batch"
+    assert captured["json"] == {
+        "layerName": "Title",
+        "propertyPath": "ADBE Transform Group.ADBE Opacity",
+        "times": [0.0, 0.5, 1.0],
+        "values": [0, 50, 100],
+        "inInterp": "bezier",
+        "outInterp": "hold",
+        "easeIn": [0, 66],
+        "easeOut": [0, 66],
+    }
+
+
+def test_add_layers_posts_batch_with_camel_case_specs(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["url"] = url
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {"createdCount": 2}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    result = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0).add_layers(
+        [
+            {"layer_type": "text", "name": "Title", "text": "Hello"},
+            {"layerType": "shape", "shape_type": "rect", "shapeFillColor": (255, 0, 0), "shape_roundness": None},
+        ]
+    )
+
+    assert result == {"createdCount": 2}
+    assert captured["url"] == "http://127.0.0.1:8080/layers/batch"
+    assert captured["json"] == {
+        "layers": [
+            {"layerType": "text", "name": "Title", "text": "Hello"},
+            {"layerType": "shape", "shapeType": "rect", "shapeFillColor": [255, 0, 0]},
+        ]
+    }
+
+
+def test_add_layers_requires_layer_type() -> None:
+    with pytest.raises(ValueError, match=r"layers\[1\] is missing layer_type"):
+        AEClient().add_layers([{"layer_type": "null"}, {"name": "No type"}])
+
+
+def test_reorder_layers_posts_uid_order(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["url"] = url
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {"moveCount": 1}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    result = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0).reorder_layers(["12", 7, "9"])
+
+    assert result == {"moveCount": 1}
+    assert captured["url"] == "http://127.0.0.1:8080/layer-order/batch"
+    assert captured["json"] == {"order": ["12", "7", "9"]}
+
+
+def test_reorder_layers_rejects_duplicate_uids() -> None:
+    with pytest.raises(ValueError, match="twice"):
+        AEClient().reorder_layers(["3", "4", "3"])
+
+
+def test_parent_layers_posts_links_by_uid_and_index(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["url"] = url
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {"linkCount": 3}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    result = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0).parent_layers({"12": "7", 4: 1, "9": None})
+
+    assert result == {"linkCount": 3}
+    assert captured["url"] == "http://127.0.0.1:8080/layer-parent/batch"
+    assert captured["json"] == {
+        "links": [
+            {"childLayerUid": "12", "parentLayerUid": "7"},
+            {"childLayerId": 4, "parentLayerId": 1},
+            {"childLayerUid": "9"},
+        ]
+    }
+
+
+def test_parent_layers_rejects_cycles_before_posting(monkeypatch) -> None:
+    monkeypatch.setattr(requests, "post", lambda *args, **kwargs: pytest.fail("should not post"))
+    with pytest.raises(ValueError, match="cycle"):
+        AEClient().parent_layers({"1": "2", "2": "3", "3": "1"})
+    with pytest.raises(ValueError, match="cycle"):
+        AEClient().parent_layers({"5": "5"})
+
+
+def test_add_shape_paths_parses_svg_and_targets_layer(monkeypatch) -> None:
+    pytest.importorskip("numpy")
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["url"] = url
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {"groupCount": 1}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    result = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0).add_shape_paths(
+        [{"d": "M0 0 H10 V10 Z", "fill_color": [255, 0, 0]}],
+        layer_uid="42",
+    )
+
+    assert result == {"groupCount": 1}
+    assert captured["url"] == "http://127.0.0.1:8080/shape-paths"
+    assert captured["json"] == {
+        "layerUid": "42",
+        "paths": [
+            {
+                "fillColor": [255, 0, 0],
+                "contours": [
+                    {
+                        "vertices": [[0.0, 0.0], [10.0, 0.0], [10.0, 10.0]],
+                        "inTangents": [[0.0, 0.0]] * 3,
+                        "outTangents": [[0.0, 0.0]] * 3,
+                        "closed": True,
+                    }
+                ],
+            }
+        ],
+    }
+
+
+def test_import_footage_posts_absolute_paths_with_hashes(monkeypatch, tmp_path) -> None:
+    first = tmp_path / "a.png"
+    second = tmp_path / "b.png"
+    first.write_bytes(b"first")
+    second.write_bytes(b"second")
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["url"] = url
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {"importedCount": 2}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    result = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0).import_footage(
+        [first, second], folder="Assets", max_workers=2
+    )
+
+    assert result == {"importedCount": 2}
+    assert captured["url"] == "http://127.0.0.1:8080/footage/import"
+    assert captured["json"] == {
+        "files": [
+            {"path": str(first), "hash": hashlib.sha256(b"first").hexdigest()},
+            {"path": str(second), "hash": hashlib.sha256(b"second").hexdigest()},
+        ],
+        "folder": "Assets",
+    }
+
+
+def test_import_footage_rejects_missing_files_before_posting(monkeypatch, tmp_path) -> None:
+    monkeypatch.setattr(requests, "post", lambda *args, **kwargs: pytest.fail("should not post"))
+    with pytest.raises(ValueError, match="Not a file"):
+        AEClient().import_footage([tmp_path / "missing.mov"])
+
+
+def test_hash_files_keeps_input_order(tmp_path) -> None:
+    paths = []
+    for index in range(6):
+        path = tmp_path / f"{index}.bin"
+        path.write_bytes(bytes([index]) * (index + 1))
+        paths.append(path)
+    expected = [hashlib.sha256(path.read_bytes()).hexdigest() for path in paths]
+    assert hash_files(paths, max_workers=3) == expected
+    assert hash_files(paths, max_workers=1) == expected
+
+
+def test_apply_scene_converts_shape_paths_on_a_copy(monkeypatch) -> None:
+    pytest.importorskip("numpy")
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+    scene = {"layers": [{"id": "logo", "type": "shape", "shapePaths": [{"d": "M0 0 L5 5"}]}]}
+
+    AEClient(base_url="http://127.0.0.1:8080", timeout=5.0, gzip_threshold=None).apply_scene(scene)
+
+    sent = captured["json"]["scene"]["layers"][0]["shapePaths"][0]
+    assert sent["contours"][0]["vertices"] == [[0.0, 0.0], [5.0, 5.0]]
+    assert scene["layers"][0]["shapePaths"] == [{"d": "M0 0 L5 5"}]
+
+
+def test_set_texts_posts_one_entry_per_layer(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["url"] = url
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {"updatedCount": 2, "notFound": []}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+    client = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0)
+
+    result = client.set_texts({"Title": "Titre", 3: 42})
+    assert result == {"updatedCount": 2, "notFound": []}
+    assert captured["url"] == "http://127.0.0.1:8080/texts/batch"
+    assert captured["json"] == {"texts": [{"layerName": "Title", "text": "Titre"}, {"layerId": 3, "text": "42"}]}
+
+    client.set_texts({"812": "Hola"}, by="uid")
+    assert captured["json"] == {"texts": [{"layerUid": "812", "text": "Hola"}]}
+
+
+def test_apply_effects_posts_layers_and_normalized_params(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["url"] = url
+        captured["json"] = json
+        captured["timeout"] = timeout
+        return DummyResponse({"status": "success", "data": {"effectsAdded": 4}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    result = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0).apply_effects(
+        ["Card 1", 4],
+        [
+            {"match_name": "ADBE Gaussian Blur 2", "params": {"Blurriness": 12, "ADBE Gaussian Blur 2-0003": True}},
+            {"matchName": "ADBE Tint", "name": "House Tint", "params": [{"property_index": 3, "value": 50}]},
+        ],
+    )
+
+    assert result == {"effectsAdded": 4}
+    assert captured["url"] == "http://127.0.0.1:8080/effects/batch"
+    assert captured["json"] == {
+        "layers": [{"layerName": "Card 1"}, {"layerId": 4}],
+        "effects": [
+            {
+                "matchName": "ADBE Gaussian Blur 2",
+                "params": [
+                    {"propertyPath": "Blurriness", "value": 12},
+                    {"matchName": "ADBE Gaussian Blur 2-0003", "value": True},
+                ],
+            },
+            {"matchName": "ADBE Tint", "name": "House Tint", "params": [{"propertyIndex": 3, "value": 50}]},
+        ],
+    }
+
+
+def test_apply_effects_requires_match_name() -> None:
+    with pytest.raises(ValueError, match="match_name"):
+        AEClient().apply_effects(["A"], [{"params": {"Blurriness": 1}}])
+
+
+def test_set_keyframes_accepts_numpy_arrays(monkeypatch) -> None:
+    np = pytest.importorskip("numpy")
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {"keyframeCount": 4}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    times = np.linspace(0.0, 1.5, 4)
+    values = np.column_stack([times * 100, times * 10])
+    AEClient().set_keyframes("ADBE Transform Group.ADBE Position", times, values, layer_id=1)
+
+    assert captured["json"]["times"] == [0.0, 0.5, 1.0, 1.5]
+    assert captured["json"]["values"] == [[0.0, 0.0], [50.0, 5.0], [100.0, 10.0], [150.0, 15.0]]
+
+
+PACKED_POSITION_KEYS = {
+    "layers": [
+        {
+            "layerId": 1,
+            "layerUid": 10,
+            "layerName": "Ball",
+            "properties": [
+                {
+                    "path": "ADBE Transform Group.ADBE Position",
+                    "name": "Position",
+                    "count": 2,
+                    "dimensions": 2,
+                    "easeDimensions": 1,
+                    "numeric": True,
+                    "times": [0, 1],
+                    "values": [0, 0, 100, 50],
+                    "inInterp": ["linear", "bezier"],
+                    "outInterp": ["bezier", "linear"],
+                    "easeIn": [0, 33, 0, 66],
+                    "easeOut": [0, 33, 0, 33],
+                    "inTangents": [0, 0, -10, 0],
+                    "outTangents": [10, 0, 0, 0],
+                },
+                {"path": "Missing", "error": "Property not found."},
+            ],
+        }
+    ]
+}
+
+
+def test_get_keyframes_sends_repeated_params(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_get(url: str, params: Any, timeout: float) -> DummyResponse:
+        captured["url"] = url
+        captured["params"] = params
+        return DummyResponse({"status": "success", "data": PACKED_POSITION_KEYS})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    data = AEClient().get_keyframes(
+        layer_ids=[1, 2],
+        layer_names=["Ball"],
+        property_paths=["ADBE Transform Group.ADBE Position"],
+    )
+
+    assert captured["url"] == "http://127.0.0.1:8080/keyframes"
+    assert captured["params"] == [
+        ("layerId", 1),
+        ("layerId", 2),
+        ("layerName", "Ball"),
+        ("propertyPath", "ADBE Transform Group.ADBE Position"),
+    ]
+    assert data == PACKED_POSITION_KEYS
+    with pytest.raises(ValueError):
+        AEClient().get_keyframes(property_paths=["ADBE Transform Group.ADBE Position"])
+
+
+def test_get_keyframes_as_numpy_reshapes_packed_arrays(monkeypatch) -> None:
+    np = pytest.importorskip("numpy")
+
+    def fake_get(url: str, params: Any, timeout: float) -> DummyResponse:
+        return DummyResponse({"status": "success", "data": json.loads(json.dumps(PACKED_POSITION_KEYS))})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    data = AEClient().get_keyframes(layer_ids=[1], as_numpy=True)
+    position, missing = data["layers"][0]["properties"]
+
+    assert position["values"].shape == (2, 2)
+    assert np.array_equal(position["values"][1], [100.0, 50.0])
+    assert position["easeIn"].shape == (2, 1, 2)
+    assert position["easeIn"][1, 0, 1] == 66.0
+    assert position["inTangents"].shape == (2, 2)
+    assert list(position["outInterp"]) == ["bezier", "linear"]
+    assert missing == {"path": "Missing", "error": "Property not found."}
+
+
+def test_get_keyframes_as_numpy_handles_properties_without_keys(monkeypatch) -> None:
+    pytest.importorskip("numpy")
+    empty = {
+        "path": "ADBE Transform Group.ADBE Position",
+        "name": "Position",
+        "count": 0,
+        "dimensions": 2,
+        "easeDimensions": 1,
+        "numeric": True,
+        "times": [],
+        "values": [],
+        "inInterp": [],
+        "outInterp": [],
+        "easeIn": [],
+        "easeOut": [],
+        "inTangents": [],
+        "outTangents": [],
+    }
+    payload = {"layers": [{"layerId": 1, "layerUid": 10, "layerName": "Ball", "properties": [empty]}]}
+
+    def fake_get(url: str, params: Any, timeout: float) -> DummyResponse:
+        return DummyResponse({"status": "success", "data": payload})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+
+    data = AEClient().get_keyframes(layer_ids=[1], as_numpy=True)
+    position = data["layers"][0]["properties"][0]
+
+    assert position["values"].shape == (0, 2)
+    assert position["easeIn"].shape == (0, 1, 2)
+    assert position["inTangents"].shape == (0, 2)
+    assert position["outTangents"].shape == (0, 2)
+
+
+def test_set_keyframes_simplifies_before_upload(monkeypatch) -> None:
+    pytest.importorskip("numpy")
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {"keyframeCount": len(json["times"])}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    times = [index / 30.0 for index in range(61)]
+    values = [index * 2.0 for index in range(61)]
+    result = AEClient().set_keyframes(
+        "ADBE Transform Group.ADBE Opacity", times, values, layer_id=1, simplify=0.1, fit_ease=True
+    )
+
+    assert captured["json"]["times"] == [0.0, 2.0]
+    assert captured["json"]["values"] == [0.0, 120.0]
+    assert captured["json"]["inInterp"] == captured["json"]["outInterp"] == "bezier"
+    assert len(captured["json"]["keyEaseIn"]) == 2
+    assert result["simplification"]["before"] == 61
+    assert result["simplification"]["after"] == 2
+
+
+def test_set_keyframes_rejects_mismatched_lengths() -> None:
+    client = AEClient()
+    with pytest.raises(ValueError, match="differ in length"):
+        client.set_keyframes("ADBE Transform Group.ADBE Opacity", [0, 1], [100], layer_id=1)
+    with pytest.raises(ValueError, match="must not be empty"):
+        client.set_keyframes("ADBE Transform Group.ADBE Opacity", [], [], layer_id=1)
+
+
 def test_add_essential_property_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -222,7 +888,8 @@ def test_add_essential_property_posts_expected_payload(monkeypatch) -> None:
 def test_add_layer_posts_shape_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -265,7 +932,8 @@ def test_add_layer_posts_shape_payload(monkeypatch) -> None:
 def test_add_shape_repeater_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -306,7 +974,8 @@ def test_add_shape_repeater_posts_expected_payload(monkeypatch) -> None:
 def test_set_keyframe_posts_easing_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -343,7 +1012,8 @@ def test_set_keyframe_posts_easing_payload(monkeypatch) -> None:
 def test_set_in_out_point_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -363,10 +1033,26 @@ def test_set_in_out_point_posts_expected_payload(monkeypatch) -> None:
     }
 
 
+def test_set_in_out_point_keeps_positional_order(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {"layerId": 1}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    AEClient().set_in_out_point(1, None, 2.0)
+
+    assert captured["json"] == {"layerId": 1, "inPoint": 2.0}
+
+
 def test_move_layer_time_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -388,7 +1074,8 @@ def test_move_layer_time_posts_expected_payload(monkeypatch) -> None:
 def test_apply_scene_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -420,7 +1107,8 @@ def test_apply_scene_posts_expected_payload(monkeypatch) -> None:
 def test_apply_scene_posts_mode_override(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -443,10 +1131,35 @@ def test_apply_scene_posts_mode_override(monkeypatch) -> None:
     }
 
 
+def test_fast_apply_flag_is_sent_only_when_requested(monkeypatch) -> None:
+    bodies: list[Any] = []
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        bodies.append(json)
+        return DummyResponse({"status": "success", "data": {}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    client = AEClient(gzip_threshold=None)
+    client.apply_scene(scene={"layers": []}, fast=True)
+    client.set_texts({"Title": "Hello"}, fast=True)
+    client.reorder_layers(["a", "b"])
+    with client.transaction("Fast", fast=True):
+        client.set_cti(1.0)
+
+    assert bodies[0]["fastApply"] is True
+    assert bodies[1] == {"texts": [{"layerName": "Title", "text": "Hello"}], "fastApply": True}
+    assert "fastApply" not in bodies[2]
+    assert bodies[3]["fastApply"] is True
+    assert "fastApply" not in bodies[3]["operations"][0]["body"]
+
+
 def test_move_layer_time_supports_layer_name(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["json"] = json
         return DummyResponse({"status": "success", "data": {"layerId": 2}})
 
@@ -474,7 +1187,8 @@ def test_layer_selector_payload_raises_when_selector_is_invalid() -> None:
 def test_set_cti_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -493,7 +1207,8 @@ def test_set_cti_posts_expected_payload(monkeypatch) -> None:
 def test_set_work_area_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -515,7 +1230,8 @@ def test_set_work_area_posts_expected_payload(monkeypatch) -> None:
 def test_parent_layer_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -534,10 +1250,35 @@ def test_parent_layer_posts_expected_payload(monkeypatch) -> None:
     }
 
 
+def test_structure_calls_send_layer_uids(monkeypatch) -> None:
+    posted: list[tuple[str, Any]] = []
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        posted.append((url.rsplit("/", 1)[-1], json))
+        return DummyResponse({"status": "success", "data": {}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    client = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0)
+    client.parent_layer(child_layer_uid="12", parent_layer_id=1)
+    client.move_layer_order(layer_id=4, layer_uid="12", after_layer_uid="9")
+    client.delete_layer(layer_uid="9")
+    client.precompose(None, "Pre", layer_uids=["12", "9"])
+
+    assert posted == [
+        ("layer-parent", {"childLayerUid": "12", "parentLayerId": 1}),
+        ("layer-order", {"layerUid": "12", "afterLayerUid": "9"}),
+        ("delete-layer", {"layerUid": "9"}),
+        ("precompose", {"name": "Pre", "moveAllAttributes": False, "layerUids": ["12", "9"]}),
+    ]
+
+
 def test_precompose_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -560,7 +1301,8 @@ def test_precompose_posts_expected_payload(monkeypatch) -> None:
 def test_duplicate_layer_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -576,10 +1318,50 @@ def test_duplicate_layer_posts_expected_payload(monkeypatch) -> None:
     assert captured["json"] == {"layerId": 4}
 
 
+def test_duplicate_layer_many_posts_overrides(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured["url"] = url
+        captured["json"] = json
+        return DummyResponse({"status": "success", "data": {"duplicatedCount": 3}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    client = AEClient(base_url="http://127.0.0.1:8080", timeout=5.0)
+    client.duplicate_layer_many(
+        layer_uid="812",
+        count=3,
+        overrides=[
+            {"name": "Row 1", "text": "Alice", "transform": {"position": [960, 200], "anchor_point": [0, 0]}},
+            None,
+            {"property_values": [{"propertyPath": "ADBE Transform Group.ADBE Opacity", "value": 50}]},
+        ],
+    )
+
+    assert captured["url"] == "http://127.0.0.1:8080/duplicate-layer/batch"
+    assert captured["json"] == {
+        "layerUid": "812",
+        "count": 3,
+        "overrides": [
+            {"name": "Row 1", "text": "Alice", "transform": {"position": [960, 200], "anchorPoint": [0, 0]}},
+            None,
+            {"propertyValues": [{"propertyPath": "ADBE Transform Group.ADBE Opacity", "value": 50}]},
+        ],
+    }
+
+
+def test_duplicate_layer_many_rejects_more_overrides_than_count() -> None:
+    with pytest.raises(ValueError, match="more entries than count"):
+        AEClient().duplicate_layer_many(layer_id=1, count=1, overrides=[{"name": "A"}, {"name": "B"}])
+
+
 def test_move_layer_order_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -601,7 +1383,8 @@ def test_move_layer_order_posts_expected_payload(monkeypatch) -> None:
 def test_delete_layer_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -620,7 +1403,8 @@ def test_delete_layer_posts_expected_payload(monkeypatch) -> None:
 def test_delete_comp_posts_expected_payload(monkeypatch) -> None:
     captured: dict[str, Any] = {}
 
-    def fake_post(url: str, json: Any, timeout: float) -> DummyResponse:
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
         captured["url"] = url
         captured["json"] = json
         captured["timeout"] = timeout
@@ -634,3 +1418,165 @@ def test_delete_comp_posts_expected_payload(monkeypatch) -> None:
     assert captured["url"] == "http://127.0.0.1:8080/delete-comp"
     assert captured["timeout"] == 5.0
     assert captured["json"] == {"compName": "Main"}
+
+
+def test_adaptive_timeouts_use_latency_stats(monkeypatch, tmp_path) -> None:
+    from ae_cli.latency import LatencyStats
+
+    captured: list[tuple[str, float]] = []
+
+    def fake_get(url: str, timeout: float) -> DummyResponse:
+        captured.append((url, timeout))
+        return DummyResponse({"status": "ok"})
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        captured.append((url, timeout))
+        return DummyResponse({"status": "success", "data": {"status": "success"}})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    stats = LatencyStats(path=tmp_path / "stats.json")
+    client = AEClient(base_url="http://127.0.0.1:8080", timeout=10.0, latency=stats, gzip_threshold=None)
+    client.health()
+    client.apply_scene({"layers": [{"id": str(index), "type": "null"} for index in range(400)]})
+
+    assert captured[0] == ("http://127.0.0.1:8080/health", 2.0)
+    assert captured[1] == ("http://127.0.0.1:8080/scene", 110.0)
+    assert stats.endpoints["GET /health"]["count"] == 1
+    assert stats.endpoints["POST /scene"]["count"] == 1
+
+    stats.save()
+    assert LatencyStats.load(tmp_path / "stats.json").endpoints == stats.endpoints
+
+
+def test_post_gzips_bodies_above_threshold(monkeypatch) -> None:
+    captured: dict[str, Any] = {}
+    health_checks: list[str] = []
+
+    def fake_get(url: str, timeout: float) -> DummyResponse:
+        health_checks.append(url)
+        return DummyResponse({"status": "ok", "requestEncodings": ["gzip"]})
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        captured.update(kwargs)
+        return DummyResponse({"status": "success", "data": {"status": "success"}})
+
+    monkeypatch.setattr(requests, "get", fake_get)
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    client = AEClient(base_url="http://127.0.0.1:8080", timeout=10.0, gzip_threshold=1024, trace=True)
+    client.set_cti(1.0)
+    assert captured == {"data": b'{"time": 1.0}', "headers": {"Content-Type": "application/json"}}
+    assert health_checks == []
+
+    captured.clear()
+    scene = {"layers": [{"id": str(index), "type": "null"} for index in range(200)]}
+    client.apply_scene(scene)
+    client.apply_scene(scene)
+    assert captured["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(captured["data"]))["scene"] == scene
+    assert "gzipMs" in client.timings[-1]
+    assert "gzipMs" not in client.timings[0]
+    assert health_checks == ["http://127.0.0.1:8080/health"]
+
+
+def test_post_sends_uncompressed_to_panels_without_gzip_support(monkeypatch) -> None:
+    captured: list[dict[str, Any]] = []
+
+    monkeypatch.setattr(requests, "get", lambda url, timeout: DummyResponse({"status": "ok"}))
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        captured.append(kwargs)
+        return DummyResponse({"status": "success", "data": {}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    scene = {"layers": [{"id": str(index), "type": "null"} for index in range(200)]}
+    AEClient(gzip_threshold=1024).apply_scene(scene)
+    assert "Content-Encoding" not in captured[0]["headers"]
+    assert json.loads(captured[0]["data"])["scene"] == scene
+
+
+def test_gzip_threshold_reads_environment(monkeypatch) -> None:
+    monkeypatch.setenv("AE_BRIDGE_GZIP_THRESHOLD", "0")
+    assert AEClient().gzip_threshold is None
+    monkeypatch.setenv("AE_BRIDGE_GZIP_THRESHOLD", "2048")
+    assert AEClient().gzip_threshold == 2048
+
+
+def test_transaction_buffers_calls_into_one_batch(monkeypatch) -> None:
+    calls: list[dict[str, Any]] = []
+
+    def fake_post(url: str, timeout: float, **kwargs: Any) -> DummyResponse:
+        json = posted_json(kwargs)
+        calls.append({"url": url, "json": json})
+        return DummyResponse({"status": "success", "data": {"committed": True, "operations": []}})
+
+    monkeypatch.setattr(requests, "post", fake_post)
+
+    client = AEClient(base_url="http://127.0.0.1:8080", gzip_threshold=None)
+    with client.transaction("Retime intro") as txn:
+        queued = client.move_layer_time(1.5, layer_name="Title")
+        client.set_cti(2.0)
+        assert calls == []
+
+    assert queued == {"queued": True, "transaction": "Retime intro", "index": 0}
+    assert calls == [
+        {
+            "url": "http://127.0.0.1:8080/batch",
+            "json": {
+                "label": "Retime intro",
+                "operations": [
+                    {"path": "/layer-time", "body": {"layerName": "Title", "delta": 1.5}},
+                    {"path": "/cti", "body": {"time": 2.0}},
+                ],
+            },
+        }
+    ]
+    assert txn.units == 2
+    assert txn.result == {"committed": True, "operations": []}
+
+
+def test_transaction_discards_calls_when_block_raises(monkeypatch) -> None:
+    monkeypatch.setattr(requests, "post", lambda *args, **kwargs: pytest.fail("nothing should be sent"))
+
+    client = AEClient()
+    with pytest.raises(KeyError):
+        with client.transaction("Broken"):
+            client.set_cti(1.0)
+            raise KeyError("stop")
+
+    assert client._transaction is None
+    with pytest.raises(RuntimeError, match="nested"):
+        with client.transaction("Outer"):
+            with client.transaction("Inner"):
+                pass
+
+
+def test_transaction_failure_raises_with_rollback_details(monkeypatch) -> None:
+    details = {
+        "failedIndex": 1,
+        "rolledBack": True,
+        "operations": [
+            {"index": 0, "path": "/cti", "status": "rolledBack", "elapsedMs": 2},
+            {"index": 1, "path": "/layer-time", "status": "error", "message": "Layer not found", "elapsedMs": 1},
+        ],
+    }
+    monkeypatch.setattr(
+        requests,
+        "post",
+        lambda url, json, timeout: DummyResponse(
+            {"status": "error", "message": "Transaction failed", "details": details}, should_raise=True
+        ),
+    )
+
+    client = AEClient(gzip_threshold=None)
+    with pytest.raises(AEBridgeError) as excinfo:
+        with client.transaction("Retime intro"):
+            client.set_cti(1.0)
+            client.move_layer_time(1.0, layer_name="Missing")
+
+    assert excinfo.value.payload["details"]["rolledBack"] is True
+    assert excinfo.value.payload["details"]["failedIndex"] == 1
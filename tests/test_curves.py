@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ae_cli.curves import simplify_keyframes, simplify_scene_animations  # noqa: E402
+
+
+def test_simplify_drops_collinear_keys() -> None:
+    times = np.arange(0, 31) / 30.0
+    values = np.column_stack([times * 300.0, times * 30.0])
+
+    curve = simplify_keyframes(times, values, tolerance=0.01)
+
+    assert curve.indices == [0, 30]
+    assert curve.values == [[0.0, 0.0], [300.0, 30.0]]
+    assert curve.report() == {"before": 31, "after": 2, "maxError": pytest.approx(0.0, abs=1e-9)}
+
+
+def test_simplify_respects_tolerance_and_ease_reduces_error() -> None:
+    times = np.arange(0, 300) / 30.0
+    values = 100.0 * np.sin(times)
+
+    linear = simplify_keyframes(times, values, tolerance=1.0)
+    eased = simplify_keyframes(times, values, tolerance=1.0, fit_ease=True)
+
+    assert linear.after < 60
+    assert linear.max_error <= 1.0
+    assert eased.indices == linear.indices
+    assert eased.max_error < linear.max_error
+    assert len(eased.ease_in) == eased.after
+    assert len(eased.ease_out[0]) == 1 and len(eased.ease_out[0][0]) == 2
+
+
+def test_simplify_rejects_non_numeric_and_unsorted_input() -> None:
+    with pytest.raises(ValueError):
+        simplify_keyframes([0, 1, 2], ["a", "b", "c"], tolerance=1.0)
+    with pytest.raises(ValueError):
+        simplify_keyframes([0, 2, 1], [0, 1, 2], tolerance=1.0)
+
+
+def test_simplify_scene_animations_reports_totals() -> None:
+    keyframes = [{"time": index / 10.0, "value": [index * 10.0, 0.0], "outInterp": "linear"} for index in range(11)]
+    scene = {
+        "layers": [
+            {"id": "a", "type": "null", "animations": [{"propertyPath": "ADBE Transform Group.ADBE Position", "keyframes": keyframes}]},
+            {"id": "b", "type": "text", "animations": [{"propertyPath": "Text", "keyframes": [{"time": t, "value": "x"} for t in range(3)]}]},
+        ]
+    }
+
+    report = simplify_scene_animations(scene, tolerance=0.5)
+
+    assert report == {"animations": 1, "before": 11, "after": 2, "maxError": pytest.approx(0.0, abs=1e-9), "skipped": 1}
+    assert [key["time"] for key in scene["layers"][0]["animations"][0]["keyframes"]] == [0.0, 1.0]
+    assert scene["layers"][0]["animations"][0]["keyframes"][0]["outInterp"] == "linear"
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from ae_cli.latency import LatencyStats, policy_for
+
+
+def test_timeout_without_samples_uses_policy_default() -> None:
+    stats = LatencyStats()
+    assert stats.timeout_for("GET /health") == 2.0
+    assert stats.timeout_for("GET /layers") == policy_for("GET /layers").default
+    assert stats.timeout_for("POST /cti") == policy_for("POST /cti").default
+
+
+def test_timeout_follows_high_percentile_within_bounds() -> None:
+    stats = LatencyStats()
+    for _ in range(50):
+        stats.record("GET /layers", 150.0)
+    assert stats.percentile("GET /layers", 0.99) == 200.0
+    assert stats.timeout_for("GET /layers") == 2.0
+
+    for _ in range(50):
+        stats.record("GET /properties", 9000.0)
+    assert stats.timeout_for("GET /properties") == 20.0
+
+    for _ in range(10):
+        stats.record("GET /health", 1.0)
+    assert stats.timeout_for("GET /health") == 0.5
+
+
+def test_scene_timeout_scales_with_layer_count() -> None:
+    stats = LatencyStats()
+    for _ in range(10):
+        stats.record("POST /scene", 4000.0, units=100)
+    assert stats.percentile("POST /scene", 0.99) == 50.0
+    assert stats.timeout_for("POST /scene", units=100) == 10.0
+    assert stats.timeout_for("POST /scene", units=1000) == 100.0
+    assert stats.timeout_for("POST /scene", units=100000) == policy_for("POST /scene").ceiling
+
+
+def test_load_ignores_corrupt_stats_file(tmp_path) -> None:
+    path = tmp_path / "stats.json"
+    path.write_text("{not json", encoding="utf-8")
+    stats = LatencyStats.load(path)
+    assert stats.endpoints == {}
+    stats.record("GET /health", 3.0)
+    stats.save()
+    assert LatencyStats.load(path).endpoints["GET /health"]["count"] == 1
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from ae_cli.svg_paths import normalize_scene_shape_paths, normalize_shape_path, parse_svg_path  # noqa: E402
+
+
+def test_parse_polygon_with_relative_commands() -> None:
+    contours = parse_svg_path("M10,10 h20 v20 l-20 0 z")
+
+    assert contours == [
+        {
+            "vertices": [[10.0, 10.0], [30.0, 10.0], [30.0, 30.0], [10.0, 30.0]],
+            "inTangents": [[0.0, 0.0]] * 4,
+            "outTangents": [[0.0, 0.0]] * 4,
+            "closed": True,
+        }
+    ]
+
+
+def test_parse_cubic_drops_duplicate_closing_vertex() -> None:
+    (contour,) = parse_svg_path("M0 0 C10 0 20 10 20 20 S0 10 0 0 Z")
+
+    assert contour["vertices"] == [[0.0, 0.0], [20.0, 20.0]]
+    assert contour["outTangents"] == [[10.0, 0.0], [0.0, 10.0]]
+    # The closing segment's second control point becomes the first vertex's in tangent.
+    assert contour["inTangents"] == [[0.0, 10.0], [0.0, -10.0]]
+
+
+def test_parse_quadratic_raises_to_cubic() -> None:
+    (contour,) = parse_svg_path("M0 0 Q30 30 60 0")
+
+    assert contour["closed"] is False
+    assert contour["outTangents"][0] == pytest.approx([20.0, 20.0])
+    assert contour["inTangents"][1] == pytest.approx([-20.0, 20.0])
+
+
+def test_parse_arc_circle_matches_radius() -> None:
+    (contour,) = parse_svg_path("M10 0 A10 10 0 1 1 -10 0 A10 10 0 1 1 10 0 Z")
+
+    assert len(contour["vertices"]) == 4
+    for vertex in contour["vertices"]:
+        assert math.hypot(*vertex) == pytest.approx(10.0)
+    handle = 4.0 / 3.0 * math.tan(math.pi / 8) * 10.0
+    assert math.hypot(*contour["outTangents"][0]) == pytest.approx(handle)
+
+
+def test_parse_compact_arc_flags_and_multiple_subpaths() -> None:
+    contours = parse_svg_path("M0 0a5 5 0 011 1zM20 20l5 5")
+
+    assert len(contours) == 2
+    assert contours[0]["vertices"][-1] == pytest.approx([1.0, 1.0])
+    assert contours[1]["vertices"] == [[20.0, 20.0], [25.0, 25.0]]
+
+
+def test_parse_rejects_garbage() -> None:
+    with pytest.raises(ValueError, match="path command"):
+        parse_svg_path("M0 0 X5 5")
+
+
+def test_normalize_shape_path_accepts_arrays_and_camel_cases_keys() -> None:
+    group = normalize_shape_path(
+        {"contours": [{"vertices": np.array([[0, 0], [10, 0], [10, 10]]), "closed": True}], "fill_rule": "evenodd"}
+    )
+
+    assert group == {
+        "contours": [
+            {
+                "vertices": [[0, 0], [10, 0], [10, 10]],
+                "closed": True,
+                "inTangents": [[0.0, 0.0]] * 3,
+                "outTangents": [[0.0, 0.0]] * 3,
+            }
+        ],
+        "fillRule": "evenodd",
+    }
+    with pytest.raises(ValueError, match="exactly one of d or contours"):
+        normalize_shape_path({"name": "Empty"})
+
+
+def test_normalize_scene_shape_paths_converts_svg_strings() -> None:
+    scene = {"layers": [{"type": "shape", "shapePaths": [{"d": "M0 0 L10 0 L0 10 Z", "fillColor": [1, 0, 0]}]}]}
+
+    assert normalize_scene_shape_paths(scene) == 1
+    group = scene["layers"][0]["shapePaths"][0]
+    assert "d" not in group
+    assert group["fillColor"] == [1, 0, 0]
+    assert group["contours"][0]["vertices"] == [[0.0, 0.0], [10.0, 0.0], [0.0, 10.0]]
@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import os
+import socket
+
+import pytest
+
+from ae_cli.client import AEClient
+from ae_cli.transport import default_socket_path, resolve_base_url, unix_socket_path
+from benchmarks.stub_bridge import StubBridge
+
+needs_unix_sockets = pytest.mark.skipif(not hasattr(socket, "AF_UNIX"), reason="Unix domain sockets unavailable")
+
+
+def test_unix_socket_path_parses_unix_urls() -> None:
+    assert unix_socket_path("unix:///tmp/bridge.sock") == "/tmp/bridge.sock"
+    assert unix_socket_path("http://127.0.0.1:8080") is None
+    with pytest.raises(ValueError):
+        unix_socket_path("unix://")
+
+
+def test_default_socket_path_can_be_disabled(monkeypatch, tmp_path) -> None:
+    monkeypatch.setenv("AE_BRIDGE_SOCKET", "off")
+    assert default_socket_path() is None
+    monkeypatch.setenv("AE_BRIDGE_SOCKET", str(tmp_path / "bridge.sock"))
+    assert default_socket_path() == tmp_path / "bridge.sock"
+
+
+@needs_unix_sockets
+def test_resolve_base_url_prefers_existing_socket(monkeypatch, tmp_path) -> None:
+    socket_path = tmp_path / "bridge.sock"
+    monkeypatch.setenv("AE_BRIDGE_SOCKET", str(socket_path))
+    monkeypatch.delenv("AE_BRIDGE_URL", raising=False)
+    assert resolve_base_url(None, "http://127.0.0.1:8080") == "http://127.0.0.1:8080"
+
+    with StubBridge(unix_socket=str(socket_path)):
+        assert resolve_base_url(None, "http://127.0.0.1:8080") == f"unix://{socket_path}"
+        assert resolve_base_url("http://127.0.0.1:9000", "http://127.0.0.1:8080") == "http://127.0.0.1:9000"
+        monkeypatch.setenv("AE_BRIDGE_URL", "http://127.0.0.1:9001")
+        assert resolve_base_url(None, "http://127.0.0.1:8080") == "http://127.0.0.1:9001"
+
+
+@needs_unix_sockets
+def test_client_round_trips_over_unix_socket(tmp_path) -> None:
+    socket_path = os.path.join(tmp_path, "bridge.sock")
+    with StubBridge(unix_socket=socket_path) as bridge:
+        client = AEClient(base_url=bridge.base_url, timeout=5.0)
+        assert client.health()["status"] == "ok"
+        assert len(client.get_layers()) == 200
+        result = client.apply_scene({"layers": [{"id": str(index), "type": "null"} for index in range(500)]})
+        assert result["layerCount"] == 500
+    assert not os.path.exists(socket_path)